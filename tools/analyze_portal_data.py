@@ -1,6 +1,8 @@
-import re
 import os
 
+from dts_model import load_api_model
+from instrumentation import run_main
+
 index_d_ts_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), '=Resources=', 'portal-docs-json', 'index.d.ts')
 
 def analyze_index_d_ts(file_path):
@@ -8,17 +10,17 @@ def analyze_index_d_ts(file_path):
         print(f"File not found: {file_path}")
         return
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    model = load_api_model(file_path)
 
-    # Count exported functions
-    functions = re.findall(r'export function (\w+)\(', content)
+    # Count exported functions (each overload is one declaration)
+    functions = [sig.name for sig in model.signatures()]
     print(f"Total exported functions: {len(functions)}")
     print(f"Unique exported functions: {len(set(functions))}")
+    overloaded = [name for name, sigs in model.functions.items() if len(sigs) > 1]
+    print(f"Overloaded functions: {len(overloaded)}")
 
     # Count namespaces
-    namespaces = re.findall(r'declare namespace (\w+)', content)
-    print(f"Namespaces: {namespaces}")
+    print(f"Namespaces: {model.namespaces}")
 
     # Count events (functions starting with On)
     events = [f for f in functions if f.startswith('On')]
@@ -27,13 +29,14 @@ def analyze_index_d_ts(file_path):
 
     # Sample some functions
     print("\nSample functions:")
-    for f in list(set(functions))[:10]:
+    for f in list(model.functions)[:10]:
         print(f"- {f}")
 
     # Check for Enums (export enum ...)
-    enums = re.findall(r'export enum (\w+)', content)
+    enums = list(model.enums)
     print(f"\nTotal Enums: {len(enums)}")
     print(f"Sample Enums: {enums[:5]}")
+    print(f"Type aliases: {len(model.type_aliases)}")
 
 if __name__ == "__main__":
-    analyze_index_d_ts(index_d_ts_path)
+    run_main(analyze_index_d_ts, index_d_ts_path)
@@ -0,0 +1,59 @@
+"""
+Benchmark for parse_blockly_js.
+
+Parses the full `web_ui/block_definitions.js` repeatedly and reports blocks/sec
+and MB/sec (best of N runs). Use `--min-blocks-per-sec` in CI to fail when the
+parser regresses below a known rate.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from instrumentation import run_main
+from parse_blockly_js import parse_blockly_js_to_json
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_INPUT = REPO_ROOT / 'web_ui' / 'block_definitions.js'
+
+
+def run_benchmark(js_content, repeat):
+    """Returns (block_count, [seconds per run])."""
+    timings = []
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = len(parse_blockly_js_to_json(js_content))
+        timings.append(time.perf_counter() - start)
+    return count, timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('input', nargs='?', default=str(DEFAULT_INPUT), help="Blockly JS definitions file")
+    parser.add_argument('--repeat', type=int, default=20, help="number of timed runs (default: 20)")
+    parser.add_argument('--scale', type=int, default=1, help="concatenate the input N times to test larger files")
+    parser.add_argument('--min-blocks-per-sec', type=float, default=0, help="exit 1 if the best rate is below this")
+    args = parser.parse_args()
+
+    with open(args.input, 'r', encoding='utf-8') as f:
+        js_content = f.read() * max(1, args.scale)
+
+    count, timings = run_benchmark(js_content, max(1, args.repeat))
+    best = min(timings)
+    median = sorted(timings)[len(timings) // 2]
+    blocks_per_sec = count / best if best else float('inf')
+    mb_per_sec = len(js_content) / 1e6 / best if best else float('inf')
+
+    print(f"Input: {args.input} x{args.scale} ({len(js_content) / 1024:.1f} KB, {count} blocks)")
+    print(f"Runs: {len(timings)}  best: {best * 1000:.2f} ms  median: {median * 1000:.2f} ms")
+    print(f"Throughput: {blocks_per_sec:,.0f} blocks/sec  {mb_per_sec:.2f} MB/sec")
+
+    if args.min_blocks_per_sec and blocks_per_sec < args.min_blocks_per_sec:
+        print(f"REGRESSION: {blocks_per_sec:,.0f} blocks/sec is below {args.min_blocks_per_sec:,.0f}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_main(main)
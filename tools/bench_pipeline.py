@@ -0,0 +1,399 @@
+"""
+Benchmark suite for the tools pipeline.
+
+Runs each stage on the shipped data and on synthetically scaled copies:
+
+    ts_extraction        block definitions parsed from the TS block files
+    catalog_build        bf6portal_blocks.json + compact DB (update_blocks_db.py, forced)
+    toolbox_generation   generate_toolbox_v2.py
+    selection_lists      index.d.ts -> selection-lists.md + sharded artifact
+    mod_analysis         portal_mod_stats.py over mod exports (json.load / --stream)
+
+Datasets are built once in a work directory as small repo roots:
+`catalog_xN` repeats every block definition N times under renamed types, `dts_xN`
+repeats every enum, `mod_<size>` is a synthetic Portal export of about that many
+blocks learned from the templates (generate_synthetic_mod.py, fixed seed).
+Without `=Resources=/portal-docs-json/index.d.ts` (see download_resources.py) the
+d.ts is rebuilt from selection-lists.md, which is generated from it.
+
+Every case runs in its own interpreter, so peak RSS (VmHWM / ru_maxrss, including the
+interpreter and the stage's imports) belongs to that case alone. Results record
+the best and median wall time of `--repeat` runs and items/sec.
+
+Usage:
+    python tools/bench_pipeline.py                                 # default cases
+    python tools/bench_pipeline.py --full                          # adds catalog_x100, dts_x10, mod_1m
+    python tools/bench_pipeline.py --only catalog --save bench.json
+    python tools/bench_pipeline.py --baseline bench.json           # exit 1 on a regression
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, NamedTuple
+
+from catalog_engine import (BLOCK_ARRAY_MARKER, BLOCKS_FILES, REPO_ROOT, SELECTION_LISTS_FILE, TOOLBOX_FILE,
+                            iter_block_definitions, load_catalog, parse_selection_lists)
+from instrumentation import run_main
+
+RESULTS_VERSION = 1
+TEMPLATES_DIR = REPO_ROOT / '=Resources=' / 'Portal Blocks'
+INDEX_D_TS = REPO_ROOT / '=Resources=' / 'portal-docs-json' / 'index.d.ts'
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_RSS_THRESHOLD = 0.25
+# Differences below these are noise, whatever the ratio.
+MIN_TIME_DELTA_S = 0.005
+MIN_RSS_DELTA_MB = 5.0
+
+MOD_SIZES = {'mod_10k': 10_000, 'mod_100k': 100_000, 'mod_1m': 1_000_000}
+
+
+# --- Datasets ---
+
+def _write_block_file(path, export_name, blocks):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    body = ',\n'.join('  ' + json.dumps(b) for b in blocks)
+    path.write_text(f"import * as Blockly from 'blockly';\n\nexport const {export_name} = "
+                    f"Blockly.common.{BLOCK_ARRAY_MARKER}[\n{body}\n]);\n", encoding='utf-8')
+
+
+def build_catalog_dataset(root: Path, scale: int):
+    """A repo root with the block files scaled `scale` times, the toolbox, and a freshly built block DB."""
+    catalog = load_catalog()
+    for rel in BLOCKS_FILES:
+        dst = root / rel
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        text = catalog.read_text(rel)
+        if scale == 1:
+            dst.write_text(text, encoding='utf-8')
+            continue
+        blocks = list(iter_block_definitions(text, rel))
+        scaled = [dict(b, type=f"{b['type']}_x{i}" if i else b['type']) for i in range(scale) for b in blocks]
+        export_name = re.search(r'export const (\w+)', text).group(1)
+        _write_block_file(dst, export_name, scaled)
+    (root / TOOLBOX_FILE).parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(catalog.path(TOOLBOX_FILE), root / TOOLBOX_FILE)
+
+    from update_blocks_db import generate_blocks_json
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate_blocks_json(load_catalog(root, refresh=True), force=True)
+
+
+def _dts_from_selection_lists():
+    lists = parse_selection_lists(load_catalog().read_text(SELECTION_LISTS_FILE))
+    out = ["declare namespace mod {"]
+    for name, values in lists.items():
+        out.append(f"    export enum {name} {{")
+        out.extend(f"        {json.dumps(v)}," for v in values)
+        out.append("    }")
+    out.append("}")
+    return '\n'.join(out) + '\n'
+
+
+ENUM_DECL_RE = re.compile(r'^[ \t]*export (?:const )?enum (\w+)\s*\{.*?\}', re.MULTILINE | re.DOTALL)
+
+
+def build_dts_dataset(root: Path, scale: int):
+    """`root/index.d.ts`: the Portal d.ts (or its reconstruction) with every enum repeated `scale` times."""
+    text = INDEX_D_TS.read_text(encoding='utf-8') if INDEX_D_TS.exists() else _dts_from_selection_lists()
+    if scale > 1:
+        enums = [m.group(0) for m in ENUM_DECL_RE.finditer(text)]
+        copies = [ENUM_DECL_RE.sub(lambda m: m.group(0).replace(f"enum {m.group(1)}", f"enum {m.group(1)}_x{i}", 1), e)
+                  for i in range(1, scale) for e in enums]
+        text += "declare namespace mod {\n" + '\n'.join(copies) + "\n}\n"
+    root.mkdir(parents=True, exist_ok=True)
+    (root / 'index.d.ts').write_text(text, encoding='utf-8')
+
+
+def build_mod_dataset(root: Path, target_blocks: int):
+    """`root/mod.json`: a synthetic export of about `target_blocks` blocks (generate_synthetic_mod.py, seed 0)."""
+    from generate_synthetic_mod import generate_mod, learn_model
+    root.mkdir(parents=True, exist_ok=True)
+    generate_mod(learn_model(TEMPLATES_DIR.glob('*.json')), root / 'mod.json', target_blocks, seed=0)
+
+
+def dataset_root(work_dir: Path, name: str) -> Path:
+    return work_dir / name
+
+
+def ensure_dataset(work_dir: Path, name: str):
+    """Builds dataset `name` in `work_dir` unless it is already there. Returns its root."""
+    if name == 'templates':
+        return TEMPLATES_DIR
+    root = dataset_root(work_dir, name)
+    done = root / '.complete'
+    if done.exists():
+        return root
+    if root.exists():
+        shutil.rmtree(root)
+    start = time.perf_counter()
+    if name.startswith('catalog_x'):
+        build_catalog_dataset(root, int(name[len('catalog_x'):]))
+    elif name.startswith('dts_x'):
+        build_dts_dataset(root, int(name[len('dts_x'):]))
+    elif name in MOD_SIZES:
+        build_mod_dataset(root, MOD_SIZES[name])
+    else:
+        raise ValueError(f"Unknown dataset {name!r}")
+    done.write_text('', encoding='utf-8')
+    print(f"  built dataset {name} in {time.perf_counter() - start:.1f}s")
+    return root
+
+
+# --- Stages (each returns the number of items it processed) ---
+
+def stage_ts_extraction(root):
+    return len(load_catalog(root, refresh=True).block_definitions())
+
+
+def stage_catalog_build(root):
+    from update_blocks_db import generate_blocks_json
+    catalog = load_catalog(root, refresh=True)
+    generate_blocks_json(catalog, force=True)
+    return len(catalog.block_definitions())
+
+
+def stage_toolbox_generation(root):
+    from block_usage import load_usage
+    from generate_toolbox_v2 import generate_toolbox
+    catalog = load_catalog(root, refresh=True)
+    generate_toolbox(load_usage(), catalog=catalog, output_file=root / 'toolbox.out.ts')
+    return len(catalog.block_db)
+
+
+def setup_selection_lists(root):
+    import dts_model
+    dts_model._MODELS.clear()
+    (root / 'index.d.ts.model.pickle').unlink(missing_ok=True)
+
+
+def stage_selection_lists(root):
+    from dts_model import load_api_model
+    from extract_selection_lists import extract_selection_lists
+    extract_selection_lists(str(root / 'index.d.ts'), str(root / 'selection-lists.md'))
+    return sum(len(e.members) for e in load_api_model(root / 'index.d.ts').enums.values())
+
+
+def _mod_files(root):
+    return sorted(Path(root).glob('*.json'))
+
+
+def stage_mod_analysis(root, stream=False):
+    from portal_mod_stats import analyze_file
+    return sum(analyze_file(path, stream=stream).total_blocks for path in _mod_files(root))
+
+
+def stage_mod_analysis_stream(root):
+    return stage_mod_analysis(root, stream=True)
+
+
+class Stage(NamedTuple):
+    run: Callable
+    setup: Callable = None
+    unit: str = 'blocks'
+
+
+STAGES: Dict[str, Stage] = {
+    'ts_extraction': Stage(stage_ts_extraction),
+    'catalog_build': Stage(stage_catalog_build),
+    'toolbox_generation': Stage(stage_toolbox_generation),
+    'selection_lists': Stage(stage_selection_lists, setup_selection_lists, unit='enum values'),
+    'mod_analysis': Stage(stage_mod_analysis),
+    'mod_analysis_stream': Stage(stage_mod_analysis_stream),
+}
+
+CATALOG_STAGES = ['ts_extraction', 'catalog_build', 'toolbox_generation']
+DEFAULT_CASES = (
+    [(stage, 'catalog_x1') for stage in CATALOG_STAGES]
+    + [(stage, 'catalog_x10') for stage in CATALOG_STAGES]
+    + [('selection_lists', 'dts_x1')]
+    + [('mod_analysis', 'templates'), ('mod_analysis', 'mod_10k'), ('mod_analysis', 'mod_100k'),
+       ('mod_analysis_stream', 'mod_100k')]
+)
+FULL_CASES = DEFAULT_CASES + (
+    [(stage, 'catalog_x100') for stage in CATALOG_STAGES]
+    + [('selection_lists', 'dts_x10'), ('mod_analysis', 'mod_1m'), ('mod_analysis_stream', 'mod_1m')]
+)
+
+
+def case_id(stage, dataset):
+    return f"{stage}/{dataset}"
+
+
+# --- Measurement ---
+
+def peak_rss_mb():
+    # Linux: VmHWM starts over at exec, while ru_maxrss can carry the parent's peak across fork + exec.
+    try:
+        with open('/proc/self/status', 'r', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def run_case(stage_name, dataset, work_dir: Path, repeat):
+    """Runs one case in this process and returns its result dict."""
+    stage = STAGES[stage_name]
+    root = dataset_root(work_dir, dataset) if dataset != 'templates' else TEMPLATES_DIR
+    timings = []
+    items = 0
+    for _ in range(repeat):
+        if stage.setup:
+            stage.setup(root)
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            items = stage.run(root)
+            timings.append(time.perf_counter() - start)
+    best = min(timings)
+    rss = peak_rss_mb()
+    return {
+        'stage': stage_name,
+        'dataset': dataset,
+        'items': items,
+        'unit': stage.unit,
+        'runs': len(timings),
+        'best_s': round(best, 6),
+        'median_s': round(statistics.median(timings), 6),
+        'items_per_s': round(items / best, 1) if best else None,
+        'peak_rss_mb': round(rss, 1) if rss is not None else None,
+    }
+
+
+def run_case_subprocess(stage, dataset, work_dir, repeat):
+    cmd = [sys.executable, str(Path(__file__).resolve()), '--run-case', stage, dataset,
+           '--work-dir', str(work_dir), '--repeat', str(repeat)]
+    proc = subprocess.run(cmd, capture_output=True, text=True, cwd=REPO_ROOT)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{case_id(stage, dataset)} failed:\n{proc.stderr.strip()}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def compare(results, baseline, threshold, rss_threshold):
+    """Returns a list of regression messages (empty if none)."""
+    regressions = []
+    for cid, res in results.items():
+        base = baseline.get(cid)
+        if not base:
+            continue
+        if res['best_s'] > base['best_s'] * (1 + threshold) and res['best_s'] - base['best_s'] > MIN_TIME_DELTA_S:
+            regressions.append(f"{cid}: {res['best_s'] * 1000:.1f} ms vs baseline {base['best_s'] * 1000:.1f} ms "
+                               f"(+{(res['best_s'] / base['best_s'] - 1) * 100:.0f}%)")
+        rss, base_rss = res.get('peak_rss_mb'), base.get('peak_rss_mb')
+        if rss and base_rss and rss > base_rss * (1 + rss_threshold) and rss - base_rss > MIN_RSS_DELTA_MB:
+            regressions.append(f"{cid}: peak RSS {rss:.0f} MB vs baseline {base_rss:.0f} MB "
+                               f"(+{(rss / base_rss - 1) * 100:.0f}%)")
+    return regressions
+
+
+def print_results(results, baseline=None):
+    print(f"  {'case':<40} {'items':>9} {'best ms':>10} {'median ms':>10} {'items/s':>12} {'RSS MB':>8}  vs baseline")
+    for cid, r in results.items():
+        base = (baseline or {}).get(cid)
+        delta = f"{(r['best_s'] / base['best_s'] - 1) * 100:+.0f}%" if base and base['best_s'] else ''
+        rss = f"{r['peak_rss_mb']:.0f}" if r['peak_rss_mb'] is not None else '-'
+        rate = f"{r['items_per_s']:,.0f}" if r['items_per_s'] is not None else '-'
+        print(f"  {cid:<40} {r['items']:>9} {r['best_s'] * 1000:>10.1f} {r['median_s'] * 1000:>10.1f} {rate:>12} {rss:>8}  {delta}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the tools pipeline on real and scaled datasets.")
+    parser.add_argument('--full', action='store_true', help="include the largest datasets (catalog_x100, dts_x10, mod_1m)")
+    parser.add_argument('--only', action='append', default=[], help="run cases whose stage/dataset id contains this (repeatable)")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per case (default: 3)")
+    parser.add_argument('--work-dir', help="where datasets are built and kept (default: a temporary directory)")
+    parser.add_argument('--save', help="write results to this JSON file (e.g. a new baseline)")
+    parser.add_argument('--baseline', help="compare with this results file; exit 1 on a regression")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help="allowed wall-time growth (default: 0.25)")
+    parser.add_argument('--rss-threshold', type=float, default=DEFAULT_RSS_THRESHOLD, help="allowed peak-RSS growth (default: 0.25)")
+    parser.add_argument('--list', action='store_true', help="list the cases and exit")
+    parser.add_argument('--run-case', nargs=2, metavar=('STAGE', 'DATASET'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    repeat = max(1, args.repeat)
+
+    if args.run_case:
+        print(json.dumps(run_case(args.run_case[0], args.run_case[1], Path(args.work_dir), repeat)))
+        return
+
+    cases = FULL_CASES if args.full else DEFAULT_CASES
+    if args.only:
+        cases = [c for c in cases if any(o in case_id(*c) for o in args.only)]
+    if args.list or not cases:
+        for c in cases:
+            print(case_id(*c))
+        return
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f).get('results', {})
+
+    temp = None
+    if args.work_dir:
+        work_dir = Path(args.work_dir)
+        work_dir.mkdir(parents=True, exist_ok=True)
+    else:
+        temp = tempfile.TemporaryDirectory(prefix='bf6-bench-')
+        work_dir = Path(temp.name)
+
+    try:
+        print(f"Preparing datasets in {work_dir}")
+        for dataset in dict.fromkeys(d for _, d in cases):
+            ensure_dataset(work_dir, dataset)
+
+        results = {}
+        for stage, dataset in cases:
+            print(f"  running {case_id(stage, dataset)} ...", flush=True)
+            results[case_id(stage, dataset)] = run_case_subprocess(stage, dataset, work_dir, repeat)
+    finally:
+        if temp:
+            temp.cleanup()
+
+    print_results(results, baseline)
+
+    if args.save:
+        data = {
+            'version': RESULTS_VERSION,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'repeat': repeat,
+            'results': results,
+        }
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+            f.write('\n')
+        print(f"Saved results to {args.save}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold, args.rss_threshold)
+        if regressions:
+            print("REGRESSIONS:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%} time / {args.rss_threshold:.0%} RSS.")
+
+
+if __name__ == "__main__":
+    run_main(main)
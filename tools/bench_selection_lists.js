@@ -0,0 +1,144 @@
+/*
+  Benchmark: time to first selection-list dropdown, markdown vs sharded artifact.
+
+  Replays what `web_ui/src/selection_lists.ts` does before a dropdown for one
+  enum can show its options:
+  - markdown: read selection-lists.md, parse every enum, build the
+    case-insensitive map, build the dropdown options
+  - sharded: read + JSON.parse selection-lists/index.json and the preloaded
+    shard(s), decode them, then (for a large enum) fetch and decode its shard,
+    build the dropdown options
+
+  Usage: node tools/bench_selection_lists.js [--repeat 50] [--enum Maps] [--enum RuntimeSpawn_Dumbo]
+*/
+
+const fs = require('fs');
+const path = require('path');
+
+const REPO_ROOT = path.resolve(__dirname, '..');
+const MD_PATH = path.join(REPO_ROOT, 'selection-lists.md');
+const ARTIFACT_DIR = path.join(REPO_ROOT, 'selection-lists');
+
+function parseSelectionListsMarkdown(md) {
+  const lines = md.split(/\r?\n/);
+  const out = {};
+
+  let i = 0;
+  while (i < lines.length) {
+    const line = (lines[i] || '').trim();
+    i++;
+
+    if (!line) continue;
+    if (line.toUpperCase() === 'SELECTION LISTS:') continue;
+
+    const enumNameItem = line;
+
+    while (i < lines.length && (lines[i] || '').trim() === '') i++;
+    if (i >= lines.length || (lines[i] || '').trim().toLowerCase() !== 'widget 1:') continue;
+    i++;
+
+    while (i < lines.length && (lines[i] || '').trim() === '') i++;
+    let enumName = i < lines.length ? (lines[i] || '').trim() : '';
+    i++;
+
+    if (enumName.endsWith('Item')) enumName = enumName.slice(0, -4);
+
+    while (i < lines.length && (lines[i] || '').trim() === '') i++;
+    if (i >= lines.length || (lines[i] || '').trim().toLowerCase() !== 'widget 2:') continue;
+    i++;
+
+    const values = [];
+    while (i < lines.length) {
+      const v = (lines[i] || '').trim();
+      if (!v) break;
+      values.push(v);
+      i++;
+    }
+
+    const normalizedEnumNameItem = enumNameItem.endsWith('Item') ? enumNameItem.slice(0, -4) : enumNameItem;
+    const key = enumName || normalizedEnumNameItem;
+    if (key) out[key] = values;
+  }
+
+  return out;
+}
+
+function caseInsensitive(map) {
+  const ci = {};
+  for (const [k, v] of Object.entries(map)) {
+    const lk = k.toLowerCase();
+    if (!(lk in ci)) ci[lk] = v;
+  }
+  return ci;
+}
+
+function firstDropdownMarkdown(enumName) {
+  const map = parseSelectionListsMarkdown(fs.readFileSync(MD_PATH, 'utf8'));
+  caseInsensitive(map);
+  return map[enumName].map((v) => [v, v]);
+}
+
+function decodeShard(index, shardNo, map) {
+  const shard = JSON.parse(fs.readFileSync(path.join(ARTIFACT_DIR, index.shards[shardNo]), 'utf8'));
+  for (const [name, [s, offset, count]] of Object.entries(index.enums)) {
+    if (s !== shardNo) continue;
+    const values = new Array(count);
+    for (let i = 0; i < count; i++) values[i] = shard.strings[shard.items[offset + i]];
+    map[name] = values;
+  }
+}
+
+function firstDropdownSharded(enumName) {
+  const index = JSON.parse(fs.readFileSync(path.join(ARTIFACT_DIR, 'index.json'), 'utf8'));
+  const map = {};
+  for (const shardNo of index.preload || []) decodeShard(index, shardNo, map);
+  caseInsensitive(map);
+  if (!map[enumName]) decodeShard(index, index.enums[enumName][0], map);
+  return map[enumName].map((v) => [v, v]);
+}
+
+function time(fn, arg, repeat) {
+  // The first call is reported separately: it includes JIT warm-up, like a real app start.
+  const timings = [];
+  let result;
+  for (let i = 0; i < repeat; i++) {
+    const start = process.hrtime.bigint();
+    result = fn(arg);
+    timings.push(Number(process.hrtime.bigint() - start) / 1e6);
+  }
+  const sorted = timings.slice(1).sort((a, b) => a - b);
+  return { result, first: timings[0], best: sorted[0] ?? timings[0], median: sorted[Math.floor(sorted.length / 2)] ?? timings[0] };
+}
+
+function main() {
+  const args = process.argv.slice(2);
+  let repeat = 50;
+  const enums = [];
+  for (let i = 0; i < args.length; i++) {
+    if (args[i] === '--repeat') repeat = Math.max(2, parseInt(args[++i], 10) || repeat);
+    else if (args[i] === '--enum') enums.push(args[++i]);
+  }
+  if (!fs.existsSync(path.join(ARTIFACT_DIR, 'index.json'))) {
+    console.error('selection-lists/index.json not found; run: python tools/selection_list_artifact.py');
+    process.exit(1);
+  }
+  if (enums.length === 0) enums.push('Maps', 'RuntimeSpawn_Dumbo');
+
+  const mdBytes = fs.statSync(MD_PATH).size;
+  console.log(`selection-lists.md: ${(mdBytes / 1024).toFixed(1)} KB; ${repeat} runs per case (first run shown separately)`);
+  for (const enumName of enums) {
+    const md = time(firstDropdownMarkdown, enumName, repeat);
+    const sh = time(firstDropdownSharded, enumName, repeat);
+    // Both paths must produce the same options.
+    if (JSON.stringify(md.result) !== JSON.stringify(sh.result)) {
+      console.error(`${enumName}: options differ between markdown and sharded paths`);
+      process.exit(1);
+    }
+    const speedup = sh.median ? md.median / sh.median : Infinity;
+    console.log(`${enumName} (${md.result.length} options)`);
+    console.log(`  markdown: first ${md.first.toFixed(2)} ms  best ${md.best.toFixed(2)} ms  median ${md.median.toFixed(2)} ms`);
+    console.log(`  sharded:  first ${sh.first.toFixed(2)} ms  best ${sh.best.toFixed(2)} ms  median ${sh.median.toFixed(2)} ms  (${speedup.toFixed(1)}x)`);
+  }
+}
+
+main();
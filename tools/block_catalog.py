@@ -0,0 +1,174 @@
+"""
+Indexed query API over the generated blocks DB (bf6portal_blocks.json).
+
+`BlockCatalog` builds hash indexes once so tools can look blocks up in O(1)
+and combine filters with set algebra instead of re-scanning the DB:
+
+    blocks = load_block_catalog()
+    blocks.find('SetPlayerHealth')                    # case-insensitive / snake_case id lookup
+    blocks.query(category='PLAYER', connection='Value')
+    blocks.with_output('Number') & blocks.accepting('Player')
+
+Indexes (every key maps to a set of block_ids):
+- lower-cased id and snake_case id -> block_id
+- Portal type (first word of the block name, as in portal_convert.ts)
+- category (case-insensitive), connection kind, output type
+- input check type (the `check` of any input_value arg)
+"""
+
+import re
+import sys
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from catalog_engine import load_catalog, portal_type_of
+from instrumentation import run_main
+
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+def snake_case(name):
+    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
+    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+
+
+def _checks_of(arg):
+    check = arg.get('check')
+    if isinstance(check, str):
+        return [check]
+    if isinstance(check, list):
+        return [c for c in check if isinstance(c, str)]
+    return []
+
+
+class BlockCatalog:
+    """Hash-indexed view of blocks DB entries (dicts with block_id, category, connections, output_type, args)."""
+
+    def __init__(self, entries: Iterable[dict]):
+        self.entries: Dict[str, dict] = {}
+        self._by_folded_id: Dict[str, str] = {}
+        self._by_portal_type: Dict[str, Set[str]] = {}
+        self._by_category: Dict[str, Set[str]] = {}
+        self._by_connection: Dict[str, Set[str]] = {}
+        self._by_output_type: Dict[str, Set[str]] = {}
+        self._by_input_check: Dict[str, Set[str]] = {}
+
+        for entry in entries:
+            block_id = entry.get('block_id')
+            if not block_id or block_id in self.entries:
+                continue
+            self.entries[block_id] = entry
+            # First writer wins so an exact-case id is never shadowed by a later variant.
+            self._by_folded_id.setdefault(block_id.lower(), block_id)
+
+            self._add(self._by_portal_type, portal_type_of(entry), block_id)
+            self._add(self._by_category, (entry.get('category') or '').upper(), block_id)
+            self._add(self._by_connection, entry.get('connections') or 'None', block_id)
+            self._add(self._by_output_type, entry.get('output_type'), block_id)
+            for arg in entry.get('args') or []:
+                if isinstance(arg, dict) and arg.get('type') == 'input_value':
+                    for check in _checks_of(arg):
+                        self._add(self._by_input_check, check, block_id)
+
+        # snake_case aliases never override a real id.
+        for block_id in self.entries:
+            self._by_folded_id.setdefault(snake_case(block_id), block_id)
+
+    @staticmethod
+    def _add(index, key, block_id):
+        if key:
+            index.setdefault(key, set()).add(block_id)
+
+    @classmethod
+    def from_catalog(cls, catalog=None) -> 'BlockCatalog':
+        catalog = catalog or load_catalog()
+        return cls(catalog.block_db)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, block_id):
+        return block_id in self.entries
+
+    def ids(self) -> List[str]:
+        """All block ids, in DB order."""
+        return list(self.entries)
+
+    def get(self, block_id) -> Optional[dict]:
+        return self.entries.get(block_id)
+
+    def find(self, name) -> Optional[str]:
+        """
+        Resolves a block name to its block_id: exact, then case-insensitive,
+        then via its snake_case form (e.g. 'SetPlayerHealth' -> 'set_player_health').
+        """
+        if name in self.entries:
+            return name
+        return self._by_folded_id.get(name.lower()) or self._by_folded_id.get(snake_case(name))
+
+    # --- Index queries. Each returns a read-only set of block ids. ---
+
+    def with_portal_type(self, portal_type) -> FrozenSet[str]:
+        return frozenset(self._by_portal_type.get(portal_type, _EMPTY))
+
+    def in_category(self, category) -> FrozenSet[str]:
+        return frozenset(self._by_category.get((category or '').upper(), _EMPTY))
+
+    def with_connection(self, connection) -> FrozenSet[str]:
+        """connection is one of 'Statement', 'Value' or 'None'."""
+        return frozenset(self._by_connection.get(connection, _EMPTY))
+
+    def with_output(self, output_type) -> FrozenSet[str]:
+        return frozenset(self._by_output_type.get(output_type, _EMPTY))
+
+    def accepting(self, check_type) -> FrozenSet[str]:
+        """Blocks with at least one value input whose check includes `check_type`."""
+        return frozenset(self._by_input_check.get(check_type, _EMPTY))
+
+    def categories(self) -> List[str]:
+        return sorted(self._by_category)
+
+    def output_types(self) -> List[str]:
+        return sorted(self._by_output_type)
+
+    def query(self, category=None, connection=None, output_type=None, input_check=None, portal_type=None) -> Set[str]:
+        """Intersection of the given filters (None = no filter). With no filters, every block."""
+        result = None
+        for ids, wanted in ((self.in_category, category), (self.with_connection, connection),
+                            (self.with_output, output_type), (self.accepting, input_check),
+                            (self.with_portal_type, portal_type)):
+            if wanted is None:
+                continue
+            matches = ids(wanted)
+            result = set(matches) if result is None else result & matches
+            if not result:
+                return set()
+        return set(self.entries) if result is None else result
+
+
+_CATALOGS = {}
+
+
+def load_block_catalog(catalog=None) -> BlockCatalog:
+    """Returns the BlockCatalog for a CatalogModel (default: the shared repo model), building it once."""
+    catalog = catalog or load_catalog()
+    key = id(catalog)
+    if key not in _CATALOGS:
+        _CATALOGS[key] = (catalog, BlockCatalog.from_catalog(catalog))
+    return _CATALOGS[key][1]
+
+
+def main():
+    blocks = load_block_catalog()
+    print(f"{len(blocks)} blocks")
+    for category in blocks.categories():
+        print(f"  {category}: {len(blocks.in_category(category))}")
+    for connection in ('Statement', 'Value', 'None'):
+        print(f"{connection}: {len(blocks.with_connection(connection))}")
+    print(f"Output types: {', '.join(blocks.output_types())}")
+    if len(sys.argv) > 1:
+        for name in sys.argv[1:]:
+            print(f"{name} -> {blocks.find(name)}")
+
+
+if __name__ == "__main__":
+    run_main(main)
@@ -0,0 +1,167 @@
+"""
+Per-category chunk modules for lazy block registration.
+
+Splits the block definitions of `bf6portal_expanded.ts` and the generator table
+rows (`generator_specs.ts`) by toolbox category (block_classifier.py,
+'toolbox_v2' names) into one module per category:
+
+    <out>/<category>.ts  export const chunk: BlockChunk = {blocks, generatorSpecs}
+    <out>/index.ts       BLOCK_CHUNK_BY_TYPE (block type -> chunk) and one
+                         dynamic-import loader per chunk
+
+The web UI does not load chunks yet: boot registers bf6portal_expanded and the
+whole generator table eagerly. Until that switch-over lands together with a
+webpack build that splits `import()` into separate files, this tool reports
+the sizes the split would have and writes the modules only when asked to
+(--out; the modules expect to live two levels below web_ui/src, e.g.
+web_ui/src/blocks/chunks). Hand-written generators stay in bf6_generators.ts.
+
+Usage:
+    python tools/block_chunks.py                              # per-chunk sizes vs the monolithic sources
+    python tools/block_chunks.py --out web_ui/src/blocks/chunks
+"""
+
+import argparse
+import json
+import re
+import zlib
+from pathlib import Path
+from typing import Dict, List
+
+from block_classifier import load_classifier
+from catalog_engine import GENERATOR_SPECS_FILE, iter_block_definitions, load_catalog
+from instrumentation import run_main
+
+EXPANDED_BLOCKS_FILE = 'web_ui/src/blocks/bf6portal_expanded.ts'
+MANIFEST_MODULE = 'index'
+CHUNK_PROFILE = 'toolbox_v2'
+
+CHUNK_HEADER = """// Generated by tools/block_chunks.py from bf6portal_expanded.ts and generator_specs.ts; do not edit.
+// Kept as JSON text: JSON.parse is cheaper for the JS engine to load than an equivalent object literal.
+
+import type { BlockChunk } from './index';
+
+"""
+MANIFEST_HEADER = """// Generated by tools/block_chunks.py; do not edit.
+
+import type { GeneratorSpec } from '../../generators/spec_generator';
+
+export interface BlockChunk {
+  /** JSON block definitions, as passed to createBlockDefinitionsFromJsonArray. */
+  blocks: any[];
+  /** Table generator rows (see spec_generator.ts). */
+  generatorSpecs: Record<string, GeneratorSpec>;
+}
+
+"""
+
+
+def chunk_name(category):
+    return re.sub(r'[^a-z0-9]+', '_', category.lower()).strip('_') or 'other'
+
+
+def _escape_template(text):
+    return text.replace('\\', '\\\\').replace('`', '\\`').replace('${', '\\${')
+
+
+def _json_text(obj):
+    return '`' + _escape_template(json.dumps(obj, ensure_ascii=False, separators=(',', ':'))) + '`'
+
+
+def plan_chunks(block_defs: List[dict], generator_specs: Dict[str, list]):
+    """{chunk: {'blocks': [...], 'generatorSpecs': {...}}}, chunks and rows in a stable order."""
+    classifier = load_classifier()
+    chunks = {}
+
+    def chunk_for(block_type):
+        name = chunk_name(classifier.classify(block_type, CHUNK_PROFILE))
+        return chunks.setdefault(name, {'blocks': [], 'generatorSpecs': {}})
+
+    for block_def in block_defs:
+        chunk_for(block_def['type'])['blocks'].append(block_def)
+    for block_type in sorted(generator_specs):
+        chunk_for(block_type)['generatorSpecs'][block_type] = generator_specs[block_type]
+    return {name: chunks[name] for name in sorted(chunks)}
+
+
+def render_chunk(chunk):
+    return CHUNK_HEADER + f"export const chunk: BlockChunk = JSON.parse({_json_text(chunk)});\n"
+
+
+def render_manifest(chunks):
+    by_type = {}
+    for name, chunk in chunks.items():
+        for block_def in chunk['blocks']:
+            by_type.setdefault(block_def['type'], name)
+        for block_type in chunk['generatorSpecs']:
+            by_type.setdefault(block_type, name)
+    loaders = ''.join(
+        f"  {json.dumps(name)}: () => import(/* webpackChunkName: \"blocks-{name}\" */ './{name}').then((m) => m.chunk),\n"
+        for name in chunks)
+    return (MANIFEST_HEADER
+            + "/** Block type -> chunk name. */\n"
+            + f"export const BLOCK_CHUNK_BY_TYPE: Record<string, string> = JSON.parse({_json_text(dict(sorted(by_type.items())))});\n\n"
+            + "export const BLOCK_CHUNK_LOADERS: Record<string, () => Promise<BlockChunk>> = {\n"
+            + loaders
+            + "};\n")
+
+
+def render_all(catalog=None):
+    """{file name: text} for every chunk module plus the manifest."""
+    catalog = catalog or load_catalog()
+    block_defs = list(iter_block_definitions(catalog.read_text(EXPANDED_BLOCKS_FILE), EXPANDED_BLOCKS_FILE))
+    chunks = plan_chunks(block_defs, catalog.generator_specs)
+    files = {f"{name}.ts": render_chunk(chunk) for name, chunk in chunks.items()}
+    files[f"{MANIFEST_MODULE}.ts"] = render_manifest(chunks)
+    return files
+
+
+def write_chunks(out_dir, catalog=None):
+    """Writes the chunk modules to `out_dir` (removing chunks that no longer exist). Returns {file name: text}."""
+    catalog = catalog or load_catalog()
+    files = render_all(catalog)
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for stale in out_dir.glob('*.ts'):
+        if stale.name not in files:
+            stale.unlink()
+    for name, text in files.items():
+        path = out_dir / name
+        if not path.exists() or path.read_text(encoding='utf-8') != text:
+            path.write_text(text, encoding='utf-8')
+    return files
+
+
+def size_report(files, catalog=None):
+    """Lines of `chunk  bytes  gzip bytes`, largest first, with the monolithic sources for comparison."""
+    catalog = catalog or load_catalog()
+
+    def row(label, text):
+        data = text.encode('utf-8')
+        return f"  {label:<28} {len(data):>8} {len(zlib.compress(data, 9)):>8}"
+
+    lines = [f"  {'chunk':<28} {'bytes':>8} {'gzip':>8}"]
+    ordered = sorted(files.items(), key=lambda kv: -len(kv[1].encode('utf-8')))
+    lines += [row(name, text) for name, text in ordered]
+    lines.append(row('(all chunks)', ''.join(files.values())))
+    for source in (EXPANDED_BLOCKS_FILE, GENERATOR_SPECS_FILE):
+        lines.append(row(f"({source.rsplit('/', 1)[-1]})", catalog.read_text(source)))
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report (and optionally write) per-category block definition and generator chunks.")
+    parser.add_argument('--out', help="write the chunk modules and manifest to this directory")
+    args = parser.parse_args()
+
+    catalog = load_catalog()
+    if args.out:
+        files = write_chunks(args.out, catalog)
+        print(f"Wrote {len(files) - 1} chunks and the manifest to {args.out}")
+    else:
+        files = render_all(catalog)
+    print('\n'.join(size_report(files, catalog)))
+
+
+if __name__ == "__main__":
+    run_main(main)
@@ -0,0 +1,162 @@
+"""
+Data-driven toolbox category classifier for block ids.
+
+Rules live in `block_classifier_rules.json`: an ordered list of
+{"category", "exact" | "prefix" | "contains": [...]} entries tested against the
+upper-cased block id, where the first matching rule wins. Profiles rename
+categories for one caller, e.g. `fill_toolbox_gaps` uses the upper-case toolbox.ts
+names.
+
+All patterns compile into one Aho-Corasick automaton (a dict-per-state DFA).
+Each state knows the best (lowest) rule of every "contains" pattern ending
+there, so classifying an id is a single scan of its characters instead of one
+substring search per pattern. "prefix" and "exact" patterns share the trie and
+only count while the scan is still on the path from the root (and, for exact,
+at the end of the id). Results are memoized per id.
+
+Usage:
+    python tools/block_classifier.py                      # category counts for the block catalog
+    python tools/block_classifier.py --naming fill_toolbox_gaps
+    python tools/block_classifier.py mod.SetPlayerScore   # classify specific ids
+"""
+
+import argparse
+import json
+from collections import Counter, deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from instrumentation import run_main
+
+RULES_FILE = Path(__file__).with_name('block_classifier_rules.json')
+MATCH_KINDS = ('exact', 'prefix', 'contains')
+
+_CLASSIFIERS = {}
+
+
+class BlockClassifier:
+    def __init__(self, rules: List[dict], default: str = 'Other', profiles: Optional[Dict[str, Dict[str, str]]] = None):
+        self.categories = [rule['category'] for rule in rules]
+        self.default = default
+        self.profiles = profiles or {}
+        self._compile(rules)
+        self._cache: Dict[str, str] = {}
+
+    def _compile(self, rules):
+        no_rule = len(rules)
+        goto: List[Dict[str, int]] = [{}]
+        # Per state: best rule for a "contains" / "prefix" / "exact" pattern spelled by that state.
+        found = {kind: [no_rule] for kind in MATCH_KINDS}
+        depth = [0]
+
+        for rule_no, rule in enumerate(rules):
+            patterns = [(kind, text) for kind in MATCH_KINDS for text in rule.get(kind, [])]
+            if not patterns:
+                raise ValueError(f"Rule for {rule.get('category')!r} has no {'/'.join(MATCH_KINDS)} patterns")
+            for kind, text in patterns:
+                state = 0
+                for ch in text.upper():
+                    nxt = goto[state].get(ch)
+                    if nxt is None:
+                        nxt = goto[state][ch] = len(goto)
+                        goto.append({})
+                        for states in found.values():
+                            states.append(no_rule)
+                        depth.append(depth[state] + 1)
+                    state = nxt
+                found[kind][state] = min(found[kind][state], rule_no)
+
+        # Breadth-first: failure links, the best "contains" rule ending in each state
+        # (own or via its failure chain), and full DFA transitions.
+        best = found['contains']
+        fail = [0] * len(goto)
+        delta = [dict(goto[0])] + [None] * (len(goto) - 1)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            best[state] = min(best[state], best[fail[state]])
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0) if state else 0
+                queue.append(nxt)
+
+        self._delta = delta
+        self._best = best
+        self._prefix = found['prefix']
+        self._exact = found['exact']
+        self._depth = depth
+
+    def _match(self, bid):
+        delta, best, prefix, depth = self._delta, self._best, self._prefix, self._depth
+        state = 0
+        rule = len(self.categories)
+        for i, ch in enumerate(bid, 1):
+            state = delta[state].get(ch, 0)
+            if best[state] < rule:
+                rule = best[state]
+            # A prefix/exact pattern only counts while the scan is still on the root path.
+            if depth[state] == i and prefix[state] < rule:
+                rule = prefix[state]
+        if depth[state] == len(bid) and self._exact[state] < rule:
+            rule = self._exact[state]
+        return self.categories[rule] if rule < len(self.categories) else self.default
+
+    def category(self, block_id: str) -> str:
+        """Category for one block id, before any profile renaming."""
+        cat = self._cache.get(block_id)
+        if cat is None:
+            cat = self._cache[block_id] = self._match(block_id.upper())
+        return cat
+
+    def classify(self, block_id: str, profile: Optional[str] = None) -> str:
+        cat = self.category(block_id)
+        if profile is None:
+            return cat
+        return self.profiles[profile].get(cat, cat)
+
+    def classify_all(self, block_ids: Iterable[str], profile: Optional[str] = None) -> Dict[str, str]:
+        """{block_id: category} for every id, in one pass."""
+        names = self.profiles[profile] if profile is not None else {}
+        out = {}
+        for block_id in block_ids:
+            cat = self.category(block_id)
+            out[block_id] = names.get(cat, cat)
+        return out
+
+
+def load_classifier(path=RULES_FILE) -> BlockClassifier:
+    """Compiles the rules file once per process."""
+    path = Path(path)
+    classifier = _CLASSIFIERS.get(path)
+    if classifier is None:
+        config = json.loads(path.read_text(encoding='utf-8'))
+        classifier = _CLASSIFIERS[path] = BlockClassifier(config['rules'], config.get('default', 'Other'),
+                                                          config.get('profiles'))
+    return classifier
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Classify block ids into toolbox categories.")
+    parser.add_argument('ids', nargs='*', help="block ids to classify (default: every block in the catalog)")
+    # Not --profile: that is the instrumentation option every entry point takes.
+    parser.add_argument('--naming', dest='profile', help="category naming profile from the rules file")
+    parser.add_argument('--rules', default=RULES_FILE, help="rules file")
+    args = parser.parse_args()
+
+    classifier = load_classifier(args.rules)
+    if args.profile is not None and args.profile not in classifier.profiles:
+        parser.error(f"unknown profile {args.profile!r}; known: {', '.join(sorted(classifier.profiles))}")
+
+    if args.ids:
+        for block_id, cat in classifier.classify_all(args.ids, args.profile).items():
+            print(f"{block_id}: {cat}")
+        return
+
+    from block_catalog import load_block_catalog
+    counts = Counter(classifier.classify_all(load_block_catalog().ids(), args.profile).values())
+    for cat, n in counts.most_common():
+        print(f"{n:5d}  {cat}")
+
+
+if __name__ == "__main__":
+    run_main(main)
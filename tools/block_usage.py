@@ -0,0 +1,128 @@
+"""
+Block usage frequencies mined from a corpus of Portal mod exports.
+
+Walks every block of every mod (see portal_mod_stats.py) and counts block
+types. The counts are keyed by Portal type as exported, e.g. `GetVariable`,
+`ruleBlock`. `usage_key` maps both those and the tool's block ids
+(`mod_GetVariable`, `get_variable`, `RULE_HEADER`, `add`/`ADD`) to one lookup
+key, so the toolbox generator can rank catalog blocks by how often real mods
+use them.
+
+    block_usage.json  {"version", "mods": [file, ...], "total_blocks": n,
+                       "types": {PortalType: count, ...}}   (most used first)
+
+Usage:
+    python tools/block_usage.py                           # mine "=Resources=/Portal Blocks"
+    python tools/block_usage.py path/to/mods --stream     # a directory (recursive) or files; bounded memory
+    python tools/block_usage.py --top 30                  # also print the most used types
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from catalog_engine import REPO_ROOT
+from instrumentation import run_main
+from portal_mod_stats import analyze_file
+from portal_tree import PORTAL_TYPE_EXPORT_OVERRIDES
+
+DEFAULT_CORPUS = REPO_ROOT / '=Resources=' / 'Portal Blocks'
+USAGE_FILE = Path(__file__).with_name('block_usage.json')
+USAGE_VERSION = 1
+
+# Portal export type -> tool block id, for the types the exporter renames.
+_IMPORT_TYPES = {}
+for _tool_type, _portal_type in PORTAL_TYPE_EXPORT_OVERRIDES.items():
+    _IMPORT_TYPES.setdefault(_portal_type, _tool_type)
+
+
+def usage_key(block_type: str) -> str:
+    """Shared key for a Portal type and the tool block ids that export to it."""
+    t = _IMPORT_TYPES.get(block_type, block_type)
+    if t.startswith('mod_'):
+        t = t[4:]
+    # Catalog ids are snake_case ('get_variable') where Portal types are CamelCase ('GetVariable').
+    return t.replace('_', '').lower()
+
+
+def mod_files(paths: Iterable) -> List[Path]:
+    files = []
+    for p in map(Path, paths):
+        files.extend(sorted(p.rglob('*.json')) if p.is_dir() else [p])
+    return files
+
+
+def mine_usage(paths: Iterable, stream=False):
+    """Returns ({PortalType: count}, [mined files]); unreadable files are reported and skipped."""
+    counts = Counter()
+    mined = []
+    for path in mod_files(paths):
+        try:
+            stats = analyze_file(path, stream=stream)
+        except (OSError, ValueError) as e:
+            print(f"Skipping {path}: {e}", file=sys.stderr)
+            continue
+        counts.update({t: n for t, n in stats.block_types.items() if t})
+        mined.append(path)
+    return counts, mined
+
+
+def write_usage(counts, mined, out_path=USAGE_FILE):
+    data = {
+        'version': USAGE_VERSION,
+        'mods': [p.name for p in mined],
+        'total_blocks': sum(counts.values()),
+        'types': dict(sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))),
+    }
+    Path(out_path).write_text(json.dumps(data, indent=2) + '\n', encoding='utf-8')
+    return data
+
+
+def load_usage(path=USAGE_FILE) -> Dict[str, int]:
+    """{usage_key: count} from a usage file; empty when it is missing or from another version."""
+    try:
+        data = json.loads(Path(path).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != USAGE_VERSION:
+        return {}
+    out = Counter()
+    for block_type, n in (data.get('types') or {}).items():
+        out[usage_key(block_type)] += n
+    return dict(out)
+
+
+def top_types(path=USAGE_FILE, n=20) -> List[str]:
+    """The `n` most used Portal types in a usage file (empty when it is missing or from another version)."""
+    try:
+        data = json.loads(Path(path).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return []
+    if data.get('version') != USAGE_VERSION:
+        return []
+    return list(data.get('types') or {})[:n]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mine block usage frequencies from Portal mod exports.")
+    parser.add_argument('paths', nargs='*', default=[DEFAULT_CORPUS], help="mod files or directories (searched recursively)")
+    parser.add_argument('--out', default=USAGE_FILE, help="usage file to write")
+    parser.add_argument('--stream', action='store_true', help="stream large exports instead of loading them whole")
+    parser.add_argument('--top', type=int, default=0, help="print the N most used types")
+    args = parser.parse_args()
+
+    counts, mined = mine_usage(args.paths, stream=args.stream)
+    if not mined:
+        print("No mod exports found.")
+        sys.exit(1)
+    data = write_usage(counts, mined, args.out)
+    print(f"Mined {data['total_blocks']} blocks ({len(counts)} types) from {len(mined)} mods into {args.out}")
+    for block_type, n in list(data['types'].items())[:args.top]:
+        print(f"{n:7d}  {block_type}")
+
+
+if __name__ == "__main__":
+    run_main(main)
@@ -0,0 +1,450 @@
+"""
+Block catalog engine.
+
+Parses the project's block sources once and keeps the result in memory so the
+catalog tools (update_blocks_db, find_missing_*, fill_toolbox_gaps, ...) can
+share a single parse instead of each re-reading and regex-scraping the same
+files.
+
+The model covers:
+- block definitions from `web_ui/src/blocks/bf6portal*.ts`
+- toolbox membership from `web_ui/src/toolbox.ts`
+- generator coverage from `web_ui/src/generators/bf6_generators.ts`
+- selection lists from `selection-lists.md`
+- the generated blocks DB (`bf6portal_blocks.json`, or its compact form)
+
+Every source is read and parsed lazily on first access and then cached on the
+model. `load_catalog()` memoizes the model per repo root, so a script that
+chains several tools in one process only pays for one parse.
+"""
+
+import hashlib
+import json
+import re
+import sys
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Set
+
+import js_literal
+from instrumentation import count, run_main, stage
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Paths are relative to the repo root.
+BLOCKS_FILES = [
+    'web_ui/src/blocks/bf6portal.ts',
+    'web_ui/src/blocks/bf6portal_expanded.ts'
+]
+TOOLBOX_FILE = 'web_ui/src/toolbox.ts'
+GENERATORS_FILE = 'web_ui/src/generators/bf6_generators.ts'
+GENERATOR_SPECS_FILE = 'web_ui/src/generators/generator_specs.ts'
+SELECTION_LISTS_FILE = 'selection-lists.md'
+BLOCK_DB_FILE = 'bf6portal_blocks.json'
+# Minified, pre-normalized copy of BLOCK_DB_FILE (see build_compact_block_db).
+COMPACT_BLOCK_DB_FILE = 'bf6portal_blocks.compact.json'
+COMPACT_BLOCK_DB_VERSION = 1
+COMPACT_STRING_FIELDS = ['block_id', 'name', 'category', 'tooltip', 'message', 'output_type', 'connections']
+
+BLOCK_ARRAY_MARKER = 'createBlockDefinitionsFromJsonArray('
+TOOLBOX_RE = re.compile(r'export\s+const\s+toolbox\s*=\s*')
+IMPERATIVE_BLOCK_RE = re.compile(r"Blockly\.Blocks\['([^']+)'\]")
+GENERATOR_RE = re.compile(r"bf6Generators\['([^']+)'\]")
+GENERATOR_SPECS_RE = re.compile(r'JSON\.parse\(`(.*?)`\)', re.DOTALL)
+SELECTION_LIST_GENERATORS_RE = re.compile(r"const __bf6SelectionListBlocks\s*=\s*\[(.*?)\];", re.DOTALL)
+
+
+class ToolboxCategory(NamedTuple):
+    name: str
+    colour: str
+    custom: Optional[str]
+    types: List[str]
+
+
+def loads_js_literal(text):
+    """Parses a JS/TS object or array literal (comments, trailing commas, unquoted keys)."""
+    return js_literal.loads(text)
+
+
+def iter_block_definitions(content, source='<string>'):
+    """
+    Yields the block definitions passed to createBlockDefinitionsFromJsonArray,
+    one at a time. Raises JSLiteralError on malformed input and ValueError when
+    the array is missing or holds something other than objects.
+    """
+    start = js_literal.find_literal_after(content, BLOCK_ARRAY_MARKER, '[')
+    if start == -1:
+        raise ValueError(f"Could not find createBlockDefinitionsFromJsonArray in {source}")
+    for block in js_literal.iter_array(content, start, source):
+        if not isinstance(block, dict):
+            raise ValueError(f"Non-object entry in block array of {source}: {block!r}")
+        yield block
+
+
+def parse_block_definitions(content, source='<string>'):
+    """
+    Returns the block definitions passed to createBlockDefinitionsFromJsonArray.
+    Parse errors propagate (see iter_block_definitions): an empty list would
+    silently drop the file's blocks from everything built on the catalog.
+    """
+    return list(iter_block_definitions(content, source))
+
+
+def parse_toolbox(content, source='<string>'):
+    """Returns the `toolbox` object exported from toolbox.ts. Raises ValueError (or JSLiteralError) on failure."""
+    match = TOOLBOX_RE.search(content)
+    if not match:
+        raise ValueError(f"Could not find 'export const toolbox' in {source}")
+    return js_literal.loads(content, match.end(), source)
+
+
+def parse_generator_specs(content):
+    """Parses the generated table in generator_specs.ts into { block_type: row }."""
+    m = GENERATOR_SPECS_RE.search(content)
+    if not m:
+        return {}
+    return json.loads(re.sub(r'\\([\\`$])', r'\1', m.group(1)))
+
+
+def parse_selection_list_generator_types(content):
+    """Types given a generator by the selection-list loop at the end of bf6_generators.ts."""
+    m = SELECTION_LIST_GENERATORS_RE.search(content)
+    return set(re.findall(r"'([^']+)'", m.group(1))) if m else set()
+
+
+def parse_selection_lists(content):
+    """
+    Parses selection-lists.md into { EnumName: [values] }.
+    Mirrors parseSelectionListsMarkdown in web_ui/src/selection_lists.ts.
+    """
+    lines = [line.strip() for line in content.splitlines()]
+    out = {}
+    i = 0
+    n = len(lines)
+
+    def skip_blank(j):
+        while j < n and not lines[j]:
+            j += 1
+        return j
+
+    while i < n:
+        line = lines[i]
+        i += 1
+        if not line or line.upper() == 'SELECTION LISTS:':
+            continue
+        enum_name_item = line
+
+        i = skip_blank(i)
+        if i >= n or lines[i].lower() != 'widget 1:':
+            continue
+        i = skip_blank(i + 1)
+        enum_name = lines[i] if i < n else ''
+        i += 1
+        if enum_name.endswith('Item'):
+            enum_name = enum_name[:-4]
+
+        i = skip_blank(i)
+        if i >= n or lines[i].lower() != 'widget 2:':
+            continue
+        i += 1
+
+        values = []
+        while i < n and lines[i]:
+            values.append(lines[i])
+            i += 1
+
+        key = enum_name or (enum_name_item[:-4] if enum_name_item.endswith('Item') else enum_name_item)
+        if key:
+            out[key] = values
+    return out
+
+
+def collect_toolbox_types(node, out=None):
+    """Collects every `kind: block` type in a toolbox tree."""
+    if out is None:
+        out = set()
+    if isinstance(node, dict):
+        if node.get('kind') == 'block' and 'type' in node:
+            out.add(node['type'])
+        for value in node.values():
+            collect_toolbox_types(value, out)
+    elif isinstance(node, list):
+        for item in node:
+            collect_toolbox_types(item, out)
+    return out
+
+
+def portal_type_of(entry):
+    """Portal block type of a blocks DB entry: the first word of its name (e.g. 'AbortIf')."""
+    words = (entry.get('name') or '').split()
+    return words[0] if words else ''
+
+
+def input_names(args):
+    """Returns ([value input names], [statement input names]) for a block's args."""
+    value_inputs = []
+    statement_inputs = []
+    for arg in args:
+        if not isinstance(arg, dict) or not arg.get('name'):
+            continue
+        if arg.get('type') == 'input_value':
+            value_inputs.append(str(arg['name']))
+        elif arg.get('type') == 'input_statement':
+            statement_inputs.append(str(arg['name']))
+    return value_inputs, statement_inputs
+
+
+def build_compact_block_db(entries, source_sha256=''):
+    """
+    Builds the compact form of bf6portal_blocks.json.
+
+    Every string column is stored as an index into a de-duplicated `strings` table,
+    `args` are real arrays instead of a nested JSON string, and `portal_specs`
+    precomputes { portalType: [valueInputs, statementInputs] } the same way
+    buildPortalSpecsFromDocsArray in web_ui/src/portal_convert.ts does, so neither
+    the app nor the tools need a second decode pass.
+    """
+    strings = []
+    index = {}
+
+    def intern(value):
+        if value is None:
+            return None
+        if value not in index:
+            index[value] = len(strings)
+            strings.append(value)
+        return index[value]
+
+    rows = []
+    specs = {}
+    for entry in entries:
+        args = entry.get('args')
+        if args is None:
+            args = json.loads(entry.get('args_json') or '[]')
+        rows.append([intern(entry.get(key)) for key in COMPACT_STRING_FIELDS] + [entry.get('colour', 0), args])
+
+        portal_type = portal_type_of(entry)
+        if not portal_type:
+            continue
+        value_inputs, statement_inputs = input_names(args)
+        # Prefer the spec with the most information.
+        prev = specs.get(portal_type)
+        if prev is None or len(value_inputs) + len(statement_inputs) > len(prev[0]) + len(prev[1]):
+            specs[portal_type] = [value_inputs, statement_inputs]
+
+    return {
+        "version": COMPACT_BLOCK_DB_VERSION,
+        "source_sha256": source_sha256,
+        "fields": COMPACT_STRING_FIELDS + ['colour', 'args'],
+        "strings": strings,
+        "blocks": rows,
+        "portal_specs": specs,
+    }
+
+
+def expand_compact_block_db(data):
+    """
+    Returns the entries of a compact blocks DB as dicts. Entries carry `args` as a
+    list; `args_json` is not rebuilt.
+    """
+    strings = data['strings']
+    n = len(COMPACT_STRING_FIELDS)
+    out = []
+    for row in data['blocks']:
+        entry = {key: (None if ref is None else strings[ref]) for key, ref in zip(COMPACT_STRING_FIELDS, row)}
+        entry['colour'] = row[n]
+        entry['args'] = row[n + 1]
+        out.append(entry)
+    return out
+
+
+class CatalogModel:
+    """In-memory view of the block sources. Each source is parsed at most once."""
+
+    def __init__(self, root=REPO_ROOT):
+        self.root = Path(root)
+        self._texts = {}
+        self._block_defs = {}
+
+    def path(self, rel_path):
+        return self.root / rel_path
+
+    def read_text(self, rel_path):
+        """Returns the (cached) contents of a repo file, or '' if it is missing."""
+        if rel_path not in self._texts:
+            try:
+                with stage('read'):
+                    self._texts[rel_path] = self.path(rel_path).read_text(encoding='utf-8')
+            except FileNotFoundError:
+                print(f"Warning: {rel_path} not found.", file=sys.stderr)
+                self._texts[rel_path] = ''
+        return self._texts[rel_path]
+
+    def sha256(self, rel_path):
+        """SHA-256 of a repo file's bytes, or '' if it is missing."""
+        try:
+            return hashlib.sha256(self.path(rel_path).read_bytes()).hexdigest()
+        except FileNotFoundError:
+            return ''
+
+    # --- Block definitions ---
+
+    def blocks_in(self, rel_path) -> List[dict]:
+        """Block definitions of a single source file, in source order."""
+        if rel_path not in self._block_defs:
+            text = self.read_text(rel_path)
+            with stage('parse'):
+                self._block_defs[rel_path] = parse_block_definitions(text, rel_path)
+            count('blocks_parsed', len(self._block_defs[rel_path]))
+        return self._block_defs[rel_path]
+
+    @property
+    def block_files(self) -> Dict[str, List[dict]]:
+        """{ rel_path: [block definitions in source order] } for BLOCKS_FILES."""
+        return {rel: self.blocks_in(rel) for rel in BLOCKS_FILES}
+
+    @cached_property
+    def imperative_block_types(self) -> Dict[str, Set[str]]:
+        """Block types registered via `Blockly.Blocks['...']` in BLOCKS_FILES."""
+        return {rel: set(IMPERATIVE_BLOCK_RE.findall(self.read_text(rel))) for rel in BLOCKS_FILES}
+
+    def block_definitions(self, files=None) -> List[dict]:
+        """All block definitions (optionally limited to some BLOCKS_FILES)."""
+        out = []
+        for rel in (files or BLOCKS_FILES):
+            out.extend(self.blocks_in(rel))
+        return out
+
+    def block_types(self, files=None) -> Set[str]:
+        return {b['type'] for b in self.block_definitions(files) if b.get('type')}
+
+    # --- Toolbox ---
+
+    @cached_property
+    def toolbox(self) -> dict:
+        text = self.read_text(TOOLBOX_FILE)
+        with stage('parse'):
+            return parse_toolbox(text, TOOLBOX_FILE)
+
+    @cached_property
+    def toolbox_categories(self) -> List[ToolboxCategory]:
+        out = []
+        for item in self.toolbox.get('contents', []):
+            if not isinstance(item, dict) or item.get('kind') != 'category':
+                continue
+            types = [c['type'] for c in item.get('contents', []) if isinstance(c, dict) and c.get('kind') == 'block' and 'type' in c]
+            out.append(ToolboxCategory(item.get('name', ''), item.get('colour', ''), item.get('custom'), types))
+        return out
+
+    @cached_property
+    def toolbox_types(self) -> Set[str]:
+        return collect_toolbox_types(self.toolbox)
+
+    @cached_property
+    def toolbox_membership(self) -> Dict[str, str]:
+        """{ block_type: category_name }. A block listed twice keeps its last category."""
+        out = {}
+        for cat in self.toolbox_categories:
+            for t in cat.types:
+                out[t] = cat.name
+        return out
+
+    # --- Generators ---
+
+    @cached_property
+    def handwritten_generator_types(self) -> Set[str]:
+        """Types with a generator function in bf6_generators.ts (these override table rows)."""
+        text = self.read_text(GENERATORS_FILE)
+        return set(GENERATOR_RE.findall(text)) | parse_selection_list_generator_types(text)
+
+    @cached_property
+    def generator_specs(self) -> Dict[str, list]:
+        """Table-driven generator rows from generator_specs.ts (see tools/generator_specs.py)."""
+        return parse_generator_specs(self.read_text(GENERATOR_SPECS_FILE))
+
+    @cached_property
+    def generator_types(self) -> Set[str]:
+        return self.handwritten_generator_types | set(self.generator_specs)
+
+    # --- Selection lists ---
+
+    @cached_property
+    def selection_lists(self) -> Dict[str, List[str]]:
+        return parse_selection_lists(self.read_text(SELECTION_LISTS_FILE))
+
+    # --- Generated blocks DB ---
+
+    def load_compact_block_db(self) -> Optional[dict]:
+        """The compact blocks DB, or None if it is missing, unreadable or older than BLOCK_DB_FILE."""
+        try:
+            with open(self.path(COMPACT_BLOCK_DB_FILE), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != COMPACT_BLOCK_DB_VERSION:
+            return None
+        source_sha256 = self.sha256(BLOCK_DB_FILE)
+        if source_sha256 and data.get('source_sha256') != source_sha256:
+            return None
+        return data
+
+    @cached_property
+    def block_db(self) -> List[dict]:
+        """
+        Entries of the generated blocks DB, with `args` decoded to a list.
+        Reads the compact form when it is current, else bf6portal_blocks.json.
+        """
+        compact = self.load_compact_block_db()
+        if compact is not None:
+            return expand_compact_block_db(compact)
+        try:
+            with open(self.path(BLOCK_DB_FILE), 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            print(f"Error: Block data file not found at {BLOCK_DB_FILE}. Please run update_blocks_db.py first.", file=sys.stderr)
+            return []
+        for entry in entries:
+            entry['args'] = json.loads(entry.pop('args_json', None) or '[]')
+        return entries
+
+    @cached_property
+    def portal_specs(self) -> Dict[str, List[List[str]]]:
+        """{ portalType: [valueInputs, statementInputs] }, as used by portal_convert.ts."""
+        compact = self.load_compact_block_db()
+        if compact is not None:
+            return compact['portal_specs']
+        return build_compact_block_db(self.block_db)['portal_specs']
+
+
+_MODELS = {}
+
+
+def load_catalog(root=REPO_ROOT, refresh=False) -> CatalogModel:
+    """Returns the shared CatalogModel for `root`, creating it on first use."""
+    key = Path(root).resolve()
+    if refresh or key not in _MODELS:
+        _MODELS[key] = CatalogModel(key)
+    return _MODELS[key]
+
+
+def main():
+    catalog = load_catalog()
+
+    for rel, blocks in catalog.block_files.items():
+        print(f"{rel}: {len(blocks)} block definitions")
+
+    defined = catalog.block_types() | set().union(*catalog.imperative_block_types.values())
+    in_toolbox = catalog.toolbox_types
+    generators = catalog.generator_types
+
+    print(f"Toolbox: {len(catalog.toolbox_categories)} categories, {len(in_toolbox)} unique block types")
+    print(f"Generators: {len(generators)} implemented")
+    print(f"Selection lists: {len(catalog.selection_lists)} enums")
+    print()
+    print(f"In toolbox but not defined: {len(in_toolbox - defined)}")
+    print(f"Defined but not in toolbox: {len(defined - in_toolbox)}")
+    print(f"Defined but missing a generator: {len(defined - generators)}")
+
+
+if __name__ == "__main__":
+    run_main(main)
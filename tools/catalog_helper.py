@@ -7,6 +7,8 @@ import json
 from pathlib import Path
 from typing import Dict
 
+from instrumentation import run_main
+
 class BlockCatalogHelper:
     def __init__(self, assets_path: str = "blockly-workspace/assets"):
         self.assets_path = Path(assets_path)
@@ -23,7 +25,12 @@ class BlockCatalogHelper:
         with open(out_path, "w") as f:
             json.dump(self.catalog, f, indent=2)
 
-if __name__ == "__main__":
+
+def main():
     helper = BlockCatalogHelper()
     # Example usage: helper.add_block("LOGIC", "Comparison", {"id": "eq", "label": "Equals"})
     helper.save_catalog()
+
+
+if __name__ == "__main__":
+    run_main(main)
@@ -1,16 +1,23 @@
+from instrumentation import run_main, stage
 
 path = 'web_ui/src/blocks/bf6portal.ts'
 
-with open(path, 'r', encoding='utf-8') as f:
-    lines = f.readlines()
 
-new_lines = []
-for line in lines:
-    if line.strip() == '// Generator stubs':
-        break
-    new_lines.append(line)
+def main():
+    with stage('read'), open(path, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
 
-with open(path, 'w', encoding='utf-8') as f:
-    f.writelines(new_lines)
+    new_lines = []
+    for line in lines:
+        if line.strip() == '// Generator stubs':
+            break
+        new_lines.append(line)
 
-print(f"Truncated {path} at '// Generator stubs'")
+    with stage('write'), open(path, 'w', encoding='utf-8') as f:
+        f.writelines(new_lines)
+
+    print(f"Truncated {path} at '// Generator stubs'")
+
+
+if __name__ == "__main__":
+    run_main(main)
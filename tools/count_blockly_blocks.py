@@ -1,7 +1,9 @@
-import json
 import re
 import sys
 
+from catalog_engine import TOOLBOX_FILE, collect_toolbox_types, load_catalog
+from instrumentation import run_main
+
 def extract_toolbox_json(ts_content):
     """
     Extracts the JSON-like string for the 'toolbox' constant from TypeScript content.
@@ -23,42 +25,25 @@ def count_unique_block_types(toolbox_data):
     """
     Recursively counts unique block types in a Blockly toolbox JSON structure.
     """
-    unique_block_types = set()
-    
-    def _traverse(node):
-        if isinstance(node, dict):
-            if node.get('kind') == 'block' and 'type' in node:
-                unique_block_types.add(node['type'])
-            for key, value in node.items():
-                _traverse(value)
-        elif isinstance(node, list):
-            for item in node:
-                _traverse(item)
-    
-    _traverse(toolbox_data)
+    unique_block_types = collect_toolbox_types(toolbox_data)
     return len(unique_block_types), list(unique_block_types)
 
-if __name__ == "__main__":
-    toolbox_file_path = "web_ui/src/toolbox.ts"
-    
-    try:
-        with open(toolbox_file_path, 'r', encoding='utf-8') as f:
-            ts_content = f.read()
-        
-        json_string = extract_toolbox_json(ts_content)
-        toolbox_data = json.loads(json_string)
-        
-        count, block_types = count_unique_block_types(toolbox_data)
-        
-        print(f"Total unique Blockly block types found: {count}")
-        # print("Block types:", block_types) # Uncomment for detailed list
-        
-    except FileNotFoundError:
-        print(f"Error: Toolbox file not found at {toolbox_file_path}", file=sys.stderr)
+
+def main():
+    catalog = load_catalog()
+
+    if not catalog.path(TOOLBOX_FILE).exists():
+        print(f"Error: Toolbox file not found at {TOOLBOX_FILE}", file=sys.stderr)
         sys.exit(1)
-    except ValueError as e:
-        print(f"Error parsing toolbox content: {e}", file=sys.stderr)
+    if not catalog.toolbox:
+        print("Error parsing toolbox content: no toolbox object found", file=sys.stderr)
         sys.exit(1)
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}", file=sys.stderr)
-        sys.exit(1)
\ No newline at end of file
+
+    count, block_types = count_unique_block_types(catalog.toolbox)
+
+    print(f"Total unique Blockly block types found: {count}")
+    # print("Block types:", block_types) # Uncomment for detailed list
+
+
+if __name__ == "__main__":
+    run_main(main)
@@ -2,6 +2,8 @@ import zipfile
 import os
 from pathlib import Path
 
+from instrumentation import run_main
+
 def create_release_zip():
     release_name = "BF6Portal_Tool_v1.2.4.zip"
     files_to_include = [
@@ -24,4 +26,4 @@ def create_release_zip():
     print("Release package created successfully!")
 
 if __name__ == "__main__":
-    create_release_zip()
+    run_main(create_release_zip)
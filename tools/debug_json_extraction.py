@@ -1,45 +1,38 @@
+import sys
 
-import re
-import json
+from catalog_engine import iter_block_definitions
+from instrumentation import run_main, stage
 
-file_path = 'web_ui/src/blocks/bf6portal.ts'
 
-with open(file_path, 'r', encoding='utf-8') as f:
-    content = f.read()
+def main():
+    file_path = sys.argv[1] if len(sys.argv) > 1 else 'web_ui/src/blocks/bf6portal.ts'
 
-match = re.search(r'createBlockDefinitionsFromJsonArray\(\s*(\[.*\])\s*\);', content, re.DOTALL)
-if match:
-    json_str = match.group(1)
-    # json_str = re.sub(r'//.*', '', json_str) 
-    # json_str = re.sub(r'/\*.*?\*/', '', json_str, flags=re.DOTALL)
-    json_str = re.sub(r',\s*\]', ']', json_str)
-    json_str = re.sub(r',\s*\}', '}', json_str)
+    with stage('read'), open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
 
+    # Parse incrementally so the last good block is known when the lexer stops.
+    blocks = []
     try:
-        data = json.loads(json_str)
-        print(f"Successfully parsed {len(data)} blocks via JSON.")
-        print(f"First block: {data[0]}")
-    except json.JSONDecodeError as e:
-        print(f"JSON Decode Error: {e}")
-        # print snippet around error
-        start = max(0, e.pos - 50)
-        end = min(len(json_str), e.pos + 50)
-        print(f"Context: {json_str[start:end]}")
+        with stage('parse'):
+            for block in iter_block_definitions(content, file_path):
+                blocks.append(block)
+                if block.get('type') == 'abort':
+                    print("Found abort!")
+        print(f"Successfully parsed {len(blocks)} blocks.")
+        if blocks:
+            print(f"First block: {blocks[0]}")
+    except ValueError as e:
+        # JSLiteralError from the lexer carries a position; a non-object entry does not.
+        print(f"Parse error after {len(blocks)} blocks: {e}")
+        if blocks:
+            print(f"Last good block: {blocks[-1].get('type')}")
+        pos = getattr(e, 'pos', None)
+        if pos is not None:
+            # print snippet around error
+            start = max(0, pos - 50)
+            end = min(len(content), pos + 50)
+            print(f"Context: {content[start:end]}")
 
-        # Try fallback
-        print("Attempting fallback...")
-        blocks = []
-        object_pattern = re.compile(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', re.DOTALL)
-        matches = object_pattern.findall(json_str)
-        print(f"Fallback found {len(matches)} matches.")
-        for i, m in enumerate(matches):
-            try:
-                b = json.loads(m)
-                blocks.append(b)
-                if b.get('type') == 'abort':
-                    print("Found abort in fallback!")
-            except:
-                if i < 3:
-                   print(f"Failed to parse match {i}: {m}")
-else:
-    print("Regex failed to find array.")
+
+if __name__ == "__main__":
+    run_main(main)
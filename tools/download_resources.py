@@ -1,22 +1,283 @@
+"""
+Fetches the portal-docs data files into `=Resources=/portal-docs-json`.
+
+- Downloads run concurrently (one thread per file, `--jobs` to limit).
+- A local manifest records each file's ETag, Last-Modified, size and SHA-256.
+  Later runs send conditional requests and skip files the server reports as
+  unchanged, as long as the local copy still matches its recorded hash.
+- Transfers go to `<name>.part` and are renamed into place only when complete.
+  An interrupted download resumes with a Range request when the server allows it.
+  Network errors, 5xx and 408/429 responses are retried with backoff; other HTTP
+  errors (404, 403, ...) and files missing from a local mirror fail at once.
+- `--base` points at another source: an HTTP(S) URL, a `file://` URL or a local
+  directory laid out like the portal-docs repo (for offline CI mirrors).
+
+Usage:
+    python tools/download_resources.py
+    python tools/download_resources.py --base ./mirror/portal-docs --jobs 2
+    python tools/download_resources.py --verify
+"""
+
+import argparse
+import hashlib
+import http.client
+import json
 import os
+import shutil
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from instrumentation import run_main
 
 resources_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), '=Resources=', 'portal-docs-json')
-os.makedirs(resources_dir, exist_ok=True)
 
+DEFAULT_BASE = "https://raw.githubusercontent.com/battlefield-portal-community/portal-docs/main/"
+MANIFEST_NAME = '.download_manifest.json'
+MANIFEST_VERSION = 1
+CHUNK_SIZE = 1 << 16
+# 4xx responses worth another attempt (416 restarts the transfer without the partial file).
+RETRYABLE_HTTP_CODES = {408, 416, 425, 429}
+
+# Local file name -> path relative to the portal-docs repo root.
 files_to_download = {
-    "enabled_blocks.json": "https://raw.githubusercontent.com/battlefield-portal-community/portal-docs/main/generators/blocks_json/data/enabled_blocks.json",
-    "index.d.ts": "https://raw.githubusercontent.com/battlefield-portal-community/portal-docs/main/generators/santiago/mod/index.d.ts",
-    "Rule.json": "https://raw.githubusercontent.com/battlefield-portal-community/portal-docs/main/generators/blocks_json/docs_json/Rule.json",
-    "Teleport.json": "https://raw.githubusercontent.com/battlefield-portal-community/portal-docs/main/generators/blocks_json/docs_json/Teleport.json",
-    "translations.json": "https://raw.githubusercontent.com/battlefield-portal-community/portal-docs/main/generators/blocks_json/data/translations.json",
-    "clean_names": "https://raw.githubusercontent.com/battlefield-portal-community/portal-docs/main/generators/blocks_json/data/clean_names"
+    "enabled_blocks.json": "generators/blocks_json/data/enabled_blocks.json",
+    "index.d.ts": "generators/santiago/mod/index.d.ts",
+    "Rule.json": "generators/blocks_json/docs_json/Rule.json",
+    "Teleport.json": "generators/blocks_json/docs_json/Teleport.json",
+    "translations.json": "generators/blocks_json/data/translations.json",
+    "clean_names": "generators/blocks_json/data/clean_names"
 }
 
-for filename, url in files_to_download.items():
-    print(f"Downloading {filename}...")
+
+class IncompleteDownload(IOError):
+    def __init__(self, message, etag):
+        super().__init__(message)
+        self.etag = etag
+
+
+def sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def resolve_source(base, rel_path):
+    """Returns ('file', path) for local mirrors and file:// bases, else ('http', url)."""
+    if base.startswith('file://'):
+        parsed = urllib.parse.urlparse(base)
+        return 'file', os.path.join(urllib.request.url2pathname(parsed.path), *rel_path.split('/'))
+    if '://' not in base:
+        return 'file', os.path.join(base, *rel_path.split('/'))
+    return 'http', urllib.parse.urljoin(base if base.endswith('/') else base + '/', rel_path)
+
+
+class Manifest:
+    """Thread-safe { filename: entry } record, saved after every completed file so runs can resume."""
+
+    def __init__(self, path, force=False):
+        self.path = path
+        self.entries = {}
+        self.lock = threading.Lock()
+        if not force:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == MANIFEST_VERSION:
+                    self.entries = data.get('files', {})
+            except (OSError, ValueError):
+                pass
+
+    def get(self, filename):
+        with self.lock:
+            return dict(self.entries.get(filename) or {})
+
+    def update(self, filename, entry):
+        with self.lock:
+            self.entries[filename] = entry
+            tmp = self.path + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'version': MANIFEST_VERSION, 'files': self.entries}, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+
+
+def local_copy_is_intact(dest, entry):
+    return bool(entry.get('sha256')) and os.path.exists(dest) and sha256_file(dest) == entry['sha256']
+
+
+def fetch_local(src, dest, entry):
+    """Copies a file from a local mirror unless the destination already has the same content."""
+    if not os.path.isfile(src):
+        raise FileNotFoundError(src)
+    digest = sha256_file(src)
+    if digest == entry.get('sha256') and local_copy_is_intact(dest, entry):
+        return 'unchanged', entry
+    part = dest + '.part'
+    shutil.copyfile(src, part)
+    os.replace(part, dest)
+    return 'copied', {'source': src, 'sha256': digest, 'size': os.path.getsize(dest)}
+
+
+def fetch_http(url, dest, entry, timeout):
+    """Conditional, resumable download of `url` to `dest`."""
+    headers = {'User-Agent': 'BF6Portal-Tool resource fetcher'}
+    intact = entry.get('url') == url and local_copy_is_intact(dest, entry)
+    if intact:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    part = dest + '.part'
+    offset = os.path.getsize(part) if os.path.exists(part) else 0
+    # Only resume a partial file that belongs to the same remote version.
+    if offset and entry.get('partial_etag'):
+        headers['Range'] = f"bytes={offset}-"
+        headers['If-Range'] = entry['partial_etag']
+    else:
+        offset = 0
+
+    request = urllib.request.Request(url, headers=headers)
     try:
-        urllib.request.urlretrieve(url, os.path.join(resources_dir, filename))
-        print(f"Successfully downloaded {filename}")
-    except Exception as e:
-        print(f"Failed to download {filename}: {e}")
+        response = urllib.request.urlopen(request, timeout=timeout)
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and intact:
+            return 'unchanged', entry
+        if e.code == 416:
+            # The partial file no longer fits the remote one; start over next attempt.
+            os.remove(part)
+        raise
+
+    with response:
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if response.status != 206:
+            offset = 0
+        expected = response.headers.get('Content-Length')
+        expected = int(expected) + offset if expected and expected.isdigit() else None
+        with open(part, 'ab' if offset else 'wb') as f:
+            while True:
+                # A dropped connection or read timeout (socket.timeout is an OSError) leaves a
+                # resumable partial file; write errors below still propagate as they are.
+                try:
+                    chunk = response.read1(CHUNK_SIZE)
+                except (http.client.HTTPException, OSError) as e:
+                    raise IncompleteDownload(f"transfer interrupted: {e!r}", etag) from None
+                if not chunk:
+                    break
+                f.write(chunk)
+
+    size = os.path.getsize(part)
+    if expected is not None and size != expected:
+        # Keep the partial file (and remember which version it is) for the next attempt.
+        raise IncompleteDownload(f"incomplete transfer: {size} of {expected} bytes", etag)
+
+    digest = sha256_file(part)
+    os.replace(part, dest)
+    return ('resumed' if offset else 'downloaded'), {
+        'url': url,
+        'etag': etag,
+        'last_modified': last_modified,
+        'sha256': digest,
+        'size': size,
+    }
+
+
+def is_retryable(error):
+    if isinstance(error, FileNotFoundError):
+        return False
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code >= 500 or error.code in RETRYABLE_HTTP_CODES
+    return True
+
+
+def fetch_one(filename, rel_path, base, dest_dir, manifest, retries, timeout):
+    dest = os.path.join(dest_dir, filename)
+    kind, source = resolve_source(base, rel_path)
+    entry = manifest.get(filename)
+    delay = 1.0
+    for attempt in range(retries + 1):
+        try:
+            if kind == 'file':
+                status, new_entry = fetch_local(source, dest, entry)
+            else:
+                status, new_entry = fetch_http(source, dest, entry, timeout)
+            if status != 'unchanged':
+                manifest.update(filename, new_entry)
+            return filename, status, None
+        except (OSError, urllib.error.URLError) as e:
+            if isinstance(e, IncompleteDownload) and e.etag:
+                # Remember the version of the partial file so this or a later run can resume it.
+                entry = dict(entry, partial_etag=e.etag)
+                manifest.update(filename, entry)
+            if attempt == retries or not is_retryable(e):
+                return filename, 'failed', e
+            time.sleep(delay)
+            delay *= 2
+    return filename, 'failed', None
+
+
+def verify(dest_dir, manifest):
+    """Checks local files against the manifest hashes. Returns the number of problems."""
+    problems = 0
+    for filename in files_to_download:
+        entry = manifest.get(filename)
+        dest = os.path.join(dest_dir, filename)
+        if not entry:
+            print(f"{filename}: not in manifest")
+            problems += 1
+        elif not os.path.exists(dest):
+            print(f"{filename}: missing")
+            problems += 1
+        elif sha256_file(dest) != entry.get('sha256'):
+            print(f"{filename}: hash mismatch")
+            problems += 1
+        else:
+            print(f"{filename}: ok ({entry.get('size', 0)} bytes)")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download portal-docs data files into =Resources=/portal-docs-json.")
+    parser.add_argument('--base', default=os.environ.get('PORTAL_DOCS_BASE', DEFAULT_BASE),
+                        help="portal-docs root: URL, file:// URL or local directory (default: GitHub raw; env PORTAL_DOCS_BASE)")
+    parser.add_argument('--dest', default=resources_dir, help="output directory")
+    parser.add_argument('--jobs', '-j', type=int, default=len(files_to_download), help="concurrent downloads")
+    parser.add_argument('--retries', type=int, default=3, help="retries per file (default: 3)")
+    parser.add_argument('--timeout', type=float, default=30, help="per-request timeout in seconds")
+    parser.add_argument('--force', action='store_true', help="ignore the manifest and fetch everything")
+    parser.add_argument('--verify', action='store_true', help="only check local files against the manifest")
+    args = parser.parse_args()
+
+    os.makedirs(args.dest, exist_ok=True)
+    manifest = Manifest(os.path.join(args.dest, MANIFEST_NAME), force=args.force and not args.verify)
+
+    if args.verify:
+        sys.exit(1 if verify(args.dest, manifest) else 0)
+
+    start = time.perf_counter()
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        futures = [pool.submit(fetch_one, filename, rel_path, args.base, args.dest, manifest, args.retries, args.timeout)
+                   for filename, rel_path in files_to_download.items()]
+        for future in futures:
+            filename, status, error = future.result()
+            if error is not None:
+                failed += 1
+                print(f"Failed to download {filename}: {error}")
+            else:
+                print(f"{filename}: {status}")
+
+    print(f"Done in {time.perf_counter() - start:.2f}s ({len(files_to_download) - failed} ok, {failed} failed).")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_main(main)
@@ -0,0 +1,492 @@
+"""
+Typed model of the Portal API declarations (`=Resources=/portal-docs-json/index.d.ts`).
+
+One declaration parser replaces the per-tool regexes. It handles what those
+regexes missed: multi-line signatures, generics, optional and rest parameters,
+union/intersection/function types, overloads, enums with initializers,
+nested namespaces and JSDoc comments.
+
+    model = load_api_model()
+    model.overloads('mod.Add')          # [Signature(...), Signature(...)]
+    model.overloads('Add')              # the same: bare names resolve to the first namespace declaring them
+    model.enum('Maps').member_names     # ['Abbasid', ...]
+    split_union('mod.Player | number')  # ['mod.Player', 'number']
+
+Functions, enums and type aliases are keyed by qualified name (`mod.Add`), so
+`mod.inner.Add` is not mistaken for an overload of `mod.Add`.
+
+`load_api_model()` keeps the parsed model in a pickle next to the typings,
+keyed by the file's SHA-256 and the model format version. Every generator
+reuses it without re-scanning the file until index.d.ts changes.
+"""
+
+import hashlib
+import os
+import pickle
+import re
+import sys
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from instrumentation import count, run_main, stage
+
+resources_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), '=Resources=', 'portal-docs-json')
+INDEX_D_TS = os.path.join(resources_dir, 'index.d.ts')
+CACHE_SUFFIX = '.model.pickle'
+# Bump when the model classes or parser output change so old caches are ignored.
+MODEL_VERSION = 4
+
+TOKEN_RE = re.compile(r'''
+    (?P<ws>\s+)
+  | (?P<doc>/\*\*.*?\*/)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'|`(?:[^`\\]|\\.)*`)
+  | (?P<number>-?(?:0[xX][0-9a-fA-F]+|\d+(?:\.\d+)?(?:[eE][+-]?\d+)?))
+  | (?P<ident>[A-Za-z_$][\w$]*)
+  | (?P<punct>=>|\.\.\.|[{}()\[\]<>;:,|&=?.*!+\-/%^~@#])
+''', re.VERBOSE | re.DOTALL)
+
+MODIFIERS = {'export', 'declare', 'default', 'abstract', 'readonly', 'public', 'private', 'protected', 'static', 'async'}
+OPENERS = {'(': ')', '[': ']', '{': '}', '<': '>'}
+CLOSERS = {')', ']', '}', '>'}
+
+# '[' only hugs what it indexes ('mod.Vector[]'), not a tuple after an operator ('A | [B, C]').
+_SPACE_BEFORE_RE = re.compile(r' (?=[,;:)\]}<>.?!])|(?<=[\w$\])>]) (?=\[)')
+_SPACE_AFTER_RE = re.compile(r'(?<=[(\[{<.]) ')
+
+
+def _qualified(namespace, name):
+    return f"{namespace}.{name}" if namespace else name
+
+
+class Param(NamedTuple):
+    name: str
+    type: str
+    optional: bool = False
+    rest: bool = False
+
+
+class Signature(NamedTuple):
+    name: str
+    namespace: str
+    params: Tuple[Param, ...]
+    return_type: str
+    type_params: Tuple[str, ...] = ()
+    doc: str = ''
+    line: int = 0
+
+    @property
+    def qualified_name(self):
+        return _qualified(self.namespace, self.name)
+
+
+class EnumDecl(NamedTuple):
+    name: str
+    namespace: str
+    members: Tuple[Tuple[str, Optional[object]], ...]  # (name, initializer or None)
+    doc: str = ''
+    line: int = 0
+
+    @property
+    def member_names(self):
+        return [m[0] for m in self.members]
+
+
+class TypeAlias(NamedTuple):
+    name: str
+    namespace: str
+    type: str
+    type_params: Tuple[str, ...] = ()
+    doc: str = ''
+    line: int = 0
+
+
+class ApiModel(NamedTuple):
+    functions: Dict[str, List[Signature]]   # qualified name -> overloads, in source order
+    enums: Dict[str, EnumDecl]              # qualified name -> enum
+    type_aliases: Dict[str, TypeAlias]      # qualified name -> alias
+    interfaces: Dict[str, str]              # name -> namespace (declarations with bodies; members not modelled)
+    namespaces: List[str]                   # dotted names, in source order
+    sha256: str = ''
+
+    def overloads(self, name) -> List[Signature]:
+        """Overloads of a qualified name, or of a bare name in the first namespace that declares it."""
+        if name in self.functions:
+            return self.functions[name]
+        return next((sigs for sigs in self.functions.values() if sigs[0].name == name), [])
+
+    def enum(self, name) -> Optional[EnumDecl]:
+        """Enum by qualified name, or by bare name in the first namespace that declares it."""
+        if name in self.enums:
+            return self.enums[name]
+        return next((e for e in self.enums.values() if e.name == name), None)
+
+    def signatures(self):
+        """All signatures in source order."""
+        out = [sig for sigs in self.functions.values() for sig in sigs]
+        out.sort(key=lambda s: s.line)
+        return out
+
+
+def split_union(type_str, sep='|'):
+    """Splits a type on top-level `sep` ('|' or '&'): 'A | Array<B | C>' -> ['A', 'Array<B | C>']."""
+    parts = []
+    depth = 0
+    start = 0
+    i = 0
+    n = len(type_str)
+    while i < n:
+        ch = type_str[i]
+        if ch in '([{<':
+            depth += 1
+        elif ch in ')]}' or (ch == '>' and type_str[i - 1:i] != '='):
+            depth -= 1
+        elif ch in '"\'`':
+            end = type_str.find(ch, i + 1)
+            i = n if end == -1 else end
+        elif ch == sep and depth == 0:
+            parts.append(type_str[start:i].strip())
+            start = i + 1
+        i += 1
+    parts.append(type_str[start:].strip())
+    return [p for p in parts if p]
+
+
+def _join_type(tokens):
+    text = ' '.join(tokens)
+    text = _SPACE_BEFORE_RE.sub('', text)
+    text = _SPACE_AFTER_RE.sub('', text)
+    return text.replace(': ', ':').replace(':', ': ').replace('? :', '?:')
+
+
+def _clean_doc(raw):
+    body = raw[3:-2]
+    lines = [re.sub(r'^\s*\*\s?', '', line).rstrip() for line in body.splitlines()]
+    return '\n'.join(lines).strip()
+
+
+class _Parser:
+    def __init__(self, text):
+        self.tokens = []   # (kind, value, line)
+        self.docs = {}     # token index -> doc text preceding it
+        pending_doc = None
+        line = 1
+        for m in TOKEN_RE.finditer(text):
+            kind = m.lastgroup
+            if kind == 'ws' or kind == 'comment':
+                line += m.group().count('\n')
+                continue
+            if kind == 'doc':
+                pending_doc = _clean_doc(m.group())
+                line += m.group().count('\n')
+                continue
+            if pending_doc is not None:
+                self.docs[len(self.tokens)] = pending_doc
+                pending_doc = None
+            self.tokens.append((kind, m.group(), line))
+            if kind == 'string':
+                line += m.group().count('\n')
+        self.i = 0
+        self.functions = defaultdict(list)
+        self.enums = {}
+        self.type_aliases = {}
+        self.interfaces = {}
+        self.namespaces = []
+
+    # --- Token helpers ---
+
+    def peek(self, offset=0):
+        j = self.i + offset
+        return self.tokens[j][1] if j < len(self.tokens) else None
+
+    def peek_kind(self, offset=0):
+        j = self.i + offset
+        return self.tokens[j][0] if j < len(self.tokens) else None
+
+    def next(self):
+        tok = self.tokens[self.i][1] if self.i < len(self.tokens) else None
+        self.i += 1
+        return tok
+
+    def accept(self, value):
+        if self.peek() == value:
+            self.i += 1
+            return True
+        return False
+
+    def line_at(self, index):
+        return self.tokens[index][2] if index < len(self.tokens) else 0
+
+    def skip_balanced(self):
+        """Skips one bracketed group starting at the current opener."""
+        depth = 0
+        while self.i < len(self.tokens):
+            tok = self.next()
+            if tok in ('{', '(', '['):
+                depth += 1
+            elif tok in ('}', ')', ']'):
+                depth -= 1
+                if depth <= 0:
+                    return
+
+    def skip_statement(self):
+        """Skips to the end of the current statement (';' or a balanced '{...}' at depth 0)."""
+        while self.i < len(self.tokens):
+            tok = self.peek()
+            if tok == ';':
+                self.i += 1
+                return
+            if tok == '}':
+                return
+            if tok in ('{', '(', '['):
+                self.skip_balanced()
+                if tok == '{':
+                    return
+                continue
+            self.i += 1
+
+    def read_type(self, stops):
+        """Collects a type expression up to a depth-0 token in `stops`; returns its normalized text."""
+        out = []
+        stack = []
+        while self.i < len(self.tokens):
+            tok = self.peek()
+            if not stack and tok in stops:
+                break
+            if tok in OPENERS:
+                stack.append(OPENERS[tok])
+            elif tok in CLOSERS:
+                if not stack:
+                    break
+                if tok == stack[-1]:
+                    stack.pop()
+            out.append(tok)
+            self.i += 1
+        return _join_type(out)
+
+    def read_type_params(self):
+        if not self.accept('<'):
+            return ()
+        params = []
+        while self.i < len(self.tokens) and not self.accept('>'):
+            params.append(self.read_type({',', '>'}))
+            self.accept(',')
+        return tuple(p for p in params if p)
+
+    # --- Declarations ---
+
+    def parse(self):
+        self.parse_block('')
+        return ApiModel(dict(self.functions), self.enums, self.type_aliases, self.interfaces, self.namespaces)
+
+    def parse_block(self, namespace):
+        while self.i < len(self.tokens):
+            tok = self.peek()
+            if tok == '}':
+                self.i += 1
+                return
+            start = self.i
+            doc = self.docs.get(start, '')
+            while self.peek() in MODIFIERS:
+                self.i += 1
+                doc = doc or self.docs.get(self.i, '')
+            tok = self.peek()
+
+            if tok in ('namespace', 'module') and self.peek_kind(1) in ('ident', 'string'):
+                self.i += 1
+                name = self.next().strip('\'"')
+                while self.accept('.'):
+                    name += '.' + self.next()
+                full = _qualified(namespace, name)
+                if self.accept('{'):
+                    if full not in self.namespaces:
+                        self.namespaces.append(full)
+                    self.parse_block(full)
+                else:
+                    self.skip_statement()
+            elif tok == 'global' and self.peek(1) == '{':
+                self.i += 2
+                self.parse_block(namespace)
+            elif tok == 'function':
+                self.parse_function(namespace, doc, start)
+            elif tok == 'enum' or (tok == 'const' and self.peek(1) == 'enum'):
+                self.accept('const')
+                self.parse_enum(namespace, doc, start)
+            elif tok == 'type' and self.peek_kind(1) == 'ident':
+                self.i += 1
+                name = self.next()
+                type_params = self.read_type_params()
+                if self.accept('='):
+                    self.type_aliases[_qualified(namespace, name)] = TypeAlias(name, namespace, self.read_type({';', '}'}), type_params, doc, self.line_at(start))
+                self.accept(';')
+            elif tok in ('interface', 'class'):
+                self.i += 1
+                self.interfaces[self.next()] = namespace
+                while self.i < len(self.tokens) and self.peek() not in ('{', ';'):
+                    self.i += 1
+                if self.peek() == '{':
+                    self.skip_balanced()
+                else:
+                    self.accept(';')
+            else:
+                self.skip_statement()
+                if self.i == start:
+                    self.i += 1
+
+    def parse_function(self, namespace, doc, start):
+        self.i += 1  # 'function'
+        name = self.next()
+        type_params = self.read_type_params()
+        params = []
+        if self.accept('('):
+            while self.i < len(self.tokens) and not self.accept(')'):
+                params.append(self.parse_param(len(params)))
+                self.accept(',')
+        return_type = self.read_type({';', '{', '}'}) if self.accept(':') else 'void'
+        if self.peek() == '{':
+            self.skip_balanced()
+        else:
+            self.accept(';')
+        self.functions[_qualified(namespace, name)].append(Signature(name, namespace, tuple(params), return_type or 'void',
+                                              type_params, doc, self.line_at(start)))
+
+    def parse_param(self, index):
+        while self.peek() in MODIFIERS:
+            self.i += 1
+        rest = self.accept('...')
+        if self.peek() in ('{', '['):
+            # Destructured parameter: keep its text as the name.
+            begin = self.i
+            self.skip_balanced()
+            name = _join_type([t[1] for t in self.tokens[begin:self.i]]) or f"arg{index}"
+        else:
+            name = self.next()
+        optional = self.accept('?')
+        type_str = self.read_type({',', ')', '='}) if self.accept(':') else 'any'
+        if self.accept('='):
+            optional = True
+            self.read_type({',', ')'})
+        return Param(name, type_str, optional, rest)
+
+    def parse_enum(self, namespace, doc, start):
+        self.i += 1  # 'enum'
+        name = self.next()
+        members = []
+        if self.accept('{'):
+            while self.i < len(self.tokens) and not self.accept('}'):
+                member = self.next().strip('\'"')
+                value = None
+                if self.accept('='):
+                    raw = self.read_type({',', '}'})
+                    value = _enum_value(raw)
+                members.append((member, value))
+                self.accept(',')
+        self.enums[_qualified(namespace, name)] = EnumDecl(name, namespace, tuple(members), doc, self.line_at(start))
+
+
+def _enum_value(raw):
+    if len(raw) >= 2 and raw[0] == raw[-1] and raw[0] in '"\'`':
+        return raw[1:-1]
+    try:
+        return int(raw, 0)
+    except ValueError:
+        try:
+            return float(raw)
+        except ValueError:
+            return raw
+
+
+def parse_declarations(text) -> ApiModel:
+    """Parses TypeScript declaration source into an ApiModel."""
+    return _Parser(text).parse()
+
+
+_MODELS = {}
+
+
+def _model_to_plain(model):
+    """The model as dicts, lists and tuples, so the pickle does not depend on the module that wrote it."""
+    return {
+        'functions': {name: [(*sig[:2], tuple(map(tuple, sig.params)), *sig[3:]) for sig in sigs]
+                      for name, sigs in model.functions.items()},
+        'enums': {name: tuple(e) for name, e in model.enums.items()},
+        'type_aliases': {name: tuple(a) for name, a in model.type_aliases.items()},
+        'interfaces': dict(model.interfaces),
+        'namespaces': list(model.namespaces),
+        'sha256': model.sha256,
+    }
+
+
+def _model_from_plain(data):
+    return ApiModel(
+        {name: [Signature(*sig[:2], tuple(Param(*p) for p in sig[2]), *sig[3:]) for sig in sigs]
+         for name, sigs in data['functions'].items()},
+        {name: EnumDecl(*e) for name, e in data['enums'].items()},
+        {name: TypeAlias(*a) for name, a in data['type_aliases'].items()},
+        data['interfaces'],
+        data['namespaces'],
+        data['sha256'],
+    )
+
+
+def load_api_model(path=INDEX_D_TS, use_cache=True) -> Optional[ApiModel]:
+    """
+    Returns the ApiModel for `path`, or None if the file does not exist.
+    Parsed models are pickled to `<path>.model.pickle` (as plain data, so a cache
+    written by running this file as a script loads in every tool) and reused while
+    the file's SHA-256 (and MODEL_VERSION) match.
+    """
+    try:
+        with stage('read'), open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        print(f"File not found: {path}", file=sys.stderr)
+        return None
+    digest = hashlib.sha256(data).hexdigest()
+
+    key = (os.path.abspath(path), digest)
+    if key in _MODELS:
+        return _MODELS[key]
+
+    cache_path = path + CACHE_SUFFIX
+    model = None
+    if use_cache:
+        try:
+            with stage('read'), open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('version') == MODEL_VERSION and cached.get('sha256') == digest:
+                model = _model_from_plain(cached['model'])
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, KeyError, TypeError):
+            model = None
+
+    if model is None:
+        with stage('parse'):
+            model = parse_declarations(data.decode('utf-8'))._replace(sha256=digest)
+        count('functions_parsed', len(model.functions))
+        count('enums_parsed', len(model.enums))
+        if use_cache:
+            try:
+                tmp = cache_path + '.tmp'
+                with stage('write'), open(tmp, 'wb') as f:
+                    pickle.dump({'version': MODEL_VERSION, 'sha256': digest, 'model': _model_to_plain(model)}, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, cache_path)
+            except OSError as e:
+                print(f"Warning: could not write {cache_path}: {e}", file=sys.stderr)
+
+    _MODELS[key] = model
+    return model
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else INDEX_D_TS
+    model = load_api_model(path)
+    if model is None:
+        sys.exit(1)
+    overloaded = {name: sigs for name, sigs in model.functions.items() if len(sigs) > 1}
+    print(f"Namespaces: {', '.join(model.namespaces) or '(none)'}")
+    print(f"Functions: {len(model.functions)} ({sum(len(s) for s in model.functions.values())} signatures, {len(overloaded)} overloaded)")
+    print(f"Enums: {len(model.enums)}  Type aliases: {len(model.type_aliases)}  Interfaces/classes: {len(model.interfaces)}")
+
+
+if __name__ == "__main__":
+    run_main(main)
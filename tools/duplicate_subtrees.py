@@ -0,0 +1,390 @@
+"""
+Repeated block subtrees in Portal mod exports, found by structural hashing.
+
+Every subtree (a block plus everything plugged into its inputs, without its
+`next`) gets a structure id in one bottom-up pass (structural_hash.py), so
+block ids and x/y do not matter. Subtrees that occur more than once are ranked
+by size x count. A repeat that only ever occurs inside the same larger repeat
+is folded into it (use --all to list it anyway).
+
+With --rewrite, repeated statement subtrees (largest savings first) are moved
+into one definition each and every occurrence becomes a call:
+
+    collections   BF6_COLLECTION_DEF / BF6_COLLECTION_CALL (web_ui/src/blocks/collections.ts).
+                  Shrinks the saved workspace; Export for Portal inlines them again.
+    subroutines   subroutineBlock / subroutineInstanceBlock. Shrinks the Portal export
+                  itself. Subtrees that depend on where they run (event payloads,
+                  subroutine arguments, loop and rule control) are left in place.
+
+The rewrite is checked by expanding the calls again (portal_export.py) and
+comparing structure ids with the original mod. Sizes are measured on the
+JSON.stringify(..., null, 2) text the UI writes.
+
+Usage:
+    python tools/duplicate_subtrees.py "=Resources=/Portal Blocks/custom_conquest_template_V8.0.json"
+    python tools/duplicate_subtrees.py mod.json --top 40 --min-size 3 --json
+    python tools/duplicate_subtrees.py mod.json --rewrite subroutines --out mod.dedup.json
+"""
+
+import argparse
+import json
+import re
+import sys
+from collections import defaultdict
+from typing import Dict, List, NamedTuple
+
+from catalog_engine import load_catalog, portal_type_of
+from instrumentation import count, run_main, stage
+from portal_export import _clone_json, dumps_js, expand_collections
+from portal_tree import COLLECTION_CALL_TYPE, COLLECTION_DEF_TYPE, block_label, owner_of, top_level_blocks, walk
+from structural_hash import HashedBlock, StructureTable
+
+STRUCTURAL_TYPES = {'modBlock', 'ruleBlock', 'conditionBlock', 'subroutineBlock', COLLECTION_DEF_TYPE, COLLECTION_CALL_TYPE}
+# Blocks whose meaning depends on the rule, loop or subroutine they run in.
+CONTEXT_DEPENDENT_RE = re.compile(
+    r'^(?:Event\w*|subroutineArgumentBlock|LoopVariable|Break|Continue|Abort|AbortIf|Return|Skip|SkipIf|SkipMandown)$')
+REWRITE_MODES = ('collections', 'subroutines')
+NAME_PREFIX = 'Shared'
+DEFINITION_SPACING = 200
+
+
+class Repeat(NamedTuple):
+    node: int
+    size: int
+    occurrences: List[HashedBlock]
+    folded: bool  # every occurrence sits inside the same larger repeat
+
+    @property
+    def count(self):
+        return len(self.occurrences)
+
+    @property
+    def score(self):
+        return self.size * self.count
+
+
+def _without_next(block):
+    return {k: v for k, v in block.items() if k != 'next'}
+
+
+def subtree_bytes(block) -> int:
+    """Compact JSON size of one occurrence (the block and its inputs, ids included)."""
+    return len(json.dumps(_without_next(block), separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+
+
+def container(visit):
+    """The visit whose input holds `visit`'s statement chain (None for a top-level chain)."""
+    while visit.slot == 'next':
+        visit = visit.parent
+    return visit.parent
+
+
+def hash_roots(roots, table=None) -> List[HashedBlock]:
+    table = table if table is not None else StructureTable()
+    hashed = []
+    with stage('transform'):
+        for root in roots:
+            if isinstance(root, dict):
+                hashed.extend(table.hash_tree(root))
+    count('blocks_hashed', len(hashed))
+    return hashed
+
+
+def find_repeats(hashed: List[HashedBlock], min_size=1, min_count=2) -> List[Repeat]:
+    """Repeated subtrees, highest size x count first."""
+    by_node: Dict[int, List[HashedBlock]] = defaultdict(list)
+    for h in hashed:
+        by_node[h.node].append(h)
+    by_block = {id(h.visit.block): h for h in hashed}
+
+    repeats = []
+    for node, occurrences in by_node.items():
+        if len(occurrences) < min_count or occurrences[0].size < min_size:
+            continue
+        outer = set()
+        for h in occurrences:
+            parent = container(h.visit)
+            outer.add(by_block[id(parent.block)].node if parent else 0)
+        (outer_node,) = outer if len(outer) == 1 else (0,)
+        folded = bool(outer_node) and len(by_node[outer_node]) == len(occurrences)
+        repeats.append(Repeat(node, occurrences[0].size, occurrences, folded))
+    repeats.sort(key=lambda r: (-r.score, -r.size, r.node))
+    return repeats
+
+
+def statement_types(catalog=None):
+    """Portal types the blocks DB lists as statements (previous/next connections)."""
+    catalog = catalog or load_catalog()
+    return {portal_type_of(e) for e in catalog.block_db if e.get('connections') == 'Statement'}
+
+
+def describe(block, limit=60) -> str:
+    """Short label such as `FindUIWidgetWithName(Text "Timer")`."""
+    parts = []
+    for visit in walk(_without_next(block)):
+        fields = visit.block.get('fields') or {}
+        values = [v for v in fields.values() if isinstance(v, (str, int, float))]
+        parts.append(visit.block.get('type', '?') + (' ' + json.dumps(values[0]) if values else ''))
+        if sum(map(len, parts)) > limit:
+            break
+    text = parts[0] + (f"({', '.join(parts[1:])})" if len(parts) > 1 else '')
+    return text if len(text) <= limit else text[:limit - 3] + '...'
+
+
+def where(h: HashedBlock) -> str:
+    owner = owner_of(h.visit)
+    return block_label(owner.block) if owner else '<top-level>'
+
+
+# --- Rewriting ---
+
+def _is_statement(h: HashedBlock, stmt_types):
+    block = h.visit.block
+    return (block.get('type') in stmt_types or h.visit.slot == 'next' or 'next' in block) \
+        and block.get('type') not in STRUCTURAL_TYPES
+
+
+def _context_free(block):
+    return not any(CONTEXT_DEPENDENT_RE.match(str(v.block.get('type', ''))) for v in walk(_without_next(block), shadows=True))
+
+
+class _Rewriter:
+    """Replaces occurrences with calls and collects the new definitions."""
+
+    def __init__(self, roots, mode):
+        self.mode = mode
+        self.replaced = set()  # id() of blocks turned into calls
+        self.dirty = set()     # id() of blocks whose inputs now hold a call
+        self.ids = set()
+        self.names = set()
+        for root in roots:
+            if not isinstance(root, dict):
+                continue
+            fields = root.get('fields') or {}
+            self.names.update(str(fields.get(k, '')).lower() for k in ('NAME', 'SUBROUTINE_NAME'))
+            self.ids.update(v.block.get('id') for v in walk(root, shadows=True))
+        self.serial = 0
+        self.definitions = []
+
+    def new_id(self, stem):
+        n = 0
+        while f"{stem}_{n}" in self.ids:
+            n += 1
+        self.ids.add(f"{stem}_{n}")
+        return f"{stem}_{n}"
+
+    def new_name(self):
+        while True:
+            self.serial += 1
+            name = f"{NAME_PREFIX}{self.serial}"
+            if name.lower() not in self.names:
+                self.names.add(name.lower())
+                return name
+
+    def call(self, name):
+        if self.mode == 'subroutines':
+            return {'type': 'subroutineInstanceBlock', 'id': self.new_id('call'),
+                    'extraState': {'subroutineName': name, 'parameters': []},
+                    'fields': {'SUBROUTINE_NAME': name}}
+        return {'type': COLLECTION_CALL_TYPE, 'id': self.new_id('call'), 'fields': {'NAME': name}}
+
+    def definition(self, name, body):
+        if self.mode == 'subroutines':
+            return {'type': 'subroutineBlock', 'id': self.new_id('subroutine'), 'x': 0, 'y': 0,
+                    'extraState': {'subroutineName': name, 'parameters': []},
+                    'fields': {'SUBROUTINE_NAME': name}, 'inputs': {'ACTIONS': {'block': body}}}
+        return {'type': COLLECTION_DEF_TYPE, 'id': self.new_id('collection'), 'x': 0, 'y': 0,
+                'fields': {'NAME': name}, 'inputs': {'STACK': {'block': body}}}
+
+    def available(self, h: HashedBlock):
+        """False if the occurrence already holds a call or sits inside a replaced block."""
+        if id(h.visit.block) in self.dirty:
+            return False
+        visit = h.visit
+        while visit.parent is not None:
+            if visit.slot != 'next' and id(visit.parent.block) in self.replaced:
+                return False
+            visit = visit.parent
+        return True
+
+    def replace(self, occurrences: List[HashedBlock]):
+        name = self.new_name()
+        body = _without_next(occurrences[0].visit.block)
+        for h in occurrences:
+            # Calls take over the block objects in place, so parents keep pointing at them.
+            block = h.visit.block
+            nxt = block.get('next')
+            block.clear()
+            block.update(self.call(name))
+            if nxt is not None:
+                block['next'] = nxt
+            self.replaced.add(id(block))
+            visit = h.visit
+            while visit.parent is not None:
+                if visit.slot != 'next':
+                    self.dirty.add(id(visit.parent.block))
+                visit = visit.parent
+        self.definitions.append(self.definition(name, body))
+        return name
+
+
+def rewrite_repeats(state, repeats: List[Repeat], stmt_types, mode='collections', min_size=2):
+    """
+    Replaces repeated statement subtrees in `state` (in place) with calls to one shared
+    definition each, appended to the top-level blocks. Returns [(name, Repeat, occurrences replaced)].
+    """
+    roots, _ = top_level_blocks(state)
+    rewriter = _Rewriter(roots, mode)
+    done = []
+    for repeat in repeats:
+        if repeat.size < min_size or not _is_statement(repeat.occurrences[0], stmt_types):
+            continue
+        if mode == 'subroutines' and not _context_free(repeat.occurrences[0].visit.block):
+            continue
+        occurrences = [h for h in repeat.occurrences if rewriter.available(h)]
+        if len(occurrences) < 2:
+            continue
+        done.append((rewriter.replace(occurrences), repeat, len(occurrences)))
+
+    y = max((r['y'] for r in roots if isinstance(r, dict) and isinstance(r.get('y'), (int, float))), default=0)
+    for i, definition in enumerate(rewriter.definitions):
+        definition['y'] = y + DEFINITION_SPACING * (i + 1)
+    roots.extend(rewriter.definitions)
+    return done
+
+
+def _inline_subroutines(state, names):
+    """Copy of a subroutine rewrite with the new subroutines as collections, for expand_collections."""
+    copy = _clone_json(state)
+    roots, _ = top_level_blocks(copy)
+    for root in roots:
+        for visit in walk(root):
+            block = visit.block
+            name = (block.get('fields') or {}).get('SUBROUTINE_NAME')
+            if name not in names:
+                continue
+            if block.get('type') == 'subroutineInstanceBlock':
+                block['type'] = COLLECTION_CALL_TYPE
+                block['fields'] = {'NAME': name}
+                block.pop('extraState', None)
+            elif block.get('type') == 'subroutineBlock' and visit.parent is None:
+                block['type'] = COLLECTION_DEF_TYPE
+                block['fields'] = {'NAME': name}
+                block['inputs'] = {'STACK': block['inputs']['ACTIONS']}
+                block.pop('extraState', None)
+    return copy
+
+
+def verify_rewrite(original_chains: List[int], rewritten, names, mode, table):
+    """True if expanding the new calls gives back the original top-level structures."""
+    expanded = expand_collections(_inline_subroutines(rewritten, names) if mode == 'subroutines' else _clone_json(rewritten))
+    roots, _ = top_level_blocks(expanded)
+    chains = [table.hash_tree(r)[0].chain for r in roots if isinstance(r, dict)]
+    return chains == original_chains
+
+
+# --- Reporting ---
+
+def report_repeats(repeats: List[Repeat], total_blocks, distinct, top, show_folded=False):
+    shown = [r for r in repeats if show_folded or not r.folded]
+    rows = []
+    for r in shown[:top]:
+        first = r.occurrences[0]
+        rows.append({
+            'node': r.node,
+            'count': r.count,
+            'size': r.size,
+            'score': r.score,
+            'bytes_each': subtree_bytes(first.visit.block),
+            'type': first.visit.block.get('type'),
+            'sample': describe(first.visit.block),
+            'first_in': where(first),
+            'folded': r.folded,
+        })
+    return {
+        'total_blocks': total_blocks,
+        'distinct_subtrees': distinct,
+        'repeated_subtrees': len(repeats),
+        'listed': len(shown),
+        'top': rows,
+    }
+
+
+def print_report(path, report):
+    print(f"== {path}")
+    print(f"Blocks: {report['total_blocks']}, distinct subtrees: {report['distinct_subtrees']}, "
+          f"repeated: {report['repeated_subtrees']} ({report['listed']} listed)")
+    print(f"  {'count':>6} {'size':>5} {'score':>7} {'bytes':>7}  subtree  [first occurrence]")
+    for row in report['top']:
+        print(f"  {row['count']:6d} {row['size']:5d} {row['score']:7d} {row['bytes_each']:7d}  "
+              f"{row['sample']}  [{row['first_in']}]" + ('  (folded)' if row['folded'] else ''))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find repeated block subtrees in Portal mod exports.")
+    parser.add_argument('file', help="Portal mod export or saved workspace JSON")
+    parser.add_argument('--top', type=int, default=20, help="repeats to list (default: 20)")
+    parser.add_argument('--min-size', type=int, default=2, help="smallest subtree (in blocks) to list or rewrite (default: 2)")
+    parser.add_argument('--all', action='store_true', help="also list repeats that only occur inside a larger repeat")
+    parser.add_argument('--json', action='store_true', help="print a JSON report")
+    parser.add_argument('--rewrite', choices=REWRITE_MODES, help="move repeated statements into shared collections or subroutines")
+    parser.add_argument('--out', help="where to write the rewritten mod (default: report only)")
+    args = parser.parse_args()
+
+    try:
+        with stage('read'), open(args.file, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Cannot read {args.file}: {e}")
+        sys.exit(1)
+    roots, _ = top_level_blocks(state)
+    if roots is None:
+        print(f"{args.file}: not a Portal mod or workspace JSON")
+        sys.exit(1)
+
+    table = StructureTable()
+    hashed = hash_roots(roots, table)
+    repeats = find_repeats(hashed, min_size=args.min_size)
+    report = report_repeats(repeats, len(hashed), len(table), args.top, args.all)
+
+    if args.rewrite:
+        original_chains = [h.chain for h in hashed if h.visit.parent is None]
+        before = len(dumps_js(state).encode('utf-8'))
+        with stage('transform'):
+            done = rewrite_repeats(state, repeats, statement_types(), args.rewrite, args.min_size)
+        after = len(dumps_js(state).encode('utf-8'))
+        names = {name for name, _, _ in done}
+        verified = verify_rewrite(original_chains, state, names, args.rewrite, table)
+        report['rewrite'] = {
+            'mode': args.rewrite,
+            'definitions': [{'name': name, 'node': r.node, 'size': r.size, 'replaced': n} for name, r, n in done],
+            'bytes_before': before,
+            'bytes_after': after,
+            'bytes_saved': before - after,
+            'verified': verified,
+        }
+        # Like portal_minify, never leave a rewrite that failed verification on disk.
+        if args.out and verified:
+            with stage('write'), open(args.out, 'w', encoding='utf-8') as f:
+                f.write(dumps_js(state))
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(args.file, report)
+        rewrite = report.get('rewrite')
+        if rewrite:
+            saved = rewrite['bytes_saved']
+            print(f"\nRewrote {sum(d['replaced'] for d in rewrite['definitions'])} occurrences into "
+                  f"{len(rewrite['definitions'])} {args.rewrite}: {rewrite['bytes_before']:,} -> {rewrite['bytes_after']:,} bytes "
+                  f"({saved:,} saved, {saved / rewrite['bytes_before'] * 100:.1f}%)"
+                  + ('' if rewrite['verified'] else '  VERIFY FAILED'))
+            if args.out:
+                print(f"Wrote {args.out}" if rewrite['verified'] else f"Not writing {args.out}")
+    if args.rewrite and not report['rewrite']['verified']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_main(main)
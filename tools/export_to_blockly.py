@@ -16,6 +16,8 @@ import json
 import os
 from pathlib import Path
 
+from instrumentation import run_main
+
 # Map internal types to Blockly shapes
 type_mapping = {
     "ACTIONS": {"type": "statement"},
@@ -53,4 +55,4 @@ def main():
     print("Definitions and toolbox stubs written.")
 
 if __name__ == "__main__":
-    main()
+    run_main(main)
@@ -1,18 +1,18 @@
-import re
 import os
+from pathlib import Path
+
+from dts_model import load_api_model
+from instrumentation import run_main
+from selection_list_artifact import build_from_markdown
 
 def extract_selection_lists(input_path, output_path):
     if not os.path.exists(input_path):
         print(f"Input file not found: {input_path}")
         return
 
-    with open(input_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Regex to capture Enum Name and the Body inside {}
-    enum_pattern = re.compile(r'export enum (\w+)\s*\{([^}]+)\}', re.MULTILINE | re.DOTALL)
-    
-    enums = enum_pattern.findall(content)
+    model = load_api_model(input_path)
+    # One list per bare enum name, from the first namespace declaring it (see ApiModel.enum).
+    enums = {name: model.enum(name) for name in dict.fromkeys(e.name for e in model.enums.values())}
     
     if not enums:
         print("No enums found.")
@@ -23,24 +23,8 @@ def extract_selection_lists(input_path, output_path):
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write("SELECTION LISTS:\n")
         
-        for name, body in enums:
-            # Remove comments
-            body = re.sub(r'//.*', '', body)
-            
-            # Replace newlines with commas and split by comma
-            raw_items = body.replace('\n', ',').split(',')
-            items = [item.strip() for item in raw_items if item.strip()]
-            
-            clean_items = []
-            for item in items:
-                # Extract the key part (before =)
-                if '=' in item:
-                    key = item.split('=')[0].strip()
-                else:
-                    key = item.strip()
-                
-                if key:
-                    clean_items.append(key)
+        for name, enum in enums.items():
+            clean_items = enum.member_names
             
             # Normalize so the "header" is always <EnumName>Item but widget 1 is always <EnumName>.
             # Older portal-docs snapshots sometimes used an "Item" suffix for enum names.
@@ -58,7 +42,17 @@ def extract_selection_lists(input_path, output_path):
 
     print(f"Successfully wrote to {output_path}")
 
-if __name__ == "__main__":
+    # Pre-indexed, sharded copy the web UI loads instead of parsing the markdown.
+    artifact_dir = Path(output_path).parent / 'selection-lists'
+    index = build_from_markdown(Path(output_path), artifact_dir)
+    print(f"Wrote {len(index['enums'])} enums in {len(index['shards'])} shards to {artifact_dir}")
+
+
+def main():
     input_file = os.path.join(os.getcwd(), '=Resources=', 'portal-docs-json', 'index.d.ts')
     output_file = os.path.join(os.getcwd(), 'selection-lists.md')
-    extract_selection_lists(input_file, output_file)
\ No newline at end of file
+    extract_selection_lists(input_file, output_file)
+
+
+if __name__ == "__main__":
+    run_main(main)
@@ -1,64 +1,17 @@
 
 import re
-import json
-import os
 
-TOOLBOX_PATH = 'web_ui/src/toolbox.ts'
-BLOCK_DATA_FILE = 'bf6portal_blocks.json' # New source for block data
-
-# Regex to find block types in toolbox.ts
-BLOCK_TYPE_REGEX = re.compile(r"'type':\s*'([^']+)'")
-
-def get_json_blocks():
-    """
-    Reads block data from the bf6portal_blocks.json file.
-    Returns a dict: { block_id: connections_type }
-    """
-    if not os.path.exists(BLOCK_DATA_FILE):
-        print(f"Error: Block data file not found at {BLOCK_DATA_FILE}. Please run update_blocks_db.py first.", file=sys.stderr)
-        return {}
-    
-    with open(BLOCK_DATA_FILE, 'r', encoding='utf-8') as f:
-        all_blocks = json.load(f)
-    
-    blocks_dict = {}
-    for block in all_blocks:
-        blocks_dict[block['block_id']] = block['connections']
-    return blocks_dict
+from block_catalog import load_block_catalog
+from block_classifier import load_classifier
+from catalog_engine import load_catalog
+from instrumentation import count, run_main, stage
 
+TOOLBOX_PATH = 'web_ui/src/toolbox.ts'
 
 def categorize_block(block_id):
-    bid = block_id.upper()
-    
-    if bid in ['MOD_BLOCK', 'RULE_HEADER', 'CONDITION_BLOCK', 'ACTION_BLOCK', 'COMMENT']:
-        return 'RULES'
-    
-    if bid.startswith('AI') : return 'AI'
-    if 'ARRAY' in bid: return 'ARRAYS'
-    if any(x in bid for x in ['AUDIO', 'SOUND', 'VO', 'MUSIC']): return 'AUDIO'
-    if 'CAMERA' in bid: return 'CAMERA'
-    if any(x in bid for x in ['EFFECT', 'SCREENFLASH', 'SCREENFADE']): return 'EFFECTS'
-    if 'EMPLACEMENT' in bid: return 'EMPLACEMENTS'
-    if bid.startswith('EVENT') or bid.startswith('ON_'): 
-        # Events usually go to Event Payloads (Value) or Rules (Statement)
-        # But here we have specific categories.
-        # "EVENT PAYLOADS" is green. "EVENTS" (if any) might be yellow.
-        return 'EVENT PAYLOADS' # Defaulting to the Green category name
-    if any(x in bid for x in ['GAMEMODE', 'SCORE', 'TIME', 'FRIENDLYFIRE']): return 'GAMEPLAY' # Mapped to Green GAMEPLAY or Yellow GAME MODE
-    if any(x in bid for x in ['IF', 'WHILE', 'FOR', 'BREAK', 'CONTINUE', 'WAIT', 'ABORT', 'SKIP', 'RETURN']): return 'LOGIC'
-    if any(x in bid for x in ['AND', 'OR', 'NOT', 'TRUE', 'FALSE', 'EQUAL', 'GREATER', 'LESS']): return 'LOGIC'
-    if any(x in bid for x in ['ADD', 'SUBTRACT', 'MULTIPLY', 'DIVIDE', 'SIN', 'COS', 'TAN', 'MOD', 'ABS', 'SQRT', 'POWER', 'ROUND', 'CEILING', 'FLOOR']): return 'MATH'
-    if any(x in bid for x in ['PLAYER', 'SOLDIER', 'SQUAD', 'TEAM', 'REVIVE', 'MAN', 'KIT', 'INVENTORY']): return 'PLAYER'
-    if 'SUBROUTINE' in bid: return 'SUBROUTINES'
-    if 'TELEPORT' in bid: return 'PLAYER' # Often in Player
-    if any(x in bid for x in ['MESSAGE', 'HUD', 'SCOREBOARD', 'ICON']): return 'USER INTERFACE'
-    if 'VEHICLE' in bid: return 'VEHICLES'
-    if any(x in bid for x in ['VECTOR', 'CROSSPRODUCT', 'DOTPRODUCT']): return 'VECTORS' # Mapped to Green VECTORS (if exists) or Math? Original had Vectors.
-    if any(x in bid for x in ['NUMBER', 'STRING', 'BOOL', 'VAR']): return 'LITERALS'
-    
-    if 'OBJECTIVE' in bid or 'CAPTURE' in bid or 'MCOM' in bid: return 'OBJECTIVES' # Yellow OBJECTIVES (STATEMENT) or Green OBJECTIVE
+    # Rules live in block_classifier_rules.json; this script uses its 'fill_toolbox_gaps' category names.
+    return load_classifier().classify(block_id, 'fill_toolbox_gaps')
 
-    return 'OTHER'
 
 def normalize_category_name(name):
     # Map variation names to canonical ones for comparison
@@ -68,22 +21,30 @@ def normalize_category_name(name):
     if n == 'OBJECTIVE': return 'OBJECTIVES'
     return n
 
-def fill_gaps():
-    with open(TOOLBOX_PATH, 'r', encoding='utf-8') as f:
-        content = f.read()
+def fill_gaps(catalog=None):
+    catalog = catalog or load_catalog()
+    content = catalog.read_text(TOOLBOX_PATH)
 
     # Extract existing blocks
-    existing_blocks = set(BLOCK_TYPE_REGEX.findall(content))
+    existing_blocks = catalog.toolbox_types
     print(f"Found {len(existing_blocks)} blocks already in toolbox.")
 
     # Get all DB blocks
-    db_blocks = get_json_blocks() # Changed to use JSON file
+    db_blocks = load_block_catalog(catalog)
     print(f"Found {len(db_blocks)} blocks in JSON data.")
 
     # Identify missing blocks
-    missing_blocks = [b for b in db_blocks.keys() if b not in existing_blocks and b != 'input_value'] # Filter internal types
+    missing_blocks = [b for b in db_blocks.ids() if b not in existing_blocks and b != 'input_value'] # Filter internal types
     print(f"Found {len(missing_blocks)} missing blocks.")
 
+    # Group missing blocks by canonical category once, instead of re-categorizing
+    # every missing block for every toolbox category.
+    missing_by_category = {}
+    with stage('transform'):
+        for block_id, cat in load_classifier().classify_all(missing_blocks, 'fill_toolbox_gaps').items():
+            missing_by_category.setdefault(normalize_category_name(cat), []).append(block_id)
+    count('blocks_classified', len(missing_blocks))
+
     # We need to insert them.
     # Parsing the file:
     # It's a JS object. We can try to split by 'kind': 'category'
@@ -129,31 +90,15 @@ def fill_gaps():
             continue
 
         # Find blocks for this category
-        blocks_to_add = []
         canonical_cat = normalize_category_name(cat_name)
         
-        for block_id in missing_blocks:
-            # Check category match
-            b_cat = categorize_block(block_id)
-            if normalize_category_name(b_cat) != canonical_cat:
-                continue
-                
-            # Check connection match
-            b_conn = db_blocks[block_id]
-            
-            # DB "None" often means Statement (e.g. commands without prev/next like headers, or just unannotated)
-            # But usually Statement blocks have "Statement". Value have "Value".
-            
-            # Logic:
-            # If Yellow menu: accept Statement and None (if not strictly value)
-            # If Green menu: accept Value
-            
-            if target_conn == "Statement":
-                if b_conn == "Statement" or b_conn == "None":
-                    blocks_to_add.append(block_id)
-            elif target_conn == "Value":
-                if b_conn == "Value":
-                    blocks_to_add.append(block_id)
+        # DB "None" often means Statement (e.g. commands without prev/next like headers, or just unannotated)
+        # Yellow menus accept Statement and None; Green menus accept Value.
+        if target_conn == "Statement":
+            accepted = db_blocks.with_connection("Statement") | db_blocks.with_connection("None")
+        else:
+            accepted = db_blocks.with_connection("Value")
+        blocks_to_add = [b for b in missing_by_category.get(canonical_cat, []) if b in accepted]
 
         if blocks_to_add:
             print(f"Adding {len(blocks_to_add)} blocks to {cat_name} ({cat_colour})")
@@ -186,9 +131,8 @@ def fill_gaps():
     # Append the rest of the file
     new_content += content[last_pos:]
     
-    with open(TOOLBOX_PATH, 'w', encoding='utf-8') as f:
+    with stage('write'), open(catalog.path(TOOLBOX_PATH), 'w', encoding='utf-8') as f:
         f.write(new_content)
 
 if __name__ == '__main__':
-    fill_gaps()
-
+    run_main(fill_gaps)
@@ -1,66 +1,30 @@
-import json
-import re
+from pathlib import Path
+
+from catalog_engine import load_catalog
+from instrumentation import run_main
 
 # File paths
 TOOLBOX_PATH = 'web_ui/src/toolbox.ts'
 BLOCK_DEFS_PATH = 'web_ui/src/blocks/bf6portal_expanded.ts'
 
-def extract_types_from_toolbox(file_path):
-    """Extracts 'type' fields from the toolbox.ts file."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        pattern_single_quote = r"'type'\s*:\s*'([^']+)'"
-        pattern_double_quote = r'"type"\s*:\s*"([^"]*)"'
-        
-        matches_single = re.findall(pattern_single_quote, content)
-        matches_double = re.findall(pattern_double_quote, content)
-        
-        all_matches = matches_single + matches_double
-        print(f"DEBUG: toolbox.ts found {len(all_matches)} type matches.")
-        return set(all_matches)
-
-    except Exception as e:
-        print(f"Error reading toolbox data: {e}")
-        return set()
-
-def extract_types_from_ts(file_path):
-    """Extracts block types by finding and parsing individual JSON-like block definitions."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        print(f"DEBUG: bf6portal_expanded.ts content length: {len(content)}")
-        
-        types = set()
-        
-        start_wrapper = "export const bf6PortalExpandedBlocks = Blockly.common.createBlockDefinitionsFromJsonArray("
-        end_wrapper = "]);"
-        
-        start_index = content.find(start_wrapper)
-        end_index = content.rfind(end_wrapper)
-        
-        if start_index == -1 or end_index == -1:
-            print("Error: Could not find TypeScript wrapper in bf6portal_expanded.ts")
-            return set()
-            
-        json_array_str_raw = content[start_index + len(start_wrapper) : end_index].strip()
-        
-        type_matches = re.findall(r'"type"\s*:\s*"([^"]*)"', json_array_str_raw)
-        
-        types = set(type_matches)
-        
-        print(f"DEBUG: bf6portal_expanded.ts found {len(types)} type matches.")
-        return types
+def extract_types_from_toolbox(catalog):
+    """Returns every block type listed in the toolbox."""
+    types = catalog.toolbox_types
+    print(f"DEBUG: toolbox.ts found {len(types)} type matches.")
+    return types
 
-    except Exception as e:
-        print(f"Error extracting types from bf6portal_expanded.ts: {e}")
-        return set()
+def extract_types_from_ts(catalog, file_path=BLOCK_DEFS_PATH):
+    """Returns the block types defined in one block definition file."""
+    types = catalog.block_types([file_path])
+    print(f"DEBUG: {Path(file_path).name} found {len(types)} type matches.")
+    return types
 
 def main():
     print("Analyzing Block Definitions...")
     
-    expected_blocks = extract_types_from_toolbox(TOOLBOX_PATH)
-    defined_blocks = extract_types_from_ts(BLOCK_DEFS_PATH)
+    catalog = load_catalog()
+    expected_blocks = extract_types_from_toolbox(catalog)
+    defined_blocks = extract_types_from_ts(catalog)
     
     print(f"Expected Blocks (from toolbox): {len(expected_blocks)}")
     print(f"Defined Blocks (from bf6portal_expanded.ts): {len(defined_blocks)}")
@@ -82,4 +46,4 @@ def main():
             print(f" - {block}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_main(main)
\ No newline at end of file
@@ -1,50 +1,31 @@
-import re
-import os
-from pathlib import Path
+from catalog_engine import BLOCKS_FILES, GENERATORS_FILE, load_catalog
+from instrumentation import run_main
 
-def find_block_types(file_path):
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Look for JSON-like definitions: {"type": "block_name", ...}
-    # This regex is a bit loose but should catch most
-    json_types = re.findall(r'\{\s*"type":\s*"([^"]+)"', content)
-    
-    # Look for Blockly.Blocks['block_name'] = ...
-    blockly_types = re.findall(r"Blockly\.Blocks\['([^']+)'\]", content)
-    
-    return set(json_types + blockly_types)
+def find_block_types(catalog, file_path):
+    # JSON definitions ({"type": "block_name", ...}) plus any
+    # Blockly.Blocks['block_name'] = ... registrations in the same file.
+    return catalog.block_types([file_path]) | catalog.imperative_block_types.get(file_path, set())
 
-def find_generators(file_path):
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Look for bf6Generators['block_name'] = ...
-    generators = re.findall(r"bf6Generators\['([^']+)'\]", content)
-    
-    return set(generators)
+def find_generators(catalog):
+    # bf6Generators['block_name'] = ...
+    return catalog.generator_types
 
 def main():
-    repo_root = Path(__file__).resolve().parents[1]
-    base_dir = repo_root / 'web_ui' / 'src'
-    blocks_dir = base_dir / 'blocks'
-    generators_file = base_dir / 'generators' / 'bf6_generators.ts'
+    catalog = load_catalog()
     
     all_blocks = set()
     
     # Scan block definition files
-    for filename in os.listdir(blocks_dir):
-        if filename.endswith(".ts") and filename.startswith("bf6portal"):
-            file_path = str(blocks_dir / filename)
-            print(f"Scanning {filename}...")
-            blocks = find_block_types(file_path)
-            all_blocks.update(blocks)
+    for file_path in BLOCKS_FILES:
+        print(f"Scanning {file_path}...")
+        blocks = find_block_types(catalog, file_path)
+        all_blocks.update(blocks)
             
     print(f"Found {len(all_blocks)} block definitions.")
     
     # Scan generator file
-    print(f"Scanning {generators_file}...")
-    implemented_generators = find_generators(str(generators_file))
+    print(f"Scanning {GENERATORS_FILE}...")
+    implemented_generators = find_generators(catalog)
     print(f"Found {len(implemented_generators)} implemented generators.")
     
     # Find missing
@@ -58,4 +39,4 @@ def main():
         print(block)
 
 if __name__ == "__main__":
-    main()
+    run_main(main)
@@ -1,7 +1,9 @@
 import json
-import re
 from pathlib import Path
 
+from catalog_engine import iter_block_definitions
+from instrumentation import run_main
+
 # Configuration
 BLOCK_DEFS_PATH = Path('web_ui/src/blocks/bf6portal_expanded.ts')
 
@@ -65,24 +67,21 @@ def fix_block_definitions():
 
         start_wrapper = """export const bf6PortalExpandedBlocks = Blockly.common.createBlockDefinitionsFromJsonArray(["""
         end_wrapper = """]);"""
-        
-        start_index = content.find(start_wrapper)
-        end_index = content.rfind(end_wrapper)
-        
-        if start_index == -1 or end_index == -1:
+
+        # Parse every block definition with the shared JS literal parser. A syntax
+        # error aborts the run rather than silently dropping blocks on rewrite.
+        try:
+            block_defs = list(iter_block_definitions(content, str(BLOCK_DEFS_PATH)))
+        except ValueError as e:
+            print(f"Error: Could not parse {BLOCK_DEFS_PATH}: {e}")
+            return
+        if not block_defs:
             print("Error: Could not find TypeScript wrapper in bf6portal_expanded.ts")
             return
-            
-        json_array_str_raw = content[start_index + len(start_wrapper) : end_index].strip()
-        
-        # Split the string into individual block definitions
-        # This is a bit heuristic, assuming blocks are separated by '}, {' or just '},'
-        block_defs_str = re.findall(r'\{(?:[^\{\}]*|\{[^\{\}]*\})*?\}', json_array_str_raw, re.DOTALL)
-        
+
         corrected_blocks = []
-        for block_str in block_defs_str:
+        for block_json in block_defs:
             try:
-                block_json = json.loads(block_str)
                 block_type = block_json.get('type')
 
                 if block_type in VALUE_BLOCKS:
@@ -100,13 +99,11 @@ def fix_block_definitions():
                 
                 corrected_blocks.append(block_json)
 
-            except json.JSONDecodeError as e:
-                print(f"Warning: Could not decode block JSON: {block_str[:100]}... Error: {e}")
             except Exception as e:
-                print(f"Error processing block {block_str[:50]}...: {e}")
+                print(f"Error processing block {block_json.get('type')}: {e}")
 
         # Reconstruct the file content
-        new_json_array_str = "\n".join(json.dumps(b, indent=2) for b in corrected_blocks)
+        new_json_array_str = ",\n".join(json.dumps(b, indent=2) for b in corrected_blocks)
         new_content = f"{start_wrapper}\n{new_json_array_str}\n{end_wrapper}\n"
 
         with open(BLOCK_DEFS_PATH, 'w', encoding='utf-8') as f:
@@ -116,10 +113,15 @@ def fix_block_definitions():
     except Exception as e:
         print(f"Error in fix_block_definitions: {e}")
 
-if __name__ == "__main__":
+
+def main():
     # Small test to verify the lists
     print(f"Total Statement Blocks: {len(STATEMENT_BLOCKS)}")
     print(f"Total Value Blocks: {len(VALUE_BLOCKS)}")
     
     # Run the fix
     fix_block_definitions()
+
+
+if __name__ == "__main__":
+    run_main(main)
@@ -1,43 +1,30 @@
-import re
 import os
 import json
 
+from dts_model import load_api_model
+from instrumentation import run_main
+
 # Paths
 resources_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), '=Resources=', 'portal-docs-json')
 index_d_ts_path = os.path.join(resources_dir, 'index.d.ts')
 output_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'web_ui', 'src', 'blocks', 'generated_blocks.ts')
 
 def parse_index_d_ts(file_path):
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    model = load_api_model(file_path)
+    if model is None:
+        return []
 
     blocks = []
-    
-    # Regex to find function definitions
-    # export function Name(arg1: Type, arg2: Type): ReturnType;
-    func_pattern = re.compile(r'export function (\w+)\(([^)]*)\): (\w+);')
-    
-    matches = func_pattern.findall(content)
-    
-    for name, args_str, return_type in matches:
+    for sig in model.signatures():
         # Skip if it's an event (handled differently usually)
-        if name.startswith('On'):
+        if sig.name.startswith('On'):
             continue
-            
-        args = []
-        if args_str.strip():
-            arg_parts = args_str.split(',')
-            for arg in arg_parts:
-                if ':' in arg:
-                    arg_name, arg_type = arg.split(':')
-                    args.append({'name': arg_name.strip(), 'type': arg_type.strip()})
-        
         blocks.append({
-            'name': name,
-            'args': args,
-            'return_type': return_type
+            'name': sig.name,
+            'args': [{'name': p.name, 'type': p.type} for p in sig.params],
+            'return_type': sig.return_type
         })
-        
+
     return blocks
 
 def generate_blockly_definitions(blocks):
@@ -92,7 +79,8 @@ export const generatedBlocks = [
     ts_code += "];\n"
     return ts_code
 
-if __name__ == "__main__":
+
+def main():
     if os.path.exists(index_d_ts_path):
         print(f"Parsing {index_d_ts_path}...")
         blocks = parse_index_d_ts(index_d_ts_path)
@@ -107,3 +95,7 @@ if __name__ == "__main__":
         print(f"Generated blocks written to {output_path}")
     else:
         print("index.d.ts not found.")
+
+
+if __name__ == "__main__":
+    run_main(main)
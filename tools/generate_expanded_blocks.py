@@ -4,6 +4,8 @@ import os
 import re
 import sys # Import sys for stderr
 
+from instrumentation import run_main
+
 def get_existing_block_types(blocks_dir):
     """Extracts block types from existing TypeScript block definition files."""
     existing_block_types = set()
@@ -36,7 +38,7 @@ def generate_typescript_block_file(parsed_blocks, output_filepath):
     print(f"Generated new block definition file: {output_filepath}")
 
 
-if __name__ == "__main__":
+def main():
     # Changed path to be relative to the tools directory
     parsed_json_path = "tools/parsed_block_definitions.json" 
     serenity_blocks_dir = "web_ui/src/blocks/"
@@ -65,3 +67,7 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"An error occurred: {e}", file=sys.stderr)
         sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_main(main)
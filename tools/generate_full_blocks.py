@@ -1,8 +1,10 @@
-import re
 import os
 import json
 from collections import defaultdict
 
+from dts_model import load_api_model
+from instrumentation import run_main
+
 # Paths
 resources_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), '=Resources=', 'portal-docs-json')
 index_d_ts_path = os.path.join(resources_dir, 'index.d.ts')
@@ -10,40 +12,25 @@ output_blocks_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'w
 output_toolbox_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'web_ui', 'src', 'generated_toolbox.ts')
 
 def parse_index_d_ts(file_path):
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
+    """{ name: [{'name', 'args': [{'name', 'type'}], 'return_type'}] } for every non-event function (overloads in order)."""
+    model = load_api_model(file_path)
     functions = defaultdict(list)
-    
-    # Regex to find function definitions
-    # export function Name(arg1: Type, arg2: Type): ReturnType;
-    func_pattern = re.compile(r'export function (\w+)\(([^)]*)\): ([\w\.<>\[\]]+);')
-    
-    matches = func_pattern.findall(content)
-    
-    for name, args_str, return_type in matches:
+    if model is None:
+        return functions
+
+    # Blocks are named by bare function name; a name declared in several namespaces
+    # takes the overloads of the first one (see ApiModel.overloads).
+    for name in dict.fromkeys(sig.name for sig in model.signatures()):
         # Skip if it's an event (handled differently usually)
         if name.startswith('On'):
             continue
-            
-        args = []
-        if args_str.strip():
-            arg_parts = args_str.split(',')
-            for arg in arg_parts:
-                if ':' in arg:
-                    # Handle cases like "arg: Type"
-                    # Also handle "arg: Type | Type2"
-                    parts = arg.split(':')
-                    arg_name = parts[0].strip()
-                    arg_type = ':'.join(parts[1:]).strip() # Rejoin in case type has :
-                    args.append({'name': arg_name, 'type': arg_type})
-        
-        functions[name].append({
-            'name': name,
-            'args': args,
-            'return_type': return_type
-        })
-        
+        for sig in model.overloads(name):
+            functions[name].append({
+                'name': name,
+                'args': [{'name': p.name, 'type': p.type} for p in sig.params],
+                'return_type': sig.return_type
+            })
+
     return functions
 
 def merge_signatures(name, signatures):
@@ -209,7 +196,8 @@ export const generatedToolbox = {
 """
     return ts_code
 
-if __name__ == "__main__":
+
+def main():
     if os.path.exists(index_d_ts_path):
         print(f"Parsing {index_d_ts_path}...")
         functions = parse_index_d_ts(index_d_ts_path)
@@ -228,3 +216,7 @@ if __name__ == "__main__":
         
     else:
         print("index.d.ts not found.")
+
+
+if __name__ == "__main__":
+    run_main(main)
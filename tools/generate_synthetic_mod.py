@@ -0,0 +1,415 @@
+"""
+Synthetic Portal mod exports for stress tests, learned from the templates.
+
+The model comes from the block trees (`mod.blocks.blocks`) of the reference
+exports in `=Resources=/Portal Blocks`:
+
+- per block type: the block heads seen (fields, extraState) and the sets of inputs used;
+- per (type, input): the types plugged into it;
+- per type: the type that follows it through `next`, or the end of the chain.
+
+Every observation keeps its multiplicity, so sampling follows the template
+frequencies. A `catalog_share` of the picks is swapped for a random catalog
+type of the same kind (value / statement), with inputs taken from the catalog's
+`args_json` specs, so generated mods also use blocks the templates never do.
+
+Output is deterministic for a seed and streamed to disk. Subroutines and rules
+are generated while they are written, so memory stays bounded by one block body
+whatever the size of the mod. Rules are spread over as many modBlocks as needed,
+each holding at most as many as the largest template's. The exports stay consistent:
+
+- template variables are merged, and clashing names are renamed;
+- only subroutines that are defined get called;
+- argument blocks only appear in subroutines that have enough parameters;
+- inputs below `max_nesting` get a leaf block or stay empty.
+
+Usage:
+    python tools/generate_synthetic_mod.py out.json --scale 10        # ~10x custom_breakthrough_V1.1.json
+    python tools/generate_synthetic_mod.py out.json --blocks 1000000 --seed 7
+    python tools/generate_synthetic_mod.py out.json --scale 100 --chain-length 300 --max-nesting 12
+"""
+
+import argparse
+import json
+import random
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from catalog_engine import REPO_ROOT, load_catalog, portal_type_of
+from instrumentation import count, run_main, stage
+from portal_tree import PORTAL_TYPE_EXPORT_OVERRIDES, iter_children
+
+TEMPLATES_DIR = REPO_ROOT / '=Resources=' / 'Portal Blocks'
+REFERENCE_TEMPLATE = 'custom_breakthrough_V1.1.json'
+DEFAULT_CATALOG_SHARE = 0.05
+
+STRUCTURAL_TYPES = frozenset(PORTAL_TYPE_EXPORT_OVERRIDES.values())
+ARGUMENT_TYPE = 'subroutineArgumentBlock'
+CALL_TYPE = 'subroutineInstanceBlock'
+BODY_INPUT = 'ACTIONS'     # statement body of rules and subroutines
+HEAD_SKIP_KEYS = frozenset(('id', 'x', 'y', 'inputs', 'next', 'icons'))
+MAX_CHAIN = 200            # cap for chains that follow the learned next-type model
+PICK_ATTEMPTS = 8
+ROOT_SPACING_Y = 400
+
+_dumps = json.JSONEncoder(separators=(',', ':')).encode
+
+
+def _subroutine_signature(head):
+    extra = head.get('extraState') or {}
+    name = extra.get('subroutineName') or (head.get('fields') or {}).get('SUBROUTINE_NAME') or ''
+    return name, json.dumps(extra.get('parameters') or [], sort_keys=True)
+
+
+class ModModel:
+    """Block-type and shape distribution of a set of Portal exports (see learn_model)."""
+
+    def __init__(self):
+        self.heads: Dict[str, List[dict]] = defaultdict(list)
+        self.input_sets: Dict[str, List[tuple]] = defaultdict(list)
+        self.children: Dict[tuple, List[str]] = defaultdict(list)     # (type, input) -> child types
+        self.next_types: Dict[str, List[Optional[str]]] = defaultdict(list)
+        self.mod_head = {'type': 'modBlock'}
+        self.subroutines: Dict[str, dict] = {}                         # name -> subroutineBlock head
+        self.variables: List[dict] = []
+        self.template_blocks: Dict[str, int] = {}
+        self.max_nesting = 0
+        self.rules_per_mod = 1
+        self.catalog_specs: Dict[str, list] = {}
+        self.catalog_values: List[str] = []
+        self.catalog_statements: List[str] = []
+        # Filled by finish()
+        self.statement_types = set()
+        self.leaf_types = set()
+        self.value_pool: List[str] = []
+        self.statement_pool: List[str] = []
+
+    def add_variables(self, variables):
+        """Merges variables by id; a different variable with a taken name and type is renamed."""
+        ids = {v['id'] for v in self.variables}
+        taken = {(v.get('name'), v.get('type')) for v in self.variables}
+        for var in variables:
+            if not isinstance(var, dict) or var.get('id') in ids:
+                continue
+            var = dict(var)
+            name, n = var.get('name'), 1
+            while (var.get('name'), var.get('type')) in taken:
+                n += 1
+                var['name'] = f"{name}_{n}"
+            ids.add(var['id'])
+            taken.add((var.get('name'), var.get('type')))
+            self.variables.append(var)
+
+    def add_tree(self, root):
+        """Learns every block of one top-level block. Returns the number of blocks."""
+        head = {k: v for k, v in root.items() if k not in HEAD_SKIP_KEYS}
+        if root.get('type') == 'modBlock':
+            self.mod_head = head
+            rule, rules = ((root.get('inputs') or {}).get('RULES') or {}).get('block'), 0
+            while isinstance(rule, dict):
+                rules += 1
+                rule = (rule.get('next') or {}).get('block')
+            self.rules_per_mod = max(self.rules_per_mod, rules)
+        elif root.get('type') == 'subroutineBlock':
+            self.subroutines.setdefault(_subroutine_signature(head)[0], head)
+
+        n = 0
+        stack = [(root, 0)]
+        while stack:
+            block, nesting = stack.pop()
+            n += 1
+            btype = block.get('type')
+            self.max_nesting = max(self.max_nesting, nesting)
+            self.heads[btype].append({k: v for k, v in block.items() if k not in HEAD_SKIP_KEYS})
+            inputs = []
+            next_type = None
+            for slot, child in iter_children(block):
+                if slot == 'next':
+                    next_type = child.get('type')
+                    stack.append((child, nesting))
+                else:
+                    inputs.append(slot)
+                    self.children[(btype, slot)].append(child.get('type'))
+                    stack.append((child, nesting + 1))
+            self.input_sets[btype].append(tuple(inputs))
+            self.next_types[btype].append(next_type)
+        return n
+
+    def add_catalog(self, catalog):
+        """Catalog types (by Portal type) and their inputs, from the blocks DB."""
+        self.catalog_specs = catalog.portal_specs
+        connections = {}
+        for entry in catalog.block_db:
+            connections.setdefault(portal_type_of(entry), entry.get('connections'))
+        for portal_type in sorted(self.catalog_specs):
+            if portal_type in STRUCTURAL_TYPES:
+                continue
+            kind = connections.get(portal_type)
+            if kind == 'Value':
+                self.catalog_values.append(portal_type)
+            elif kind == 'Statement':
+                self.catalog_statements.append(portal_type)
+
+    def finish(self):
+        """Derives the pools and type sets used by the generator."""
+        # Only call subroutines whose definition (name and parameters) is part of the model.
+        defined = {_subroutine_signature(h) for h in self.subroutines.values()}
+        self.heads[CALL_TYPE] = [h for h in self.heads.get(CALL_TYPE, []) if _subroutine_signature(h) in defined]
+        if not self.heads[CALL_TYPE]:
+            del self.heads[CALL_TYPE]
+
+        for btype, nexts in self.next_types.items():
+            for nxt in nexts:
+                if nxt is not None:
+                    self.statement_types.update((btype, nxt))
+        self.statement_types.update(self.catalog_statements)
+        self.leaf_types = {t for t, sets in self.input_sets.items() if () in sets and t in self.heads}
+        self.leaf_types.update(t for t in self.catalog_values + self.catalog_statements
+                               if not any(self.catalog_specs[t]) and t not in self.heads)
+        for (_parent, _slot), types in sorted(self.children.items()):
+            for t in types:
+                if t in STRUCTURAL_TYPES or t not in self.heads:
+                    continue
+                (self.statement_pool if t in self.statement_types else self.value_pool).append(t)
+        return self
+
+
+def learn_model(template_paths: Optional[Iterable] = None, catalog=None) -> ModModel:
+    """Learns a ModModel from Portal exports (default: every template) and the block catalog."""
+    model = ModModel()
+    for path in sorted(map(Path, template_paths or TEMPLATES_DIR.glob('*.json'))):
+        with stage('read'):
+            data = json.loads(path.read_text(encoding='utf-8'))
+        with stage('parse'):
+            mod = (data or {}).get('mod') or {}
+            model.add_variables(mod.get('variables') or [])
+            model.template_blocks[path.name] = sum(model.add_tree(root) for root in (mod.get('blocks') or {}).get('blocks') or [])
+    if not model.heads.get('ruleBlock'):
+        raise ValueError("The templates have no ruleBlock to learn from")
+    model.add_catalog(catalog or load_catalog())
+    return model.finish()
+
+
+class ModGenerator:
+    """Samples blocks from a ModModel; `blocks` counts every block produced so far."""
+
+    def __init__(self, model: ModModel, seed=0, max_nesting=None, chain_length=None, catalog_share=DEFAULT_CATALOG_SHARE):
+        self.model = model
+        self.rng = random.Random(seed)
+        self.max_nesting = model.max_nesting if max_nesting is None else max_nesting
+        self.chain_length = chain_length
+        self.catalog_share = catalog_share
+        self.blocks = 0
+        self.rule_count = 0
+
+    def _new_block(self, head):
+        self.blocks += 1
+        block = {'type': head['type'], 'id': f"syn{self.blocks:08x}"}
+        block.update(head)
+        return block
+
+    def _swap(self, btype):
+        """`btype`, or with probability `catalog_share` a random catalog type of the same kind."""
+        if self.catalog_share and self.rng.random() < self.catalog_share:
+            m = self.model
+            pool = m.catalog_statements if btype in m.statement_types else m.catalog_values
+            if pool:
+                return self.rng.choice(pool)
+        return btype
+
+    def _pick(self, candidates, leaf, params):
+        """A (possibly swapped) type from `candidates` usable here, or None."""
+        if not candidates:
+            return None
+        for _ in range(PICK_ATTEMPTS):
+            btype = self._swap(self.rng.choice(candidates))
+            if btype == ARGUMENT_TYPE and not params:
+                continue
+            if leaf and btype not in self.model.leaf_types:
+                continue
+            return btype
+        return None
+
+    def _inputs(self, btype, nesting, params, body=None, body_length=None):
+        """{input: {'block': block or chain}} for a new `btype` block at `nesting`."""
+        m = self.model
+        if btype in m.heads:
+            names = self.rng.choice(m.input_sets[btype])
+            children = lambda name: m.children[(btype, name)]
+        else:
+            values, statements = m.catalog_specs.get(btype, ([], []))
+            names = list(values) + list(statements)
+            children = lambda name: m.value_pool if name in values else m.statement_pool
+        leaf = nesting + 1 >= self.max_nesting
+        inputs = {}
+        for name in names:
+            first = self._pick(children(name), leaf, params)
+            if first is None:
+                continue
+            if name == body:
+                # Consumed lazily while the block is written (see write_block).
+                inputs[name] = {'block': self.chain(first, nesting + 1, params, body_length)}
+            else:
+                chain = list(self.chain(first, nesting + 1, params))
+                inputs[name] = {'block': chain[0] if len(chain) == 1 else chain}
+        return inputs
+
+    def block(self, btype, nesting, params):
+        """One block of `btype` (without `next`), its inputs filled recursively."""
+        m = self.model
+        if btype == ARGUMENT_TYPE:
+            head = {'type': ARGUMENT_TYPE, 'fields': {'ARGUMENT_INDEX': str(self.rng.randrange(params))}}
+        elif btype in m.heads:
+            head = self.rng.choice(m.heads[btype])
+        else:
+            head = {'type': btype}
+        block = self._new_block(head)
+        if nesting < self.max_nesting:
+            inputs = self._inputs(btype, nesting, params)
+            if inputs:
+                block['inputs'] = inputs
+        return block
+
+    def chain(self, first, nesting, params, length=None) -> Iterator[dict]:
+        """
+        Blocks linked through `next`, starting with a `first` block: `length` of them, or
+        as many as the next-type model gives (at most MAX_CHAIN).
+        """
+        m = self.model
+        btype = first
+        n = 0
+        limit = length or MAX_CHAIN
+        while btype is not None and n < limit:
+            yield self.block(btype, nesting, params)
+            n += 1
+            nxt = self.rng.choice(m.next_types.get(btype) or [None])
+            if nxt is None and length and m.statement_pool:
+                nxt = self.rng.choice(m.statement_pool)
+            btype = self._swap(nxt) if nxt is not None else None
+
+    def root(self, head, params=0, nesting=0, y=0, body_length=None):
+        """A rule or subroutine definition whose ACTIONS body is generated as it is written."""
+        block = self._new_block(head)
+        if not nesting:
+            block.update(x=0, y=y)
+        inputs = self._inputs(head['type'], nesting, params, BODY_INPUT, body_length)
+        if inputs:
+            block['inputs'] = inputs
+        return block
+
+    def subroutines(self):
+        for i, head in enumerate(self.model.subroutines.values()):
+            params = len((head.get('extraState') or {}).get('parameters') or [])
+            yield self.root(head, params, y=i * ROOT_SPACING_Y)
+
+    def rules(self, target_blocks, limit) -> Iterator[dict]:
+        """Up to `limit` rules (at least one) until about `target_blocks` blocks have been produced."""
+        heads = self.model.heads['ruleBlock']
+        n = 0
+        while n < limit and (not n or self.blocks < target_blocks):
+            n += 1
+            self.rule_count += 1
+            head = self.rng.choice(heads)
+            fields = dict(head.get('fields') or {})
+            if 'NAME' in fields:
+                fields['NAME'] = f"{fields['NAME']} {self.rule_count}"
+            yield self.root(dict(head, fields=fields), nesting=1, body_length=self.chain_length)
+
+    def mod_blocks(self, target_blocks, y=0) -> Iterator[dict]:
+        """
+        modBlocks (at least one) until about `target_blocks` blocks have been produced, each
+        with a lazily generated RULES chain of at most `rules_per_mod` rules. Splitting keeps
+        `next` chains as deep as in the templates, so json.load-based tools can read any size.
+        """
+        n = 0
+        while not n or self.blocks < target_blocks:
+            block = self._new_block(self.model.mod_head)
+            block.update(x=0, y=y + n * ROOT_SPACING_Y)
+            block['inputs'] = {'RULES': {'block': self.rules(target_blocks, self.model.rules_per_mod)}}
+            n += 1
+            yield block
+
+
+def write_block(write, block, close=True):
+    """
+    Writes one block as compact JSON. An input whose `block` is a list or iterator is a
+    statement chain and is written linked through `next`, one block at a time.
+    """
+    inputs = block.get('inputs')
+    if not inputs:
+        text = _dumps(block)
+        write(text if close else text[:-1])
+        return
+    head = _dumps({k: v for k, v in block.items() if k != 'inputs'})
+    write(head[:-1] + ',"inputs":{')
+    for i, (name, slot) in enumerate(inputs.items()):
+        write((',' if i else '') + _dumps(name) + ':{"block":')
+        child = slot['block']
+        if isinstance(child, dict):
+            write_block(write, child)
+        else:
+            write_chain(write, child)
+        write('}')
+    write('}}' if close else '}')
+
+
+def write_chain(write, blocks):
+    """Writes a non-empty chain: each block's `next` holds the following one."""
+    n = 0
+    for block in blocks:
+        if n:
+            write(',"next":{"block":')
+        write_block(write, block, close=False)
+        n += 1
+    # Each block's object plus every `next` wrapper between them.
+    write('}' * (2 * n - 1))
+
+
+def generate_mod(model: ModModel, out_path, target_blocks, seed=0, max_nesting=None, chain_length=None,
+                 catalog_share=DEFAULT_CATALOG_SHARE):
+    """Streams a synthetic export of about `target_blocks` blocks to `out_path`. Returns its stats."""
+    gen = ModGenerator(model, seed, max_nesting, chain_length, catalog_share)
+    with stage('write'), open(out_path, 'w', encoding='utf-8') as f:
+        write = f.write
+        write('{"mod":{"blocks":{"languageVersion":0,"blocks":[')
+        subroutines = 0
+        for sub in gen.subroutines():
+            write_block(write, sub)
+            write(',')
+            subroutines += 1
+        for i, mod in enumerate(gen.mod_blocks(target_blocks, y=subroutines * ROOT_SPACING_Y)):
+            write(',' if i else '')
+            write_block(write, mod)
+        write(']},"variables":' + _dumps(model.variables) + '}}')
+    count('blocks_generated', gen.blocks)
+    return {'blocks': gen.blocks, 'rules': gen.rule_count, 'subroutines': subroutines, 'variables': len(model.variables)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic Portal mod export learned from the templates.")
+    parser.add_argument('out', help="export file to write")
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument('--scale', type=float, default=10, help=f"size as a multiple of {REFERENCE_TEMPLATE} (default: 10)")
+    size.add_argument('--blocks', type=int, help="size in blocks")
+    parser.add_argument('--seed', type=int, default=0, help="random seed (same seed, same export)")
+    parser.add_argument('--chain-length', type=int,
+                        help="statements in every rule body (default: learned); long chains nest deeper than json.load allows")
+    parser.add_argument('--max-nesting', type=int, help="deepest input nesting (default: the deepest in the templates)")
+    parser.add_argument('--catalog-share', type=float, default=DEFAULT_CATALOG_SHARE,
+                        help=f"share of picks replaced by catalog types the templates may not use (default: {DEFAULT_CATALOG_SHARE})")
+    parser.add_argument('--templates', nargs='+', help="exports to learn from (default: =Resources=/Portal Blocks/*.json)")
+    args = parser.parse_args()
+
+    model = learn_model(args.templates)
+    target = args.blocks
+    if target is None:
+        reference = model.template_blocks.get(REFERENCE_TEMPLATE) or max(model.template_blocks.values())
+        target = int(reference * args.scale)
+    stats = generate_mod(model, args.out, target, args.seed, args.max_nesting, args.chain_length, args.catalog_share)
+    print(f"Wrote {stats['blocks']} blocks ({stats['rules']} rules, {stats['subroutines']} subroutines, "
+          f"{stats['variables']} variables) to {args.out}")
+
+
+if __name__ == "__main__":
+    run_main(main)
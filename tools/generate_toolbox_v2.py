@@ -1,10 +1,21 @@
 
+import argparse
 import re
 import json
-import os
+import sys
+
+from block_catalog import load_block_catalog
+from block_classifier import load_classifier
+from block_usage import USAGE_FILE, load_usage, top_types, usage_key
+from catalog_engine import portal_type_of
+from instrumentation import count, run_main, stage
 
-BLOCK_DATA_FILE = 'bf6portal_blocks.json' # New source for block data
 OUTPUT_FILE = 'web_ui/src/toolbox.ts'
+# Categories with less than this share of the mined block usage are emitted as
+# `custom` categories that the UI fills on first open (see lazyCategoryContents).
+LAZY_USAGE_SHARE = 0.01
+# The most used mined types that must get usage when the catalog has them (see check_usage_matches).
+CHECKED_TOP_TYPES = 25
 
 # Categories based on BF6 Portal Menu
 CATEGORIES = [
@@ -14,67 +25,76 @@ CATEGORIES = [
     "Values", "Vehicles", "Vectors", "Other"
 ]
 
-def get_json_blocks():
-    """
-    Reads block data from the bf6portal_blocks.json file.
-    Returns a list of block_ids.
-    """
-    if not os.path.exists(BLOCK_DATA_FILE):
-        print(f"Error: Block data file not found at {BLOCK_DATA_FILE}. Please run update_blocks_db.py first.", file=sys.stderr)
-        return []
-    
-    with open(BLOCK_DATA_FILE, 'r', encoding='utf-8') as f:
-        all_blocks = json.load(f)
-    
-    return [block['block_id'] for block in all_blocks]
-
 def categorize_block(block_id):
-    bid = block_id.upper()
-    
-    if bid in ['MOD_BLOCK', 'RULE_HEADER', 'CONDITION_BLOCK', 'ACTION_BLOCK', 'COMMENT']:
-        return 'Rules'
-    
-    if bid.startswith('AI'): return 'AI'
-    if 'ARRAY' in bid: return 'Arrays'
-    if any(x in bid for x in ['AUDIO', 'SOUND', 'VO', 'MUSIC']): return 'Audio'
-    if 'CAMERA' in bid: return 'Camera'
-    if any(x in bid for x in ['EFFECT', 'SCREENFLASH', 'SCREENFADE']): return 'Effects'
-    if 'EMPLACEMENT' in bid: return 'Emplacements'
-    if bid.startswith('EVENT') or bid.startswith('ON_'): return 'Events'
-    if any(x in bid for x in ['GAMEMODE', 'SCORE', 'TIME', 'FRIENDLYFIRE']): return 'Gameplay'
-    if any(x in bid for x in ['IF', 'WHILE', 'FOR', 'BREAK', 'CONTINUE', 'WAIT', 'ABORT', 'SKIP', 'RETURN']): return 'Control'
-    if any(x in bid for x in ['AND', 'OR', 'NOT', 'TRUE', 'FALSE', 'EQUAL', 'GREATER', 'LESS']): return 'Logic'
-    if any(x in bid for x in ['ADD', 'SUBTRACT', 'MULTIPLY', 'DIVIDE', 'SIN', 'COS', 'TAN', 'MOD', 'ABS', 'SQRT', 'POWER', 'ROUND', 'CEILING', 'FLOOR']): return 'Math'
-    if any(x in bid for x in ['PLAYER', 'SOLDIER', 'SQUAD', 'TEAM', 'REVIVE', 'MAN', 'KIT', 'INVENTORY']): return 'Player'
-    if 'SUBROUTINE' in bid: return 'Subroutine'
-    if 'TELEPORT' in bid: return 'Teleport'
-    if any(x in bid for x in ['MESSAGE', 'HUD', 'SCOREBOARD', 'ICON']): return 'UI'
-    if 'VEHICLE' in bid: return 'Vehicles'
-    if any(x in bid for x in ['VECTOR', 'CROSSPRODUCT', 'DOTPRODUCT']): return 'Vectors'
-    if any(x in bid for x in ['NUMBER', 'STRING', 'BOOL', 'VAR']): return 'Values'
-    
-    return 'Other'
+    # Rules live in block_classifier_rules.json; this script uses its 'toolbox_v2' category names.
+    return load_classifier().classify(block_id, 'toolbox_v2')
+
+
+def lazy_category_key(cat):
+    return 'LAZY_' + re.sub(r'[^A-Z0-9]+', '_', cat.upper())
+
 
-def generate_toolbox():
-    blocks = get_json_blocks() # Changed to use JSON file
+def block_usage(block_id, catalog, usage):
+    """Mined uses of a catalog block, looked up by its Portal type and by its id."""
+    entry = catalog.get(block_id)
+    keys = {usage_key(block_id)}
+    if entry:
+        keys.add(usage_key(portal_type_of(entry)))
+    return max(usage.get(key, 0) for key in keys)
+
+
+def check_usage_matches(usage, catalog, types):
+    """Mined `types` that the catalog has blocks for where some of those blocks get no usage."""
+    missed = []
+    for portal_type in types:
+        matches = set(catalog.with_portal_type(portal_type))
+        if catalog.find(portal_type):
+            matches.add(catalog.find(portal_type))
+        if not all(block_usage(b, catalog, usage) for b in matches):
+            missed.append(portal_type)
+    return missed
+
+
+def generate_toolbox(usage=None, lazy_share=LAZY_USAGE_SHARE, catalog=None, output_file=OUTPUT_FILE):
+    """
+    `usage` ({usage_key: count}, see block_usage.py) orders blocks and categories by
+    how often mods use them; categories below `lazy_share` of that usage become lazy.
+    Without usage data, categories keep menu order and blocks are sorted by name.
+    """
+    block_catalog = load_block_catalog(catalog)
+    blocks = block_catalog.ids()
+    usage = usage or {}
     
     # Initialize categories
     toolbox_data = {cat: [] for cat in CATEGORIES}
+    with stage('transform'):
+        categories = load_classifier().classify_all(blocks, 'toolbox_v2')
+    count('blocks_classified', len(categories))
     
     for block in blocks:
         # Filter out internal/duplicate blocks if necessary
         # For now, include everything but maybe prioritize uppercase (expanded) blocks
         # if duplicates exist.
         
-        cat = categorize_block(block)
+        cat = categories[block]
         if cat in toolbox_data:
             toolbox_data[cat].append(block)
         else:
             toolbox_data['Other'].append(block)
 
-    # Sort blocks within categories
+    # Most used blocks first, then by name
+    block_uses = {block: block_usage(block, block_catalog, usage) for block in blocks}
     for cat in toolbox_data:
-        toolbox_data[cat].sort()
+        toolbox_data[cat].sort(key=lambda b: (-block_uses[b], b))
+
+    # Most used categories first (stable, so menu order breaks ties); rarely used ones go last, lazily
+    category_uses = {cat: sum(block_uses[b] for b in toolbox_data[cat]) for cat in CATEGORIES}
+    total_uses = sum(category_uses.values())
+    ordered = sorted(CATEGORIES, key=lambda cat: -category_uses[cat])
+    lazy = set()
+    if total_uses:
+        lazy = {cat for cat in CATEGORIES if category_uses[cat] < lazy_share * total_uses}
+        ordered = [cat for cat in ordered if cat not in lazy] + [cat for cat in ordered if cat in lazy]
 
     # Build TS content
     ts_content = """/**
@@ -89,7 +109,7 @@ def generate_toolbox():
     ts_content += "  'contents': [\n"
 
     # Add standard categories
-    for cat in CATEGORIES:
+    for cat in ordered:
         if not toolbox_data[cat]:
             continue
             
@@ -104,6 +124,10 @@ def generate_toolbox():
         ts_content += f"      'kind': 'category',\n"
         ts_content += f"      'name': '{cat}',\n"
         ts_content += f"      'colour': '{color}',\n"
+        if cat in lazy:
+            ts_content += f"      'custom': '{lazy_category_key(cat)}'\n"
+            ts_content += "    },\n"
+            continue
         ts_content += "      'contents': [\n"
         
         for block in toolbox_data[cat]:
@@ -129,12 +153,39 @@ def generate_toolbox():
     }
 """
     ts_content += "  ]\n"
-    ts_content += "};\n""
+    ts_content += "};\n"
+
+    # Block types of the lazy categories, registered as toolbox category callbacks in index.ts
+    ts_content += "\n// Block types of `custom: 'LAZY_*'` categories, filled on first open (see tools/generate_toolbox_v2.py).\n"
+    ts_content += "export const lazyCategoryContents: Record<string, string[]> = {\n"
+    for cat in ordered:
+        if cat in lazy and toolbox_data[cat]:
+            ts_content += f"  '{lazy_category_key(cat)}': {json.dumps(toolbox_data[cat])},\n"
+    ts_content += "};\n"
 
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
+    with stage('write'), open(output_file, 'w', encoding='utf-8') as f:
         f.write(ts_content)
     
-    print(f"Generated toolbox at {OUTPUT_FILE} with {len(blocks)} blocks.")
+    print(f"Generated toolbox at {output_file} with {len(blocks)} blocks.")
+    if lazy:
+        print(f"Lazy categories: {', '.join(cat for cat in ordered if cat in lazy and toolbox_data[cat])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate web_ui/src/toolbox.ts from the block catalog.")
+    parser.add_argument('--usage', default=USAGE_FILE, help="block usage file from tools/block_usage.py")
+    parser.add_argument('--no-usage', action='store_true', help="ignore usage data: menu order, alphabetical blocks, nothing lazy")
+    parser.add_argument('--lazy-share', type=float, default=LAZY_USAGE_SHARE,
+                        help="usage share below which a category is loaded lazily (0 disables)")
+    args = parser.parse_args()
+    usage = None if args.no_usage else load_usage(args.usage)
+    if usage:
+        missed = check_usage_matches(usage, load_block_catalog(), top_types(args.usage, CHECKED_TOP_TYPES))
+        if missed:
+            print(f"Mined usage does not reach catalog blocks for: {', '.join(missed)} (see block_usage.usage_key)")
+            sys.exit(1)
+    generate_toolbox(usage, args.lazy_share)
+
 
 if __name__ == '__main__':
-    generate_toolbox()
+    run_main(main)
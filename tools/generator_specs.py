@@ -0,0 +1,222 @@
+"""
+Table-driven JS generators.
+
+Most Portal generators only read their value inputs and emit a `mod.<Function>(...)`
+call. Instead of one hand-shaped function per block, those are rows in
+`web_ui/src/generators/generator_specs.ts`, interpreted at runtime by the single
+generic generator in `spec_generator.ts`. Hand-written generators in
+`bf6_generators.ts` are overrides and always win over a table row.
+
+A row is `[portal_function, kind]` or `[portal_function, kind, inputs]`:
+- kind: 0 = statement, 1 = value (Order.NONE), 2 = value (Order.ATOMIC)
+- input: its name (valueToCode with Order.NONE, 'null' when empty), or
+  `[name, fallback]` / `[name, fallback, 1]` (1 = read with Order.ATOMIC)
+
+Usage:
+    python tools/generator_specs.py            # add table rows for catalog blocks without a generator
+    python tools/generator_specs.py --migrate  # also move table-expressible functions out of bf6_generators.ts
+    python tools/generator_specs.py --check    # exit 1 if the table is out of date
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+
+from catalog_engine import (BLOCKS_FILES, GENERATOR_SPECS_FILE, GENERATORS_FILE, load_catalog,
+                            parse_selection_list_generator_types, portal_type_of)
+from dts_model import INDEX_D_TS, load_api_model
+from instrumentation import run_main
+
+KIND_STATEMENT = 0
+KIND_VALUE = 1
+KIND_VALUE_ATOMIC = 2
+
+SPECS_HEADER = """// Generated by tools/generator_specs.py; edit bf6_generators.ts for hand-written generators.
+// Rows are interpreted by specGenerator (spec_generator.ts); see that file for the row format.
+// Kept as JSON text: JSON.parse is cheaper for the JS engine to load than an equivalent object literal.
+
+import type { GeneratorSpec } from './spec_generator';
+
+export const GENERATOR_SPECS: Record<string, GeneratorSpec> = JSON.parse(`{
+"""
+SPECS_FOOTER = "}`);\n"
+
+# One top-level generator assignment: header line through the closing `};` in column 0.
+GENERATOR_DEF_RE = re.compile(r"^bf6Generators\['([^']+)'\] = function\s*\(.*?^\};\n", re.MULTILINE | re.DOTALL)
+SIMPLE_HEADER_RE = re.compile(r"^bf6Generators\['[^']+'\] = function\(block: any, generator: any\) \{$")
+VALUE_LINE_RE = re.compile(r"^  const (\w+) = generator\.valueToCode\(block, '([^']+)', Order\.(NONE|ATOMIC)\)(?: \|\| '([^'\\]*)')?;$")
+VALUE_CODE_RE = re.compile(r"^  const code = `mod\.(\w+)\((.*)\)`;$")
+STATEMENT_CODE_RE = re.compile(r"^  const code = `mod\.(\w+)\((.*)\);\\n`;$")
+PLACEHOLDER_RE = re.compile(r'%\d+')
+NON_IDENTIFIER_RE = re.compile(r'[^A-Za-z0-9_]')
+
+
+def _escape_template(text):
+    return text.replace('\\', '\\\\').replace('`', '\\`').replace('${', '\\${')
+
+
+def render_specs(specs):
+    rows = [f"{json.dumps(t)}: {json.dumps(spec, separators=(', ', ': '))}" for t, spec in sorted(specs.items())]
+    return SPECS_HEADER + _escape_template(',\n'.join(rows)) + '\n' + SPECS_FOOTER
+
+
+def spec_from_function(source):
+    """Returns the table row equivalent to a generator function's source, or None if it is not table-expressible."""
+    lines = source.rstrip('\n').split('\n')
+    if len(lines) < 4 or not SIMPLE_HEADER_RE.match(lines[0]) or lines[-1] != '};':
+        return None
+    body, code_line, return_line = lines[1:-3], lines[-3], lines[-2]
+
+    inputs = []
+    variables = []
+    for line in body:
+        m = VALUE_LINE_RE.match(line)
+        if not m:
+            return None
+        var, name, order, fallback = m.groups()
+        variables.append(var)
+        fallback = '' if fallback is None else fallback
+        if order == 'ATOMIC':
+            inputs.append([name, fallback, 1])
+        elif fallback != 'null':
+            inputs.append([name, fallback])
+        else:
+            inputs.append(name)
+
+    m = STATEMENT_CODE_RE.match(code_line)
+    if m and return_line == '  return code;':
+        kind = KIND_STATEMENT
+    else:
+        m = VALUE_CODE_RE.match(code_line)
+        if not m:
+            return None
+        if return_line == '  return [code, Order.NONE];':
+            kind = KIND_VALUE
+        elif return_line == '  return [code, Order.ATOMIC];':
+            kind = KIND_VALUE_ATOMIC
+        else:
+            return None
+    func_name, args = m.groups()
+    if args != ', '.join(f"${{{v}}}" for v in variables):
+        return None
+    return [func_name, kind, inputs] if inputs else [func_name, kind]
+
+
+def spec_for_block(block_def):
+    """Table row for a catalog block definition: its value inputs in order, named after message0."""
+    message = block_def.get('message0', '')
+    # "Get All Players In Vehicle %1" -> GetAllPlayersInVehicle
+    func_name = NON_IDENTIFIER_RE.sub('', PLACEHOLDER_RE.split(message, 1)[0]) or block_def['type']
+    inputs = [arg['name'] for arg in block_def.get('args0', []) if arg.get('type') == 'input_value' and arg.get('name')]
+    kind = KIND_VALUE if 'output' in block_def else KIND_STATEMENT
+    return [func_name, kind, inputs] if inputs else [func_name, kind]
+
+
+def migrate_functions(generators_text):
+    """
+    Moves table-expressible generators out of `generators_text`.
+    Returns (new_text, {type: spec}). A type is moved only when its effective
+    (last) definition is table-expressible; shadowed earlier definitions of it go too.
+    Functions for selection-list types are dropped: the loop at the end of the file replaces them.
+    """
+    defs = list(GENERATOR_DEF_RE.finditer(generators_text))
+    last = {}
+    for m in defs:
+        last[m.group(1)] = m
+    loop_types = parse_selection_list_generator_types(generators_text)
+    loop_pos = generators_text.find('for (const t of __bf6SelectionListBlocks)')
+
+    moved = {}
+    for block_type, m in last.items():
+        if block_type in loop_types:
+            continue
+        spec = spec_from_function(m.group(0))
+        if spec is not None:
+            moved[block_type] = spec
+
+    out = []
+    pos = 0
+    for m in defs:
+        dead = m.group(1) in loop_types and 0 <= m.end() <= loop_pos
+        if m.group(1) not in moved and not dead:
+            continue
+        out.append(generators_text[pos:m.start()])
+        pos = m.end()
+        # Drop the blank line that separated the removed function from the next one.
+        if generators_text.startswith('\n', pos):
+            pos += 1
+    out.append(generators_text[pos:])
+    return ''.join(out), moved
+
+
+def api_function_names(catalog):
+    """Portal function names a generated row may call: catalog Portal types, plus index.d.ts functions when present."""
+    names = {portal_type_of(entry) for entry in catalog.block_db}
+    if os.path.exists(INDEX_D_TS):
+        model = load_api_model()
+        names.update(sig.name for sig in model.signatures())
+    return names
+
+
+def missing_specs(catalog, specs, files=None):
+    """
+    Rows for block definitions in `files` that have neither a hand-written generator nor a table row.
+    Blocks whose message0 does not name a Portal function (e.g. placeholders) get no row.
+    """
+    handwritten = catalog.handwritten_generator_types
+    known = None
+    out = {}
+    for block_def in catalog.block_definitions(files):
+        t = block_def.get('type')
+        if t and t not in handwritten and t not in specs and t not in out:
+            spec = spec_for_block(block_def)
+            known = api_function_names(catalog) if known is None else known
+            if spec[0] not in known:
+                print(f"Skipping {t}: mod.{spec[0]} is not a Portal API function", file=sys.stderr)
+                continue
+            out[t] = spec
+    return out
+
+
+def update_specs(catalog, files=None, migrate=False, write=True):
+    """
+    Brings the spec table up to date. Returns (added: {type: spec}, migrated: {type: spec}).
+    With `migrate`, table-expressible functions are also removed from bf6_generators.ts.
+    """
+    specs = dict(catalog.generator_specs)
+    migrated = {}
+    generators_text = catalog.read_text(GENERATORS_FILE)
+    if migrate:
+        generators_text, migrated = migrate_functions(generators_text)
+        specs.update(migrated)
+    added = missing_specs(catalog, specs, files)
+    specs.update(added)
+
+    if write and (added or migrated):
+        if migrated:
+            catalog.path(GENERATORS_FILE).write_text(generators_text, encoding='utf-8')
+        catalog.path(GENERATOR_SPECS_FILE).write_text(render_specs(specs), encoding='utf-8')
+    return added, migrated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Update the table-driven generator specs.")
+    parser.add_argument('--migrate', action='store_true', help="move table-expressible functions out of bf6_generators.ts")
+    parser.add_argument('--check', action='store_true', help="only report; exit 1 if rows are missing")
+    parser.add_argument('--file', action='append', choices=BLOCKS_FILES, help="limit to these block definition files")
+    args = parser.parse_args()
+
+    catalog = load_catalog()
+    added, migrated = update_specs(catalog, args.file, migrate=args.migrate and not args.check, write=not args.check)
+    if migrated:
+        print(f"Moved {len(migrated)} generators from {GENERATORS_FILE} into {GENERATOR_SPECS_FILE}")
+    verb = "Missing" if args.check else "Added"
+    print(f"{verb} {len(added)} table rows" + (": " + ", ".join(sorted(added)) if added else ""))
+    if args.check and added:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_main(main)
@@ -0,0 +1,219 @@
+"""
+Shared --trace / --profile instrumentation for tools/ entry points.
+
+    if __name__ == "__main__":
+        run_main(main)
+
+`run_main` takes these options out of sys.argv before `main()` parses its own:
+
+    --trace[=PATH]    time every stage and record its peak traced memory (tracemalloc);
+                      print a summary to stderr and, with PATH, write a JSON report
+    --profile[=PATH]  also run under cProfile: the summary lists the top functions and
+                      regex calls; with PATH, the pstats data is dumped there
+
+Tools mark their phases with `with stage('parse'):` (read / parse / transform /
+write by convention) and count work with `count('blocks_parsed', n)`. Both do
+nothing unless the entry point was started with --trace or --profile.
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+REPORT_VERSION = 1
+TOP_FUNCTIONS = 15
+REGEX_METHOD_SUFFIX = " of 're.Pattern' objects>"
+
+
+class _Run:
+    """Stage timings and counters of one instrumented run."""
+
+    def __init__(self, trace_memory):
+        self.trace_memory = trace_memory
+        self.stages: Dict[str, dict] = {}
+        self.counters: Dict[str, int] = {}
+        self._stack: List[list] = []  # [name, start, peak bytes seen while this stage was open]
+        self._peak = 0  # peak bytes over the whole run, kept across the per-stage reset_peak() calls
+
+    def enter(self, name):
+        if self.trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            # The enclosing stage keeps the peak reached so far; the new stage starts from the current size.
+            if self._stack:
+                self._stack[-1][2] = max(self._stack[-1][2], peak)
+            self._peak = max(self._peak, peak)
+            tracemalloc.reset_peak()
+        self._stack.append([name, time.perf_counter(), 0])
+
+    def exit(self):
+        name, start, peak = self._stack.pop()
+        elapsed = time.perf_counter() - start
+        if self.trace_memory:
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            if self._stack:
+                self._stack[-1][2] = max(self._stack[-1][2], peak)
+        entry = self.stages.setdefault(name, {'calls': 0, 'seconds': 0.0})
+        self._peak = max(self._peak, peak)
+        entry['calls'] += 1
+        entry['seconds'] += elapsed
+        if self.trace_memory:
+            entry['peak_kb'] = max(entry.get('peak_kb', 0), peak // 1024)
+
+    def peak_bytes(self):
+        """Peak traced memory of the whole run so far."""
+        return max(self._peak, tracemalloc.get_traced_memory()[1])
+
+
+_RUN: Optional[_Run] = None
+
+
+@contextmanager
+def stage(name):
+    """Times the enclosed block as stage `name` (stages may nest; repeated stages accumulate)."""
+    run = _RUN
+    if run is None:
+        yield
+        return
+    run.enter(name)
+    try:
+        yield
+    finally:
+        run.exit()
+
+
+def count(name, n=1):
+    """Adds `n` to counter `name`."""
+    if _RUN is not None:
+        _RUN.counters[name] = _RUN.counters.get(name, 0) + n
+
+
+def enabled():
+    return _RUN is not None
+
+
+def _take_option(argv, name):
+    """Removes `--name` / `--name=VALUE` from argv. Returns None if absent, else the value ('' if none)."""
+    found = None
+    rest = [argv[0]]
+    for arg in argv[1:]:
+        if arg == f"--{name}":
+            found = found or ''
+        elif arg.startswith(f"--{name}="):
+            found = arg.split('=', 1)[1]
+        else:
+            rest.append(arg)
+    argv[:] = rest
+    return found
+
+
+def _profile_summary(profiler):
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    regex_calls = 0
+    rows = []
+    for (filename, line, func), (cc, ncalls, tottime, cumtime, _callers) in stats.stats.items():
+        if func.endswith(REGEX_METHOD_SUFFIX):
+            regex_calls += ncalls
+        label = func if filename == '~' else f"{os.path.basename(filename)}:{line}({func})"
+        rows.append({'function': label, 'ncalls': ncalls, 'tottime': round(tottime, 6), 'cumtime': round(cumtime, 6)})
+    rows.sort(key=lambda r: -r['tottime'])
+    return {'regex_calls': regex_calls, 'top': rows[:TOP_FUNCTIONS]}
+
+
+def build_report(run, tool, argv, wall, exit_code, profile=None):
+    report = {
+        'version': REPORT_VERSION,
+        'tool': tool,
+        'argv': argv,
+        'exit_code': exit_code,
+        'wall_s': round(wall, 6),
+        'stages': {name: dict(s, seconds=round(s['seconds'], 6))
+                   for name, s in sorted(run.stages.items(), key=lambda kv: -kv[1]['seconds'])},
+        'counters': dict(sorted(run.counters.items())),
+    }
+    if run.trace_memory:
+        report['peak_traced_kb'] = run.peak_bytes() // 1024
+    if profile is not None:
+        report['profile'] = profile
+    return report
+
+
+def format_summary(report):
+    lines = [f"[trace] {report['tool']}: {report['wall_s']:.3f} s"
+             + (f", peak traced memory {report['peak_traced_kb']:,} KB" if 'peak_traced_kb' in report else '')]
+    memory = 'peak_traced_kb' in report
+    if report['stages']:
+        # Stages nest (e.g. 'parse' inside 'transform'), so shares can add up to more than 100%.
+        lines.append(f"  {'stage':<24} {'calls':>6} {'seconds':>9} {'%':>5}" + (f" {'peak KB':>10}" if memory else ''))
+        for i, (name, s) in enumerate(report['stages'].items()):
+            share = s['seconds'] / report['wall_s'] * 100 if report['wall_s'] else 0
+            peak = f" {s['peak_kb']:>10,}" if memory else ''
+            hot = '  <- hottest' if i == 0 and len(report['stages']) > 1 else ''
+            lines.append(f"  {name:<24} {s['calls']:>6} {s['seconds']:>9.3f} {share:>4.0f}%{peak}{hot}")
+    else:
+        lines.append("  (no stages recorded)")
+    if report['counters']:
+        lines.append("  counters: " + ', '.join(f"{k}={v:,}" for k, v in report['counters'].items()))
+    profile = report.get('profile')
+    if profile:
+        lines.append(f"  regex calls: {profile['regex_calls']:,}")
+        lines.append("  top functions by own time:")
+        for row in profile['top'][:10]:
+            lines.append(f"    {row['tottime']:>8.3f} s {row['ncalls']:>9,}  {row['function']}")
+    return '\n'.join(lines)
+
+
+def run_main(main, *args):
+    """Runs `main(*args)`; with --trace / --profile in sys.argv, instruments it and reports on exit."""
+    global _RUN
+    argv = sys.argv
+    trace_path = _take_option(argv, 'trace')
+    profile_path = _take_option(argv, 'profile')
+    if trace_path is None and profile_path is None:
+        return main(*args)
+
+    tool = os.path.basename(argv[0])
+    _RUN = run = _Run(trace_memory=trace_path is not None)
+    if run.trace_memory:
+        tracemalloc.start()
+    profiler = cProfile.Profile() if profile_path is not None else None
+    exit_code = 0
+    start = time.perf_counter()
+    try:
+        if profiler:
+            profiler.enable()
+        return main(*args)
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        raise
+    except BaseException:
+        exit_code = 1
+        raise
+    finally:
+        if profiler:
+            profiler.disable()
+        wall = time.perf_counter() - start
+        profile = None
+        if profiler:
+            profile = _profile_summary(profiler)
+            if profile_path:
+                profiler.dump_stats(profile_path)
+        report = build_report(run, tool, argv[1:], wall, exit_code, profile)
+        if run.trace_memory:
+            tracemalloc.stop()
+        _RUN = None
+        sys.stdout.flush()
+        print(format_summary(report), file=sys.stderr)
+        if trace_path:
+            with open(trace_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+                f.write('\n')
+            print(f"[trace] report written to {trace_path}", file=sys.stderr)
+        if profile_path:
+            print(f"[trace] pstats written to {profile_path}", file=sys.stderr)
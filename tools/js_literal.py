@@ -0,0 +1,231 @@
+"""
+Streaming parser for JS/TS object and array literals.
+
+The block definition files and the toolbox are written as JS literals rather
+than strict JSON: they may contain `//` and `/* */` comments, single-quoted
+strings, unquoted keys and trailing commas. This module tokenizes them with a
+single compiled pattern (one left-to-right pass, no backtracking across
+tokens) and builds plain Python values.
+
+`iter_array()` yields the elements of a top-level array one at a time, so a
+caller can process block definitions as they are parsed. Any syntax the
+parser does not understand raises `JSLiteralError` with a line/column instead
+of skipping the element.
+
+Literals that are JSON apart from a few comments and trailing commas (the
+generated block files and the toolbox) take a fast path through `json`: where
+the decoder stops on a comment or trailing comma, that token is cut out and
+decoding restarts. Anything else, including every malformed input, goes
+through the tokenizer.
+"""
+
+import json
+import re
+
+TOKEN_RE = re.compile(r'''
+    (?P<ws>\s+)
+  | (?P<line_comment>//[^\n]*)
+  | (?P<block_comment>/\*.*?\*/)
+  | (?P<dstring>"(?:[^"\\\n]|\\.)*")
+  | (?P<sstring>'(?:[^'\\\n]|\\.)*')
+  | (?P<tstring>`(?:[^`\\$]|\\.|\$(?!\{))*`)
+  | (?P<number>-?(?:0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?))
+  | (?P<ident>[A-Za-z_$][\w$]*)
+  | (?P<punct>[{}\[\]:,()])
+''', re.VERBOSE | re.DOTALL)
+
+# Comments and trailing commas the json fast path cuts out before deferring to the tokenizer.
+MAX_JSON_REPAIRS = 64
+_JSON_DECODER = json.JSONDecoder()
+
+ESCAPE_RE = re.compile(r'''\\(?:u\{([0-9a-fA-F]+)\}|u([0-9a-fA-F]{4})|x([0-9a-fA-F]{2})|(\r\n|[\s\S]))''')
+SIMPLE_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0', '\n': '', '\r\n': ''}
+KEYWORDS = {'true': True, 'false': False, 'null': None, 'undefined': None,
+            'NaN': float('nan'), 'Infinity': float('inf')}
+
+
+class JSLiteralError(ValueError):
+    def __init__(self, message, text, pos, source=None):
+        line = text.count('\n', 0, pos) + 1
+        col = pos - (text.rfind('\n', 0, pos) + 1) + 1
+        super().__init__(f"{message} at line {line}, column {col}" + (f" of {source}" if source else ''))
+        self.pos = pos
+        self.line = line
+        self.col = col
+
+
+def _unescape_match(m):
+    code = m.group(1) or m.group(2) or m.group(3)
+    if code:
+        return chr(int(code, 16))
+    ch = m.group(4)
+    return SIMPLE_ESCAPES.get(ch, ch)
+
+
+def decode_string(raw):
+    """Decodes a quoted JS string token (including its quotes)."""
+    body = raw[1:-1]
+    if '\\' not in body:
+        return body
+    return ESCAPE_RE.sub(_unescape_match, body)
+
+
+def tokenize(text, pos=0, source=None):
+    """Yields (kind, raw, pos) tokens, skipping whitespace and comments."""
+    match = TOKEN_RE.match
+    end = len(text)
+    while pos < end:
+        m = match(text, pos)
+        if not m:
+            raise JSLiteralError(f"Unexpected character {text[pos]!r}", text, pos, source)
+        kind = m.lastgroup
+        if kind not in ('ws', 'line_comment', 'block_comment'):
+            yield kind, m.group(), pos
+        pos = m.end()
+
+
+class _Parser:
+    def __init__(self, text, pos, source=None):
+        self.text = text
+        self.source = source
+        self.tokens = tokenize(text, pos, source)
+        self.pending = None
+        self.end_pos = pos
+
+    def error(self, message, pos=None):
+        return JSLiteralError(message, self.text, self.end_pos if pos is None else pos, self.source)
+
+    def next(self):
+        if self.pending is not None:
+            tok, self.pending = self.pending, None
+            return tok
+        try:
+            tok = next(self.tokens)
+        except StopIteration:
+            raise self.error("Unexpected end of input") from None
+        self.end_pos = tok[2] + len(tok[1])
+        return tok
+
+    def peek(self):
+        if self.pending is None:
+            self.pending = self.next()
+        return self.pending
+
+    def expect(self, raw):
+        kind, value, pos = self.next()
+        if value != raw:
+            raise self.error(f"Expected {raw!r} but found {value!r}", pos)
+
+    def value(self):
+        kind, raw, pos = self.next()
+        if kind in ('dstring', 'sstring', 'tstring'):
+            return decode_string(raw)
+        if kind == 'number':
+            if raw.lstrip('-')[:2] in ('0x', '0X'):
+                return int(raw, 16)
+            return float(raw) if any(c in raw for c in '.eE') else int(raw)
+        if kind == 'ident':
+            if raw in KEYWORDS:
+                return KEYWORDS[raw]
+            raise self.error(f"Unsupported identifier {raw!r}", pos)
+        if raw == '{':
+            return self.object_body()
+        if raw == '[':
+            return list(self.array_items())
+        raise self.error(f"Unexpected token {raw!r}", pos)
+
+    def object_body(self):
+        obj = {}
+        while True:
+            kind, raw, pos = self.next()
+            if raw == '}':
+                return obj
+            if kind in ('dstring', 'sstring'):
+                key = decode_string(raw)
+            elif kind in ('ident', 'number'):
+                key = raw
+            else:
+                raise self.error(f"Expected a property name but found {raw!r}", pos)
+            self.expect(':')
+            obj[key] = self.value()
+            kind, raw, pos = self.next()
+            if raw == '}':
+                return obj
+            if raw != ',':
+                raise self.error(f"Expected ',' or '}}' but found {raw!r}", pos)
+
+    def array_items(self):
+        while True:
+            if self.peek()[1] == ']':
+                self.next()
+                return
+            yield self.value()
+            kind, raw, pos = self.next()
+            if raw == ']':
+                return
+            if raw != ',':
+                raise self.error(f"Expected ',' or ']' but found {raw!r}", pos)
+
+
+def _repair_json(text, pos):
+    """
+    `text` without the comment or trailing comma that stopped the json decoder at
+    `pos`, or None. Errors inside a string are never reported at '/', ']' or '}'.
+    """
+    if text.startswith('//', pos):
+        end = text.find('\n', pos)
+        return text[:pos] + (text[end:] if end != -1 else '')
+    if text.startswith('/*', pos):
+        end = text.find('*/', pos + 2)
+        return text[:pos] + ' ' + text[end + 2:] if end != -1 else None
+    if text.startswith((']', '}'), pos):
+        comma = len(text[:pos].rstrip()) - 1
+        if comma >= 0 and text[comma] == ',':
+            return text[:comma] + text[comma + 1:]
+    return None
+
+
+def _json_loads(text, pos):
+    """The literal at `pos` decoded with `json`, or None if it is not JSON plus comments and trailing commas."""
+    text = text[pos:]
+    for _ in range(MAX_JSON_REPAIRS):
+        text = text.lstrip()
+        try:
+            return _JSON_DECODER.raw_decode(text)[0]
+        except json.JSONDecodeError as e:
+            text = _repair_json(text, e.pos)
+            if text is None:
+                return None
+        except (ValueError, RecursionError):
+            return None
+    return None
+
+
+def loads(text, pos=0, source=None):
+    """Parses the single literal starting at `pos`. Trailing content is ignored; `source` names the text in errors."""
+    value = _json_loads(text, pos)
+    if value is not None:
+        return value
+    return _Parser(text, pos, source).value()
+
+
+def iter_array(text, pos=0, source=None):
+    """Yields the elements of the array literal starting at `pos`, as they are parsed."""
+    value = _json_loads(text, pos)
+    if isinstance(value, list):
+        yield from value
+        return
+    parser = _Parser(text, pos, source)
+    parser.expect('[')
+    yield from parser.array_items()
+
+
+def find_literal_after(text, marker, opener):
+    """
+    Returns the index of the first `opener` ('[' or '{') following `marker`,
+    or -1 if the marker is not present.
+    """
+    start = text.find(marker)
+    if start == -1:
+        return -1
+    return text.find(opener, start + len(marker))
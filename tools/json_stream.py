@@ -0,0 +1,199 @@
+"""
+Incremental JSON reader for large files.
+
+`iter_items(fp, paths)` reads a JSON document in fixed-size chunks and yields
+the elements of the arrays found at the given dotted paths, one at a time:
+
+    with open('mod.json', encoding='utf-8') as f:
+        for path, block in iter_items(f, ['mod.blocks.blocks', 'mod.variables']):
+            ...
+
+Only the containers leading to a requested path are tokenized. Each yielded
+element is decoded with the C `JSONDecoder.raw_decode` (reading more input and
+retrying when the buffer ends mid-element), and everything else is skipped by
+a brace-matching scan without being decoded. Memory use is bounded by the
+chunk size plus the largest single element rather than the size of the file.
+"""
+
+import json
+import re
+
+CHUNK_SIZE = 1 << 16
+
+TOKEN_RE = re.compile(r'''\s*(?:(?P<string>"(?:[^"\\]|\\.)*")|(?P<punct>[{}\[\]:,])|(?P<scalar>[^\s{}\[\]:,"]+))''', re.DOTALL)
+# Text runs, strings and brackets: enough to find where a container ends.
+SPAN_RE = re.compile(r'''[^"{}\[\]]+|"(?:[^"\\]|\\.)*"|[{}\[\]]''', re.DOTALL)
+_DECODER = json.JSONDecoder()
+
+
+class JSONStreamError(ValueError):
+    def __init__(self, message, offset):
+        super().__init__(f"{message} at offset {offset}")
+        self.offset = offset
+
+
+class _Reader:
+    def __init__(self, fp, chunk_size):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.base = 0  # file offset of buf[0]
+        self.eof = False
+
+    def fill(self, keep_from=None, size=None):
+        """Appends the next chunk, dropping consumed text before `keep_from` (default: pos)."""
+        if self.eof:
+            return False
+        chunk = self.fp.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        keep = self.pos if keep_from is None else keep_from
+        self.base += keep
+        self.buf = self.buf[keep:] + chunk
+        self.pos -= keep
+        return True
+
+    def error(self, message):
+        return JSONStreamError(message, self.base + self.pos)
+
+    def token(self):
+        """Returns the next (kind, raw) token, or (None, None) at end of input."""
+        while True:
+            m = TOKEN_RE.match(self.buf, self.pos)
+            # A token touching the end of the buffer may continue in the next chunk.
+            if m and (m.end() < len(self.buf) or self.eof):
+                self.pos = m.end()
+                return m.lastgroup, m.group(m.lastgroup)
+            if not self.fill() and not m:
+                if self.buf[self.pos:].strip():
+                    raise self.error("Malformed JSON")
+                return None, None
+
+    def expect(self, raw):
+        kind, tok = self.token()
+        if tok != raw:
+            raise self.error(f"Expected {raw!r} but found {tok!r}")
+
+    def raw_value(self, kind, tok):
+        """Returns the raw text of the value whose first token was just read."""
+        if kind != 'punct':
+            return tok
+        if tok not in '{[':
+            raise self.error(f"Unexpected {tok!r}")
+        start = self.pos - 1
+        scan = self.pos
+        depth = 1
+        while depth:
+            m = SPAN_RE.match(self.buf, scan)
+            if not m or (m.end() == len(self.buf) and not self.eof):
+                offset = start
+                if not self.fill(keep_from=start):
+                    if not m:
+                        raise self.error("Unterminated container")
+                else:
+                    start -= offset
+                    scan -= offset
+                    continue
+            t = m.group()
+            scan = m.end()
+            if t == '{' or t == '[':
+                depth += 1
+            elif t == '}' or t == ']':
+                depth -= 1
+        self.pos = scan
+        return self.buf[start:scan]
+
+    def value(self, kind, tok):
+        """Decodes the value whose first token was just read."""
+        if kind != 'punct':
+            return _decode(kind, tok)
+        start = self.pos - 1
+        while True:
+            try:
+                obj, end = _DECODER.raw_decode(self.buf, start)
+                break
+            except json.JSONDecodeError as e:
+                # Most likely the element continues past the buffer. Grow the read size
+                # with the element so a large element costs O(size) re-parsing overall.
+                if not self.fill(keep_from=start, size=max(self.chunk_size, len(self.buf) - start)):
+                    raise JSONStreamError(e.msg, self.base + e.pos) from None
+                start = 0
+        self.pos = end
+        return obj
+
+
+def _decode(kind, raw):
+    if kind == 'string' and '\\' not in raw:
+        return raw[1:-1]
+    return json.loads(raw)
+
+
+def _walk(reader, path, paths, prefixes, kind, tok):
+    if path in paths:
+        if tok != '[':
+            # Not an array: yield the value itself.
+            yield path, reader.value(kind, tok)
+            return
+        while True:
+            kind, tok = reader.token()
+            if tok == ']':
+                return
+            yield path, reader.value(kind, tok)
+            kind, tok = reader.token()
+            if tok == ']':
+                return
+            if tok != ',':
+                raise reader.error(f"Expected ',' or ']' but found {tok!r}")
+
+    if path not in prefixes or kind != 'punct' or tok not in '{[':
+        reader.raw_value(kind, tok)
+        return
+
+    if tok == '{':
+        while True:
+            kind, tok = reader.token()
+            if tok == '}':
+                return
+            if kind != 'string':
+                raise reader.error(f"Expected a property name but found {tok!r}")
+            key = _decode(kind, tok)
+            reader.expect(':')
+            child = f"{path}.{key}" if path else key
+            yield from _walk(reader, child, paths, prefixes, *reader.token())
+            kind, tok = reader.token()
+            if tok == '}':
+                return
+            if tok != ',':
+                raise reader.error(f"Expected ',' or '}}' but found {tok!r}")
+    else:
+        child = f"{path}.item" if path else 'item'
+        while True:
+            kind, tok = reader.token()
+            if tok == ']':
+                return
+            yield from _walk(reader, child, paths, prefixes, kind, tok)
+            kind, tok = reader.token()
+            if tok == ']':
+                return
+            if tok != ',':
+                raise reader.error(f"Expected ',' or ']' but found {tok!r}")
+
+
+def iter_items(fp, paths, chunk_size=CHUNK_SIZE):
+    """
+    Yields (path, element) for every element of the arrays at `paths` (dotted keys;
+    'item' steps into array elements, e.g. 'mods.item.blocks'), in document order.
+    A path that names a non-array value yields that value once.
+    """
+    paths = set(paths)
+    prefixes = {''}
+    for p in paths:
+        parts = p.split('.')
+        prefixes.update('.'.join(parts[:i]) for i in range(1, len(parts)))
+    reader = _Reader(fp, chunk_size)
+    kind, tok = reader.token()
+    if kind is None:
+        return
+    yield from _walk(reader, '', paths, prefixes, kind, tok)
@@ -0,0 +1,396 @@
+"""
+Versioned archive of Portal mod exports with a content-addressed subtree store.
+
+Every revision is split into Merkle objects: one per block, holding the block's
+own data with each input (and its shadow) replaced by the list of digests of the
+statement chain plugged into it. A block's digest (sha256 of its object) covers
+its whole subtree, so a revision that changes one action only adds that block
+and the blocks above it; everything else is shared with earlier revisions (and
+with other mods in the same archive). The variables list is one object; the
+revision root holds the rest of the document with the top-level chains.
+
+Layout of the archive directory:
+
+    objects.pack     zlib segments of objects (one per archived file), append-only
+    objects.idx      fixed-size records: sha256, segment, slice of the segment
+    revisions.jsonl  one line per revision (listing only reads this file)
+
+Ids, x/y and key order are stored as-is, so a checkout gives back the same JSON
+value that was added (every --add checks this before recording the revision).
+Checkouts are written the way the UI writes them (JSON.stringify(..., null, 2)).
+
+Usage:
+    python tools/mod_archive.py --add mod_v1.json mod_v2.json --name conquest
+    python tools/mod_archive.py --list
+    python tools/mod_archive.py --checkout latest --name conquest --out mod.json
+    python tools/mod_archive.py --checkout 12 --out mod_r12.json
+    python tools/mod_archive.py --stats --archive backups/.mod_archive
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import zlib
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from instrumentation import count, run_main, stage
+from portal_export import dumps_js
+from portal_tree import walk
+
+DEFAULT_ARCHIVE = '.mod_archive'
+PACK_FILE = 'objects.pack'
+INDEX_FILE = 'objects.idx'
+REVISIONS_FILE = 'revisions.jsonl'
+INDEX_RECORD = struct.Struct('<32sQIII')  # sha256, segment offset, segment length, object start, object length
+PACK_LEVEL = 9
+FORMAT_VERSION = 1
+SHORT_DIGEST = 12
+
+
+def _plain_next(nxt):
+    """True for a `next` that only links the following statement (the usual case)."""
+    return isinstance(nxt, dict) and len(nxt) == 1 and isinstance(nxt.get('block'), dict)
+
+
+def _chain(block):
+    """`block` and the statements linked after it through plain `next`s."""
+    while True:
+        yield block
+        nxt = block.get('next')
+        if not _plain_next(nxt):
+            return
+        block = nxt['block']
+
+
+def _workspace_path(state) -> List[str]:
+    """Keys leading to the dict holding `blocks` (same unwrapping as portal_tree.top_level_blocks)."""
+    path = []
+    while isinstance(state, dict):
+        key = 'mod' if isinstance(state.get('mod'), dict) else 'workspace' if isinstance(state.get('workspace'), dict) else None
+        if key is None:
+            break
+        path.append(key)
+        state = state[key]
+    return path
+
+
+class ObjectStore:
+    """
+    Append-only pack of JSON objects addressed by sha256. Each flush appends one
+    zlib segment holding all new objects (similar blocks compress far better
+    together than one by one); the index maps a digest to its segment and slice.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.index: Dict[bytes, tuple] = {}
+        self.pack_size = 0
+        self.written = 0
+        self.written_bytes = 0
+        self._pending: Dict[bytes, bytes] = {}
+        self._segments: Dict[int, bytes] = {}
+        self._reader = None
+        pack_path = os.path.join(directory, PACK_FILE)
+        index_path = os.path.join(directory, INDEX_FILE)
+        if os.path.exists(index_path):
+            with open(index_path, 'rb') as f:
+                data = f.read()
+            # A record cut short by an interrupted --add is ignored (its revision was never recorded).
+            usable = len(data) - len(data) % INDEX_RECORD.size
+            for digest, *location in INDEX_RECORD.iter_unpack(data[:usable]):
+                self.index[digest] = location
+        if os.path.exists(pack_path):
+            self.pack_size = os.path.getsize(pack_path)
+
+    def __len__(self):
+        return len(self.index)
+
+    def put(self, obj) -> str:
+        data = json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        digest = hashlib.sha256(data)
+        key = digest.digest()
+        if key not in self.index and key not in self._pending:
+            self._pending[key] = data
+        return digest.hexdigest()
+
+    def get(self, digest: str):
+        key = bytes.fromhex(digest)
+        data = self._pending.get(key)
+        if data is None:
+            offset, length, start, size = self.index[key]
+            segment = self._segments.get(offset)
+            if segment is None:
+                if self._reader is None:
+                    self._reader = open(os.path.join(self.directory, PACK_FILE), 'rb')
+                self._reader.seek(offset)
+                segment = self._segments[offset] = zlib.decompress(self._reader.read(length))
+            data = segment[start:start + size]
+        return json.loads(data)
+
+    def flush(self):
+        if not self._pending:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        records = []
+        start = 0
+        for key, data in self._pending.items():
+            records.append((key, start, len(data)))
+            start += len(data)
+        packed = zlib.compress(b''.join(self._pending.values()), PACK_LEVEL)
+        with open(os.path.join(self.directory, PACK_FILE), 'ab') as pack:
+            offset = pack.tell()
+            pack.write(packed)
+        with open(os.path.join(self.directory, INDEX_FILE), 'ab') as idx:
+            idx.write(b''.join(INDEX_RECORD.pack(key, offset, len(packed), start, size) for key, start, size in records))
+        for key, start, size in records:
+            self.index[key] = (offset, len(packed), start, size)
+        self.written += len(records)
+        self.written_bytes += len(packed)
+        self.pack_size = offset + len(packed)
+        self._pending = {}
+
+    def close(self):
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+
+# --- Splitting and rebuilding ---
+
+def _refs(slot, digests, keys):
+    """Copy of an input (or `next`) slot with the blocks under `keys` replaced by chain digests."""
+    if not isinstance(slot, dict):
+        return slot
+    return {k: [digests[id(b)] for b in _chain(v)] if k in keys and isinstance(v, dict) else v
+            for k, v in slot.items()}
+
+
+def put_chain(store: ObjectStore, root):
+    """Stores every block under `root` bottom-up; returns (digests of `root`'s chain, blocks stored)."""
+    digests: Dict[int, str] = {}
+    for visit in reversed(list(walk(root, shadows=True))):  # children and `next` before their block
+        obj = {}
+        for key, value in visit.block.items():
+            if key == 'next':
+                if _plain_next(value):
+                    continue
+                value = _refs(value, digests, ('block',))
+            elif key == 'inputs' and isinstance(value, dict):
+                value = {name: _refs(slot, digests, ('block', 'shadow')) for name, slot in value.items()}
+            obj[key] = value
+        digests[id(visit.block)] = store.put(obj)
+    count('blocks_stored', len(digests))
+    return [digests[id(b)] for b in _chain(root)], len(digests)
+
+
+def put_revision(store: ObjectStore, state):
+    """Stores a whole document; returns (root digest, blocks). Raises ValueError if it has no blocks array."""
+    path = _workspace_path(state)
+    workspace = state
+    for key in path:
+        workspace = workspace[key]
+    blocks = workspace.get('blocks') if isinstance(workspace, dict) else None
+    roots = blocks.get('blocks') if isinstance(blocks, dict) else blocks
+    if not isinstance(roots, list):
+        raise ValueError("not a Portal mod or workspace JSON (no blocks array)")
+
+    chains, total = [], 0
+    for root in roots:
+        if isinstance(root, dict):
+            chain, blocks_stored = put_chain(store, root)
+            chains.append(chain)
+            total += blocks_stored
+        else:
+            chains.append(root)
+    stored = dict(workspace)
+    stored['blocks'] = {**blocks, 'blocks': chains} if isinstance(blocks, dict) else chains
+    if isinstance(workspace.get('variables'), list):
+        stored['variables'] = store.put(workspace['variables'])
+    document = stored
+    for depth in range(len(path) - 1, -1, -1):
+        parent = state
+        for key in path[:depth]:
+            parent = parent[key]
+        document = {**parent, path[depth]: document}
+    root = store.put({'format': FORMAT_VERSION, 'path': path, 'document': document})
+    return root, total
+
+
+def _get_chain(store: ObjectStore, holder, key, chain):
+    """Rebuilds `chain` into holder[key] (iteratively; statement chains become `next` links)."""
+    stack = [(holder, key, chain)]
+    while stack:
+        holder, key, chain = stack.pop()
+        previous = None
+        for digest in chain:
+            block = store.get(digest)
+            if previous is None:
+                holder[key] = block
+            else:
+                previous['next'] = {'block': block}
+            previous = block
+            slots = list((block.get('inputs') or {}).values()) if isinstance(block.get('inputs'), dict) else []
+            if isinstance(block.get('next'), dict):
+                slots.append(block['next'])
+            for slot in slots:
+                if not isinstance(slot, dict):
+                    continue
+                for k in ('block', 'shadow'):
+                    if isinstance(slot.get(k), list):
+                        stack.append((slot, k, slot[k]))
+
+
+def get_revision(store: ObjectStore, root: str):
+    """The document stored under `root`."""
+    record = store.get(root)
+    if record.get('format') != FORMAT_VERSION:
+        raise ValueError(f"unsupported archive object format {record.get('format')!r}")
+    state = record['document']
+    workspace = state
+    for key in record['path']:
+        workspace = workspace[key]
+    if isinstance(workspace.get('variables'), str):
+        workspace['variables'] = store.get(workspace['variables'])
+    blocks = workspace['blocks']
+    chains = blocks['blocks'] if isinstance(blocks, dict) else blocks
+    for i, chain in enumerate(chains):
+        if isinstance(chain, list):
+            _get_chain(store, chains, i, chain)
+    return state
+
+
+# --- Revisions ---
+
+def load_revisions(directory) -> List[dict]:
+    path = os.path.join(directory, REVISIONS_FILE)
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def find_revision(revisions: List[dict], ref: str, name: Optional[str] = None) -> Optional[dict]:
+    """A revision by number, 'latest' (optionally of one --name) or root digest prefix."""
+    candidates = [r for r in revisions if name is None or r['name'] == name]
+    if ref == 'latest':
+        return candidates[-1] if candidates else None
+    if ref.isdigit():
+        return next((r for r in candidates if r['rev'] == int(ref)), None)
+    matches = [r for r in candidates if r['root'].startswith(ref.lower())]
+    return matches[0] if len({r['root'] for r in matches}) == 1 else None
+
+
+def add_files(directory, paths, name=None):
+    store = ObjectStore(directory)
+    revisions = load_revisions(directory)
+    added = []
+    for path in paths:
+        try:
+            with stage('read'), open(path, 'rb') as f:
+                raw = f.read()
+            with stage('parse'):
+                state = json.loads(raw)
+            with stage('transform'):
+                before = (store.written, store.written_bytes)
+                root, blocks = put_revision(store, state)
+                ok = get_revision(store, root) == state
+        except (OSError, ValueError) as e:
+            print(f"Cannot archive {path}: {e}")
+            sys.exit(1)
+        if not ok:
+            print(f"Cannot archive {path}: the stored revision does not rebuild to the same JSON")
+            sys.exit(1)
+        with stage('write'):
+            store.flush()
+            record = {
+                'rev': (revisions[-1]['rev'] if revisions else 0) + 1,
+                'name': name or os.path.splitext(os.path.basename(path))[0],
+                'file': os.path.basename(path),
+                'added': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+                'root': root,
+                'blocks': blocks,
+                'bytes': len(raw),
+                'new_objects': store.written - before[0],
+                'new_bytes': store.written_bytes - before[1],
+            }
+            with open(os.path.join(directory, REVISIONS_FILE), 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record) + '\n')
+        revisions.append(record)
+        added.append(record)
+        count('revisions_added')
+    store.close()
+    return added
+
+
+def print_revisions(revisions: List[dict]):
+    print(f"{'rev':>5}  {'root':{SHORT_DIGEST}}  {'added':20}  {'blocks':>6} {'bytes':>10} {'new objs':>8} {'new bytes':>9}  name")
+    for r in revisions:
+        print(f"{r['rev']:5d}  {r['root'][:SHORT_DIGEST]}  {r['added']:20}  {r['blocks']:6d} {r['bytes']:10,d} "
+              f"{r['new_objects']:8d} {r['new_bytes']:9,d}  {r['name']}")
+
+
+def archive_stats(directory, revisions: List[dict]):
+    store = ObjectStore(directory)
+    stored = store.pack_size + len(store) * INDEX_RECORD.size
+    revisions_size = os.path.getsize(os.path.join(directory, REVISIONS_FILE)) if revisions else 0
+    raw = sum(r['bytes'] for r in revisions)
+    return {
+        'revisions': len(revisions),
+        'mods': len({r['name'] for r in revisions}),
+        'objects': len(store),
+        'raw_bytes': raw,
+        'stored_bytes': stored + revisions_size,
+        'ratio': round(raw / (stored + revisions_size), 2) if stored else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Versioned, deduplicated archive of Portal mod exports.")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument('--add', nargs='+', metavar='FILE', help="archive these exports as new revisions, in order")
+    mode.add_argument('--list', action='store_true', help="list revisions")
+    mode.add_argument('--checkout', metavar='REV', help="rebuild a revision: number, 'latest' or root digest prefix")
+    mode.add_argument('--stats', action='store_true', help="print archive size against the raw revisions")
+    parser.add_argument('--archive', default=DEFAULT_ARCHIVE, help=f"archive directory (default: {DEFAULT_ARCHIVE})")
+    parser.add_argument('--name', help="mod name for --add (default: file name); filters --list and --checkout")
+    parser.add_argument('--out', help="where --checkout writes the mod (default: stdout)")
+    args = parser.parse_args()
+
+    if args.add:
+        for record in add_files(args.archive, args.add, args.name):
+            print(f"r{record['rev']} {record['root'][:SHORT_DIGEST]} {record['name']}: {record['blocks']} blocks, "
+                  f"{record['new_objects']} new objects ({record['new_bytes']:,} bytes for {record['bytes']:,} bytes of JSON)")
+        return
+
+    revisions = load_revisions(args.archive)
+    if args.list:
+        print_revisions([r for r in revisions if args.name is None or r['name'] == args.name])
+    elif args.stats:
+        stats = archive_stats(args.archive, revisions)
+        print(f"{stats['revisions']} revisions of {stats['mods']} mods, {stats['objects']:,} objects: "
+              f"{stats['raw_bytes']:,} bytes of JSON stored in {stats['stored_bytes']:,} bytes (x{stats['ratio']})")
+    else:
+        record = find_revision(revisions, args.checkout, args.name)
+        if record is None:
+            print(f"No revision {args.checkout!r} in {args.archive}" + (f" for {args.name}" if args.name else ''))
+            sys.exit(1)
+        store = ObjectStore(args.archive)
+        with stage('transform'):
+            state = get_revision(store, record['root'])
+        store.close()
+        with stage('write'):
+            text = dumps_js(state)
+            if args.out:
+                with open(args.out, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                print(f"r{record['rev']} {record['name']} -> {args.out}")
+            else:
+                sys.stdout.write(text + '\n')
+
+
+if __name__ == "__main__":
+    run_main(main)
@@ -4,176 +4,196 @@ import json
 import os
 import sys # Import sys for stderr
 
+from instrumentation import count, run_main, stage
+
+# One combined alternation, scanned once over the init body. Each named group
+# corresponds to one Blockly builder call. Builder calls are always chained
+# (`this.setColour(...)`, `.appendField(...)`), so every token starts with a
+# literal '.', which lets the regex engine jump from dot to dot.
+_CHECK = r"""(?:\s*\.setCheck\s*\(\s*(?:"(?P<check_single>[^"]*)"|\[(?P<check_list>[^\]]*)\])\s*\))?"""
+_CONNECTION_ARGS = r"""\((?:true|false|'[^']*'|null),\s*(?P<connection_check>null|'[^']*'|\[[^\]]*\])\)"""
+_INIT_CALLS = (
+    r"""(?P<text>appendField\s*\(\s*"(?P<field_text>[^"]*)"\s*\))"""
+    r"""|(?P<field>appendField\s*\(\s*(?:new\s+Blockly\.Field(?:TextInput|Dropdown|Checkbox)\s*\((?:[^,]*,\s*)?"(?P<field_default>[^"]*)"\s*\)"""
+    r"""|new\s+Blockly\.FieldVariable\s*\(\s*"(?P<field_var_default>[^"]*)"\s*\)),\s*"(?P<field_name>[^"]*)"\s*\))"""
+    r"""|(?P<input>append(?P<input_kind>Statement|Value)Input\s*\(\s*"(?P<input_name>[^"]*)"\s*\)""" + _CHECK + r""")"""
+    r"""|(?P<connection>set(?P<connection_kind>PreviousStatement|NextStatement|Output)""" + _CONNECTION_ARGS + r""")"""
+    r"""|(?P<text_prop>set(?P<text_prop_kind>Colour|Tooltip|HelpUrl)\('(?P<text_value>[^']*)'\))"""
+    r"""|(?P<bool_prop>set(?P<bool_prop_kind>Deletable|Movable)\((?P<bool_value>true|false)\))"""
+)
+INIT_TOKEN_RE = re.compile(r"\.(?:" + _INIT_CALLS + r")")
+# While an input waits for the end of its call chain, `;` and appendDummyInput are tokens too.
+PENDING_TOKEN_RE = re.compile(r"\.(?:" + _INIT_CALLS + r"|(?P<dummy_input>appendDummyInput\b))|(?P<chain_end>;)")
+
+CONNECTION_KEYS = {'PreviousStatement': 'previousStatement', 'NextStatement': 'nextStatement', 'Output': 'output'}
+TEXT_PROP_KEYS = {'Colour': 'colour', 'Tooltip': 'tooltip', 'HelpUrl': 'helpUrl'}
+BOOL_PROP_KEYS = {'Deletable': 'deletable', 'Movable': 'movable'}
+QUOTED_RE = re.compile(r'"([^"]*)"')
+
+# Braces, plus anything that may contain braces without opening a scope (strings,
+# comments). Block headers are only looked for at the top level and init headers
+# only directly inside a block, so inside bodies the scan stops on []{}"'`/ alone.
+_BRACES = r"""(?P<open>\{)|(?P<close>\})|"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'|`(?:[^`\\]|\\.)*`|//[^\n]*|/\*.*?\*/"""
+TOP_TOKEN_RE = re.compile(
+    r"""(?=[B{}"'`/])(?:(?P<block>Blockly\.Blocks\[\s*'(?P<block_type>[^']*)'\s*\]\s*=\s*\{)|""" + _BRACES + ")", re.DOTALL)
+BLOCK_TOKEN_RE = re.compile(r"""(?=[i{}"'`/])(?:(?P<init>init\s*:\s*function\s*\(\s*\)\s*\{)|""" + _BRACES + ")", re.DOTALL)
+BODY_TOKEN_RE = re.compile(r"""(?=[{}"'`/])(?:""" + _BRACES + ")", re.DOTALL)
+# A body made only of complete strings, comments and other code. Each unit can
+# match in one way only, so a failed fullmatch backtracks in linear time.
+CLOSED_BODY_RE = re.compile(r"""(?:[^"'`/]+(?=["'`/]|\Z)|"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*'|`(?:[^`\\]|\\.)*`"""
+                            r"""|//[^\n]*(?=\n)|/\*(?:[^*]|\*(?!/))*\*/|/(?![/*]))*""")
+
+
+def _parse_connection_check(raw):
+    raw = raw.strip()
+    if raw == "null":
+        return None
+    if raw.startswith('['):
+        return [s.strip("'\"") for s in raw[1:-1].split(',')]
+    return raw.strip("'\"")
+
+
 def parse_blockly_init_function(init_function_code):
     """
     Parses the content of a Blockly block's init function to extract properties.
+
+    The body is scanned once, left to right, with a single precompiled pattern.
+    Message parts and args follow source order, except that fields chained onto
+    an append*Input call are placed before that input (as Blockly renders them).
+    For the set* calls the first occurrence wins.
     """
     block_data = {}
     message_parts = []
     args_list = []
-
-    # Iterate through each line of the init function code
-    for line in init_function_code.split(';'): # Split by semicolons for individual statements
-        line = line.strip()
-        if not line:
-            continue
-
-        # Extract message parts and args from appendField, appendStatementInput, appendValueInput
-        # This is a simplified approach and may not capture all complexities of Blockly init
-        
-        # appendField for message parts
-        field_text_match = re.search(r"\.appendField\s*\(\s*\"([^\"]*)\"\s*\)", line)
-        if field_text_match:
-            message_parts.append(field_text_match.group(1))
-
-        # appendField with a Field (e.g., FieldTextInput, FieldDropdown)
-        field_match = re.search(r"\.appendField\s*\(\s*(?:new Blockly\.Field(?:TextInput|Dropdown|Checkbox)\s*\((?:[^,]*,\s*)?\"([^\"]*)\"\s*\)|new Blockly\.FieldVariable\s*\(\s*\"([^\"]*)\"\s*\)),\s*\"([^\"]*)\"\s*\)", line)
-        if field_match:
-            # Group 1 is for TextInput/Dropdown default text, Group 2 for FieldVariable default text, Group 3 is field name
-            field_default_text = field_match.group(1) or field_match.group(2)
-            field_name = field_match.group(3)
-            
-            message_parts.append(f"%{len(args_list) + 1}")
-            arg_obj = {"type": "field_input", "name": field_name} # Simplified type, could be more specific
+    connections = {}
+    props = {}
+    pending_input = None
+
+    def add_arg(arg_obj):
+        message_parts.append(f"%{len(args_list) + 1}")
+        args_list.append(arg_obj)
+
+    pos = 0
+    while True:
+        m = (PENDING_TOKEN_RE if pending_input else INIT_TOKEN_RE).search(init_function_code, pos)
+        if not m:
+            break
+        pos = m.end()
+        kind = m.lastgroup
+        if kind in ('chain_end', 'dummy_input'):
+            add_arg(pending_input)
+            pending_input = None
+        elif kind == 'text':
+            message_parts.append(m.group('field_text'))
+        elif kind == 'field':
+            arg_obj = {"type": "field_input", "name": m.group('field_name')} # Simplified type, could be more specific
+            field_default_text = m.group('field_default') or m.group('field_var_default')
             if field_default_text:
                 arg_obj["text"] = field_default_text
-            args_list.append(arg_obj)
-
-        # appendStatementInput
-        statement_input_match = re.search(r"\.appendStatementInput\s*\(\s*\"([^\"]*)\"\s*\)(?:\.setCheck\s*\((?:\"([^\"]*)\"|\[\"([^\"]*)\"(?:,\s*\"([^\"]*)\")*\])\)\s*)?", line)
-        if statement_input_match:
-            input_name = statement_input_match.group(1)
-            check_value = statement_input_match.group(2) or statement_input_match.group(3)
-            
-            message_parts.append(f"%{len(args_list) + 1}")
-            arg_obj = {"type": "input_statement", "name": input_name}
-            if check_value:
-                # Handle single string check or array of strings
-                if statement_input_match.group(2): # Single string
-                    arg_obj["check"] = check_value
-                elif statement_input_match.group(3): # Array, need to re-extract all
-                    checks = re.findall(r"\"([^\"]*)\"", re.search(r"\[(\"([^\"]*)\"(?:,\s*\"([^\"]*)\")*)]", line).group(1))
-                    arg_obj["check"] = checks
-            args_list.append(arg_obj)
-
-        # appendValueInput
-        value_input_match = re.search(r"\.appendValueInput\s*\(\s*\"([^\"]*)\"\s*\)(?:\.setCheck\s*\((?:\"([^\"]*)\"|\[\"([^\"]*)\"(?:,\s*\"([^\"]*)\")*\])\)\s*)?", line)
-        if value_input_match:
-            input_name = value_input_match.group(1)
-            check_value = value_input_match.group(2) or value_input_match.group(3)
-            
-            message_parts.append(f"%{len(args_list) + 1}")
-            arg_obj = {"type": "input_value", "name": input_name}
-            if check_value:
-                if value_input_match.group(2): # Single string
-                    arg_obj["check"] = check_value
-                elif value_input_match.group(3): # Array, need to re-extract all
-                    checks = re.findall(r"\"([^\"]*)\"", re.search(r"\[(\"([^\"]*)\"(?:,\s*\"([^\"]*)\")*)]", line).group(1))
-                    arg_obj["check"] = checks
-            args_list.append(arg_obj)
-
+            add_arg(arg_obj)
+        elif kind == 'input':
+            if pending_input:
+                add_arg(pending_input)
+            input_type = "input_statement" if m.group('input_kind') == 'Statement' else "input_value"
+            arg_obj = {"type": input_type, "name": m.group('input_name')}
+            if m.group('check_single'):
+                arg_obj["check"] = m.group('check_single')
+            elif m.group('check_list'):
+                arg_obj["check"] = QUOTED_RE.findall(m.group('check_list'))
+            pending_input = arg_obj
+        elif kind == 'connection':
+            key = CONNECTION_KEYS[m.group('connection_kind')]
+            connections.setdefault(key, _parse_connection_check(m.group('connection_check')))
+        elif kind == 'text_prop':
+            props.setdefault(TEXT_PROP_KEYS[m.group('text_prop_kind')], m.group('text_value'))
+        elif kind == 'bool_prop':
+            props.setdefault(BOOL_PROP_KEYS[m.group('bool_prop_kind')], m.group('bool_value') == 'true')
+
+    if pending_input:
+        add_arg(pending_input)
 
     if message_parts:
         block_data['message0'] = " ".join(message_parts)
     if args_list:
         block_data['args0'] = args_list
 
-    # Previous/Next statement
-    previous_statement_match = re.search(r"setPreviousStatement\((true|false|'[^']*'|null),\s*(null|'[^']*'|\[[^\]]*\])\)", init_function_code)
-    if previous_statement_match:
-        prev_type = previous_statement_match.group(2).strip()
-        if prev_type == "null":
-            block_data['previousStatement'] = None
-        elif prev_type.startswith('['):
-            block_data['previousStatement'] = [s.strip("'\"") for s in prev_type[1:-1].split(',')]
-        else:
-            block_data['previousStatement'] = prev_type.strip("'\"")
-    else:
-        block_data['previousStatement'] = None
-
-    next_statement_match = re.search(r"setNextStatement\((true|false|'[^']*'|null),\s*(null|'[^']*'|\[[^\]]*\])\)", init_function_code)
-    if next_statement_match:
-        next_type = next_statement_match.group(2).strip()
-        if next_type == "null":
-            block_data['nextStatement'] = None
-        elif next_type.startswith('['):
-            block_data['nextStatement'] = [s.strip("'\"") for s in next_type[1:-1].split(',')]
-        else:
-            block_data['nextStatement'] = next_type.strip("'\"")
-    else:
-        block_data['nextStatement'] = None
-
-    # Output
-    output_match = re.search(r"setOutput\((true|false|'[^']*'|null),\s*(null|'[^']*'|\[[^\]]*\])\)", init_function_code)
-    if output_match:
-        output_type = output_match.group(2).strip()
-        if output_type == "null":
-            block_data['output'] = None
-        elif output_type.startswith('['):
-            block_data['output'] = [s.strip("'\"") for s in output_type[1:-1].split(',')]
-        else:
-            block_data['output'] = output_type.strip("'\"")
-    else:
-        block_data['output'] = None
-
-    # Colour
-    colour_match = re.search(r"setColour\('([^']*)'\)", init_function_code)
-    if colour_match:
-        block_data['colour'] = colour_match.group(1)
-
-    # Tooltip
-    tooltip_match = re.search(r"setTooltip\('([^']*)'\)", init_function_code)
-    if tooltip_match:
-        block_data['tooltip'] = tooltip_match.group(1)
-
-    # HelpUrl
-    help_url_match = re.search(r"setHelpUrl\('([^']*)'\)", init_function_code)
-    if help_url_match:
-        block_data['helpUrl'] = help_url_match.group(1)
-
-    # setDeletable and setMovable
-    deletable_match = re.search(r"setDeletable\((true|false)\)", init_function_code)
-    if deletable_match:
-        block_data['deletable'] = deletable_match.group(1) == 'true'
-
-    movable_match = re.search(r"setMovable\((true|false)\)", init_function_code)
-    if movable_match:
-        block_data['movable'] = movable_match.group(1) == 'true'
+    # Previous/Next statement and output default to None when not declared.
+    for key in ('previousStatement', 'nextStatement', 'output'):
+        block_data[key] = connections.get(key)
+    for key in ('colour', 'tooltip', 'helpUrl', 'deletable', 'movable'):
+        if key in props:
+            block_data[key] = props[key]
 
     return block_data
 
 
+def iter_block_init_bodies(js_content):
+    """
+    Yields (block_type, init_body) for each Blockly.Blocks['...'] = { init: function() {...} }.
+    The file is tokenized once; brace depth tracks where each block and init body ends.
+    An init body without nested braces ends at its first '}', which is checked
+    with one match instead of tokenizing every string in it.
+    """
+    depth = 0
+    block_type = None
+    init_start = None
+    pos = 0
+    while True:
+        if depth == 0:
+            token_re = TOP_TOKEN_RE
+        elif depth == 1 and block_type is not None and init_start is None:
+            token_re = BLOCK_TOKEN_RE
+        else:
+            token_re = BODY_TOKEN_RE
+        m = token_re.search(js_content, pos)
+        if not m:
+            return
+        pos = m.end()
+        kind = m.lastgroup
+        if kind == 'block':
+            block_type = m.group('block_type')
+            init_start = None
+            depth = 1
+        elif kind == 'init':
+            end = js_content.find('}', pos)
+            body = js_content[pos:end]
+            if end != -1 and '{' not in body and CLOSED_BODY_RE.fullmatch(body):
+                yield block_type, body
+                block_type = None
+                pos = end + 1
+                continue
+            init_start = pos
+            depth = 2
+        elif kind == 'open':
+            depth += 1
+        elif kind == 'close' and depth > 0:
+            depth -= 1
+            if depth == 1 and init_start is not None:
+                yield block_type, js_content[init_start:m.start()]
+                init_start = None
+                block_type = None
+            elif depth == 0 and block_type is not None:
+                print(f"Warning: Could not find init function for block type {block_type}")
+                block_type = None
+
+
 def parse_blockly_js_to_json(js_content):
     """
     Parses JavaScript content containing Blockly.Blocks definitions
     and converts them into a list of JSON-compatible dictionaries.
     """
     json_blocks = []
-    
-    # Regex to find each Blockly.Blocks['BLOCK_TYPE'] definition
-    block_pattern = re.compile(r"Blockly\.Blocks\[\s*'([^']*)'\s*\]\s*=\s*{([^}]*init: function\(\) {[^}]*})[^}]*}", re.DOTALL)
-    
-    for match in block_pattern.finditer(js_content):
-        block_type = match.group(1)
-        # Extract the entire content of the block definition to pass to init function parser
-        block_definition_content = match.group(2)
-        
-        # Now, extract the init function content specifically
-        init_content_match = re.search(r"init: function\(\) {(.+)}", block_definition_content, re.DOTALL)
-        if init_content_match:
-            init_code = init_content_match.group(1)
-            parsed_data = parse_blockly_init_function(init_code)
-            
-            # Add type to the parsed data
-            parsed_data['type'] = block_type
-            json_blocks.append(parsed_data)
-        else:
-            print(f"Warning: Could not find init function for block type {block_type}")
+    for block_type, init_code in iter_block_init_bodies(js_content):
+        parsed_data = parse_blockly_init_function(init_code)
+
+        # Add type to the parsed data
+        parsed_data['type'] = block_type
+        json_blocks.append(parsed_data)
 
     return json_blocks
 
 
-if __name__ == "__main__":
+def main():
     js_file_path = "web_ui/block_definitions.js" # Changed to relative path
     output_json_path = "tools/parsed_block_definitions.json" # Changed to relative path
     
@@ -183,16 +203,22 @@ if __name__ == "__main__":
                   "This file should contain original Blockly block definitions.", file=sys.stderr)
             sys.exit(1)
 
-        with open(js_file_path, 'r', encoding='utf-8') as f:
+        with stage('read'), open(js_file_path, 'r', encoding='utf-8') as f:
             js_content = f.read()
         
-        parsed_blocks = parse_blockly_js_to_json(js_content)
+        with stage('parse'):
+            parsed_blocks = parse_blockly_js_to_json(js_content)
+        count('blocks_parsed', len(parsed_blocks))
         
         # Output to a JSON file for inspection
-        with open(output_json_path, 'w', encoding='utf-8') as f:
+        with stage('write'), open(output_json_path, 'w', encoding='utf-8') as f:
             json.dump(parsed_blocks, f, indent=2)
         
         print(f"Successfully parsed {len(parsed_blocks)} blocks and saved to {output_json_path}")
     except Exception as e:
         print(f"An error occurred: {e}", file=sys.stderr)
         sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_main(main)
@@ -0,0 +1,411 @@
+"""
+Structural diff between two Portal mod exports (or saved workspaces).
+
+Textual diffs of exports are useless once Blockly regenerates block ids or
+moves blocks around the canvas. This compares the block trees instead, with ids
+and x/y ignored, and reports edits:
+
+    update   a matched block whose own data changed (fields, extraState, ...)
+    move     a matched block that now sits in another input, or out of order in its chain
+    insert   a subtree only in the new mod
+    delete   a subtree only in the old mod
+
+Matching runs in phases, each one linear (or n log n) in the number of blocks:
+
+    1. anchors    rules by name (and occurrence), subroutines by name, mods in order
+    2. exact      identical subtrees by structure id (structural_hash.py, one table for
+                  both mods), largest first; ambiguous small subtrees are left for later
+    3. bottom-up  an unmatched block whose input child is matched follows that child
+    4. top-down   inside matched blocks, unmatched statements and values of the same
+                  type are paired in order, input by input
+
+Usage:
+    python tools/portal_diff.py old.json new.json
+    python tools/portal_diff.py old.json new.json --json
+    python tools/portal_diff.py old.json new.json --limit 0   # summary only
+"""
+
+import argparse
+import bisect
+import json
+import sys
+from collections import defaultdict, deque
+from typing import Dict, List, NamedTuple, Optional
+
+from duplicate_subtrees import describe
+from instrumentation import count, run_main, stage
+from portal_tree import block_label, owner_of, subroutine_name, top_level_blocks, walk
+from structural_hash import IGNORED_KEYS, StructureTable, block_data
+
+EDIT_KINDS = ('delete', 'insert', 'move', 'update')
+MIN_AMBIGUOUS_SIZE = 3  # smaller repeated subtrees (Number 0, EventPlayer) only match in context
+
+
+class Edit(NamedTuple):
+    kind: str
+    old: Optional[int]   # pre-order index in the old mod
+    new: Optional[int]   # pre-order index in the new mod
+    blocks: int          # blocks inserted/deleted (1 for update/move)
+    detail: str
+
+
+class _Tree:
+    """One mod's blocks in pre-order, with the links the matcher needs as flat lists."""
+
+    def __init__(self, roots, table: StructureTable):
+        self.hashed = []
+        for root in roots:
+            if isinstance(root, dict):
+                self.hashed.extend(table.hash_tree(root))
+        n = len(self.hashed)
+        index = {id(h.visit.block): i for i, h in enumerate(self.hashed)}
+        self.parent = [-1] * n     # Visit parent (the previous statement for `next`)
+        self.container = [-1] * n  # block whose input holds the chain this block is in
+        self.slot: List[Optional[str]] = [None] * n
+        self.position = [0] * n    # index in that chain (in the top-level list for roots)
+        self.next = [-1] * n
+        self.heads: List[Dict[str, int]] = [{} for _ in range(n)]  # input name -> first block (shadows skipped)
+        self.roots: List[int] = []
+        for i, h in enumerate(self.hashed):
+            visit = h.visit
+            if visit.parent is None:
+                self.position[i] = len(self.roots)
+                self.roots.append(i)
+                continue
+            p = self.parent[i] = index[id(visit.parent.block)]
+            if visit.slot == 'next':
+                self.next[p] = i
+                self.container[i], self.slot[i], self.position[i] = self.container[p], self.slot[p], self.position[p] + 1
+            else:
+                self.container[i], self.slot[i] = p, visit.slot
+                slot = (visit.parent.block.get('inputs') or {}).get(visit.slot) or {}
+                if slot.get('block') is visit.block:
+                    self.heads[p][visit.slot] = i
+
+    def __len__(self):
+        return len(self.hashed)
+
+    def block(self, i):
+        return self.hashed[i].visit.block
+
+    def node_range(self, i):
+        """Pre-order indices of block i and everything in its inputs (its `next` chain excluded)."""
+        return range(i, i + self.hashed[i].size)
+
+    def chain(self, head):
+        while head != -1:
+            yield head
+            head = self.next[head]
+
+    def location(self, i) -> str:
+        visit = self.hashed[i].visit
+        owner = owner_of(visit)
+        where = block_label(owner.block) if owner else '<top-level>'
+        c = self.container[i]
+        if c == -1 or (owner is not None and owner.block is self.block(i)):
+            return where
+        container = self.block(c)
+        inner = f"{container.get('type')}.{self.slot[i]}"
+        if owner is not None and owner.block is container:
+            inner = str(self.slot[i])
+        in_chain = self.position[i] or self.next[i] != -1
+        return f"{where} {inner}" + (f"[{self.position[i]}]" if in_chain else '')
+
+
+def _anchor_keys(tree: _Tree) -> Dict[tuple, int]:
+    keys = {}
+    seen = defaultdict(int)
+    for i, h in enumerate(tree.hashed):
+        block = h.visit.block
+        btype = block.get('type')
+        if btype == 'ruleBlock':
+            base = ('rule', str((block.get('fields') or {}).get('NAME', '')))
+        elif btype == 'subroutineBlock':
+            base = ('subroutine', subroutine_name(block))
+        elif btype == 'modBlock':
+            base = ('mod',)
+        else:
+            continue
+        keys[base + (seen[base],)] = i
+        seen[base] += 1
+    return keys
+
+
+class _Matcher:
+    def __init__(self, old: _Tree, new: _Tree):
+        self.old, self.new = old, new
+        self.to_new = [-1] * len(old)
+        self.to_old = [-1] * len(new)
+        self._old_index = {id(h.visit.block): i for i, h in enumerate(old.hashed)}
+
+    def pair(self, o, n):
+        self.to_new[o] = n
+        self.to_old[n] = o
+
+    def pair_subtree(self, o, n):
+        """Pairs two structurally equal subtrees block by block; False if part of either is taken."""
+        olds, news = self.old.node_range(o), self.new.node_range(n)
+        for a, b in zip(olds, news):
+            if (self.to_new[a] != -1 or self.to_old[b] != -1) and self.to_new[a] != b:
+                return False
+        for a, b in zip(olds, news):
+            self.pair(a, b)
+        return True
+
+    def anchors(self):
+        new_keys = _anchor_keys(self.new)
+        for key, o in _anchor_keys(self.old).items():
+            if key in new_keys:
+                self.pair(o, new_keys[key])
+
+    def _owner_key(self, tree: _Tree, i, to_other=None):
+        """id() of the rule/subroutine holding block i, seen from the new mod (None at top level, -1 if unmatched)."""
+        owner = owner_of(tree.hashed[i].visit)
+        if owner is None:
+            return None
+        if to_other is None:
+            return id(owner.block)
+        partner = to_other[self._old_index[id(owner.block)]]
+        return id(self.new.block(partner)) if partner != -1 else -1
+
+    def exact(self):
+        by_node_old, by_node_new = defaultdict(list), defaultdict(list)
+        for i, h in enumerate(self.old.hashed):
+            by_node_old[h.node].append(i)
+        for i, h in enumerate(self.new.hashed):
+            by_node_new[h.node].append(i)
+        shared = [node for node in by_node_old if node in by_node_new]
+        shared.sort(key=lambda node: -self.old.hashed[by_node_old[node][0]].size)
+        for node in shared:
+            olds = [o for o in by_node_old[node] if self.to_new[o] == -1]
+            news = [n for n in by_node_new[node] if self.to_old[n] == -1]
+            if not olds or not news:
+                continue
+            if len(olds) == 1 and len(news) == 1:
+                self.pair_subtree(olds[0], news[0])
+                continue
+            if self.old.hashed[olds[0]].size < MIN_AMBIGUOUS_SIZE:
+                continue
+            # Ambiguous: first pair occurrences in rules/subroutines matched to each other, then the rest in order.
+            by_owner = defaultdict(deque)
+            for n in news:
+                by_owner[self._owner_key(self.new, n)].append(n)
+            rest = []
+            for o in olds:
+                candidates = by_owner.get(self._owner_key(self.old, o, self.to_new))
+                while candidates and self.to_old[candidates[0]] != -1:
+                    candidates.popleft()
+                if not (candidates and self.pair_subtree(o, candidates.popleft())):
+                    rest.append(o)
+            for o, n in zip(rest, [n for n in news if self.to_old[n] == -1]):
+                self.pair_subtree(o, n)
+
+    def bottom_up(self):
+        old, new = self.old, self.new
+        for o in range(len(old) - 1, -1, -1):
+            if self.to_new[o] != -1:
+                continue
+            block_type = old.block(o).get('type')
+            for name, child in old.heads[o].items():
+                partner = self.to_new[child]
+                if partner == -1 or new.slot[partner] != name:
+                    continue
+                n = new.container[partner]
+                if n != -1 and self.to_old[n] == -1 and new.block(n).get('type') == block_type:
+                    self.pair(o, n)
+                    break
+
+    def align(self, olds, news):
+        """Pairs the unmatched blocks of two sibling lists: same structure first, then same type, each in order."""
+        olds = [o for o in olds if self.to_new[o] == -1]
+        news = [n for n in news if self.to_old[n] == -1]
+        if not olds or not news:
+            return
+        for exact in (True, False):
+            waiting = defaultdict(deque)
+            for n in news:
+                if self.to_old[n] == -1:
+                    waiting[self.new.hashed[n].node if exact else self.new.block(n).get('type')].append(n)
+            for o in olds:
+                if self.to_new[o] != -1:
+                    continue
+                candidates = waiting.get(self.old.hashed[o].node if exact else self.old.block(o).get('type'))
+                if not candidates:
+                    continue
+                n = candidates.popleft()
+                if exact:
+                    self.pair_subtree(o, n)
+                else:
+                    self.pair(o, n)
+
+    def top_down(self):
+        old, new = self.old, self.new
+        self.align(old.roots, new.roots)
+        for o in range(len(old)):
+            n = self.to_new[o]
+            if n == -1:
+                continue
+            for name, head in old.heads[o].items():
+                other = new.heads[n].get(name)
+                if other is not None:
+                    self.align(old.chain(head), new.chain(other))
+
+    def run(self):
+        with stage('transform'):
+            self.anchors()
+            self.exact()
+            self.bottom_up()
+            self.top_down()
+        count('blocks_matched', sum(1 for n in self.to_new if n != -1))
+
+
+def _longest_increasing(values: List[int]) -> set:
+    """Indices of one longest strictly increasing subsequence of `values` (patience sorting)."""
+    tails, tail_at, back = [], [], [-1] * len(values)
+    for i, v in enumerate(values):
+        k = bisect.bisect_left(tails, v)
+        if k == len(tails):
+            tails.append(v)
+            tail_at.append(i)
+        else:
+            tails[k], tail_at[k] = v, i
+        back[i] = tail_at[k - 1] if k else -1
+    keep, i = set(), tail_at[-1] if tail_at else -1
+    while i != -1:
+        keep.add(i)
+        i = back[i]
+    return keep
+
+
+def _changes(a: dict, b: dict) -> str:
+    fields_a, fields_b = a.get('fields') or {}, b.get('fields') or {}
+    parts = []
+    for key in list(fields_a) + [k for k in fields_b if k not in fields_a]:
+        if fields_a.get(key) != fields_b.get(key):
+            parts.append(f"{key} {json.dumps(fields_a.get(key))} -> {json.dumps(fields_b.get(key))}")
+    for key in sorted((set(a) | set(b)) - set(IGNORED_KEYS) - {'inputs', 'next', 'fields'}):
+        if a.get(key) != b.get(key):
+            parts.append(key)
+    return ', '.join(parts)
+
+
+def diff_trees(old: _Tree, new: _Tree) -> List[Edit]:
+    matcher = _Matcher(old, new)
+    matcher.run()
+    to_new, to_old = matcher.to_new, matcher.to_old
+    edits = []
+
+    # Reorders inside a chain: matched blocks off the longest in-order run moved.
+    reordered = set()
+    chains = defaultdict(list)
+    for o in range(len(old)):
+        n = to_new[o]
+        c = old.container[o]
+        if n != -1 and c != -1 and to_new[c] == new.container[n] and old.slot[o] == new.slot[n]:
+            chains[(c, old.slot[o])].append(o)
+    for members in chains.values():
+        if len(members) > 1:
+            keep = _longest_increasing([new.position[to_new[o]] for o in members])
+            reordered.update(o for k, o in enumerate(members) if k not in keep)
+
+    with stage('transform'):
+        for o in range(len(old)):
+            n = to_new[o]
+            if n == -1:
+                c = old.container[o]
+                if c == -1 or to_new[c] != -1:
+                    size = sum(1 for i in old.node_range(o) if to_new[i] == -1)
+                    edits.append(Edit('delete', o, None, size, f"{describe(old.block(o))} from {old.location(o)}"))
+                continue
+            a, b = old.block(o), new.block(n)
+            if block_data(a) != block_data(b):
+                edits.append(Edit('update', o, n, 1, f"{a.get('type')} at {new.location(n)}: {_changes(a, b)}"))
+            c = old.container[o]
+            if c == -1:
+                continue
+            if to_new[c] != new.container[n] or old.slot[o] != new.slot[n]:
+                edits.append(Edit('move', o, n, 1, f"{describe(a)} from {old.location(o)} to {new.location(n)}"))
+            elif o in reordered:
+                edits.append(Edit('move', o, n, 1, f"{describe(a)} within {old.location(o)} -> [{new.position[n]}]"))
+        for n in range(len(new)):
+            c = new.container[n]
+            if to_old[n] == -1 and (c == -1 or to_old[c] != -1):
+                size = sum(1 for i in new.node_range(n) if to_old[i] == -1)
+                edits.append(Edit('insert', None, n, size, f"{describe(new.block(n))} at {new.location(n)}"))
+    for kind in EDIT_KINDS:
+        count(f"edits_{kind}", sum(1 for e in edits if e.kind == kind))
+    return edits
+
+
+def name_variables(state, roots):
+    """
+    Replaces variable ids in `fields.VAR` with the variable names (in place), so a
+    variable that Blockly recreated under a new id still compares equal.
+    """
+    workspace = state
+    while isinstance(workspace, dict) and not isinstance(workspace.get('variables'), list) \
+            and isinstance(workspace.get('mod', workspace.get('workspace')), dict):
+        workspace = workspace.get('mod', workspace.get('workspace'))
+    variables = workspace.get('variables') if isinstance(workspace, dict) else None
+    names = {v.get('id'): v.get('name') for v in variables or () if isinstance(v, dict)}
+    for root in roots:
+        if not isinstance(root, dict):
+            continue
+        for visit in walk(root, shadows=True):
+            var = (visit.block.get('fields') or {}).get('VAR')
+            if isinstance(var, dict) and var.get('id') in names:
+                var['id'] = names[var['id']]
+
+
+def diff_mods(old_state, new_state):
+    """Returns (old tree, new tree, edits)."""
+    old_roots, _ = top_level_blocks(old_state)
+    new_roots, _ = top_level_blocks(new_state)
+    name_variables(old_state, old_roots or [])
+    name_variables(new_state, new_roots or [])
+    table = StructureTable()
+    with stage('transform'):
+        old, new = _Tree(old_roots or [], table), _Tree(new_roots or [], table)
+    return old, new, diff_trees(old, new)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Structural diff of two Portal mod exports (ids and x/y ignored).")
+    parser.add_argument('old', help="old export or saved workspace JSON")
+    parser.add_argument('new', help="new export or saved workspace JSON")
+    parser.add_argument('--json', action='store_true', help="print the edits as JSON")
+    parser.add_argument('--limit', type=int, default=200, help="edits to print (default: 200, 0 for the summary only)")
+    args = parser.parse_args()
+
+    states = []
+    for path in (args.old, args.new):
+        try:
+            with stage('read'), open(path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Cannot read {path}: {e}")
+            sys.exit(1)
+        if top_level_blocks(state)[0] is None:
+            print(f"{path}: not a Portal mod or workspace JSON")
+            sys.exit(1)
+        states.append(state)
+
+    old, new, edits = diff_mods(*states)
+    totals = {kind: sum(1 for e in edits if e.kind == kind) for kind in EDIT_KINDS}
+    matched = len(old) - sum(e.blocks for e in edits if e.kind == 'delete')
+    if args.json:
+        json.dump({'old_blocks': len(old), 'new_blocks': len(new), 'matched_blocks': matched, 'totals': totals,
+                   'edits': [e._asdict() for e in edits]}, sys.stdout, indent=2)
+        print()
+        return
+    for e in edits[:args.limit]:
+        size = f" ({e.blocks} blocks)" if e.blocks > 1 else ''
+        print(f"{e.kind:7} {e.detail}{size}")
+    if len(edits) > args.limit > 0:
+        print(f"... {len(edits) - args.limit} more")
+    print(f"{len(old)} -> {len(new)} blocks, {matched} matched: "
+          + ', '.join(f"{totals[k]} {k}" for k in EDIT_KINDS))
+
+
+if __name__ == "__main__":
+    run_main(main)
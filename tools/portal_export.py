@@ -0,0 +1,732 @@
+"""
+Headless "Export for Portal": converts saved workspaces to Portal imports.
+
+Python port of the web UI export path (serialization.ts `exportForPortal`):
+
+    expand_collections   expandCollectionsForPortalExport: inline BF6_COLLECTION_CALL
+                         blocks, strip the tool-only collection blocks
+    convert_state        convertWorkspaceStateInternalToPortal (portal_convert.ts): Portal
+                         type names, RULE_HEADER fields, subroutine extraState, input
+                         renames by position (remap_inputs_by_position)
+    dumps_js             JSON.stringify(wrapPortalExport(state), null, 2)
+
+Portal specs are catalog.portal_specs (bf6portal_blocks.compact.json, else
+bf6portal_blocks.json), as loaded by the UI. The internal input shapes the UI
+reads off a fresh Blockly block come from the JSON block definitions, in the
+UI's registration order; the imperatively defined structural blocks resolve
+through PORTAL_TYPE_EXPORT_OVERRIDES instead.
+
+For a workspace saved by the tool the output is byte-identical to the UI
+export, except for the ids of blocks cloned out of a collection definition:
+the UI draws them from crypto.randomUUID(), this port from a seeded generator
+so re-exports are reproducible. Tree walks use explicit stacks, so long `next`
+chains do not hit the recursion limit.
+
+Usage:
+    python tools/portal_export.py workspaces/ --out exports/          # one process per CPU
+    python tools/portal_export.py a.json b.json --out exports/ --jobs 1
+
+Directory inputs keep their relative layout under --out. Exits 1 when any file
+fails to convert.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import re
+import sys
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from json.encoder import encode_basestring
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from catalog_engine import BLOCKS_FILES, input_names, iter_block_definitions, load_catalog
+from instrumentation import count, run_main, stage
+from portal_tree import COLLECTION_CALL_TYPE, COLLECTION_DEF_TYPE, PORTAL_TYPE_EXPORT_OVERRIDES, walk
+
+GENERATED_BLOCKS_FILE = 'web_ui/src/blocks/generated_blocks.ts'
+# Registration order in index.ts; later definitions replace earlier ones.
+SHAPE_SOURCES = BLOCKS_FILES + [GENERATED_BLOCKS_FILE]
+# index.ts keeps the ./blocks/variables versions of these instead of the expanded ones.
+SHAPE_SKIPPED_TYPES = {'GETVARIABLE', 'SETVARIABLE'}
+RULE_HEADER_FIELD_RENAMES = [
+    ('RULE_NAME', 'NAME'),
+    ('EVENT_TYPE', 'EVENTTYPE'),
+    ('SCOPE', 'OBJECTTYPE'),
+    ('SCOPE_TYPE', 'OBJECTTYPE'),
+]
+CALL_ARG_RE = re.compile(r'ARG_(\d+)', re.ASCII)
+CLONE_ID_SEED = 0
+MAX_UNKNOWN_LISTED = 10
+
+_SURROGATE_RE = re.compile('[\ud800-\udfff]')
+_END = object()
+
+# Per-process export context, set once per worker by _init_worker.
+_CONTEXT = None
+
+
+# --- JavaScript value semantics ---
+
+def _is_object(value):
+    """typeof value === 'object' && value !== null."""
+    return isinstance(value, (dict, list))
+
+
+def _truthy(value):
+    return _is_object(value) or bool(value)
+
+
+def _get(obj, key):
+    """obj?.[key] for parsed JSON values."""
+    return obj.get(key) if isinstance(obj, dict) else None
+
+
+def _js_number(value):
+    """Number.prototype.toString for a JSON number (as JSON.stringify prints it)."""
+    if isinstance(value, int):
+        if abs(value) < 2 ** 53:
+            return str(value)
+        try:
+            value = float(value)
+        except OverflowError:
+            return 'null'
+    if not math.isfinite(value):
+        return 'null'
+    if value == 0:
+        return '0'
+    if value.is_integer() and abs(value) < 2 ** 53:
+        return str(int(value))
+    sign = '-' if value < 0 else ''
+    _, digit_tuple, exponent = Decimal(repr(abs(value))).as_tuple()
+    digits = ''.join(map(str, digit_tuple)).rstrip('0')
+    exponent += len(digit_tuple) - len(digits)
+    k = len(digits)
+    n = exponent + k  # value = 0.digits * 10**n
+    if k <= n <= 21:
+        return sign + digits + '0' * (n - k)
+    if 0 < n <= 21:
+        return sign + digits[:n] + '.' + digits[n:]
+    if -6 < n <= 0:
+        return sign + '0.' + '0' * -n + digits
+    mantissa = digits[0] + ('.' + digits[1:] if k > 1 else '')
+    return f"{sign}{mantissa}e{'+' if n - 1 >= 0 else '-'}{abs(n - 1)}"
+
+
+def _js_string(value):
+    """String(value ?? '')."""
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return _js_number(value)
+    if isinstance(value, list):
+        return ','.join(_js_string(v) for v in value)
+    return '[object Object]'
+
+
+def _quote(text):
+    quoted = encode_basestring(text)
+    if _SURROGATE_RE.search(quoted):
+        # JSON.stringify escapes lone surrogates instead of emitting invalid UTF-16.
+        quoted = _SURROGATE_RE.sub(lambda m: f"\\u{ord(m.group()):04x}", quoted)
+    return quoted
+
+
+def _is_array_index(key):
+    return key.isdigit() and key.isascii() and (key == '0' or key[0] != '0') and int(key) < 2 ** 32 - 1
+
+
+def _js_items(obj):
+    """obj's entries in JavaScript property order: array-index keys first, ascending."""
+    indexes = [k for k in obj if _is_array_index(k)]
+    if not indexes:
+        return obj.items()
+    indexes.sort(key=int)
+    index_set = set(indexes)
+    return [(k, obj[k]) for k in indexes] + [(k, v) for k, v in obj.items() if k not in index_set]
+
+
+def dumps_js(value, indent=2):
+    """JSON.stringify(value, null, indent) for parsed JSON values, without recursion."""
+    parts = []
+    append = parts.append
+    stack = []  # [iterator, closing bracket, is_object, has_items]
+    pending = value
+    while True:
+        v = pending
+        if isinstance(v, str):
+            append(_quote(v))
+        elif v is None:
+            append('null')
+        elif v is True:
+            append('true')
+        elif v is False:
+            append('false')
+        elif isinstance(v, (int, float)):
+            append(_js_number(v))
+        elif isinstance(v, dict):
+            if v:
+                append('{')
+                stack.append([iter(_js_items(v)), '}', True, False])
+            else:
+                append('{}')
+        elif isinstance(v, list):
+            if v:
+                append('[')
+                stack.append([iter(v), ']', False, False])
+            else:
+                append('[]')
+        else:
+            raise TypeError(f"not a JSON value: {type(v).__name__}")
+
+        while stack:
+            frame = stack[-1]
+            item = next(frame[0], _END)
+            if item is _END:
+                stack.pop()
+                append('\n' + ' ' * (indent * len(stack)) + frame[1])
+                continue
+            append((',\n' if frame[3] else '\n') + ' ' * (indent * len(stack)))
+            frame[3] = True
+            if frame[2]:
+                key, pending = item
+                append(_quote(key) + ': ')
+            else:
+                pending = item
+            break
+        else:
+            return ''.join(parts)
+
+
+def _clone_json(value):
+    """JSON.parse(JSON.stringify(value)), without recursion."""
+    stack = []
+
+    def fresh(v):
+        if isinstance(v, dict):
+            c = {}
+        elif isinstance(v, list):
+            c = []
+        else:
+            return v
+        stack.append((v, c))
+        return c
+
+    root = fresh(value)
+    while stack:
+        src, dst = stack.pop()
+        if isinstance(src, dict):
+            for k, v in src.items():
+                dst[k] = fresh(v)
+        else:
+            dst.extend(fresh(v) for v in src)
+    return root
+
+
+# --- Workspace state (portal_json.ts) ---
+
+def normalize_workspace_state(state):
+    """normalizeWorkspaceState: unwraps `mod` / `workspace` and fills in Blockly's state shape (in place)."""
+    while _is_object(state):
+        if isinstance(state, list):
+            return state
+        if _is_object(state.get('mod')):
+            state = state['mod']
+            continue
+        if _is_object(state.get('workspace')):
+            state = state['workspace']
+            continue
+        blocks = state.get('blocks')
+        if isinstance(blocks, dict) and isinstance(blocks.get('blocks'), list):
+            if 'languageVersion' not in blocks:
+                blocks['languageVersion'] = 0
+            if not isinstance(state.get('variables'), list):
+                state['variables'] = []
+            return state
+        if isinstance(blocks, list):
+            variables = state.get('variables')
+            return {
+                'blocks': {'languageVersion': 0, 'blocks': blocks},
+                'variables': variables if isinstance(variables, list) else [],
+            }
+        return state
+    return state
+
+
+def wrap_portal_export(state):
+    """wrapPortalExport: {mod: {blocks, variables}}."""
+    normalized = normalize_workspace_state(state)
+    if isinstance(normalized, dict) and _is_object(normalized.get('blocks')):
+        variables = normalized.get('variables')
+        return {'mod': {'blocks': normalized['blocks'], 'variables': variables if isinstance(variables, list) else []}}
+    return {'mod': {'blocks': {'languageVersion': 0, 'blocks': []}, 'variables': []}}
+
+
+# --- Collections (serialization.ts) ---
+
+def _field_string(block, name):
+    return _js_string(_get(_get(block, 'fields'), name)).strip()
+
+
+def _next_block(block):
+    nxt = _get(block, 'next')
+    child = _get(nxt, 'block')
+    return child if _truthy(child) else None
+
+
+def _set_next(block, nxt):
+    if not isinstance(block, dict):
+        return
+    if nxt is None:
+        if _truthy(block.get('next')):
+            del block['next']
+        return
+    if not isinstance(block.get('next'), dict):
+        block['next'] = {}
+    block['next']['block'] = nxt
+
+
+def _tail(block):
+    while _next_block(block) is not None:
+        block = block['next']['block']
+    return block
+
+
+def _attach(head, link, block):
+    """Links `block` after `link` ((block, 'assign' | 'set') or None for the chain head). Returns the head."""
+    if link is None:
+        return block
+    prev, how = link
+    if how == 'assign':
+        prev['next']['block'] = block
+    else:
+        _set_next(prev, block)
+    return head
+
+
+class _CollectionExpander:
+    """expandCollectionsInBlockTree over explicit stacks: chains are walked in a loop, inputs are queued."""
+
+    def __init__(self, definitions, existing_ids, seed=CLONE_ID_SEED):
+        self.definitions = definitions
+        self.existing_ids = existing_ids
+        self.rng = random.Random(seed)
+        self.pending: List[Tuple[dict, tuple]] = []
+
+    def new_id(self):
+        while True:
+            block_id = str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+            if block_id not in self.existing_ids:
+                self.existing_ids.add(block_id)
+                return block_id
+
+    def clone(self, head):
+        copy = _clone_json(head)
+        for visit in walk(copy, shadows=True):
+            visit.block['id'] = self.new_id()
+        return copy
+
+    def expand_tree(self, root):
+        """The expanded replacement for a top-level block (None if nothing is left)."""
+        root = self.expand_chain(root, ())
+        while self.pending:
+            slot, stack = self.pending.pop()
+            slot['block'] = self.expand_chain(slot['block'], stack)
+        return root
+
+    def expand_chain(self, block, stack):
+        frames = []  # (head, link, block after the call, stack) of the chains waiting on a cloned body
+        head, link = None, None
+        while True:
+            while _truthy(block):
+                if isinstance(block, dict) and block.get('type') == COLLECTION_CALL_TYPE:
+                    name = _field_string(block, 'NAME')
+                    key = name.lower()
+                    following = _next_block(block)
+                    if name:
+                        if key in stack:
+                            raise ValueError(f"Recursive collection call blocked: {name}")
+                        definition = self.definitions.get(key)
+                        if definition is None:
+                            raise ValueError(f"Collection definition not found: {name}")
+                        body = _get(_get(_get(definition, 'inputs'), 'STACK'), 'block')
+                        if _truthy(body):
+                            frames.append((head, link, following, stack))
+                            head, link, block, stack = None, None, self.clone(body), stack + (key,)
+                            continue
+                    # No name or an empty definition: the call is dropped.
+                    block = following
+                    continue
+
+                head = _attach(head, link, block)
+                if not isinstance(block, dict):
+                    link = None
+                    break
+                inputs = block.get('inputs')
+                if isinstance(inputs, dict):
+                    for slot in inputs.values():
+                        if isinstance(slot, dict) and _truthy(slot.get('block')):
+                            self.pending.append((slot, stack))
+                if _next_block(block) is not None:
+                    link = (block, 'assign')
+                    block = block['next']['block']
+                else:
+                    link = None
+                    break
+
+            if link is not None:
+                _attach(head, link, None)
+            if not frames:
+                return head
+            expanded = head
+            head, link, block, stack = frames.pop()
+            if expanded is not None:
+                head = _attach(head, link, expanded)
+                link = (_tail(expanded), 'set')
+
+
+def _contains_collection_blocks(root):
+    stack = [root]
+    while stack:
+        block = stack.pop()
+        if not _truthy(block):
+            continue
+        if _get(block, 'type') in (COLLECTION_CALL_TYPE, COLLECTION_DEF_TYPE):
+            return True
+        inputs = _get(block, 'inputs')
+        if isinstance(inputs, dict):
+            stack.extend(_get(slot, 'block') for slot in inputs.values())
+        stack.append(_get(_get(block, 'next'), 'block'))
+    return False
+
+
+def expand_collections(state, seed=CLONE_ID_SEED):
+    """
+    expandCollectionsForPortalExport, in place: inlines every collection call with
+    a re-id'd copy of its definition's STACK and drops the collection blocks.
+    Raises ValueError for unknown or recursive collections.
+    """
+    normalized = normalize_workspace_state(state)
+    blocks_root = _get(normalized, 'blocks')
+    if not isinstance(blocks_root, dict):
+        return normalized
+    top_blocks = blocks_root.get('blocks') if isinstance(blocks_root.get('blocks'), list) else []
+
+    existing_ids = set()
+    definitions = {}
+    for root in top_blocks:
+        if not isinstance(root, dict):
+            continue
+        for visit in walk(root, shadows=True):
+            block_id = visit.block.get('id')
+            if isinstance(block_id, str) and block_id:
+                existing_ids.add(block_id)
+        if root.get('type') == COLLECTION_DEF_TYPE:
+            name = _field_string(root, 'NAME')
+            if name:
+                definitions.setdefault(name.lower(), root)
+
+    expander = _CollectionExpander(definitions, existing_ids, seed)
+    for i, root in enumerate(top_blocks):
+        if _truthy(root):
+            top_blocks[i] = expander.expand_tree(root)
+
+    blocks_root['blocks'] = [b for b in top_blocks if _truthy(b) and _get(b, 'type') not in (COLLECTION_DEF_TYPE, COLLECTION_CALL_TYPE)]
+    if any(_contains_collection_blocks(b) for b in blocks_root['blocks']):
+        raise ValueError('Internal collection blocks remained after export expansion.')
+    return normalized
+
+
+# --- Internal -> Portal conversion (portal_convert.ts) ---
+
+def internal_shapes(catalog=None) -> Dict[str, Tuple[List[str], List[str]]]:
+    """{internal type: ([value inputs], [statement inputs])} as Blockly builds them from the JSON definitions."""
+    catalog = catalog or load_catalog()
+    shapes = {}
+    for rel in SHAPE_SOURCES:
+        block_defs = catalog.blocks_in(rel) if rel in BLOCKS_FILES else iter_block_definitions(catalog.read_text(rel), rel)
+        for block_def in block_defs:
+            block_type = block_def.get('type')
+            if not block_type or (rel != GENERATED_BLOCKS_FILE and block_type in SHAPE_SKIPPED_TYPES):
+                continue
+            args = []
+            i = 0
+            while f"message{i}" in block_def:
+                args.extend(block_def.get(f"args{i}") or [])
+                i += 1
+            shapes[block_type] = input_names(args)
+    return shapes
+
+
+def remap_inputs_by_position(inputs, from_names, to_names):
+    """remapInputsByPosition: renames existing keys of `inputs` from_names[i] -> to_names[i] (returns a copy)."""
+    if not isinstance(inputs, dict):
+        return inputs
+    out = dict(inputs)
+    for old, new in zip(from_names, to_names):
+        if not old or not new or old == new or old not in out or new in out:
+            continue
+        out[new] = out.pop(old)
+    return out
+
+
+def _rename_call_args(inputs):
+    out = dict(inputs)
+    for key in list(out):
+        m = CALL_ARG_RE.fullmatch(key)
+        if not m:
+            continue
+        new = f"PARAM-{m.group(1)}"
+        if new in out:
+            continue
+        out[new] = out.pop(key)
+    return out
+
+
+def _subroutine_field(block, name):
+    value = _get(_get(block, 'fields'), name)
+    return value if isinstance(value, str) else _js_string(value).strip()
+
+
+def _normalize_sub_params(params):
+    out = []
+    for p in params if isinstance(params, list) else []:
+        if isinstance(p, dict):
+            item = p
+        elif _is_object(p):
+            item = {}
+        else:
+            item = {'name': _js_string(p), 'type': ''}
+        name = _js_string(item.get('name')).strip()
+        types = _js_string(item['types'] if item.get('types') is not None else item.get('type')).strip()
+        if name:
+            out.append({'name': name, 'types': types or 'Any'})
+    return out
+
+
+def _subroutine_params(block):
+    extra = block.get('extraState')
+    if isinstance(extra, dict):
+        if isinstance(extra.get('parameters'), list):
+            return _normalize_sub_params(extra['parameters'])
+        if isinstance(extra.get('params'), list):
+            return _normalize_sub_params(extra['params'])
+    raw = _get(block.get('mutation'), 'params')
+    if isinstance(raw, list):
+        return _normalize_sub_params(raw)
+    if isinstance(raw, str) and raw.strip():
+        try:
+            return _normalize_sub_params(json.loads(raw))
+        except ValueError:
+            pass
+    return []
+
+
+class ExportContext:
+    """Portal specs, the case-insensitive type index and the internal block shapes."""
+
+    def __init__(self, specs, shapes):
+        self.specs = specs
+        self.shapes = shapes
+        self.by_lower = {}
+        for portal_type in specs:
+            self.by_lower[portal_type.lower()] = portal_type
+        self.known_types = set(specs) | set(PORTAL_TYPE_EXPORT_OVERRIDES.values())
+
+    def shape(self, internal_type):
+        return self.shapes.get(internal_type, ([], []))
+
+    def resolve(self, internal_type):
+        """resolvePortalTypeFromInternalType."""
+        t = internal_type.strip()
+        if not t:
+            return t
+        if t in PORTAL_TYPE_EXPORT_OVERRIDES:
+            return PORTAL_TYPE_EXPORT_OVERRIDES[t]
+        candidate = self.by_lower.get(t.lower()) or t
+        if candidate != t:
+            spec = self.specs.get(candidate)
+            if spec is not None:
+                want = len(spec[0]) + len(spec[1])
+                value_inputs, statement_inputs = self.shape(t)
+                # Only rename when the internal block's input arity matches the Portal spec.
+                if want > 0 and len(value_inputs) + len(statement_inputs) != want:
+                    return t
+        return candidate
+
+    def convert_block(self, block):
+        """convertBlockTreeInternalToPortal for one block (its children are converted by the caller)."""
+        internal_type = _js_string(block.get('type')) if _truthy(block.get('type')) else ''
+        portal_type = self.resolve(internal_type)
+
+        if internal_type == 'RULE_HEADER' and isinstance(block.get('fields'), dict):
+            fields = dict(block['fields'])
+            for old, new in RULE_HEADER_FIELD_RENAMES:
+                if old in fields and new not in fields:
+                    fields[new] = fields.pop(old)
+            block['fields'] = fields
+
+        if internal_type in ('SUBROUTINE_BLOCK', 'CALLSUBROUTINE'):
+            name = _subroutine_field(block, 'SUBROUTINE_NAME') or _subroutine_field(block, 'SUBROUTINE')
+            params = _subroutine_params(block)
+            existing = block.get('extraState')
+            extra = dict(existing) if isinstance(existing, dict) else {}
+            if name and not isinstance(extra.get('subroutineName'), str):
+                extra['subroutineName'] = name
+            if not (isinstance(extra.get('parameters'), list) and extra['parameters']):
+                extra['parameters'] = params
+            if internal_type == 'CALLSUBROUTINE' and isinstance(block.get('inputs'), dict):
+                # Dynamic ARG_n inputs become Portal's PARAM-n.
+                block['inputs'] = _rename_call_args(block['inputs'])
+            block['extraState'] = extra
+
+        if internal_type == 'RULE_HEADER' and not _is_object(block.get('extraState')):
+            block['extraState'] = {'isOngoingEvent': False}
+
+        if portal_type != internal_type and isinstance(block.get('inputs'), dict):
+            spec = self.specs.get(portal_type) if portal_type else None
+            if spec is not None:
+                value_inputs, statement_inputs = self.shape(internal_type)
+                inputs = remap_inputs_by_position(block['inputs'], value_inputs, spec[0])
+                block['inputs'] = remap_inputs_by_position(inputs, statement_inputs, spec[1])
+
+        if portal_type and portal_type != internal_type:
+            block['type'] = portal_type
+
+    def convert_state(self, state):
+        """convertWorkspaceStateInternalToPortal, in place. Returns (state, blocks converted)."""
+        s = normalize_workspace_state(state)
+        blocks = _get(_get(s, 'blocks'), 'blocks')
+        converted = 0
+        if isinstance(blocks, list):
+            for root in blocks:
+                if not isinstance(root, dict):
+                    continue
+                for visit in walk(root):
+                    self.convert_block(visit.block)
+                    converted += 1
+        return s, converted
+
+    def unknown_types(self, state):
+        """Block types (shadows included) that Portal will not recognise, as describePortalExportUnknownTypes lists them."""
+        found = set()
+        for root in _get(_get(state, 'blocks'), 'blocks') or []:
+            if not isinstance(root, dict):
+                continue
+            for visit in walk(root, shadows=True):
+                block_type = visit.block.get('type')
+                if isinstance(block_type, str) and block_type not in self.known_types:
+                    found.add(block_type)
+        return sorted(found, key=str.lower)
+
+
+def export_state(state, ctx, seed=CLONE_ID_SEED):
+    """Workspace state -> (Portal export text, blocks converted, unknown types). Mutates `state`."""
+    with stage('transform'):
+        expanded = expand_collections(state, seed)
+        converted, blocks = ctx.convert_state(expanded)
+        unknown = ctx.unknown_types(converted)
+        text = dumps_js(wrap_portal_export(converted))
+    count('blocks_converted', blocks)
+    return text, blocks, unknown
+
+
+# --- Batch mode ---
+
+def iter_inputs(paths, out_dir=None):
+    """
+    Yields (input file, output file); directories are searched recursively and mirrored
+    under out_dir. Without out_dir the output file is None.
+    """
+    out_dir = Path(out_dir).resolve() if out_dir is not None else None
+    for p in map(Path, paths):
+        if p.is_dir():
+            for f in sorted(x for x in p.rglob('*.json') if x.is_file()):
+                if out_dir is None:
+                    yield f, None
+                elif out_dir not in f.resolve().parents:
+                    yield f, out_dir / f.relative_to(p)
+        elif p.is_file():
+            yield p, out_dir / p.name if out_dir is not None else None
+        else:
+            print(f"Warning: {p} not found.", file=sys.stderr)
+
+
+def export_file(job):
+    src, dst = job
+    result = {'path': str(src), 'out': str(dst), 'blocks': 0, 'unknown_types': [], 'error': None}
+    try:
+        with stage('read'):
+            with open(src, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        text, result['blocks'], result['unknown_types'] = export_state(state, _CONTEXT)
+        with stage('write'):
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            dst.write_bytes(text.encode('utf-8'))
+    except (OSError, ValueError) as e:
+        result['error'] = str(e)
+    return result
+
+
+def _init_worker(specs, shapes):
+    global _CONTEXT
+    _CONTEXT = ExportContext(specs, shapes)
+
+
+def export_paths(paths, out_dir, jobs=None, catalog=None):
+    """Exports every JSON file under `paths` into out_dir. Yields per-file results in input order."""
+    catalog = catalog or load_catalog()
+    specs = catalog.portal_specs
+    shapes = internal_shapes(catalog)
+    jobs_list = list(iter_inputs(paths, out_dir))
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1 or len(jobs_list) <= 1:
+        _init_worker(specs, shapes)
+        for job in jobs_list:
+            yield export_file(job)
+        return
+    chunksize = max(1, len(jobs_list) // (jobs * 8))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(specs, shapes)) as pool:
+        yield from pool.map(export_file, jobs_list, chunksize=chunksize)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert saved workspaces to Portal exports (headless Export for Portal).")
+    parser.add_argument('paths', nargs='+', help="workspace JSON files or directories (searched recursively)")
+    parser.add_argument('--out', required=True, help="output directory")
+    parser.add_argument('--jobs', '-j', type=int, default=0, help="worker processes (default: CPU count; 1 = in-process)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = []
+    for result in export_paths(args.paths, args.out, args.jobs):
+        results.append(result)
+        if result['error']:
+            print(f"{result['path']}: ERROR: {result['error']}")
+        elif result['unknown_types']:
+            unknown = result['unknown_types']
+            more = f" (+{len(unknown) - MAX_UNKNOWN_LISTED} more)" if len(unknown) > MAX_UNKNOWN_LISTED else ''
+            print(f"{result['path']}: warn: unknown/unsupported Portal block types ({len(unknown)}): "
+                  f"{', '.join(unknown[:MAX_UNKNOWN_LISTED])}{more}")
+    elapsed = time.perf_counter() - start
+
+    failed = [r for r in results if r['error']]
+    blocks = sum(r['blocks'] for r in results)
+    rate = len(results) / elapsed if elapsed else 0.0
+    print(f"\nExported {len(results) - len(failed)} of {len(results)} files ({blocks} blocks) to {args.out} "
+          f"in {elapsed:.2f}s: {rate:.1f} files/sec")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_main(main)
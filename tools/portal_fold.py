@@ -0,0 +1,349 @@
+"""
+Constant folding for Portal mod exports.
+
+Expressions such as `Add(Number 2, Multiply(Number 3, Number 4))` or
+`Not(Boolean TRUE)` are evaluated by the game server every time their rule
+fires. When every input of a pure block is a literal, the block can be replaced
+by the literal it produces, and the pass runs bottom-up so nested expressions
+fold completely:
+
+    arithmetic  Add Subtract Multiply Divide Modulo RaiseToPower Max
+                AbsoluteValue Floor Ceiling RoundToInteger SquareRoot
+    logic       And Or Xor Not
+    comparison  Equals NotEqualTo GreaterThan GreaterThanEqualTo LessThan LessThanEqualTo
+    vectors     Add/Subtract of two literal vectors, Multiply/Divide of a literal vector
+                by a Number, GetX/Y/ZComponent of a literal vector
+
+Portal has no vector literal, so `CreateVector(Number, Number, Number)` is
+already the cheapest form of a constant vector: its inputs are folded and
+vector arithmetic on it is precomputed, but the CreateVector itself stays.
+
+A type is only folded if its evaluator here is backed by the catalog: the
+block DB must list it as a value block (MATH/LOGIC/OTHER/TRANSFORM) with at
+least as many inputs as the evaluator reads. Min has an evaluator but no block
+in the DB, so it is not folded. Where the game's behaviour is not documented,
+nothing is folded: division or modulo by zero, modulo or rounding of negative
+numbers, and results that are not finite.
+
+The report counts evaluations removed per rule firing (per call for
+subroutines): one per block that disappeared, counted once even if it sits in a
+branch that does not run. Blocks inside loops are listed separately, since
+those are saved on every iteration.
+
+Usage:
+    python tools/portal_fold.py "=Resources=/Portal Blocks/custom_conquest_template_V8.0.json"
+    python tools/portal_fold.py mod.json --out mod.folded.json
+    python tools/portal_fold.py mod.json --json
+"""
+
+import argparse
+import json
+import math
+import sys
+from collections import defaultdict
+from typing import Callable, Dict, NamedTuple, Optional
+
+from catalog_engine import load_catalog, portal_type_of
+from instrumentation import count, run_main, stage
+from portal_export import dumps_js
+from portal_tree import block_label, owner_of, top_level_blocks, walk
+
+# Toolbox categories whose value blocks may be pure; TRANSFORM holds the vector blocks.
+PURE_CATEGORIES = ('MATH', 'LOGIC', 'OTHER', 'TRANSFORM')
+# Loop inputs evaluated on every iteration (ForVariable's bounds are read once).
+LOOP_BODIES = {'ForVariable': ('DO',), 'While': ('VALUE-0', 'DO')}
+VECTOR_TYPE = 'CreateVector'
+
+
+class Vector(NamedTuple):
+    x: float
+    y: float
+    z: float
+
+
+def _number(v):
+    return v if isinstance(v, (int, float)) and not isinstance(v, bool) else None
+
+
+def _numbers(*values):
+    return all(_number(v) is not None for v in values)
+
+
+def _nonnegative(*values):
+    return _numbers(*values) and all(v >= 0 for v in values)
+
+
+def _add(a, b):
+    if _numbers(a, b):
+        return a + b
+    if isinstance(a, Vector) and isinstance(b, Vector):
+        return Vector(a.x + b.x, a.y + b.y, a.z + b.z)
+    return None
+
+
+def _subtract(a, b):
+    if _numbers(a, b):
+        return a - b
+    if isinstance(a, Vector) and isinstance(b, Vector):
+        return Vector(a.x - b.x, a.y - b.y, a.z - b.z)
+    return None
+
+
+def _multiply(a, b):
+    if _numbers(a, b):
+        return a * b
+    if isinstance(a, Vector) and _number(b) is not None:
+        return Vector(a.x * b, a.y * b, a.z * b)
+    if isinstance(b, Vector) and _number(a) is not None:
+        return Vector(b.x * a, b.y * a, b.z * a)
+    return None
+
+
+def _divide(a, b):
+    if _number(b) is None or b == 0:
+        return None
+    if _number(a) is not None:
+        return a / b
+    if isinstance(a, Vector):
+        return Vector(a.x / b, a.y / b, a.z / b)
+    return None
+
+
+def _power(a, b):
+    if not _numbers(a, b) or (a < 0 and not float(b).is_integer()) or (a == 0 and b < 0):
+        return None
+    try:
+        return math.pow(a, b)
+    except OverflowError:
+        return None
+
+
+def _bools(*values):
+    return all(isinstance(v, bool) for v in values)
+
+
+def _compare(op):
+    return lambda a, b: op(a, b) if _numbers(a, b) else None
+
+
+def _equals(a, b):
+    return a == b if _numbers(a, b) or _bools(a, b) else None
+
+
+def _component(index):
+    return lambda v: v[index] if isinstance(v, Vector) else None
+
+
+# Portal type -> (number of VALUE-n inputs, evaluator returning None when it cannot fold).
+EVALUATORS: Dict[str, tuple] = {
+    'Add': (2, _add),
+    'Subtract': (2, _subtract),
+    'Multiply': (2, _multiply),
+    'Divide': (2, _divide),
+    'Modulo': (2, lambda a, b: a % b if _nonnegative(a, b) and b else None),
+    'RaiseToPower': (2, _power),
+    'Max': (2, lambda a, b: max(a, b) if _numbers(a, b) else None),
+    'Min': (2, lambda a, b: min(a, b) if _numbers(a, b) else None),
+    'AbsoluteValue': (1, lambda a: abs(a) if _numbers(a) else None),
+    'Floor': (1, lambda a: math.floor(a) if _numbers(a) else None),
+    'Ceiling': (1, lambda a: math.ceil(a) if _numbers(a) else None),
+    'RoundToInteger': (1, lambda a: math.floor(a + 0.5) if _nonnegative(a) else None),
+    'SquareRoot': (1, lambda a: math.sqrt(a) if _nonnegative(a) else None),
+    'And': (2, lambda a, b: a and b if _bools(a, b) else None),
+    'Or': (2, lambda a, b: a or b if _bools(a, b) else None),
+    'Xor': (2, lambda a, b: a != b if _bools(a, b) else None),
+    'Not': (1, lambda a: not a if _bools(a) else None),
+    'Equals': (2, _equals),
+    'NotEqualTo': (2, lambda a, b: None if _equals(a, b) is None else not _equals(a, b)),
+    'GreaterThan': (2, _compare(lambda a, b: a > b)),
+    'GreaterThanEqualTo': (2, _compare(lambda a, b: a >= b)),
+    'LessThan': (2, _compare(lambda a, b: a < b)),
+    'LessThanEqualTo': (2, _compare(lambda a, b: a <= b)),
+    'GetXComponent': (1, _component(0)),
+    'GetYComponent': (1, _component(1)),
+    'GetZComponent': (1, _component(2)),
+}
+
+
+def _input_names(arity):
+    return [f"VALUE-{i}" for i in range(arity)]
+
+
+def foldable_types(catalog=None) -> Dict[str, Callable]:
+    """Evaluators whose type the catalog lists as a pure value block taking enough inputs."""
+    catalog = catalog or load_catalog()
+    entries = {portal_type_of(e): e for e in catalog.block_db}
+    out = {}
+    for portal_type, (arity, fn) in EVALUATORS.items():
+        entry = entries.get(portal_type)
+        values, statements = catalog.portal_specs.get(portal_type, ([], []))
+        if entry is None or entry.get('connections') != 'Value' or entry.get('category') not in PURE_CATEGORIES:
+            continue
+        # Exports name inputs positionally (VALUE-n) even where the catalog's arg names differ, e.g. Not.
+        if statements or len(values) < arity:
+            continue
+        out[portal_type] = (arity, fn)
+    return out
+
+
+# --- Literals ---
+
+def _child(block, name):
+    slot = (block.get('inputs') or {}).get(name)
+    return slot.get('block') if isinstance(slot, dict) else None
+
+
+def literal_value(block):
+    """Python value of a literal block (number, bool or Vector), or None."""
+    if not isinstance(block, dict):
+        return None
+    btype = block.get('type')
+    fields = block.get('fields') or {}
+    if btype == 'Number':
+        value = fields.get('NUM')
+        if isinstance(value, str):
+            try:
+                value = float(value)
+            except ValueError:
+                return None
+        return value if _number(value) is not None and math.isfinite(value) else None
+    if btype == 'Boolean':
+        value = str(fields.get('BOOL', '')).upper()
+        return {'TRUE': True, 'FALSE': False}.get(value)
+    if btype == VECTOR_TYPE:
+        parts = [literal_value(_child(block, name)) for name in _input_names(3)]
+        if len(block.get('inputs') or {}) == 3 and _numbers(*parts):
+            return Vector(*parts)
+    return None
+
+
+def _num_literal(value, block_id):
+    if isinstance(value, float) and value.is_integer() and abs(value) < 2 ** 53:
+        value = int(value)
+    return {'type': 'Number', 'id': block_id, 'fields': {'NUM': value}}
+
+
+def literal_block(value, block_id, template=None) -> Optional[dict]:
+    """A literal block for `value` with id `block_id`; vectors reuse the ids of `template` (a literal CreateVector)."""
+    if isinstance(value, bool):
+        return {'type': 'Boolean', 'id': block_id, 'fields': {'BOOL': 'TRUE' if value else 'FALSE'}}
+    if isinstance(value, Vector):
+        if not all(math.isfinite(v) for v in value) or template is None:
+            return None
+        inputs = {}
+        for name, v in zip(_input_names(3), value):
+            inputs[name] = {'block': _num_literal(v, _child(template, name).get('id'))}
+        return {'type': VECTOR_TYPE, 'id': block_id, 'inputs': inputs}
+    if _number(value) is not None and math.isfinite(value):
+        return _num_literal(value, block_id)
+    return None
+
+
+# --- Folding ---
+
+def _subtree_size(block):
+    return sum(1 for _ in walk(block))
+
+
+def _in_loop(visit):
+    # A loop reached through `next` merely runs before the block.
+    while visit.parent is not None:
+        if visit.slot in LOOP_BODIES.get(visit.parent.block.get('type'), ()):
+            return True
+        visit = visit.parent
+    return False
+
+
+def fold_state(state, evaluators):
+    """
+    Folds literal expressions in place. Returns {owner label: {'removed', 'in_loops', 'folds'}}
+    where `removed` is block evaluations removed per firing (or call).
+    """
+    roots, _ = top_level_blocks(state)
+    if roots is None:
+        raise ValueError("not a Portal mod or workspace JSON")
+    report = defaultdict(lambda: {'removed': 0, 'in_loops': 0, 'folds': 0})
+    for root in roots:
+        if not isinstance(root, dict):
+            continue
+        for visit in reversed(list(walk(root))):  # inputs before the blocks that use them
+            block = visit.block
+            spec = evaluators.get(block.get('type'))
+            if spec is None or visit.slot == 'next' or 'next' in block:
+                continue
+            arity, fn = spec
+            if len(block.get('inputs') or {}) != arity:
+                continue
+            children = [_child(block, name) for name in _input_names(arity)]
+            args = [literal_value(child) for child in children]
+            if any(a is None for a in args):
+                continue
+            value = fn(*args)
+            if value is None:
+                continue
+            template = next((c for c, a in zip(children, args) if isinstance(a, Vector)), None)
+            folded = literal_block(value, block.get('id'), template)
+            if folded is None:
+                continue
+            before = _subtree_size(block)
+            block.clear()
+            block.update(folded)
+            removed = before - _subtree_size(block)
+            owner = owner_of(visit)
+            entry = report[block_label(owner.block) if owner else '<top-level>']
+            entry['removed'] += removed
+            entry['folds'] += 1
+            if _in_loop(visit):
+                entry['in_loops'] += removed
+            count('blocks_folded')
+    return dict(report)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fold constant expressions in a Portal mod export.")
+    parser.add_argument('file', help="Portal mod export JSON")
+    parser.add_argument('--out', help="where to write the folded mod (default: report only)")
+    parser.add_argument('--json', action='store_true', help="print a JSON report")
+    parser.add_argument('--top', type=int, default=20, help="rules/subroutines to list (default: 20)")
+    args = parser.parse_args()
+
+    try:
+        with stage('read'), open(args.file, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Cannot read {args.file}: {e}")
+        sys.exit(1)
+    evaluators = foldable_types()
+    try:
+        with stage('transform'):
+            report = fold_state(state, evaluators)
+    except ValueError as e:
+        print(f"{args.file}: {e}")
+        sys.exit(1)
+    if args.out:
+        with stage('write'), open(args.out, 'w', encoding='utf-8') as f:
+            f.write(dumps_js(state))
+
+    rows = sorted(report.items(), key=lambda item: (-item[1]['removed'], item[0]))
+    totals = {key: sum(r[key] for r in report.values()) for key in ('removed', 'in_loops', 'folds')}
+    if args.json:
+        json.dump({'folded_types': sorted(evaluators), 'totals': totals, 'owners': dict(rows)}, sys.stdout, indent=2)
+        print()
+        return
+    print(f"== {args.file}")
+    print(f"  {'removed':>7} {'in loops':>8} {'folds':>5}  rule / subroutine")
+    for label, r in rows[:args.top]:
+        print(f"  {r['removed']:7d} {r['in_loops']:8d} {r['folds']:5d}  {label}")
+    if len(rows) > args.top:
+        print(f"  ... {len(rows) - args.top} more")
+    print(f"Folded {totals['folds']} expressions: {totals['removed']} block evaluations removed per firing/call "
+          f"across {len(rows)} rules and subroutines ({totals['in_loops']} of them inside loops, saved per iteration)")
+    skipped = sorted(set(EVALUATORS) - set(evaluators))
+    if skipped:
+        print(f"Not folded (not a pure value block in the catalog): {', '.join(skipped)}")
+    if args.out:
+        print(f"Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    run_main(main)
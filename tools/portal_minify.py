@@ -0,0 +1,249 @@
+"""
+Minify Portal mod exports before pasting them into the Portal editor.
+
+Export for Portal (portal_json.wrapPortalExport / serialization.exportForPortal)
+writes what the editor needs to restore the canvas: x/y of every top-level
+block, Blockly's random 20-character ids, `collapsed` and `inline` flags,
+variables that no block uses, and two-space indentation. None of it changes
+what the mod does. This pass:
+
+    - drops x/y (--keep-positions keeps them), `collapsed` and `inline`;
+    - renumbers block and variable ids to short deterministic ones, in document order;
+    - removes variables that no block field references;
+    - writes compact JSON.
+
+Comments (`icons`) stay unless --strip-comments. Every file is checked by
+parsing the minified text back: it must have the same block structure
+(structural_hash.py, with the removed keys ignored), reference the same
+variables (by type and name) and have unique ids.
+
+A variable is referenced by any field holding `{"id": ...}` with its id:
+`VAR` in Portal's own blocks, `VARIABLE`/`VARIABLE_NAME` in the tool's
+SETVARIABLE/GETVARIABLE blocks (web_ui/src/blocks/variables.ts).
+
+Usage:
+    python tools/portal_minify.py "=Resources=/Portal Blocks"          # report only
+    python tools/portal_minify.py mod.json --out minified/
+    python tools/portal_minify.py exports/ --out minified/ --keep-positions --json
+"""
+
+import argparse
+import itertools
+import json
+import string
+import sys
+import time
+
+from instrumentation import count, run_main, stage
+from portal_export import dumps_js, iter_inputs
+from portal_tree import top_level_blocks, walk
+from structural_hash import IGNORED_KEYS, StructureTable
+
+POSITION_KEYS = ('x', 'y')
+LAYOUT_KEYS = ('collapsed', 'inline')
+COMMENT_KEYS = ('icons',)
+ID_ALPHABET = string.ascii_letters + string.digits
+
+
+def short_id(n: int) -> str:
+    """0 -> 'a', 51 -> 'Z', 62 -> 'ba', ... (letters first, so no id looks like a number)."""
+    digits = ''
+    while True:
+        n, r = divmod(n, len(ID_ALPHABET))
+        digits = ID_ALPHABET[r] + digits
+        if not n:
+            break
+    return digits if digits[0].isalpha() else 'a' + digits
+
+
+def _workspace(state):
+    """The dict holding `blocks` and `variables` (a Portal export's `mod`)."""
+    while isinstance(state, dict) and 'variables' not in state:
+        inner = state.get('mod', state.get('workspace'))
+        if not isinstance(inner, dict):
+            break
+        state = inner
+    return state
+
+
+def variable_fields(block):
+    """The field values of `block` shaped like a variable reference (`{"id": ...}`)."""
+    fields = block.get('fields')
+    if not isinstance(fields, dict):
+        return []
+    return [value for value in fields.values() if isinstance(value, dict) and 'id' in value]
+
+
+def minify_state(state, keep_positions=False, strip_comments=False):
+    """Minifies a parsed export in place; returns counts of what was removed or renumbered."""
+    roots, _ = top_level_blocks(state)
+    if roots is None:
+        raise ValueError("not a Portal mod or workspace JSON")
+    dropped = LAYOUT_KEYS + (() if keep_positions else POSITION_KEYS) + (COMMENT_KEYS if strip_comments else ())
+    stats = {'blocks': 0, 'keys_dropped': 0, 'variables_removed': 0}
+
+    visits = [v for root in roots if isinstance(root, dict) for v in walk(root, shadows=True)]
+    workspace = _workspace(state)
+    declared = {v.get('id') for v in workspace.get('variables') or () if isinstance(v, dict)}
+    used = {ref['id'] for visit in visits for ref in variable_fields(visit.block) if ref['id'] in declared}
+
+    ids = map(short_id, itertools.count())
+    variable_ids = {}
+    if isinstance(workspace.get('variables'), list):
+        kept = []
+        for variable in workspace['variables']:
+            if isinstance(variable, dict) and variable.get('id') not in used:
+                stats['variables_removed'] += 1
+                continue
+            if isinstance(variable, dict) and 'id' in variable:
+                variable_ids[variable['id']] = variable['id'] = next(ids)
+            kept.append(variable)
+        workspace['variables'] = kept
+
+    for visit in visits:
+        block = visit.block
+        stats['blocks'] += 1
+        for key in dropped:
+            if key in block:
+                del block[key]
+                stats['keys_dropped'] += 1
+        if 'id' in block:
+            block['id'] = next(ids)
+        for ref in variable_fields(block):
+            if ref['id'] in variable_ids:
+                ref['id'] = variable_ids[ref['id']]
+    count('blocks_minified', stats['blocks'])
+    return stats
+
+
+def dumps_compact(state) -> str:
+    return json.dumps(state, separators=(',', ':'), ensure_ascii=False)
+
+
+def _semantics(state, table: StructureTable):
+    """
+    (structure ids of the top-level blocks, referenced variables as (type, name)).
+    Every `{"id": ...}` field value counts as a reference, declared or not, so an id
+    left dangling shows up as '<missing>'. Rewrites those ids in place.
+    """
+    workspace = _workspace(state)
+    variables = {v.get('id'): (v.get('type'), v.get('name'))
+                 for v in workspace.get('variables') or () if isinstance(v, dict)}
+    roots, _ = top_level_blocks(state)
+    referenced = set()
+    for root in roots or ():
+        if not isinstance(root, dict):
+            continue
+        for visit in walk(root, shadows=True):
+            for value in (visit.block.get('fields') or {}).values():
+                if isinstance(value, dict) and 'id' in value:
+                    key = variables.get(value['id'], ('<missing>', value['id']))
+                    value['id'] = list(key)
+                    referenced.add(key)
+    chains = [table.hash_tree(r)[0].chain for r in roots or () if isinstance(r, dict)]
+    return chains, referenced
+
+
+def check_minified(original_text, minified_text, keep_positions=False, strip_comments=False):
+    """Problems found when reading the minified text back (empty if it means the same as the original)."""
+    ignored = IGNORED_KEYS + LAYOUT_KEYS + (COMMENT_KEYS if strip_comments else ())
+    table = StructureTable(ignored)
+    minified = json.loads(minified_text)
+    problems = []
+
+    ids = set()
+    for variable in _workspace(minified).get('variables') or ():
+        if isinstance(variable, dict):
+            ids.add(variable.get('id'))
+    roots, _ = top_level_blocks(minified)
+    for root in roots or ():
+        if not isinstance(root, dict):
+            continue
+        if not keep_positions and any(k in root for k in POSITION_KEYS):
+            problems.append("positions left on a top-level block")
+        for visit in walk(root, shadows=True):
+            block_id = visit.block.get('id')
+            if block_id in ids:
+                problems.append(f"duplicate id {block_id!r}")
+            ids.add(block_id)
+    # A variable removed while still in use shows up as a '<missing>' reference here.
+    before = _semantics(json.loads(original_text), table)
+    after = _semantics(minified, table)
+    if before[0] != after[0]:
+        problems.append("block structure changed")
+    if before[1] != after[1]:
+        problems.append("referenced variables changed")
+    return problems
+
+
+def minify_file(path, out_path=None, keep_positions=False, strip_comments=False):
+    with stage('read'), open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    with stage('parse'):
+        state = json.loads(text)
+    with stage('transform'):
+        ui_bytes = len(dumps_js(state).encode('utf-8'))
+        stats = minify_state(state, keep_positions, strip_comments)
+        minified = dumps_compact(state)
+        problems = check_minified(text, minified, keep_positions, strip_comments)
+    if out_path is not None and not problems:
+        with stage('write'):
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            out_path.write_text(minified, encoding='utf-8')
+    return {
+        'path': str(path),
+        'bytes_file': len(text.encode('utf-8')),
+        'bytes_ui': ui_bytes,
+        'bytes_minified': len(minified.encode('utf-8')),
+        **stats,
+        'problems': problems,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Strip editor-only data from Portal exports and check the result.")
+    parser.add_argument('paths', nargs='+', help="export JSON files or directories (searched recursively)")
+    parser.add_argument('--out', help="output directory (default: report only)")
+    parser.add_argument('--keep-positions', action='store_true', help="keep x/y of top-level blocks")
+    parser.add_argument('--strip-comments', action='store_true', help="also drop block comments")
+    parser.add_argument('--json', action='store_true', help="print a JSON report")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = []
+    for path, out_path in iter_inputs(args.paths, args.out):
+        try:
+            result = minify_file(path, out_path, args.keep_positions, args.strip_comments)
+        except (OSError, ValueError) as e:
+            result = {'path': str(path), 'problems': [f"cannot minify: {e}"]}
+        results.append(result)
+    elapsed = time.perf_counter() - start
+
+    done = [r for r in results if 'bytes_minified' in r]
+    totals = {key: sum(r[key] for r in done) for key in
+              ('bytes_file', 'bytes_ui', 'bytes_minified', 'blocks', 'keys_dropped', 'variables_removed')}
+    failed = [r for r in results if r['problems']]
+    if args.json:
+        json.dump({'totals': totals, 'seconds': round(elapsed, 3), 'results': results}, sys.stdout, indent=2)
+        print()
+    else:
+        print(f"  {'file':44} {'file bytes':>11} {'UI export':>11} {'minified':>10} {'vs file':>8} {'vars cut':>8}")
+        for r in results:
+            if 'bytes_minified' not in r:
+                print(f"  {r['path']}: {'; '.join(r['problems'])}")
+                continue
+            print(f"  {r['path'][-44:]:44} {r['bytes_file']:11,d} {r['bytes_ui']:11,d} {r['bytes_minified']:10,d} "
+                  f"{(1 - r['bytes_minified'] / r['bytes_file']) * 100:7.1f}% {r['variables_removed']:8d}"
+                  + (f"  CHECK FAILED: {'; '.join(r['problems'])}" if r['problems'] else ''))
+        if done:
+            print(f"\n{len(done)} files, {totals['blocks']} blocks in {elapsed:.2f}s: "
+                  f"{totals['bytes_file']:,} bytes as given, {totals['bytes_ui']:,} as the UI writes them -> "
+                  f"{totals['bytes_minified']:,} minified ({(1 - totals['bytes_minified'] / totals['bytes_file']) * 100:.1f}% "
+                  f"and {(1 - totals['bytes_minified'] / totals['bytes_ui']) * 100:.1f}% smaller); "
+                  f"round-trip check {'passed' if not failed else 'FAILED for ' + str(len(failed)) + ' files'}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_main(main)
@@ -0,0 +1,218 @@
+"""
+Statistics for Portal mod exports (`{"mod": {"blocks": {"blocks": [...]}, "variables": [...]}}`).
+
+Reports block-type histograms, the subroutine call graph, variable usage and
+the maximum tree depth. Trees are walked with an explicit stack, so deep
+`next` chains cannot hit the recursion limit.
+
+By default each file is loaded with `json.load`. With `--stream`, top-level
+blocks are read one at a time (see json_stream.py), so memory stays bounded
+by the largest single top-level block instead of the whole export.
+
+Usage:
+    python tools/portal_mod_stats.py "=Resources=/Portal Blocks/custom_conquest_template_V8.0.json"
+    python tools/portal_mod_stats.py --stream --json big_mod.json
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter, defaultdict
+
+from instrumentation import count, run_main, stage
+from json_stream import JSONStreamError, iter_items
+from portal_tree import block_label, owner_of, subroutine_name, walk
+
+BLOCKS_PATH = 'mod.blocks.blocks'
+VARIABLES_PATH = 'mod.variables'
+
+
+class ModStats:
+    """Accumulates statistics one top-level block (and variable) at a time."""
+
+    def __init__(self):
+        self.block_types = Counter()
+        self.top_level_types = Counter()
+        self.total_blocks = 0
+        self.max_depth = 0
+        self.max_nesting = 0
+        self.deepest_root = None
+        self.subroutines = {}            # name -> {'params': n, 'blocks': n}
+        self.calls = defaultdict(Counter)  # caller label -> Counter(callee name)
+        self.variables = {}              # id -> {'name', 'type'}
+        self.var_reads = Counter()
+        self.var_writes = Counter()
+        self.var_refs = Counter()
+
+    def add_variable(self, var):
+        if isinstance(var, dict) and var.get('id'):
+            self.variables[var['id']] = {'name': var.get('name', ''), 'type': var.get('type', '')}
+
+    def add_root(self, root):
+        if not isinstance(root, dict):
+            return
+        self.top_level_types[root.get('type')] += 1
+        blocks = 0
+        for visit in walk(root):
+            block = visit.block
+            btype = block.get('type')
+            blocks += 1
+            self.block_types[btype] += 1
+            if visit.depth > self.max_depth:
+                self.max_depth = visit.depth
+                self.deepest_root = block_label(root)
+            self.max_nesting = max(self.max_nesting, visit.nesting)
+
+            if btype == 'subroutineInstanceBlock':
+                owner = owner_of(visit.parent)
+                caller = block_label(owner.block) if owner else '<top-level>'
+                self.calls[caller][subroutine_name(block)] += 1
+            elif btype == 'variableReferenceBlock':
+                var = (block.get('fields') or {}).get('VAR')
+                var_id = var.get('id') if isinstance(var, dict) else var
+                if not var_id:
+                    continue
+                self.var_refs[var_id] += 1
+                parent_type = visit.parent.block.get('type') if visit.parent else None
+                if parent_type == 'GetVariable':
+                    self.var_reads[var_id] += 1
+                elif parent_type == 'SetVariable' and visit.slot == 'VALUE-0':
+                    self.var_writes[var_id] += 1
+
+        if root.get('type') == 'subroutineBlock':
+            extra = root.get('extraState') or {}
+            params = extra.get('parameters') if isinstance(extra, dict) else None
+            self.subroutines[subroutine_name(root)] = {
+                'params': len(params) if isinstance(params, list) else 0,
+                'blocks': blocks,
+            }
+        self.total_blocks += blocks
+
+    # --- Reporting ---
+
+    def call_graph(self):
+        return {caller: dict(callees) for caller, callees in sorted(self.calls.items())}
+
+    def variable_usage(self):
+        out = []
+        ids = sorted(set(self.variables) | set(self.var_refs))
+        for var_id in sorted(ids, key=lambda v: -self.var_refs[v]):
+            info = self.variables.get(var_id, {})
+            out.append({
+                'id': var_id,
+                'name': info.get('name', ''),
+                'type': info.get('type', ''),
+                'declared': var_id in self.variables,
+                'refs': self.var_refs[var_id],
+                'reads': self.var_reads[var_id],
+                'writes': self.var_writes[var_id],
+            })
+        return out
+
+    def to_dict(self):
+        called = Counter()
+        for callees in self.calls.values():
+            called.update(callees)
+        return {
+            'total_blocks': self.total_blocks,
+            'top_level_blocks': sum(self.top_level_types.values()),
+            'unique_types': len(self.block_types),
+            'max_depth': self.max_depth,
+            'max_nesting': self.max_nesting,
+            'deepest_root': self.deepest_root,
+            'block_types': dict(self.block_types.most_common()),
+            'top_level_types': dict(self.top_level_types.most_common()),
+            'subroutines': self.subroutines,
+            'subroutine_calls': dict(called.most_common()),
+            'uncalled_subroutines': sorted(set(self.subroutines) - set(called)),
+            'undefined_subroutines': sorted(set(called) - set(self.subroutines)),
+            'call_graph': self.call_graph(),
+            'variables': self.variable_usage(),
+        }
+
+
+def analyze_file(path, stream=False):
+    stats = ModStats()
+    # Streaming interleaves reading and parsing, so both count as 'parse'.
+    with stage('parse'), open(path, 'r', encoding='utf-8') as f:
+        if stream:
+            for item_path, item in iter_items(f, [BLOCKS_PATH, VARIABLES_PATH]):
+                if item_path == BLOCKS_PATH:
+                    stats.add_root(item)
+                else:
+                    stats.add_variable(item)
+        else:
+            mod = (json.load(f) or {}).get('mod') or {}
+            for root in (mod.get('blocks') or {}).get('blocks') or []:
+                stats.add_root(root)
+            for var in mod.get('variables') or []:
+                stats.add_variable(var)
+    count('blocks_parsed', stats.total_blocks)
+    return stats
+
+
+def print_report(path, report, top):
+    print(f"== {path}")
+    print(f"Blocks: {report['total_blocks']} ({report['top_level_blocks']} top-level, {report['unique_types']} types)")
+    print(f"Max depth: {report['max_depth']} (in {report['deepest_root']}), max input nesting: {report['max_nesting']}")
+
+    print(f"\nTop {top} block types:")
+    for btype, n in list(report['block_types'].items())[:top]:
+        print(f"  {n:6d}  {btype}")
+
+    subs = report['subroutines']
+    print(f"\nSubroutines: {len(subs)} defined, {sum(report['subroutine_calls'].values())} calls")
+    for name, n in list(report['subroutine_calls'].items())[:top]:
+        print(f"  {n:6d}  {name}")
+    if report['uncalled_subroutines']:
+        print(f"  Never called: {', '.join(report['uncalled_subroutines'])}")
+    if report['undefined_subroutines']:
+        print(f"  Called but not defined: {', '.join(report['undefined_subroutines'])}")
+
+    print("\nCall graph:")
+    for caller, callees in report['call_graph'].items():
+        print(f"  {caller} -> {', '.join(f'{c} x{n}' if n > 1 else c for c, n in callees.items())}")
+
+    variables = report['variables']
+    print(f"\nVariables: {sum(1 for v in variables if v['declared'])} declared")
+    for v in variables[:top]:
+        print(f"  {v['refs']:6d} refs ({v['reads']} get, {v['writes']} set)  {v['name'] or v['id']} [{v['type']}]")
+    unused = [v['name'] or v['id'] for v in variables if v['declared'] and not v['refs']]
+    if unused:
+        print(f"  Unused: {', '.join(unused)}")
+    undeclared = [v['id'] for v in variables if not v['declared']]
+    if undeclared:
+        print(f"  Referenced but not declared: {', '.join(undeclared)}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report block, subroutine and variable statistics for Portal mod exports.")
+    parser.add_argument('files', nargs='+', help="Portal mod JSON exports")
+    parser.add_argument('--stream', action='store_true', help="read top-level blocks incrementally (bounded memory)")
+    parser.add_argument('--json', action='store_true', help="print a JSON report instead of text")
+    parser.add_argument('--top', type=int, default=20, help="rows per table in the text report (default: 20)")
+    args = parser.parse_args()
+
+    reports = {}
+    failed = False
+    for path in args.files:
+        try:
+            reports[path] = analyze_file(path, stream=args.stream).to_dict()
+        except (OSError, ValueError, JSONStreamError) as e:
+            print(f"Error analyzing {path}: {e}", file=sys.stderr)
+            failed = True
+
+    if args.json:
+        json.dump(reports, sys.stdout, indent=2)
+        print()
+    else:
+        for path, report in reports.items():
+            print_report(path, report, args.top)
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_main(main)
@@ -0,0 +1,368 @@
+"""
+Pack Portal mod exports into one file compressed with a shared zlib dictionary.
+
+Portal exports repeat the same JSON over and over (`"type":"Number"`,
+`"fields":{...}`, `variableReferenceBlock`, ...). Compressed one file at a
+time, every mod pays again to teach the compressor that text. Here a preset
+dictionary (zlib `zdict`, up to the 32 KB deflate window) is trained once from
+sample exports, by default the shipped templates in =Resources=/Portal Blocks,
+and every mod in a pack is compressed on its own with it. Packs stay
+random-access: one mod is decoded without touching the others.
+
+Training picks the most valuable 256-byte segments of the samples, in the
+spirit of zstd's COVER trainer. Each 8-byte substring is scored by how often it
+occurs in the samples. The samples are split into one epoch per segment, and
+each epoch contributes its best-scoring window, counting every substring once
+and only if no earlier segment covered it. The best segments go last, where
+they are cheapest to reference.
+
+Pack layout (little-endian):
+
+    b'BF6PACK1'  u32 dictionary length  dictionary
+    compressed mods (zlib format, one stream each)
+    index        zlib-compressed JSON: [{name, offset, length, size, crc32}]
+    footer       u64 index offset  u32 index length  b'BF6PACK1'
+
+Usage:
+    python tools/portal_pack.py mods/*.json --pack mods.bf6pack
+    python tools/portal_pack.py --list mods.bf6pack
+    python tools/portal_pack.py --unpack mods.bf6pack --name my_mod.json --out restored/
+    python tools/portal_pack.py --train-dict portal.zdict
+    python tools/portal_pack.py --bench                  # templates, leave-one-out dictionaries
+    python tools/portal_pack.py mods/*.json --bench --dict portal.zdict
+"""
+
+import argparse
+import gzip
+import json
+import os
+import struct
+import sys
+import time
+import zlib
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional
+
+from catalog_engine import REPO_ROOT
+from instrumentation import count, run_main, stage
+
+MAGIC = b'BF6PACK1'
+HEADER = struct.Struct('<8sI')
+FOOTER = struct.Struct('<QI8s')
+TEMPLATES_DIR = REPO_ROOT / '=Resources=' / 'Portal Blocks'
+DICT_SIZE = 32 * 1024  # deflate cannot reach further back than its 32 KB window
+SEGMENT_SIZE = 256
+DMER_SIZE = 8
+LEVEL = 9
+BENCH_MIN_SECONDS = 0.2
+
+
+class PackEntry(NamedTuple):
+    name: str
+    offset: int
+    length: int   # compressed bytes
+    size: int     # original bytes
+    crc32: int
+
+
+# --- Dictionary training ---
+
+def _best_segment(data: bytes, lo: int, hi: int, freq: Counter, segment: int, dmer: int):
+    """(score, start) of the window in data[lo:hi] whose distinct d-mers score highest."""
+    if hi - lo < segment:
+        return None
+    window: Dict[bytes, int] = {}
+    score = 0
+    best = (0, lo)
+    for i in range(lo, hi - dmer + 1):
+        key = data[i:i + dmer]
+        seen = window.get(key, 0)
+        if not seen:
+            score += freq[key]
+        window[key] = seen + 1
+        first = i - (segment - dmer)  # d-mer leaving the window
+        if first > lo:
+            old = data[first - 1:first - 1 + dmer]
+            left = window[old] - 1
+            if left:
+                window[old] = left
+            else:
+                del window[old]
+                score -= freq[old]
+        if first >= lo and score > best[0]:
+            best = (score, first)
+    return best if best[0] else None
+
+
+def train_dictionary(samples: List[bytes], size=DICT_SIZE, segment=SEGMENT_SIZE, dmer=DMER_SIZE) -> bytes:
+    """Preset dictionary for zlib's zdict built from the highest-scoring segments of `samples`."""
+    if not any(samples):
+        raise ValueError("no training samples")
+    freq: Counter = Counter()
+    for sample in samples:
+        freq.update(sample[i:i + dmer] for i in range(len(sample) - dmer + 1))
+    data = b'\0'.join(samples)
+    epochs = max(1, min(size // segment, len(data) // segment))
+    epoch_len = len(data) // epochs
+    chosen = []
+    for epoch in range(epochs):
+        lo = epoch * epoch_len
+        best = _best_segment(data, lo, len(data) if epoch == epochs - 1 else lo + epoch_len, freq, segment, dmer)
+        if best is None:
+            continue
+        score, start = best
+        piece = data[start:start + segment]
+        chosen.append((score, piece))
+        for i in range(len(piece) - dmer + 1):
+            freq[piece[i:i + dmer]] = 0  # covered: later segments gain nothing from it
+    chosen.sort(key=lambda c: c[0])
+    count('dictionary_segments', len(chosen))
+    return b''.join(piece for _, piece in chosen)[-size:]
+
+
+def template_paths() -> List[str]:
+    return [str(p) for p in sorted(TEMPLATES_DIR.glob('*.json'))]
+
+
+def template_samples(exclude=()) -> List[bytes]:
+    samples = []
+    for path in template_paths():
+        with open(path, 'rb') as f:
+            data = f.read()
+        if data not in exclude:
+            samples.append(data)
+    return samples
+
+
+# --- Compression ---
+
+def compress(data: bytes, zdict: bytes) -> bytes:
+    c = zlib.compressobj(LEVEL, zlib.DEFLATED, zlib.MAX_WBITS, 9, zlib.Z_DEFAULT_STRATEGY, zdict) if zdict \
+        else zlib.compressobj(LEVEL)
+    return c.compress(data) + c.flush()
+
+
+def decompress(blob: bytes, zdict: bytes) -> bytes:
+    d = zlib.decompressobj(zdict=zdict) if zdict else zlib.decompressobj()
+    return d.decompress(blob) + d.flush()
+
+
+def write_pack(path, files: Dict[str, bytes], zdict: bytes) -> List[PackEntry]:
+    entries = []
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(zdict)))
+        f.write(zdict)
+        for name, data in files.items():
+            blob = compress(data, zdict)
+            entries.append(PackEntry(name, f.tell(), len(blob), len(data), zlib.crc32(data)))
+            f.write(blob)
+            count('mods_packed')
+        index = zlib.compress(json.dumps([e._asdict() for e in entries]).encode('utf-8'), LEVEL)
+        index_offset = f.tell()
+        f.write(index)
+        f.write(FOOTER.pack(index_offset, len(index), MAGIC))
+    return entries
+
+
+class Pack:
+    """Read side of a pack: the footer, index and dictionary, then mods on demand."""
+
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        try:
+            magic, dict_len = HEADER.unpack(self.file.read(HEADER.size))
+            self.file.seek(-FOOTER.size, os.SEEK_END)
+            index_offset, index_len, footer_magic = FOOTER.unpack(self.file.read(FOOTER.size))
+            if magic != MAGIC or footer_magic != MAGIC:
+                raise ValueError("not a BF6 pack")
+            self.file.seek(HEADER.size)
+            self.zdict = self.file.read(dict_len)
+            self.file.seek(index_offset)
+            self.entries = [PackEntry(**e) for e in json.loads(zlib.decompress(self.file.read(index_len)))]
+        except (struct.error, zlib.error, ValueError, TypeError) as e:
+            self.file.close()
+            raise ValueError(f"{path}: {e}")
+
+    def find(self, name) -> Optional[PackEntry]:
+        return next((e for e in self.entries if e.name == name), None)
+
+    def read(self, entry: PackEntry) -> bytes:
+        self.file.seek(entry.offset)
+        data = decompress(self.file.read(entry.length), self.zdict)
+        if zlib.crc32(data) != entry.crc32:
+            raise ValueError(f"{entry.name}: checksum mismatch")
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+# --- Benchmark ---
+
+def _decode_rate(fn, size) -> float:
+    """MB/s of `fn()` (repeated for at least BENCH_MIN_SECONDS)."""
+    runs, start = 0, time.perf_counter()
+    while True:
+        fn()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= BENCH_MIN_SECONDS:
+            return size * runs / elapsed / 1e6
+
+
+def bench(files: Dict[str, bytes], zdict: Optional[bytes]):
+    """
+    Size and decode speed per file for gzip, zlib without a dictionary and zlib with one.
+    Without `zdict`, each file gets a dictionary trained on the templates other than itself.
+    """
+    rows = []
+    for name, data in files.items():
+        with stage('transform'):
+            held_out = zdict if zdict is not None else train_dictionary(template_samples(exclude={data}))
+        row = {'name': name, 'size': len(data)}
+        for method, blob, decode in (
+                ('gzip', gzip.compress(data, LEVEL), gzip.decompress),
+                ('zlib', compress(data, b''), lambda b: decompress(b, b'')),
+                ('zdict', compress(data, held_out), lambda b: decompress(b, held_out))):
+            assert decode(blob) == data
+            row[method] = {'bytes': len(blob), 'ratio': round(len(data) / len(blob), 2),
+                           'decode_mb_s': round(_decode_rate(lambda: decode(blob), len(data)), 1)}
+        rows.append(row)
+    return rows
+
+
+def print_bench(rows, trained_on):
+    print(f"Dictionary: {trained_on}")
+    if not rows:
+        print("  (no files)")
+        return
+    print(f"  {'file':36} {'size':>9}  {'gzip':>17}  {'zlib':>17}  {'zdict':>17}  {'zdict vs gzip':>13}")
+    totals = Counter()
+    for row in rows:
+        cells = [f"{row[m]['bytes']:>8,d} {row[m]['decode_mb_s']:>5.0f}MB/s" for m in ('gzip', 'zlib', 'zdict')]
+        print(f"  {row['name'][:36]:36} {row['size']:9,d}  {'  '.join(cells)}  "
+              f"{(1 - row['zdict']['bytes'] / row['gzip']['bytes']) * 100:12.1f}%")
+        totals['size'] += row['size']
+        for m in ('gzip', 'zlib', 'zdict'):
+            totals[m] += row[m]['bytes']
+    print(f"  {'total':36} {totals['size']:9,d}  " + '  '.join(
+        f"{totals[m]:>8,d} x{totals['size'] / totals[m]:<7.2f}" for m in ('gzip', 'zlib', 'zdict'))
+          + f"  {(1 - totals['zdict'] / totals['gzip']) * 100:12.1f}%")
+
+
+def _read_files(paths) -> Dict[str, bytes]:
+    files = {}
+    for path in paths:
+        name = os.path.basename(path)
+        if name in files:
+            print(f"Duplicate file name in pack: {name}")
+            sys.exit(1)
+        try:
+            with open(path, 'rb') as f:
+                files[name] = f.read()
+        except OSError as e:
+            print(f"Cannot read {path}: {e}")
+            sys.exit(1)
+    return files
+
+
+def _train_or_exit(samples) -> bytes:
+    try:
+        return train_dictionary(samples)
+    except ValueError as e:
+        print(f"Cannot train a dictionary: {e} (pass mod exports, or check {TEMPLATES_DIR})")
+        sys.exit(1)
+
+
+def _load_dict(path) -> bytes:
+    try:
+        with open(path, 'rb') as f:
+            return f.read()[-DICT_SIZE:]
+    except OSError as e:
+        print(f"Cannot read dictionary {path}: {e}")
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack Portal mod exports with a shared zlib dictionary.")
+    parser.add_argument('files', nargs='*', help="mod exports to pack, train on or benchmark")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument('--pack', metavar='PACK', help="write `files` into this pack")
+    mode.add_argument('--list', metavar='PACK', help="list the mods in a pack")
+    mode.add_argument('--unpack', metavar='PACK', help="extract mods from a pack")
+    mode.add_argument('--train-dict', metavar='OUT', help="train a dictionary from `files` (default: the templates)")
+    mode.add_argument('--bench', action='store_true', help="compare sizes and decode speed against gzip")
+    parser.add_argument('--dict', help="dictionary file from --train-dict (default: train from the templates)")
+    parser.add_argument('--name', action='append', help="with --unpack: only this mod (repeatable)")
+    parser.add_argument('--out', default='.', help="with --unpack: output directory (default: .)")
+    args = parser.parse_args()
+
+    if args.list or args.unpack:
+        try:
+            pack = Pack(args.list or args.unpack)
+        except (OSError, ValueError) as e:
+            print(f"Cannot open pack: {e}")
+            sys.exit(1)
+        if args.list:
+            print(f"{len(pack.entries)} mods, {len(pack.zdict):,} byte dictionary")
+            for e in pack.entries:
+                print(f"  {e.name:40} {e.size:10,d} -> {e.length:9,d}  x{e.size / max(e.length, 1):.2f}")
+        else:
+            wanted = pack.entries if not args.name else [pack.find(n) for n in args.name]
+            missing = [n for n, e in zip(args.name or (), wanted) if e is None]
+            if missing:
+                print(f"Not in pack: {', '.join(missing)}")
+                sys.exit(1)
+            os.makedirs(args.out, exist_ok=True)
+            for entry in wanted:
+                try:
+                    with stage('transform'):
+                        data = pack.read(entry)
+                except (zlib.error, ValueError) as e:
+                    print(f"Cannot unpack {entry.name}: {e}")
+                    sys.exit(1)
+                with stage('write'), open(os.path.join(args.out, entry.name), 'wb') as f:
+                    f.write(data)
+                print(f"{entry.name} ({entry.size:,} bytes)")
+        pack.close()
+        return
+
+    with stage('read'):
+        files = _read_files(args.files)
+    if args.bench:
+        if not files:
+            files = _read_files(template_paths())
+        if not files:
+            print(f"Nothing to benchmark: no files given and no templates in {TEMPLATES_DIR}")
+            sys.exit(1)
+        zdict = _load_dict(args.dict) if args.dict else None
+        try:
+            rows = bench(files, zdict)
+        except ValueError as e:
+            print(f"Cannot train a dictionary: {e} (leave-one-out needs at least two templates in {TEMPLATES_DIR})")
+            sys.exit(1)
+        print_bench(rows, args.dict or "templates, leaving out the file being compressed")
+        return
+
+    if args.train_dict:
+        with stage('transform'):
+            zdict = _train_or_exit(list(files.values()) or template_samples())
+        with stage('write'), open(args.train_dict, 'wb') as f:
+            f.write(zdict)
+        print(f"Wrote {args.train_dict} ({len(zdict):,} bytes)")
+        return
+
+    if not files:
+        print("Nothing to pack")
+        sys.exit(1)
+    with stage('transform'):
+        zdict = _load_dict(args.dict) if args.dict else _train_or_exit(template_samples())
+    with stage('write'):
+        entries = write_pack(args.pack, files, zdict)
+    size = sum(e.size for e in entries)
+    packed = os.path.getsize(args.pack)
+    print(f"Packed {len(entries)} mods: {size:,} -> {packed:,} bytes (x{size / packed:.2f}) into {args.pack}")
+
+
+if __name__ == "__main__":
+    run_main(main)
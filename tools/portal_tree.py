@@ -0,0 +1,114 @@
+"""
+Helpers for walking Portal mod block trees (`mod.blocks.blocks`).
+
+A block's children are the blocks plugged into its `inputs` (in key order)
+followed by its `next` block. Real exports chain hundreds of statements
+through `next`, so walks use an explicit stack instead of recursion.
+"""
+
+from typing import Iterator, NamedTuple, Optional
+
+STRUCTURAL_OWNER_TYPES = ('ruleBlock', 'subroutineBlock')
+
+# Mirrors PORTAL_TYPE_EXPORT_OVERRIDES in web_ui/src/portal_convert.ts.
+PORTAL_TYPE_EXPORT_OVERRIDES = {
+    'MOD_BLOCK': 'modBlock',
+    'RULE_HEADER': 'ruleBlock',
+    'CONDITION_BLOCK': 'conditionBlock',
+    'condition': 'conditionBlock',
+    'SUBROUTINE_BLOCK': 'subroutineBlock',
+    'CALLSUBROUTINE': 'subroutineInstanceBlock',
+}
+# Tool-only blocks (web_ui/src/blocks/collections.ts) that must not reach a Portal export.
+COLLECTION_DEF_TYPE = 'BF6_COLLECTION_DEF'
+COLLECTION_CALL_TYPE = 'BF6_COLLECTION_CALL'
+
+
+class Visit(NamedTuple):
+    block: dict
+    parent: Optional['Visit']
+    slot: Optional[str]   # input name in the parent, 'next', or None for a root
+    depth: int            # edges from the root, counting `next` links
+    nesting: int          # input edges only (how deep blocks are plugged into each other)
+
+
+def iter_children(block, shadows=False):
+    """
+    Yields (slot, child_block) pairs: inputs in key order, then 'next'.
+    With `shadows`, an input's shadow block is yielded too (after its real block).
+    """
+    inputs = block.get('inputs')
+    if isinstance(inputs, dict):
+        for name, slot in inputs.items():
+            if not isinstance(slot, dict):
+                continue
+            child = slot.get('block')
+            if isinstance(child, dict):
+                yield name, child
+            if shadows and isinstance(slot.get('shadow'), dict):
+                yield name, slot['shadow']
+    nxt = block.get('next')
+    if isinstance(nxt, dict) and isinstance(nxt.get('block'), dict):
+        yield 'next', nxt['block']
+
+
+def walk(root, shadows=False) -> Iterator[Visit]:
+    """Pre-order walk of one top-level block, in source order, without recursion."""
+    stack = [Visit(root, None, None, 0, 0)]
+    while stack:
+        visit = stack.pop()
+        yield visit
+        children = list(iter_children(visit.block, shadows))
+        for slot, child in reversed(children):
+            nesting = visit.nesting if slot == 'next' else visit.nesting + 1
+            stack.append(Visit(child, visit, slot, visit.depth + 1, nesting))
+
+
+def owner_of(visit, owner_types=STRUCTURAL_OWNER_TYPES) -> Optional[Visit]:
+    """Nearest enclosing visit (including itself) whose block type is in `owner_types`."""
+    while visit is not None:
+        if visit.block.get('type') in owner_types:
+            return visit
+        visit = visit.parent
+    return None
+
+
+def block_label(block) -> str:
+    """Readable name for rule/subroutine blocks, e.g. 'rule:Initialise' or 'sub:Scoreboard'."""
+    btype = block.get('type')
+    fields = block.get('fields') or {}
+    if btype == 'ruleBlock':
+        return f"rule:{fields.get('NAME', '') or block.get('id', '')}"
+    if btype in ('subroutineBlock', 'subroutineInstanceBlock'):
+        return f"sub:{subroutine_name(block)}"
+    return str(btype)
+
+
+def subroutine_name(block) -> str:
+    extra = block.get('extraState') or {}
+    name = extra.get('subroutineName') if isinstance(extra, dict) else None
+    return str(name or (block.get('fields') or {}).get('SUBROUTINE_NAME', ''))
+
+
+def top_level_blocks(state):
+    """
+    Returns (top-level blocks, is_portal_mod) for a saved workspace or Portal export.
+    Unwraps the same container shapes as normalizeWorkspaceState in
+    web_ui/src/portal_json.ts; returns (None, False) if no blocks array is found.
+    """
+    is_mod = False
+    while isinstance(state, dict):
+        if isinstance(state.get('mod'), dict):
+            state, is_mod = state['mod'], True
+        elif isinstance(state.get('workspace'), dict):
+            state = state['workspace']
+        else:
+            break
+    if not isinstance(state, dict):
+        return None, False
+    blocks = state.get('blocks')
+    if isinstance(blocks, dict) and isinstance(blocks.get('blocks'), list):
+        return blocks['blocks'], is_mod
+    if isinstance(blocks, list):
+        return blocks, is_mod
+    return None, False
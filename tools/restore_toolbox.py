@@ -1,11 +1,12 @@
 
 import os
 import json
-import re
 import sys # Import sys for stderr
 
+from block_catalog import load_block_catalog
+from instrumentation import run_main
+
 ASSETS_DIR = 'web_ui/assets' # Clarified: assuming JSON definitions are here now
-BLOCK_DATA_FILE = 'bf6portal_blocks.json' # New source for block data
 OUTPUT_FILE = 'web_ui/src/toolbox.ts'
 
 # Map category folders to display names and colors
@@ -35,29 +36,8 @@ CATEGORY_MAP = {
     # Add any missing ones
 }
 
-def get_json_block_ids():
-    """
-    Reads block data from the bf6portal_blocks.json file.
-    Returns a dict: { lower_case_block_id: original_case_block_id }
-    """
-    if not os.path.exists(BLOCK_DATA_FILE):
-        print(f"Error: Block data file not found at {BLOCK_DATA_FILE}. Please run update_blocks_db.py first.", file=sys.stderr)
-        return {}
-    
-    with open(BLOCK_DATA_FILE, 'r', encoding='utf-8') as f:
-        all_blocks = json.load(f)
-    
-    blocks_dict = {}
-    for block in all_blocks:
-        blocks_dict[block['block_id'].lower()] = block['block_id']
-    return blocks_dict
-
-def snake_case(name):
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
-
 def restore_toolbox():
-    json_block_ids = get_json_block_ids() # Get block IDs from JSON file
+    catalog = load_block_catalog()
     toolbox_contents = []
 
     # Iterate through known categories in specific order if possible, or alphabetical
@@ -96,13 +76,8 @@ def restore_toolbox():
         if "sub_categories" in data:
             for sub_name, blocks in data["sub_categories"].items():
                 for block_key, block_def in blocks.items():
-                    found_type = None
-                    # Look up in our json_block_ids (case-insensitive)
-                    if block_key.lower() in json_block_ids:
-                        found_type = json_block_ids[block_key.lower()]
-                    elif snake_case(block_key).lower() in json_block_ids:
-                        found_type = json_block_ids[snake_case(block_key).lower()]
-                    
+                    # Case-insensitive, then snake_case lookup
+                    found_type = catalog.find(block_key)
                     if found_type:
                         category_blocks.append(found_type)
         
@@ -144,4 +119,4 @@ def restore_toolbox():
     print(f"Restored toolbox with {len(toolbox_contents)} categories.")
 
 if __name__ == '__main__':
-    restore_toolbox()
+    run_main(restore_toolbox)
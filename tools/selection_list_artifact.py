@@ -0,0 +1,156 @@
+"""
+Sharded, pre-indexed form of selection-lists.md for the web UI.
+
+    selection-lists/index.json    {"version", "source_sha256", "shards": [...], "preload": [0],
+                                   "enums": {EnumName: [shard, offset, count]}}
+    selection-lists/shard-N.json  {"strings": [...], "items": [string index, ...]}
+
+An enum's values are `strings[i] for i in items[offset:offset + count]` of its
+shard. Strings are interned per shard. Small enums share shard 0, which the UI
+loads with the index. Large enums (the per-map RuntimeSpawn lists) are grouped
+by shared values into shards of about SHARD_TARGET_BYTES, and the UI fetches a
+shard the first time one of its enums is needed.
+
+Usage:
+    python tools/selection_list_artifact.py           # rebuild from selection-lists.md
+    python tools/selection_list_artifact.py --check   # exit 1 if the artifact is stale
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from typing import Dict, List
+
+from catalog_engine import REPO_ROOT, SELECTION_LISTS_FILE, parse_selection_lists
+from instrumentation import run_main
+
+ARTIFACT_DIR = REPO_ROOT / 'selection-lists'
+INDEX_FILE = 'index.json'
+ARTIFACT_VERSION = 1
+# Enums up to this many values go into the preloaded shard 0.
+SMALL_ENUM_ITEMS = 400
+SHARD_TARGET_BYTES = 64 * 1024
+
+
+def _text_size(values):
+    return sum(len(v) + 3 for v in values)
+
+
+def plan_shards(lists: Dict[str, List[str]], small_items=SMALL_ENUM_ITEMS, target_bytes=SHARD_TARGET_BYTES):
+    """
+    Groups enum names into shards: [small enums] + clusters of large ones.
+    Each cluster starts from the first unassigned large enum (by name) and greedily
+    adds the enum sharing the largest fraction of its values with the cluster, while
+    the cluster's estimated size (interned strings + item indices) stays within budget.
+    """
+    small = [name for name in lists if len(lists[name]) <= small_items]
+    shards = [small]
+    remaining = sorted(n for n in lists if len(lists[n]) > small_items)
+    value_sets = {n: set(lists[n]) for n in remaining}
+    while remaining:
+        cluster = [remaining.pop(0)]
+        strings = set(value_sets[cluster[0]])
+        size = _text_size(strings) + 5 * len(lists[cluster[0]])
+        while remaining:
+            best = max(remaining, key=lambda n: len(value_sets[n] & strings) / len(value_sets[n]))
+            cost = _text_size(value_sets[best] - strings) + 5 * len(lists[best])
+            if size + cost > target_bytes:
+                break
+            remaining.remove(best)
+            cluster.append(best)
+            strings |= value_sets[best]
+            size += cost
+        shards.append(sorted(cluster))
+    return shards
+
+
+def build_artifact(lists: Dict[str, List[str]], source_sha256='', **plan_kwargs):
+    """Returns (index, [shard dicts])."""
+    enums = {}
+    shards = []
+    for shard_no, names in enumerate(plan_shards(lists, **plan_kwargs)):
+        strings = []
+        ids = {}
+        items = []
+        for name in names:
+            values = lists[name]
+            enums[name] = [shard_no, len(items), len(values)]
+            for v in values:
+                i = ids.get(v)
+                if i is None:
+                    i = ids[v] = len(strings)
+                    strings.append(v)
+                items.append(i)
+        shards.append({'strings': strings, 'items': items})
+    index = {
+        'version': ARTIFACT_VERSION,
+        'source_sha256': source_sha256,
+        'shards': [f"shard-{n}.json" for n in range(len(shards))],
+        'preload': [0] if shards else [],
+        # Keep source order so the UI sees enums in the same order as the markdown.
+        'enums': {name: enums[name] for name in lists},
+    }
+    return index, shards
+
+
+def decode_enum(index, shards, name):
+    shard_no, offset, count = index['enums'][name]
+    shard = shards[shard_no]
+    return [shard['strings'][i] for i in shard['items'][offset:offset + count]]
+
+
+def _dump(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+def write_artifact(lists, source_sha256, out_dir=ARTIFACT_DIR):
+    """Writes index.json and the shards (removing shards left over from a larger build). Returns the index."""
+    index, shards = build_artifact(lists, source_sha256)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for name, shard in zip(index['shards'], shards):
+        (out_dir / name).write_text(_dump(shard), encoding='utf-8')
+    for stale in out_dir.glob('shard-*.json'):
+        if stale.name not in index['shards']:
+            stale.unlink()
+    # Index last, so a reader never sees an index pointing at shards that are not written yet.
+    (out_dir / INDEX_FILE).write_text(_dump(index), encoding='utf-8')
+    return index
+
+
+def build_from_markdown(md_path=REPO_ROOT / SELECTION_LISTS_FILE, out_dir=ARTIFACT_DIR):
+    data = md_path.read_bytes()
+    lists = parse_selection_lists(data.decode('utf-8'))
+    return write_artifact(lists, hashlib.sha256(data).hexdigest(), out_dir)
+
+
+def is_current(md_path=REPO_ROOT / SELECTION_LISTS_FILE, out_dir=ARTIFACT_DIR):
+    try:
+        index = json.loads((out_dir / INDEX_FILE).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return False
+    return (index.get('version') == ARTIFACT_VERSION
+            and index.get('source_sha256') == hashlib.sha256(md_path.read_bytes()).hexdigest()
+            and all((out_dir / name).exists() for name in index.get('shards', [])))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the sharded selection-list artifact from selection-lists.md.")
+    parser.add_argument('--check', action='store_true', help="exit 1 if the artifact is missing or stale")
+    args = parser.parse_args()
+
+    if args.check:
+        if not is_current():
+            print(f"{ARTIFACT_DIR.name}/ is out of date; run python tools/selection_list_artifact.py")
+            sys.exit(1)
+        print(f"{ARTIFACT_DIR.name}/ is up to date.")
+        return
+
+    index = build_from_markdown()
+    sizes = [(ARTIFACT_DIR / name).stat().st_size for name in index['shards']]
+    print(f"Wrote {len(index['enums'])} enums in {len(sizes)} shards to {ARTIFACT_DIR} "
+          f"(index {(ARTIFACT_DIR / INDEX_FILE).stat().st_size} bytes, shards {sum(sizes)} bytes, largest {max(sizes, default=0)})")
+
+
+if __name__ == "__main__":
+    run_main(main)
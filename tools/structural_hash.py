@@ -0,0 +1,89 @@
+"""
+Structural hashing (hash-consing) of Portal block trees.
+
+Two subtrees get the same structure id when they hold the same blocks with the
+same fields, extraState and children; block ids and x/y are ignored (variable
+references such as `fields.VAR.id` are kept, they change the meaning). Ids are
+small ints handed out by an intern table, bottom-up: each block is keyed by its
+own data plus the ids of its children, so hashing a whole mod is one linear
+pass and comparing two subtrees is an int comparison.
+
+    table = StructureTable()
+    for hashed in table.hash_tree(root):     # pre-order, like portal_tree.walk
+        hashed.node, hashed.chain, hashed.size
+
+`node` covers a block and everything plugged into its inputs; `chain` also
+covers the rest of its `next` chain. Share one table between trees (or mods)
+whose structures should compare equal.
+"""
+
+import json
+from typing import Dict, List, NamedTuple
+
+from portal_tree import Visit, walk
+
+IGNORED_KEYS = ('id', 'x', 'y')
+_SKIPPED_KEYS = set(IGNORED_KEYS) | {'inputs', 'next'}
+
+
+class HashedBlock(NamedTuple):
+    visit: Visit
+    node: int         # structure id of the block and its inputs (without `next`)
+    chain: int        # structure id of the block followed by the rest of its chain
+    size: int         # blocks in `node` (shadows included)
+    chain_size: int   # blocks in `chain`
+
+
+def block_data(block, skipped=_SKIPPED_KEYS) -> dict:
+    """A block's own data (type, fields, extraState, ...), without ids, x/y and children."""
+    return {k: v for k, v in block.items() if k not in skipped}
+
+
+def block_data_key(block, skipped=_SKIPPED_KEYS) -> str:
+    """Canonical text of block_data(block)."""
+    return json.dumps(block_data(block, skipped), sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+
+class StructureTable:
+    """
+    Intern table mapping block structures to ids (0 stands for 'no block').
+    `ignored` replaces IGNORED_KEYS, e.g. to also ignore editor-only keys such as `collapsed`.
+    """
+
+    def __init__(self, ignored=IGNORED_KEYS):
+        self._skipped = set(ignored) | {'inputs', 'next'}
+        self._nodes: Dict[tuple, int] = {}
+        self._chains: Dict[tuple, int] = {}
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def _intern(self, table, key):
+        sid = table.get(key)
+        if sid is None:
+            sid = table[key] = len(table) + 1
+        return sid
+
+    def hash_tree(self, root) -> List[HashedBlock]:
+        """HashedBlock for every block of `root` (shadows included), in pre-order."""
+        visits = list(walk(root, shadows=True))
+        done: Dict[int, HashedBlock] = {}
+        for visit in reversed(visits):  # descendants (inputs and `next`) come before their ancestors
+            block = visit.block
+            size = 1
+            inputs = []
+            slots = block.get('inputs')
+            if isinstance(slots, dict):
+                for name, slot in slots.items():
+                    if not isinstance(slot, dict):
+                        continue
+                    child = done.get(id(slot.get('block')))
+                    shadow = done.get(id(slot.get('shadow')))
+                    inputs.append((name, child.chain if child else 0, shadow.chain if shadow else 0))
+                    size += (child.chain_size if child else 0) + (shadow.chain_size if shadow else 0)
+            node = self._intern(self._nodes, (block_data_key(block, self._skipped), tuple(inputs)))
+            nxt = block.get('next')
+            after = done.get(id(nxt.get('block'))) if isinstance(nxt, dict) else None
+            chain = self._intern(self._chains, (node, after.chain if after else 0))
+            done[id(block)] = HashedBlock(visit, node, chain, size, size + (after.chain_size if after else 0))
+        return [done[id(v.block)] for v in visits]
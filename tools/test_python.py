@@ -0,0 +1,490 @@
+"""
+Regression checks for the Python tools (run by test_python.bat, or with pytest).
+
+Usage:
+    python tools/test_python.py
+    python -m pytest tools/test_python.py
+"""
+
+import http.server
+import json
+import pickle
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import download_resources  # noqa: E402
+import duplicate_subtrees  # noqa: E402
+import generate_synthetic_mod  # noqa: E402
+import js_literal  # noqa: E402
+import mod_archive  # noqa: E402
+import portal_diff  # noqa: E402
+import portal_fold  # noqa: E402
+import portal_minify  # noqa: E402
+import portal_pack  # noqa: E402
+import restore_toolbox  # noqa: E402
+from catalog_engine import load_catalog, parse_block_definitions, parse_toolbox  # noqa: E402
+from dts_model import _model_from_plain, _model_to_plain, parse_declarations  # noqa: E402
+from instrumentation import run_main  # noqa: E402
+from portal_export import ExportContext, dumps_js, export_state  # noqa: E402
+from portal_tree import top_level_blocks, walk  # noqa: E402
+from structural_hash import StructureTable  # noqa: E402
+from validate_portal_exports import DEFAULT_REFERENCE_DIR, ValidationContext, learn_reference_inputs, validate_state  # noqa: E402
+
+
+def _single_signature(source):
+    model = parse_declarations(source)
+    (signatures,) = model.functions.values()
+    (signature,) = signatures
+    return signature
+
+
+def test_array_and_generic_types():
+    sig = _single_signature(
+        "declare namespace mod {\n"
+        "  export function F(a: mod.Vector[], b: Array<Map<string, number[]>>, ...c: (A | B)[]): readonly string[][];\n"
+        "}\n")
+    assert [p.type for p in sig.params] == ['mod.Vector[]', 'Array<Map<string, number[]>>', '(A | B)[]']
+    assert sig.params[2].rest
+    assert sig.return_type == 'readonly string[][]'
+
+
+def test_tuple_types_keep_their_brackets():
+    sig = _single_signature("declare function G(t: A | [B, C]): [number, string];")
+    assert sig.params[0].type == 'A | [B, C]'
+    assert sig.return_type == '[number, string]'
+
+
+def test_nested_namespaces_keep_their_own_declarations():
+    model = parse_declarations(
+        "declare namespace mod {\n"
+        "  export function Add(a: number, b: number): number;\n"
+        "  export function Add(a: mod.Vector, b: mod.Vector): mod.Vector;\n"
+        "  export enum Maps { Abbasid, Aftermath }\n"
+        "  namespace inner {\n"
+        "    export function Add(a: string): string;\n"
+        "    export enum Maps { Other }\n"
+        "  }\n"
+        "}\n")
+    assert len(model.overloads('mod.Add')) == 2
+    assert [p.type for p in model.overloads('mod.inner.Add')[0].params] == ['string']
+    assert model.overloads('Add') == model.overloads('mod.Add')
+    assert model.enums['mod.Maps'].member_names == ['Abbasid', 'Aftermath']
+    assert model.enums['mod.inner.Maps'].member_names == ['Other']
+    assert model.enum('Maps') == model.enums['mod.Maps']
+
+
+def test_truncated_declarations_do_not_raise():
+    for source in ("declare namespace", "type", "declare namespace mod { export type"):
+        parse_declarations(source)
+
+
+def test_cached_model_is_plain_data():
+    model = parse_declarations("declare namespace mod { export function F(a?: number[]): void; export enum E { A = 1 } }")
+    data = pickle.dumps(_model_to_plain(model))
+    assert b'dts_model' not in data and b'__main__' not in data
+    assert _model_from_plain(pickle.loads(data)) == model
+
+
+def test_json_fast_path_matches_the_lexer():
+    for source in ('[1, 2,]', '{"u": "a//b", "v": "/*x*/"} // c', '[1,\n// c\n2, /* d */ 3,\n]',
+                   '{"a": [1,],}', '// lead\n[1.5e3, true, null]', "{a: 'x', b: [1,],}"):
+        assert js_literal.loads(source) == js_literal._Parser(source, 0).value(), source
+
+
+def test_block_parse_errors_propagate():
+    source = 'x = Blockly.common.createBlockDefinitionsFromJsonArray([\n  {"type": "a"},\n  {"type": },\n]);'
+    try:
+        parse_block_definitions(source, 'blocks.ts')
+    except js_literal.JSLiteralError as e:
+        assert (e.line, str(e).endswith('of blocks.ts')) == (3, True)
+    else:
+        raise AssertionError("malformed block array parsed")
+    for bad in ('no array here', 'x = Blockly.common.createBlockDefinitionsFromJsonArray([1]);'):
+        try:
+            parse_block_definitions(bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"{bad!r} parsed")
+
+
+def _rule_with_action(action):
+    return {'mod': {'blocks': {'blocks': [{'type': 'ruleBlock', 'id': 'r', 'inputs': {'ACTIONS': {'block': action}}}]},
+                    'variables': []}}
+
+
+def test_validator_flags_inputs_on_zero_input_specs():
+    ctx = ValidationContext({'EventPlayer': [[], []]})
+    bogus = {'type': 'EventPlayer', 'id': 'e', 'inputs': {'BOGUS': {'block': {'type': 'EventPlayer', 'id': 'f'}}}}
+    _, _, errors, warnings = validate_state(_rule_with_action(bogus), ctx)
+    assert not errors
+    assert warnings == {'EventPlayer: input BOGUS not in spec': 1}
+
+
+def test_restore_toolbox_resolves_the_real_toolbox():
+    categories = [c for c in load_catalog().toolbox_categories if c.types and c.name.lower() in restore_toolbox.CATEGORY_MAP]
+    saved = restore_toolbox.ASSETS_DIR, restore_toolbox.OUTPUT_FILE
+    with tempfile.TemporaryDirectory() as tmp:
+        assets, out = Path(tmp, 'assets'), Path(tmp, 'toolbox.ts')
+        for cat in categories:
+            name = cat.name.lower()
+            (assets / name).mkdir(parents=True, exist_ok=True)
+            data = {'sub_categories': {cat.colour: {t: {} for t in cat.types}}}
+            # PascalCase names resolve through the catalog's snake_case index.
+            data['sub_categories']['extra'] = {'SetPlayerMaxHealth': {}} if name == 'player' else {}
+            (assets / name / f"{name}_data.json").write_text(json.dumps(data), encoding='utf-8')
+        restore_toolbox.ASSETS_DIR, restore_toolbox.OUTPUT_FILE = str(assets), str(out)
+        try:
+            restore_toolbox.restore_toolbox()
+        finally:
+            restore_toolbox.ASSETS_DIR, restore_toolbox.OUTPUT_FILE = saved
+        toolbox = parse_toolbox(out.read_text(encoding='utf-8'), str(out))
+    contents = {c['name']: [b['type'] for b in c.get('contents', [])] for c in toolbox['contents']}
+    assert len(contents) > len(categories) // 2
+    assert 'set_player_max_health' in contents['Player']
+    assert contents['Variables'] == [] and contents['Subroutines'] == []
+
+
+# Portal export golden: a collection call, a RULE_HEADER, a CALLSUBROUTINE with ARG_n inputs
+# and an internal 'wait' whose SECONDS input is renamed by position to the spec's VALUE-0.
+EXPORT_SPECS = {'Wait': [['VALUE-0'], []], 'Number': [[], []]}
+EXPORT_SHAPES = {'wait': (['SECONDS'], []), 'number': ([], [])}
+
+
+def _number(block_id, value):
+    return {'block': {'type': 'number', 'id': block_id, 'fields': {'NUM': value}}}
+
+
+def _export_workspace():
+    wait = {'type': 'wait', 'id': 'w', 'inputs': {'SECONDS': _number('n1', 0.5)}}
+    call = {'type': 'CALLSUBROUTINE', 'id': 's', 'fields': {'SUBROUTINE_NAME': 'Sub'},
+            'inputs': {'ARG_0': _number('n2', 1e21), 'ARG_1': _number('n3', 1e-7), 'ARG_2': _number('n4', 100.0)}}
+    return {'blocks': {'languageVersion': 0, 'blocks': [
+        {'type': 'BF6_COLLECTION_DEF', 'id': 'def', 'fields': {'NAME': 'Greet'}, 'inputs': {'STACK': {'block': wait}}},
+        {'type': 'RULE_HEADER', 'id': 'r', 'fields': {'RULE_NAME': 'Main', 'EVENT_TYPE': 'OnPlayerJoin', 'SCOPE': 'Global'},
+         'inputs': {'ACTIONS': {'block': {'type': 'BF6_COLLECTION_CALL', 'id': 'c', 'fields': {'NAME': 'greet'},
+                                          'next': {'block': call}}}}},
+    ]}, 'variables': []}
+
+
+EXPORT_GOLDEN = """\
+{
+  "mod": {
+    "blocks": {
+      "languageVersion": 0,
+      "blocks": [
+        {
+          "type": "ruleBlock",
+          "id": "r",
+          "fields": {
+            "NAME": "Main",
+            "EVENTTYPE": "OnPlayerJoin",
+            "OBJECTTYPE": "Global"
+          },
+          "inputs": {
+            "ACTIONS": {
+              "block": {
+                "type": "Wait",
+                "id": "e3e70682-c209-4cac-a29f-6fbed82c07cd",
+                "inputs": {
+                  "VALUE-0": {
+                    "block": {
+                      "type": "Number",
+                      "id": "f728b4fa-4248-4e3a-8a5d-2f346baa9455",
+                      "fields": {
+                        "NUM": 0.5
+                      }
+                    }
+                  }
+                },
+                "next": {
+                  "block": {
+                    "type": "subroutineInstanceBlock",
+                    "id": "s",
+                    "fields": {
+                      "SUBROUTINE_NAME": "Sub"
+                    },
+                    "inputs": {
+                      "PARAM-0": {
+                        "block": {
+                          "type": "Number",
+                          "id": "n2",
+                          "fields": {
+                            "NUM": 1e+21
+                          }
+                        }
+                      },
+                      "PARAM-1": {
+                        "block": {
+                          "type": "Number",
+                          "id": "n3",
+                          "fields": {
+                            "NUM": 1e-7
+                          }
+                        }
+                      },
+                      "PARAM-2": {
+                        "block": {
+                          "type": "Number",
+                          "id": "n4",
+                          "fields": {
+                            "NUM": 100
+                          }
+                        }
+                      }
+                    },
+                    "extraState": {
+                      "subroutineName": "Sub",
+                      "parameters": []
+                    }
+                  }
+                }
+              }
+            }
+          },
+          "extraState": {
+            "isOngoingEvent": false
+          }
+        }
+      ]
+    },
+    "variables": []
+  }
+}"""
+
+
+def test_portal_export_golden():
+    text, converted, unknown = export_state(_export_workspace(), ExportContext(EXPORT_SPECS, EXPORT_SHAPES))
+    assert text == EXPORT_GOLDEN, text
+    assert converted == 7 and unknown == []
+
+
+def test_dumps_js_formats_numbers_like_json_stringify():
+    values = [0.5, 1e21, 1e-7, 100.0, -0.0, 1.5e-6, 123456789.125, 2 ** 53, float('nan'), True, None, {}, []]
+    assert dumps_js(values, indent=0).replace('\n', '') == \
+        '[0.5,1e+21,1e-7,100,0,0.0000015,123456789.125,9007199254740992,null,true,null,{},[]]'
+    assert dumps_js({'2': 'b', 'a': 1, '1': 'a'}) == '{\n  "1": "a",\n  "2": "b",\n  "a": 1\n}'
+
+
+def test_synthetic_mod_is_seeded_and_valid():
+    model = generate_synthetic_mod.learn_model()
+    with tempfile.TemporaryDirectory() as tmp:
+        a, b, c = (Path(tmp, name) for name in ('a.json', 'b.json', 'c.json'))
+        stats = generate_synthetic_mod.generate_mod(model, a, 2000, seed=5)
+        generate_synthetic_mod.generate_mod(model, b, 2000, seed=5)
+        generate_synthetic_mod.generate_mod(model, c, 2000, seed=6)
+        assert a.read_bytes() == b.read_bytes()
+        assert a.read_bytes() != c.read_bytes()
+        state = json.loads(a.read_text(encoding='utf-8'))
+    ctx = ValidationContext(load_catalog().portal_specs, learn_reference_inputs([DEFAULT_REFERENCE_DIR]))
+    kind, blocks, errors, warnings = validate_state(state, ctx)
+    assert kind == 'portal' and blocks == stats['blocks'] >= 2000
+    assert not errors and not warnings, (errors, warnings)
+
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / '=Resources=' / 'Portal Blocks'
+
+
+def test_subroutine_rewrite_verifies():
+    state = json.loads((TEMPLATES_DIR / 'custom_rush_V1.0.json').read_text(encoding='utf-8'))
+    roots, _ = top_level_blocks(state)
+    table = StructureTable()
+    hashed = duplicate_subtrees.hash_roots(roots, table)
+    original_chains = [h.chain for h in hashed if h.visit.parent is None]
+    done = duplicate_subtrees.rewrite_repeats(state, duplicate_subtrees.find_repeats(hashed),
+                                              duplicate_subtrees.statement_types(), 'subroutines')
+    names = {name for name, _, _ in done}
+    assert done
+    assert duplicate_subtrees.verify_rewrite(original_chains, state, names, 'subroutines', table)
+    # A definition that no longer matches its call sites must fail verification.
+    roots[-1]['inputs']['ACTIONS']['block']['type'] = 'Wait'
+    assert not duplicate_subtrees.verify_rewrite(original_chains, state, names, 'subroutines', table)
+
+
+def test_archive_checkout_gives_back_the_added_json():
+    original = (TEMPLATES_DIR / 'custom_rush_V1.0.json').read_text(encoding='utf-8')
+    edited = json.loads(original)
+    edited['mod']['blocks']['blocks'][0]['x'] = 12345
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = Path(tmp, 'archive')
+        archive.mkdir()
+        v2 = Path(tmp, 'v2.json')
+        v2.write_text(json.dumps(edited), encoding='utf-8')
+        first, second = mod_archive.add_files(str(archive), [str(TEMPLATES_DIR / 'custom_rush_V1.0.json'), str(v2)], 'rush')
+        # The edit only touches the root block; every other block is shared.
+        assert 0 < second['new_objects'] < first['new_objects'] // 10
+        store = mod_archive.ObjectStore(str(archive))
+        try:
+            revisions = mod_archive.load_revisions(str(archive))
+            latest = mod_archive.find_revision(revisions, 'latest', 'rush')
+            assert mod_archive.get_revision(store, first['root']) == json.loads(original)
+            assert mod_archive.get_revision(store, latest['root']) == edited
+        finally:
+            store.close()
+
+
+def test_pack_round_trips_and_detects_a_bad_crc():
+    files = {p.name: p.read_bytes() for p in sorted(TEMPLATES_DIR.glob('*.json'))}
+    zdict = portal_pack.train_dictionary(list(files.values()), size=4096)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp, 'mods.bf6pack')
+        entries = portal_pack.write_pack(path, files, zdict)
+        pack = portal_pack.Pack(path)
+        try:
+            assert [e.name for e in pack.entries] == list(files)
+            for name, data in files.items():
+                assert pack.read(pack.find(name)) == data
+        finally:
+            pack.close()
+
+        # Rewrite the index with a wrong checksum for the first mod.
+        raw = path.read_bytes()
+        index_offset, _, magic = portal_pack.FOOTER.unpack(raw[-portal_pack.FOOTER.size:])
+        bad = [e._asdict() for e in entries]
+        bad[0]['crc32'] ^= 1
+        index = zlib.compress(json.dumps(bad).encode('utf-8'))
+        path.write_bytes(raw[:index_offset] + index + portal_pack.FOOTER.pack(index_offset, len(index), magic))
+        pack = portal_pack.Pack(path)
+        try:
+            assert pack.read(pack.entries[1]) == files[entries[1].name]
+            pack.read(pack.entries[0])
+        except ValueError as e:
+            assert 'checksum mismatch' in str(e)
+        else:
+            raise AssertionError("bad CRC not detected")
+        finally:
+            pack.close()
+
+
+def _reidentified(state):
+    """A copy of a mod with new block and variable ids and every top-level block moved."""
+    copy = json.loads(json.dumps(state))
+    variable_ids = {v['id']: f"var{i}" for i, v in enumerate(copy['mod']['variables'])}
+    for v in copy['mod']['variables']:
+        v['id'] = variable_ids[v['id']]
+    roots, _ = top_level_blocks(copy)
+    n = 0
+    for root in roots:
+        root['x'] = root.get('x', 0) + 500
+        root['y'] = root.get('y', 0) - 70
+        for visit in walk(root, shadows=True):
+            visit.block['id'] = f"b{n}"
+            n += 1
+            var = (visit.block.get('fields') or {}).get('VAR')
+            if isinstance(var, dict) and var.get('id') in variable_ids:
+                var['id'] = variable_ids[var['id']]
+    return copy
+
+
+def test_diff_ignores_ids_and_positions():
+    state = json.loads((TEMPLATES_DIR / 'custom_rush_V1.0.json').read_text(encoding='utf-8'))
+    moved = _reidentified(state)
+    _, _, edits = portal_diff.diff_mods(json.loads(json.dumps(state)), json.loads(json.dumps(moved)))
+    assert edits == []
+
+    roots, _ = top_level_blocks(moved)
+    numbers = [v.block for root in roots for v in walk(root) if v.block.get('type') == 'Number']
+    numbers[len(numbers) // 2]['fields']['NUM'] = 987654
+    _, _, edits = portal_diff.diff_mods(state, moved)
+    assert [e.kind for e in edits] == ['update'], edits
+
+
+def test_minify_keeps_variables_used_by_the_tool_blocks():
+    get_health = {'type': 'GETVARIABLE', 'id': 'get', 'fields': {'VARIABLE_NAME': {'id': 'v-health'}}}
+    set_score = {'type': 'SETVARIABLE', 'id': 'set', 'x': 10, 'y': 20, 'collapsed': True,
+                 'fields': {'VARIABLE': {'id': 'v-score'}}, 'inputs': {'VALUE': {'block': get_health}}}
+    state = {'blocks': {'languageVersion': 0, 'blocks': [set_score]}, 'variables': [
+        {'name': 'score', 'id': 'v-score', 'type': ''},
+        {'name': 'unused', 'id': 'v-unused', 'type': ''},
+        {'name': 'health', 'id': 'v-health', 'type': ''},
+    ]}
+    original = json.dumps(state)
+    stats = portal_minify.minify_state(state)
+    assert stats['variables_removed'] == 1
+    assert [v['name'] for v in state['variables']] == ['score', 'health']
+    score_id, health_id = (v['id'] for v in state['variables'])
+    assert set_score['fields']['VARIABLE'] == {'id': score_id}
+    assert get_health['fields']['VARIABLE_NAME'] == {'id': health_id}
+    assert 'x' not in set_score and 'collapsed' not in set_score
+    assert portal_minify.check_minified(original, portal_minify.dumps_compact(state)) == []
+
+
+def _value(block_type, *inputs):
+    return {'type': block_type, 'id': block_type.lower(),
+            'inputs': {f"VALUE-{i}": {'block': b} for i, b in enumerate(inputs)}}
+
+
+def _literal(value):
+    return {'type': 'Number', 'id': f"n{value}", 'fields': {'NUM': value}}
+
+
+def _folded(expression):
+    state = _rule_with_action({'type': 'Wait', 'id': 'wait', 'inputs': {'VALUE-0': {'block': expression}}})
+    portal_fold.fold_state(state, portal_fold.foldable_types())
+    return state['mod']['blocks']['blocks'][0]['inputs']['ACTIONS']['block']['inputs']['VALUE-0']['block']
+
+
+def test_fold_nested_arithmetic():
+    folded = _folded(_value('Add', _literal(2), _value('Multiply', _literal(3), _literal(4))))
+    assert folded == {'type': 'Number', 'id': 'add', 'fields': {'NUM': 14}}
+
+
+def test_fold_vector_component_of_a_vector_sum():
+    a = _value('CreateVector', _literal(1), _literal(2), _literal(3))
+    b = _value('CreateVector', _literal(4), _literal(5), _literal(6))
+    folded = _folded(_value('GetXComponent', _value('Add', a, b)))
+    assert folded == {'type': 'Number', 'id': 'getxcomponent', 'fields': {'NUM': 5}}
+
+
+def test_fold_leaves_division_by_zero():
+    expression = _value('Divide', _literal(1), _literal(0))
+    assert _folded(json.loads(json.dumps(expression))) == expression
+
+
+def test_download_does_not_retry_a_404():
+    requests = []
+
+    class NotFound(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests.append(self.path)
+            self.send_error(404)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.HTTPServer(('127.0.0.1', 0), NotFound)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = download_resources.Manifest(str(Path(tmp, 'manifest.json')))
+            start = time.perf_counter()
+            name, status, error = download_resources.fetch_one(
+                'Rule.json', 'data/Rule.json', f"http://127.0.0.1:{server.server_port}/", tmp, manifest, 3, 5)
+            elapsed = time.perf_counter() - start
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert status == 'failed' and getattr(error, 'code', None) == 404
+    assert requests == ['/data/Rule.json'] and elapsed < 1
+
+
+def main():
+    tests = [(name, fn) for name, fn in globals().items() if name.startswith('test_') and callable(fn)]
+    failed = 0
+    for name, fn in tests:
+        try:
+            fn()
+        except Exception as e:
+            failed += 1
+            print(f"FAIL {name}: {e!r}")
+    print(f"{len(tests) - failed}/{len(tests)} passed")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    run_main(main)
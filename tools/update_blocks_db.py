@@ -1,146 +1,212 @@
+import argparse
+import hashlib
 import json
-import re
-import os
-from pathlib import Path
+import sys
+
+from catalog_engine import (BLOCK_DB_FILE, BLOCKS_FILES, COMPACT_BLOCK_DB_FILE, TOOLBOX_FILE, build_compact_block_db,
+                            load_catalog)
+from instrumentation import count, run_main, stage
 
 # Configuration
-BLOCKS_FILES = [
-    'web_ui/src/blocks/bf6portal.ts',
-    'web_ui/src/blocks/bf6portal_expanded.ts'
-]
-TOOLBOX_FILE = 'web_ui/src/toolbox.ts'
-OUTPUT_JSON_FILE = 'bf6portal_blocks.json'
-
-def extract_json_from_ts(file_path):
+OUTPUT_JSON_FILE = BLOCK_DB_FILE
+# Local build cache (see generate_blocks_json); not committed.
+MANIFEST_FILE = 'bf6portal_blocks.manifest.json'
+MANIFEST_VERSION = 1
+
+def fold_categories(categories):
+    """{ lower_case_block_type: category } for case-insensitive lookups; the first listing wins."""
+    folded = {}
+    for t, c in categories.items():
+        folded.setdefault(t.lower(), c)
+    return folded
+
+def resolve_category(block_type, categories, folded=None):
+    category = categories.get(block_type, 'Uncategorized')
+    if category == 'Uncategorized':
+        # Try case-insensitive lookup
+        if folded is None:
+            folded = fold_categories(categories)
+        category = folded.get(block_type.lower(), category)
+    return category
+
+def derive_block_entry(block, categories, folded=None):
+    """Builds the bf6portal_blocks.json entry for one block definition."""
+    block_type = block['type']
+
+    # Determine Output / Connections
+    output_type = block.get('output')
+    connections = "None"
+    if 'previousStatement' in block:
+        connections = "Statement"
+    if output_type:
+        connections = "Value"
+
+    return {
+        "block_id": block_type,
+        "name": block.get('message0', ''),
+        "category": resolve_category(block_type, categories, folded),
+        "colour": block.get('colour', 0),
+        "tooltip": block.get('tooltip', ''),
+        "message": block.get('message0', ''),
+        "args_json": json.dumps(block.get('args0', [])),
+        "output_type": str(output_type) if output_type else None,
+        "connections": connections
+    }
+
+def block_digest(block):
+    return hashlib.sha256(json.dumps(block, sort_keys=True).encode('utf-8')).hexdigest()
+
+def load_manifest(catalog):
     """
-    Extracts the JSON array from a TypeScript file.
-    Assumes the format: export const ... = Blockly.common.createBlockDefinitionsFromJsonArray([...]);
+    Returns the previous build's manifest plus its output entries split per source file,
+    or (None, None) when there is nothing reusable.
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Find the start of the JSON array
-        match = re.search(r'createBlockDefinitionsFromJsonArray\(\s*(\[.*\])\s*\);', content, re.DOTALL)
-        if match:
-            json_str = match.group(1)
-            
-            # Trailing commas are valid in JS/TS but not JSON
-            # We try to fix them. This might still be risky if inside strings, but less common for comma+bracket
-            json_str = re.sub(r',\s*\]', ']', json_str)
-            json_str = re.sub(r',\s*\}', '}', json_str)
-
-            try:
-                return json.loads(json_str)
-            except json.JSONDecodeError as e:
-                print(f"Error parsing JSON from {file_path}: {e}")
-                # Fallback: try manual extraction if it's a list of objects
-                blocks = []
-                # Simple regex to grab objects. This is brittle but might work for simple formatted files
-                # Finds { ... } blocks. Logic: Match { then non-{} or nested {} then }
-                # This simple regex handles one level of nesting which is usually enough for args0
-                object_pattern = re.compile(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', re.DOTALL)
-                matches = object_pattern.findall(json_str)
-                for m in matches:
-                    try:
-                        # Attempt to clean individual block strings if needed
-                        blocks.append(json.loads(m))
-                    except:
-                        pass # skip malformed
-                if blocks:
-                    return blocks
-                return []
-        else:
-            print(f"Could not find createBlockDefinitionsFromJsonArray in {file_path}")
-            return []
-    except Exception as e:
-        print(f"Error reading {file_path}: {e}")
-        return []
-
-def extract_categories_from_toolbox(file_path):
+        with open(catalog.path(MANIFEST_FILE), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') != MANIFEST_VERSION:
+            return None, None
+        if catalog.sha256(OUTPUT_JSON_FILE) != manifest.get('output_sha256'):
+            return None, None
+        with open(catalog.path(OUTPUT_JSON_FILE), 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        return None, None
+
+    entries_by_file = {}
+    pos = 0
+    for file_path in BLOCKS_FILES:
+        digests = manifest.get('files', {}).get(file_path, {}).get('digests', [])
+        entries_by_file[file_path] = previous[pos:pos + len(digests)]
+        pos += len(digests)
+    if pos != len(previous):
+        return None, None
+    return manifest, entries_by_file
+
+def write_compact_block_db(catalog, entries=None):
     """
-    Extracts block categories from the toolbox definition.
-    Returns a dict: { block_type: category_name }
+    Writes bf6portal_blocks.compact.json from `entries` (default: the current
+    bf6portal_blocks.json). It records the SHA-256 of the JSON it was built from so
+    loaders can tell when it is stale.
     """
-    block_categories = {}
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        # Extract the toolbox object
-        match = re.search(r'export const toolbox = ({.*});', content, re.DOTALL)
-        if match:
-            toolbox_str = match.group(1)
-            
-            # Find all categories
-            category_pattern = re.compile(r"\{[^{}]*'kind':\s*'category',[^{}]*'name':\s*'([^']+)',[^{}]*'contents':\s*\[(.*?)\]", re.DOTALL)
-            categories = category_pattern.findall(toolbox_str)
-            
-            for cat_name, contents in categories:
-                # Find all block types in this category
-                type_pattern = re.compile(r"'type':\s*'([^']+)'")
-                types = type_pattern.findall(contents)
-                for t in types:
-                    block_categories[t] = cat_name
-                    
-    except Exception as e:
-        print(f"Error reading toolbox {file_path}: {e}")
-        
-    return block_categories
-
-def generate_blocks_json():
-    all_block_data = []
+    if entries is None:
+        with open(catalog.path(OUTPUT_JSON_FILE), 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+    with stage('transform'):
+        compact = build_compact_block_db(entries, catalog.sha256(OUTPUT_JSON_FILE))
+    with stage('write'):
+        with open(catalog.path(COMPACT_BLOCK_DB_FILE), 'w', encoding='utf-8') as f:
+            json.dump(compact, f, separators=(',', ':'), ensure_ascii=False)
+    print(f"Wrote {len(compact['blocks'])} blocks ({len(compact['strings'])} strings, "
+          f"{len(compact['portal_specs'])} portal types) to {COMPACT_BLOCK_DB_FILE}")
 
-    # Get categories mapping
-    categories = extract_categories_from_toolbox(TOOLBOX_FILE)
-    print(f"Found {len(categories)} block categorizations.")
+def generate_blocks_json(catalog=None, force=False):
+    """
+    Rebuilds bf6portal_blocks.json.
 
-    # Process block files
-    total_blocks = 0
-    for file_path in BLOCKS_FILES:
-        blocks = extract_json_from_ts(file_path)
-        print(f"Processing {len(blocks)} blocks from {file_path}")
-        
-        for block in blocks:
-            block_type = block.get('type')
-            if not block_type:
+    A sidecar manifest records the SHA-256 of every source plus a digest per block, so
+    unchanged sources are not re-parsed and unchanged blocks keep their previous entry.
+    A run with no source changes only hashes the inputs.
+
+    A source that fails to parse raises (ValueError / JSLiteralError) before anything
+    is written, so the DB, the manifest and the compact catalog keep the last good build.
+    """
+    catalog = catalog or load_catalog()
+
+    with stage('read'):
+        source_hashes = {file_path: catalog.sha256(file_path) for file_path in BLOCKS_FILES}
+        toolbox_hash = catalog.sha256(TOOLBOX_FILE)
+        manifest, previous = (None, None) if force else load_manifest(catalog)
+    prev_files = manifest.get('files', {}) if manifest else {}
+    toolbox_changed = not manifest or manifest.get('toolbox_sha256') != toolbox_hash
+    changed_files = [f for f in BLOCKS_FILES if prev_files.get(f, {}).get('sha256') != source_hashes[f]]
+
+    if manifest and not toolbox_changed and not changed_files:
+        print(f"{OUTPUT_JSON_FILE} is up to date.")
+        if catalog.load_compact_block_db() is None:
+            write_compact_block_db(catalog)
+        return
+
+    categories = catalog.toolbox_membership if toolbox_changed or changed_files else {}
+    folded = fold_categories(categories)
+    if toolbox_changed:
+        print(f"Found {len(categories)} block categorizations.")
+
+    all_block_data = []
+    files_manifest = {}
+    reused = derived = 0
+
+    with stage('transform'):
+        for file_path in BLOCKS_FILES:
+            if file_path not in changed_files:
+                # Source unchanged: keep the previous entries, only re-resolving categories
+                # when the toolbox moved.
+                entries = previous[file_path]
+                if toolbox_changed:
+                    for entry in entries:
+                        entry['category'] = resolve_category(entry['block_id'], categories, folded)
+                files_manifest[file_path] = prev_files[file_path]
+                all_block_data.extend(entries)
+                reused += len(entries)
                 continue
 
-            # Determine category
-            category = categories.get(block_type, 'Uncategorized')
-            if category == 'Uncategorized':
-                # Try case-insensitive lookup
-                for t, c in categories.items():
-                    if t.lower() == block_type.lower():
-                        category = c
-                        break
-
-            # Determine Output / Connections
-            output_type = block.get('output')
-            connections = "None"
-            if 'previousStatement' in block:
-                connections = "Statement"
-            if output_type:
-                connections = "Value"
-
-            # Prepare data
-            block_entry = {
-                "block_id": block_type,
-                "name": block.get('message0', ''),
-                "category": category,
-                "colour": block.get('colour', 0),
-                "tooltip": block.get('tooltip', ''),
-                "message": block.get('message0', ''),
-                "args_json": json.dumps(block.get('args0', [])),
-                "output_type": str(output_type) if output_type else None,
-                "connections": connections
-            }
-            all_block_data.append(block_entry)
-            total_blocks += 1
-
-    with open(OUTPUT_JSON_FILE, 'w', encoding='utf-8') as f:
-        json.dump(all_block_data, f, indent=4)
-    print(f"Successfully generated {total_blocks} blocks to {OUTPUT_JSON_FILE}.")
+            blocks = [b for b in catalog.blocks_in(file_path) if b.get('type')]
+            print(f"Processing {len(blocks)} blocks from {file_path}")
+
+            prev_by_digest = {}
+            if previous and not toolbox_changed:
+                prev_digests = prev_files.get(file_path, {}).get('digests', [])
+                prev_by_digest = dict(zip(prev_digests, previous[file_path]))
+
+            digests = []
+            for block in blocks:
+                digest = block_digest(block)
+                digests.append(digest)
+                entry = prev_by_digest.get(digest)
+                if entry is not None:
+                    reused += 1
+                else:
+                    entry = derive_block_entry(block, categories, folded)
+                    derived += 1
+                all_block_data.append(entry)
+
+            files_manifest[file_path] = {"sha256": source_hashes[file_path], "digests": digests}
+
+    count('blocks_derived', derived)
+    count('blocks_reused', reused)
+
+    with stage('write'):
+        with open(catalog.path(OUTPUT_JSON_FILE), 'w', encoding='utf-8') as f:
+            json.dump(all_block_data, f, indent=4)
+
+        with open(catalog.path(MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump({
+                "version": MANIFEST_VERSION,
+                "toolbox_sha256": toolbox_hash,
+                "output_sha256": catalog.sha256(OUTPUT_JSON_FILE),
+                "files": files_manifest,
+            }, f, indent=1)
+
+    print(f"Successfully generated {len(all_block_data)} blocks to {OUTPUT_JSON_FILE} "
+          f"({derived} derived, {reused} reused).")
+    write_compact_block_db(catalog, all_block_data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate bf6portal_blocks.json from the block sources.")
+    parser.add_argument('--force', action='store_true', help="ignore the build manifest and rebuild everything")
+    parser.add_argument('--compact-only', action='store_true',
+                        help=f"only rebuild {COMPACT_BLOCK_DB_FILE} from the existing {OUTPUT_JSON_FILE}")
+    args = parser.parse_args()
+    if args.compact_only:
+        write_compact_block_db(load_catalog())
+    else:
+        try:
+            generate_blocks_json(force=args.force)
+        except ValueError as e:
+            print(f"Error: {e}. {OUTPUT_JSON_FILE} was not updated.", file=sys.stderr)
+            sys.exit(1)
+
 
 if __name__ == "__main__":
-    generate_blocks_json()
\ No newline at end of file
+    run_main(main)
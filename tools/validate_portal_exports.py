@@ -0,0 +1,233 @@
+"""
+Batch validator for Portal exports and saved workspaces.
+
+Checks every JSON file under the given paths against the block catalog, in
+parallel, without the Electron UI:
+
+- errors: unknown block types (after the same type resolution as
+  portal_convert.ts), leftover internal collection blocks, unreadable files
+- warnings: input names that are not in the block's spec (args_json)
+
+Specs come from the blocks DB (bf6portal_blocks.compact.json / .json). Types
+and input names seen in the official reference exports (by default the
+templates in `=Resources=/Portal Blocks`) are accepted as well, since the docs
+catalog does not cover every block the Portal editor emits.
+
+Usage:
+    python tools/validate_portal_exports.py mods/ --jobs 8
+    python tools/validate_portal_exports.py mods/ --strict --json > report.json
+
+Exits 1 when any file has errors (or warnings, with --strict).
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from catalog_engine import REPO_ROOT, load_catalog
+from instrumentation import run_main
+from portal_tree import COLLECTION_CALL_TYPE, COLLECTION_DEF_TYPE, PORTAL_TYPE_EXPORT_OVERRIDES, top_level_blocks, walk
+
+DEFAULT_REFERENCE_DIR = REPO_ROOT / '=Resources=' / 'Portal Blocks'
+INTERNAL_COLLECTION_TYPES = {COLLECTION_DEF_TYPE, COLLECTION_CALL_TYPE}
+# Inputs added by mutators, so their names are not listed in any spec.
+DYNAMIC_INPUT_RES = {
+    'subroutineInstanceBlock': re.compile(r'^PARAM-\d+$'),
+    'If': re.compile(r'^(?:IF|DO)\d+$|^ELSE$'),
+}
+
+# Per-process validation context, set once per worker by _init_worker.
+_CONTEXT = None
+
+
+class ValidationContext:
+    """Known Portal types and their allowed input names."""
+
+    def __init__(self, specs, extra_inputs=None):
+        self.inputs = {t: set(spec[0]) | set(spec[1]) for t, spec in specs.items()}
+        for t, names in (extra_inputs or {}).items():
+            self.inputs.setdefault(t, set()).update(names)
+        # Types with a spec (possibly with no inputs); the export overrides below are only known by name.
+        self.specified = set(self.inputs)
+        for t in PORTAL_TYPE_EXPORT_OVERRIDES.values():
+            self.inputs.setdefault(t, set())
+        self.by_lower = {}
+        for t in self.inputs:
+            self.by_lower.setdefault(t.lower(), t)
+
+    def resolve(self, block_type):
+        """Portal type for a block type (as resolvePortalTypeFromInternalType does), or None if unknown."""
+        if block_type in PORTAL_TYPE_EXPORT_OVERRIDES:
+            return PORTAL_TYPE_EXPORT_OVERRIDES[block_type]
+        if block_type in self.inputs:
+            return block_type
+        return self.by_lower.get(block_type.lower())
+
+    def input_allowed(self, portal_type, name):
+        if name in self.inputs.get(portal_type, ()):
+            return True
+        dynamic = DYNAMIC_INPUT_RES.get(portal_type)
+        return bool(dynamic and dynamic.match(name))
+
+
+def learn_reference_inputs(paths):
+    """{ block_type: {input names} } observed in reference (official) exports."""
+    out = {}
+    for path in iter_json_files(paths):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                roots, _ = top_level_blocks(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"Warning: skipping reference {path}: {e}", file=sys.stderr)
+            continue
+        for root in roots or []:
+            for visit in walk(root, shadows=True):
+                names = out.setdefault(visit.block.get('type'), set())
+                names.update((visit.block.get('inputs') or {}).keys())
+    return out
+
+
+def validate_state(state, ctx):
+    """Returns (kind, block_count, errors: Counter, warnings: Counter) for one parsed file."""
+    errors = Counter()
+    warnings = Counter()
+    roots, is_mod = top_level_blocks(state)
+    if roots is None:
+        errors['not a Portal mod or workspace JSON'] += 1
+        return 'unknown', 0, errors, warnings
+
+    count = 0
+    for root in roots:
+        if not isinstance(root, dict):
+            continue
+        for visit in walk(root, shadows=True):
+            block = visit.block
+            count += 1
+            btype = str(block.get('type') or '')
+            if btype in INTERNAL_COLLECTION_TYPES:
+                errors[f"internal collection block {btype}"] += 1
+                continue
+            portal_type = ctx.resolve(btype)
+            if portal_type is None:
+                errors[f"unknown block type {btype}"] += 1
+                continue
+            # Internal (tool) input names are renamed on export, so only check blocks
+            # that are already in Portal form. A spec with no inputs still flags any input.
+            if portal_type != btype or portal_type not in ctx.specified:
+                continue
+            for name in (block.get('inputs') or {}):
+                if not ctx.input_allowed(portal_type, name):
+                    warnings[f"{portal_type}: input {name} not in spec"] += 1
+    return ('portal' if is_mod else 'workspace'), count, errors, warnings
+
+
+def validate_file(path):
+    ctx = _CONTEXT
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError) as e:
+        return {'path': str(path), 'kind': 'unreadable', 'blocks': 0, 'errors': {f"cannot read: {e}": 1}, 'warnings': {}}
+    kind, count, errors, warnings = validate_state(state, ctx)
+    return {'path': str(path), 'kind': kind, 'blocks': count, 'errors': dict(errors), 'warnings': dict(warnings)}
+
+
+def _init_worker(specs, extra_inputs):
+    global _CONTEXT
+    _CONTEXT = ValidationContext(specs, extra_inputs)
+
+
+def iter_json_files(paths):
+    for p in paths:
+        p = Path(p)
+        if p.is_dir():
+            yield from sorted(x for x in p.rglob('*.json') if x.is_file())
+        elif p.is_file():
+            yield p
+        else:
+            print(f"Warning: {p} not found.", file=sys.stderr)
+
+
+def validate_paths(paths, specs, extra_inputs=None, jobs=None):
+    """Validates every JSON file under `paths`. Yields per-file results in input order."""
+    files = list(iter_json_files(paths))
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1 or len(files) <= 1:
+        _init_worker(specs, extra_inputs)
+        for path in files:
+            yield validate_file(path)
+        return
+    chunksize = max(1, len(files) // (jobs * 8))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(specs, extra_inputs)) as pool:
+        yield from pool.map(validate_file, files, chunksize=chunksize)
+
+
+def print_result(result, max_issues):
+    if not result['errors'] and not result['warnings']:
+        return
+    print(f"{result['path']} [{result['kind']}, {result['blocks']} blocks]")
+    for label, issues in (('ERROR', result['errors']), ('warn', result['warnings'])):
+        items = sorted(issues.items(), key=lambda kv: (-kv[1], kv[0]))
+        for message, n in items[:max_issues]:
+            print(f"  {label}: {message}" + (f" (x{n})" if n > 1 else ""))
+        if len(items) > max_issues:
+            print(f"  {label}: ... {len(items) - max_issues} more")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate Portal exports / workspaces against the block catalog.")
+    parser.add_argument('paths', nargs='+', help="JSON files or directories (searched recursively)")
+    parser.add_argument('--jobs', '-j', type=int, default=0, help="worker processes (default: CPU count; 1 = in-process)")
+    parser.add_argument('--reference', action='append', default=None,
+                        help=f"official exports whose types/inputs are accepted (default: {DEFAULT_REFERENCE_DIR.name}); "
+                             "pass --reference none to disable")
+    parser.add_argument('--strict', action='store_true', help="fail on warnings too")
+    parser.add_argument('--json', action='store_true', help="print a JSON report")
+    parser.add_argument('--max-issues', type=int, default=10, help="issues listed per file and severity (default: 10)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    specs = load_catalog().portal_specs
+    references = [DEFAULT_REFERENCE_DIR] if args.reference is None else [r for r in args.reference if r.lower() != 'none']
+    extra_inputs = learn_reference_inputs(references) if references else {}
+
+    results = []
+    for result in validate_paths(args.paths, specs, extra_inputs, args.jobs):
+        results.append(result)
+        if not args.json:
+            print_result(result, args.max_issues)
+    elapsed = time.perf_counter() - start
+
+    failed = [r for r in results if r['errors'] or (args.strict and r['warnings'])]
+    blocks = sum(r['blocks'] for r in results)
+    rate = len(results) / elapsed if elapsed else 0.0
+    summary = {
+        'files': len(results),
+        'blocks': blocks,
+        'files_with_errors': sum(1 for r in results if r['errors']),
+        'files_with_warnings': sum(1 for r in results if r['warnings']),
+        'seconds': round(elapsed, 3),
+        'files_per_sec': round(rate, 1),
+        'blocks_per_sec': round(blocks / elapsed if elapsed else 0.0, 1),
+    }
+
+    if args.json:
+        json.dump({'summary': summary, 'results': results}, sys.stdout, indent=2)
+        print()
+    else:
+        print(f"\nValidated {summary['files']} files ({blocks} blocks) in {elapsed:.2f}s: "
+              f"{summary['files_per_sec']} files/sec, {summary['blocks_per_sec']:.0f} blocks/sec")
+        print(f"{summary['files_with_errors']} with errors, {summary['files_with_warnings']} with warnings")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_main(main)
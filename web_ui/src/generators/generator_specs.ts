@@ -0,0 +1,327 @@
+// Generated by tools/generator_specs.py; edit bf6_generators.ts for hand-written generators.
+// Rows are interpreted by specGenerator (spec_generator.ts); see that file for the row format.
+// Kept as JSON text: JSON.parse is cheaper for the JS engine to load than an equivalent object literal.
+
+import type { GeneratorSpec } from './spec_generator';
+
+export const GENERATOR_SPECS: Record<string, GeneratorSpec> = JSON.parse(`{
+"ABORT": ["Abort", 0],
+"AIATTACKTARGET": ["AIAttackTarget", 0, ["AI_PLAYER", "TARGET_PLAYER"]],
+"AIBATTLEFIELDBEHAVIOR": ["AIBattlefieldBehavior", 0, ["PLAYER"]],
+"AIBATTLEFIELDBEHAVIOUR": ["AIBattlefieldBehaviour", 0, ["PLAYER"]],
+"AIDEFENDPOSITIONBEHAVIOR": ["AIDefendPositionBehavior", 0, ["PLAYER", "DEFEND_POSITION", ["MIN_DISTANCE", "0"], ["MAX_DISTANCE", "0"]]],
+"AIDEFENDPOSITIONBEHAVIOUR": ["AIDefendPositionBehaviour", 0, ["PLAYER"]],
+"AIFOLLOWPLAYER": ["AIFollowPlayer", 0, ["AI_PLAYER", "TARGET_PLAYER", ["DISTANCE", "0"]]],
+"AIHOLDPOSITION": ["AIHoldPosition", 0, ["PLAYER"]],
+"AIIDLEBEHAVIOR": ["AIIdleBehavior", 0, ["PLAYER"]],
+"AIIDLEBEHAVIOUR": ["AIIdleBehaviour", 0, ["PLAYER"]],
+"AIISALIVE": ["AIIsAlive", 1, ["PLAYER"]],
+"AILOSMOVETOBEHAVIOUR": ["AILOSMoveTOBehaviour", 0, ["PLAYER"]],
+"AIMOVETOBEHAVIOR": ["AIMoveToBehavior", 0, ["PLAYER", "POSITION", ["SPRINT", "false"]]],
+"AIMOVETOBEHAVIOUR": ["AIMoveToBehaviour", 0, ["PLAYER"]],
+"AIPARACHUTEBEHAVIOR": ["AIParachuteBehavior", 0, ["PLAYER"]],
+"AIPARACHUTEBEHAVIOUR": ["AIParachuteBehaviour", 0, ["PLAYER"]],
+"AIVALIDATEMOVETOBEHAVIOUR": ["AIValidateMoveToBehaviour", 0, ["PLAYER", "POSITION"]],
+"AIWAYPOINTIDLEBEHAVIOR": ["AIWaypointIdleBehavior", 0, ["PLAYER", "WAYPOINT_PATH"]],
+"AIWAYPOINTIDLEBEHAVIOUR": ["AIWaypointIdleBehaviour", 0, ["PLAYER", "WAYPOINT_PATH"]],
+"AND": ["And", 2, [["A", "false"], ["B", "false"]]],
+"ANGLEBETWEENVECTORS": ["AngleBetweenVectors", 2, [["VECTOR1", "mod.CreateVector(0,0,0)"], ["VECTOR2", "mod.CreateVector(0,0,0)"]]],
+"ANGLEDIFFERENCE": ["AngleDifference", 2, [["ANGLE1", "0"], ["ANGLE2", "0"]]],
+"APPLYMEDGADGET": ["ApplyMedGadget", 0, ["PLAYER", "MEDGADGET"]],
+"ARCCOSINEINDEGREES": ["ArccosineInDegrees", 2, [["NUMBER", "0"]]],
+"ARCCOSINEINRADIANS": ["ArccosineInRadians", 2, [["NUMBER", "0"]]],
+"ARCSINEINDEGREES": ["ArcsineInDegrees", 2, [["NUMBER", "0"]]],
+"ARCSINEINRADIANS": ["ArcsineInRadians", 2, [["NUMBER", "0"]]],
+"ARCTANGENTINDEGREES": ["ArctangentInDegrees", 2, [["NUMBER", "0"]]],
+"ARCTANGENTINRADIANS": ["ArctangentInRadians", 2, [["NUMBER", "0"]]],
+"ARRAYCONTAINS": ["ArrayContains", 2, [["ARRAY", "[]"], "ITEM"]],
+"ARRAYSLICE": ["ArraySlice", 2, [["ARRAY", "[]"], ["START_INDEX", "0"], ["COUNT", "0"]]],
+"AbortIf": ["AbortIf", 0, [["CONDITION", "false"]]],
+"BACKWARDVECTOR": ["BackwardVector", 2],
+"CAPTUREPOINTCAPTURINGTIME": ["CapturePointCapturingTime", 0, ["CAPTURE_POINT", ["TIME", "0"]]],
+"CAPTUREPOINTNEUTRALIZATIONTIME": ["CapturePointNeutralizationTime", 0, ["CAPTURE_POINT", ["TIME", "0"]]],
+"CLEARALLCUSTOMMESSAGES": ["ClearAllCustomMessages", 0, ["RECIPIENT"]],
+"CLEARCUSTOMMESSAGE": ["ClearCustomMessage", 0, ["RECIPIENT", "MESSAGE_SLOT"]],
+"CLOSESTPLAYERTO": ["ClosestPlayerTo", 2, ["POSITION"]],
+"COMPARECAPTUREPOINT": ["CompareCapturePoint", 2, ["CAPTURE_POINT_A", "CAPTURE_POINT_B"]],
+"COMPAREVEHICLENAME": ["CompareVehicleName", 2, ["VEHICLE", ["NAME", "\\"\\""]]],
+"COSINEFROMDEGREES": ["CosineFromDegrees", 2, [["ANGLE", "0"]]],
+"COSINEFROMRADIANS": ["CosineFromRadians", 2, [["ANGLE", "0"]]],
+"COUNTOF": ["CountOf", 2, [["ARRAY", "[]"]]],
+"CROSSPRODUCT": ["CrossProduct", 2, ["VECTOR_A", "VECTOR_B"]],
+"DEPLOYAI": ["DeployAI", 0, ["TEAM", "SOLDIER_TYPE", "POSITION", "KIT"]],
+"DESPAWNAI": ["DespawnAI", 0, ["PLAYER"]],
+"DISTANCEBETWEEN": ["DistanceBetween", 2, ["POSITION_A", "POSITION_B"]],
+"DOTPRODUCT": ["DotProduct", 2, ["VECTOR_A", "VECTOR_B"]],
+"DOWN": ["DownVector", 2],
+"FORWARD": ["ForwardVector", 2],
+"GETAIHEALTH": ["GetAIHealth", 1, ["PLAYER"]],
+"GETAITEAM": ["GetAITeam", 1, ["PLAYER"]],
+"LEFT": ["LeftVector", 2],
+"LOADMUSIC": ["LoadMusic", 0, ["MUSIC_ID"]],
+"NORMALIZE": ["Normalize", 2, ["VECTOR"]],
+"PAUSEROUND": ["PauseRound", 0],
+"PLAYMUSIC": ["PlayMusic", 0, ["MUSIC_ID", "PLAYERS"]],
+"PLAYSOUND": ["PlaySound", 0, ["SOUND_ID", "POSITION", "PLAYERS", ["VOLUME", "1.0"], ["PITCH", "1.0"]]],
+"PLAYVO": ["PlayVO", 0, ["VO_ID", "SPEAKER", "LISTENER", "PLAYERS"]],
+"RIGHT": ["RightVector", 2],
+"SETAIBEHAVIOR": ["SetAIBehavior", 0, ["PLAYER", "BEHAVIOR_MODE"]],
+"SETAIHEALTH": ["SetAIHealth", 0, ["PLAYER", ["AMOUNT", "0"]]],
+"SETAISPAWNLOCATION": ["SetAISpawnLocation", 0, ["TEAM", "POSITION"]],
+"SETAITEAM": ["SetAITeam", 0, ["PLAYER", "TEAM_ID"]],
+"SETELEMENT": ["SetElement", 0, ["ARRAY", ["INDEX", "0"], "VALUE"]],
+"SETMUSICPARAM": ["SetMusicParam", 0, ["MUSIC_ID", "PARAM", "PLAYERS"]],
+"SETPLAYERLOADOUT": ["SetPlayerLoadout", 0, ["PLAYER", "LOADOUT"]],
+"STOPSOUND": ["StopSound", 0, ["SOUND_ID", "PLAYERS"]],
+"TELEPORT": ["Teleport", 0, ["PLAYER", "LOCATION"]],
+"UNLOADMUSIC": ["UnloadMusic", 0, ["MUSIC_ID"]],
+"UP": ["UpVector", 2],
+"VECTOR": ["CreateVector", 2, [["X", "0"], ["Y", "0"], ["Z", "0"]]],
+"VECTORMAGNITUDE": ["VectorMagnitude", 2, ["VECTOR"]],
+"VECTORTOWARDS": ["VectorTowards", 2, ["START_POS", "END_POS"]],
+"WAIT": ["Wait", 0, [["SECONDS", "0"]]],
+"WAITUNTIL": ["WaitUntil", 0, [["CONDITION", "false"], ["TIMEOUT", "0"]]],
+"XCOMPONENTOF": ["XComponentOf", 2, ["VECTOR"]],
+"YCOMPONENTOF": ["YComponentOf", 2, ["VECTOR"]],
+"ZCOMPONENTOF": ["ZComponentOf", 2, ["VECTOR"]],
+"abort": ["Abort", 0],
+"abort_if": ["AbortIf", 0, ["VALUE-0"]],
+"absolute_value": ["AbsoluteValue", 1, ["VALUE-0"]],
+"add": ["Add", 1, ["VALUE-0", "VALUE-1"]],
+"and": ["And", 1, ["VALUE-0", "VALUE-1"]],
+"angle_between_vectors": ["AngleBetweenVectors", 1, ["VALUE-0", "VALUE-1"]],
+"angle_difference": ["AngleDifference", 1, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3"]],
+"append_to_array": ["AppendToArray", 1, ["VALUE-0", "VALUE-1"]],
+"apply_med_gadget": ["ApplyMedGadget", 0, ["VALUE-0", "VALUE-1"]],
+"arccosine_in_degrees": ["ArccosineInDegrees", 1, ["VALUE-0"]],
+"arccosine_in_radians": ["ArccosineInRadians", 1, ["VALUE-0"]],
+"arcsine_in_degrees": ["ArcsineInDegrees", 1, ["VALUE-0"]],
+"arcsine_in_radians": ["ArcsineInRadians", 1, ["VALUE-0"]],
+"arctangent_in_degrees": ["ArctangentInDegrees", 1, ["VALUE-0"]],
+"arctangent_in_radians": ["ArctangentInRadians", 1, ["VALUE-0"]],
+"array_contains": ["ArrayContains", 1, ["VALUE-0", "VALUE-1"]],
+"array_slice": ["ArraySlice", 1, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3", "VALUE-4"]],
+"backward_vector": ["BackwardVector", 1],
+"bool": ["Bool", 0],
+"break": ["Break", 0],
+"capture_point_capturing_time": ["CapturePointCapturingTime", 0, ["VALUE-0", "VALUE-1"]],
+"capture_point_neutralization_time": ["CapturePointNeutralizationTime", 0, ["VALUE-0", "VALUE-1"]],
+"ceiling": ["Ceiling", 1, ["VALUE-0"]],
+"clear_all_custom_messages": ["ClearAllCustomMessages", 0, ["VALUE-0", "VALUE-1", "VALUE-2"]],
+"clear_custom_message": ["ClearCustomMessage", 0, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3"]],
+"closest_player_to": ["ClosestPlayerTo", 1, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3"]],
+"compare_capture_point": ["CompareCapturePoint", 1, ["VALUE-0", "VALUE-1"]],
+"compare_vehicle_name": ["CompareVehicleName", 1, ["VALUE-0", "VALUE-1"]],
+"condition": ["CONDITION", 0, ["VALUE-0"]],
+"continue": ["Continue", 0],
+"cosine_from_degrees": ["CosineFromDegrees", 1, ["VALUE-0"]],
+"cosine_from_radians": ["CosineFromRadians", 1, ["VALUE-0"]],
+"count_of": ["CountOf", 1, ["VALUE-0"]],
+"create_vector": ["CreateVector", 1, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3", "VALUE-4", "VALUE-5"]],
+"cross_product": ["CrossProduct", 1, ["VALUE-0", "VALUE-1"]],
+"current_array_element": ["CurrentArrayElement", 1],
+"damage_vehicle": ["DamageVehicle", 0, ["VALUE-0", "VALUE-1"]],
+"deal_damage": ["DealDamage", 0, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3", "VALUE-4", "VALUE-5"]],
+"degrees_to_radians": ["DegreesToRadians", 1, ["VALUE-0"]],
+"deploy_all_players": ["DeployAllPlayers", 0],
+"deploy_player": ["DeployPlayer", 0, ["VALUE-0"]],
+"destroy_vehicle": ["DestroyVehicle", 0, ["VALUE-0"]],
+"direction_from_angles": ["DirectionFromAngles", 1, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3"]],
+"direction_towards": ["DirectionTowards", 1, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3"]],
+"display_custom_message": ["DisplayCustomMessage", 0, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3", "VALUE-4", "VALUE-5", "VALUE-6"]],
+"display_game_mode_message": ["DisplayGameModeMessage", 0, ["VALUE-0", "VALUE-1", "VALUE-2"]],
+"display_highlighted_world_log_message": ["DisplayHighlightedWorldLogMessage", 0, ["VALUE-0", "VALUE-1", "VALUE-2"]],
+"display_notification_message": ["DisplayNotificationMessage", 0, ["VALUE-0", "VALUE-1", "VALUE-2"]],
+"distance_between": ["DistanceBetween", 1, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3"]],
+"divide": ["Divide", 1, ["VALUE-0", "VALUE-1"]],
+"dot_product": ["DotProduct", 1, ["VALUE-0", "VALUE-1"]],
+"down_vector": ["DownVector", 1],
+"else": ["Else", 0],
+"else_if": ["ElseIf", 0, ["VALUE-0"]],
+"empty_array": ["EmptyArray", 1],
+"enable_all_input_restrictions": ["EnableAllInputRestrictions", 0, ["VALUE-0", "VALUE-1"]],
+"enable_all_player_deploy": ["EnableAllPlayerDeploy", 0, ["VALUE-0"]],
+"enable_capture_point_deploying": ["EnableCapturePointDeploying", 0, ["VALUE-0", "VALUE-1"]],
+"enable_capturing": ["EnableCapturing", 0, ["VALUE-0", "VALUE-1"]],
+"enable_default_game_mode_scoring": ["EnableDefaultGameModeScoring", 0, [["VALUE-0", "false"]]],
+"enable_default_game_mode_win_condition": ["EnableDefaultGameModeWinCondition", 0, [["VALUE-0", "false"]]],
+"enable_game_mode_objective": ["EnableGameModeObjective", 0, ["VALUE-0", ["VALUE-1", "false"]]],
+"enable_hq": ["EnableHQ", 0, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3"]],
+"enable_input_restriction": ["EnableInputRestriction", 0, ["VALUE-0", "VALUE-1", "VALUE-2"]],
+"enable_player_deploy": ["EnablePlayerDeploy", 0, ["VALUE-0", ["VALUE-1", "false"]]],
+"enable_ticket_bleed_acceleration": ["EnableTicketBleedAcceleration", 0, ["VALUE-0"]],
+"enable_vo_messaging": ["EnableVOMessaging", 0, [["VALUE-0", "false"]]],
+"enable_world_icon_image": ["EnableWorldIconImage", 0, ["VALUE-0", "VALUE-1"]],
+"enable_world_icon_text": ["EnableWorldIconText", 0, ["VALUE-0", "VALUE-1"]],
+"end_game_mode": ["EndGameMode", 0, ["VALUE-0"]],
+"equals": ["Equals", 1, ["VALUE-0", "VALUE-1"]],
+"event_capture_point": ["EventCapturePoint", 1],
+"event_damage_type": ["EventDamageType", 1],
+"event_death_type": ["EventDeathType", 1],
+"event_mcom": ["EventMCOM", 1],
+"event_other_player": ["EventOtherPlayer", 1],
+"event_player": ["EventPlayer", 1],
+"event_seat": ["EventSeat", 1],
+"event_team": ["EventTeam", 1],
+"event_vehicle": ["EventVehicle", 1],
+"event_weapon": ["EventWeapon", 1],
+"farthest_player_from": ["FarthestPlayerFrom", 1, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3"]],
+"filtered_array": ["FilteredArray", 1, ["VALUE-0", "VALUE-1"]],
+"first_of": ["FirstOf", 1, ["VALUE-0"]],
+"floor": ["Floor", 1, ["VALUE-0"]],
+"force_all_exit_vehicle": ["ForceAllExitVehicle", 0, ["VALUE-0"]],
+"force_mandown": ["ForceMandown", 0, ["VALUE-0"]],
+"force_player_exit_vehicle": ["ForcePlayerExitVehicle", 0, ["VALUE-0", "VALUE-1"]],
+"force_player_to_seat": ["ForcePlayerToSeat", 0, ["VALUE-0", "VALUE-1", "VALUE-2"]],
+"force_revive": ["ForceRevive", 0, ["VALUE-0"]],
+"force_switch_inventory": ["ForceSwitchInventory", 0, ["VALUE-0", "VALUE-1"]],
+"forward_vector": ["ForwardVector", 1],
+"get_all_capture_points": ["GetAllCapturePoints", 1],
+"get_all_mco_ms": ["GetAllMCOMs", 1],
+"get_all_players_in_vehicle": ["GetAllPlayersInVehicle", 1, ["VALUE-0"]],
+"get_all_vehicles": ["GetAllVehicles", 1],
+"get_capture_point_position": ["GetCapturePointPosition", 1, ["VALUE-0"]],
+"get_capture_progress": ["GetCaptureProgress", 1, ["VALUE-0"]],
+"get_current_owner_team_id": ["GetCurrentOwnerTeamID", 1, ["VALUE-0"]],
+"get_game_mode_score": ["GetGameModeScore", 1, ["VALUE-0"]],
+"get_game_mode_target_score": ["GetGameModeTargetScore", 1],
+"get_game_mode_time_elapsed": ["GetGameModeTimeElapsed", 1],
+"get_game_mode_time_limit": ["GetGameModeTimeLimit", 1],
+"get_game_mode_time_remaining": ["GetGameModeTimeRemaining", 1],
+"get_inventory_ammo": ["GetInventoryAmmo", 1, ["VALUE-0", "VALUE-1"]],
+"get_inventory_magazine_ammo": ["GetInventoryMagazineAmmo", 1, ["VALUE-0", "VALUE-1"]],
+"get_mcom_state": ["GetMCOMState", 1, ["VALUE-0", "VALUE-1"]],
+"get_objective": ["GetObjective", 1, ["VALUE-0"]],
+"get_owner_progress_team_id": ["GetOwnerProgressTeamID", 1, ["VALUE-0"]],
+"get_player_deaths": ["GetPlayerDeaths", 1, ["VALUE-0"]],
+"get_player_from_vehicle_seat": ["GetPlayerFromVehicleSeat", 1, ["VALUE-0", "VALUE-1"]],
+"get_player_kills": ["GetPlayerKills", 1, ["VALUE-0"]],
+"get_player_state": ["GetPlayerState", 1, ["VALUE-0", "VALUE-1"]],
+"get_player_vehicle_seat": ["GetPlayerVehicleSeat", 1, ["VALUE-0"]],
+"get_players": ["GetPlayers", 1],
+"get_players_on_point": ["GetPlayersOnPoint", 1, ["VALUE-0"]],
+"get_previous_owner_team_id": ["GetPreviousOwnerTeamID", 1, ["VALUE-0"]],
+"get_remaining_fuse_time": ["GetRemainingFuseTime", 1, ["VALUE-0"]],
+"get_seat_count": ["GetSeatCount", 1, ["VALUE-0"]],
+"get_subroutine_argument": ["GetSubroutineArgument", 1],
+"get_team_id": ["GetTeamId", 1, ["VALUE-0"]],
+"get_variable": ["GetVariable", 1, ["VALUE-0"]],
+"get_vehicle_from_player": ["GetVehicleFromPlayer", 1, ["VALUE-0"]],
+"get_vehicle_state": ["GetVehicleState", 1, ["VALUE-0", "VALUE-1"]],
+"get_vehicle_team_id": ["GetVehicleTeamId", 1, ["VALUE-0"]],
+"get_x_component": ["GetXComponent", 1, ["VALUE-0"]],
+"get_y_component": ["GetYComponent", 1, ["VALUE-0"]],
+"get_z_component": ["GetZComponent", 1, ["VALUE-0"]],
+"greater_than": ["GreaterThan", 1, ["VALUE-0", "VALUE-1"]],
+"greater_than_equal_to": ["GreaterThanEqualTo", 1, ["VALUE-0", "VALUE-1"]],
+"has_inventory": ["HasInventory", 1, ["VALUE-0", "VALUE-1"]],
+"heal": ["Heal", 0, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3", "VALUE-4", "VALUE-5"]],
+"if": ["If", 0, ["VALUE-0"]],
+"if_then_else": ["IfThenElse", 1, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3", "VALUE-4"]],
+"index_of_array_value": ["IndexOfArrayValue", 1, ["VALUE-0", "VALUE-1"]],
+"is_current_map": ["IsCurrentMap", 1, ["VALUE-0"]],
+"is_faction": ["IsFaction", 1, ["VALUE-0", "VALUE-1"]],
+"is_inventory_slot_active": ["IsInventorySlotActive", 1, ["VALUE-0", "VALUE-1"]],
+"is_killer_weapon": ["IsKillerWeapon", 1, ["VALUE-0", "VALUE-1"]],
+"is_player_using_soldier": ["IsPlayerUsingSoldier", 0, ["VALUE-0", "VALUE-1"]],
+"is_player_valid": ["IsPlayerValid", 1, ["VALUE-0"]],
+"is_true_for_all": ["IsTrueForAll", 1, ["VALUE-0", "VALUE-1"]],
+"is_true_for_any": ["IsTrueForAny", 1, ["VALUE-0", "VALUE-1"]],
+"is_type": ["IsType", 1, ["VALUE-0", "VALUE-1"]],
+"is_vehicle_occupied": ["IsVehicleOccupied", 1, ["VALUE-0"]],
+"is_vehicle_seat_occupied": ["IsVehicleSeatOccupied", 1, ["VALUE-0", "VALUE-1"]],
+"is_victim_damage_type": ["IsVictimDamageType", 1, ["VALUE-0", "VALUE-1"]],
+"is_victim_death_type": ["IsVictimDeathType", 1, ["VALUE-0", "VALUE-1"]],
+"kill": ["Kill", 0, ["VALUE-0"]],
+"last_of": ["LastOf", 1, ["VALUE-0"]],
+"left_vector": ["LeftVector", 1],
+"less_than": ["LessThan", 1, ["VALUE-0", "VALUE-1"]],
+"less_than_equal_to": ["LessThanEqualTo", 1, ["VALUE-0", "VALUE-1"]],
+"local_to_world_position": ["LocalToWorldPosition", 1, ["VALUE-0", "VALUE-1", "VALUE-2"]],
+"local_to_world_vector": ["LocalToWorldVector", 1, ["VALUE-0", "VALUE-1", "VALUE-2"]],
+"loop_variable": ["LoopVariable", 0, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3", "VALUE-4", "VALUE-5", "VALUE-6"]],
+"mapped_array": ["MappedArray", 1, ["VALUE-0", "VALUE-1", "VALUE-2"]],
+"max": ["Max", 1, ["VALUE-0", "VALUE-1"]],
+"mcom_state_bool": ["MCOMStateBool", 1],
+"message": ["Message", 1, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3", "VALUE-4", "VALUE-5", "VALUE-6"]],
+"mod": ["MOD", 0],
+"modulo": ["Modulo", 1, ["VALUE-0", "VALUE-1"]],
+"multiply": ["Multiply", 1, ["VALUE-0", "VALUE-1"]],
+"normalize": ["Normalize", 1, ["VALUE-0"]],
+"not": ["Not", 1, ["VALUE-0"]],
+"not_equal_to": ["NotEqualTo", 1, ["VALUE-0", "VALUE-1"]],
+"number": ["Number", 0],
+"or": ["Or", 1, ["VALUE-0", "VALUE-1"]],
+"pause_game_mode_time": ["PauseGameModeTime", 0, ["VALUE-0"]],
+"pi": ["Pi", 1],
+"radians_to_degrees": ["RadiansToDegrees", 1, ["VALUE-0"]],
+"raise_to_power": ["RaiseToPower", 1, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3"]],
+"random_real": ["RandomReal", 1, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3"]],
+"random_value_in_array": ["RandomValueInArray", 1, ["VALUE-0"]],
+"randomized_array": ["RandomizedArray", 1, ["VALUE-0"]],
+"remove_from_array": ["RemoveFromArray", 1, ["VALUE-0", "VALUE-1"]],
+"remove_player_inventory": ["RemovePlayerInventory", 0, ["VALUE-0", "VALUE-1"]],
+"remove_player_inventory_at_slot": ["RemovePlayerInventoryAtSlot", 0, ["VALUE-0", "VALUE-1"]],
+"repair_vehicle": ["RepairVehicle", 0, ["VALUE-0", "VALUE-1"]],
+"replace_player_inventory": ["ReplacePlayerInventory", 0, ["VALUE-0", "VALUE-1"]],
+"reset_game_mode_time": ["ResetGameModeTime", 0],
+"resupply": ["Resupply", 0, ["VALUE-0", "VALUE-1"]],
+"right_vector": ["RightVector", 1],
+"round_to_integer": ["RoundToInteger", 1, ["VALUE-0"]],
+"rule": ["RULE", 0],
+"send_error_report": ["SendErrorReport", 0, ["VALUE-0"]],
+"set_capture_multiplier": ["SetCaptureMultiplier", 0, ["VALUE-0", "VALUE-1"]],
+"set_game_mode_score": ["SetGameModeScore", 0, ["VALUE-0", "VALUE-1"]],
+"set_game_mode_target_score": ["SetGameModeTargetScore", 0, ["VALUE-0"]],
+"set_game_mode_time_limit": ["SetGameModeTimeLimit", 0, ["VALUE-0"]],
+"set_inventory_ammo": ["SetInventoryAmmo", 0, ["VALUE-0", "VALUE-1", "VALUE-2"]],
+"set_inventory_magazine_ammo": ["SetInventoryMagazineAmmo", 0, ["VALUE-0", "VALUE-1", "VALUE-2"]],
+"set_mcom_fuse_time": ["SetMCOMFuseTime", 0, ["VALUE-0", "VALUE-1"]],
+"set_neutralization_time_multiplier": ["SetNeutralizationTimeMultiplier", 0, ["VALUE-0", "VALUE-1"]],
+"set_objective_owner": ["SetObjectiveOwner", 0, ["VALUE-0", "VALUE-1"]],
+"set_player_max_health": ["SetPlayerMaxHealth", 0, ["VALUE-0", ["VALUE-1", "0"]]],
+"set_player_soldier": ["SetPlayerSoldier", 0, ["VALUE-0", "VALUE-1"]],
+"set_redeploy_time": ["SetRedeployTime", 0, ["VALUE-0", "VALUE-1"]],
+"set_team_id": ["SetTeamId", 0, ["VALUE-0", "VALUE-1"]],
+"set_variable": ["SetVariable", 0, ["VALUE-0", "VALUE-1"]],
+"set_variable_at_index": ["SetVariableAtIndex", 0, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3", "VALUE-4"]],
+"set_vehicle_max_health_multiplier": ["SetVehicleMaxHealthMultiplier", 0, ["VALUE-0", "VALUE-1"]],
+"set_world_icon_image": ["SetWorldIconImage", 0, ["VALUE-0", "VALUE-1"]],
+"set_world_icon_owner": ["SetWorldIconOwner", 0, ["VALUE-0", "VALUE-1"]],
+"set_world_icon_position": ["SetWorldIconPosition", 0, ["VALUE-0", "VALUE-1"]],
+"set_world_icon_text": ["SetWorldIconText", 0, ["VALUE-0", "VALUE-1"]],
+"sine_from_degrees": ["SineFromDegrees", 1, ["VALUE-0"]],
+"sine_from_radians": ["SineFromRadians", 1, ["VALUE-0"]],
+"skip": ["Skip", 0, ["VALUE-0"]],
+"skip_if": ["SkipIf", 0, ["VALUE-0", "VALUE-1"]],
+"skip_mandown": ["SkipMandown", 0, ["VALUE-0", "VALUE-1"]],
+"sorted_array": ["SortedArray", 1, ["VALUE-0", "VALUE-1", "VALUE-2"]],
+"spot_target": ["SpotTarget", 0, ["VALUE-0", "VALUE-1", "VALUE-2"]],
+"spot_target_for_player": ["SpotTargetForPlayer", 0, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3", "VALUE-4", "VALUE-5"]],
+"square_root": ["SquareRoot", 1, ["VALUE-0"]],
+"stop_tracking_variable": ["StopTrackingVariable", 0, ["VALUE-0"]],
+"string": ["String", 0],
+"subroutine": ["SUBROUTINE", 0],
+"subroutine_instance_block": ["subroutineInstanceBlock", 0],
+"subtract": ["Subtract", 1, ["VALUE-0", "VALUE-1"]],
+"tangent_from_degrees": ["TangentFromDegrees", 1, ["VALUE-0"]],
+"tangent_from_radians": ["TangentFromRadians", 1, ["VALUE-0"]],
+"teleport": ["Teleport", 0, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3", "VALUE-4"]],
+"track_variable_at_rate": ["TrackVariableAtRate", 0, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3", "VALUE-4"]],
+"track_variable_over_time": ["TrackVariableOverTime", 0, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3", "VALUE-4"]],
+"trigger_audio": ["TriggerAudio", 0, ["VALUE-0", "VALUE-1"]],
+"trigger_audio_at_location": ["TriggerAudioAtLocation", 0, ["VALUE-0", "VALUE-1"]],
+"undeploy_all_players": ["UndeployAllPlayers", 0],
+"undeploy_player": ["UndeployPlayer", 0, ["VALUE-0"]],
+"unspot_target": ["UnspotTarget", 0, ["VALUE-0"]],
+"up_vector": ["UpVector", 1],
+"value_in_array": ["ValueInArray", 1, ["VALUE-0", "VALUE-1"]],
+"variable": ["Variable", 0],
+"vector_towards": ["VectorTowards", 1, ["VALUE-0", "VALUE-1", "VALUE-2", "VALUE-3"]],
+"wait": ["Wait", 0, ["VALUE-0"]],
+"wait_until": ["WaitUntil", 0, ["VALUE-0", "VALUE-1"]],
+"while": ["While", 0, ["VALUE-0"]],
+"world_to_local_position": ["WorldToLocalPosition", 1, ["VALUE-0", "VALUE-1", "VALUE-2"]],
+"world_to_local_vector": ["WorldToLocalVector", 1, ["VALUE-0", "VALUE-1", "VALUE-2"]],
+"xor": ["Xor", 1, ["VALUE-0", "VALUE-1"]]
+}`);
@@ -0,0 +1,47 @@
+/**
+ * @license
+ * Copyright 2023 Google LLC
+ * SPDX-License-Identifier: Apache-2.0
+ */
+
+import {Order} from 'blockly/javascript';
+
+import { GENERATOR_SPECS } from './generator_specs';
+
+/**
+ * A value input: its name (read with Order.NONE, 'null' when empty), or
+ * [name, fallback] / [name, fallback, 1] where 1 reads it with Order.ATOMIC.
+ */
+export type GeneratorInputSpec = string | [string, string, number?];
+
+/**
+ * [portal function, kind, inputs?]
+ * kind: 0 = statement, 1 = value (Order.NONE), 2 = value (Order.ATOMIC).
+ * Rows are generated by tools/generator_specs.py from the block catalog.
+ */
+export type GeneratorSpec = [string, number, GeneratorInputSpec[]?];
+
+/** Generic generator for table-driven blocks: emits `mod.<Function>(<inputs>)`. */
+export function specGenerator(block: any, generator: any) {
+  const spec = GENERATOR_SPECS[block.type];
+  const inputs = spec[2] || [];
+  const args: string[] = new Array(inputs.length);
+  for (let i = 0; i < inputs.length; i++) {
+    const input = inputs[i];
+    if (typeof input === 'string') {
+      args[i] = generator.valueToCode(block, input, Order.NONE) || 'null';
+    } else {
+      args[i] = generator.valueToCode(block, input[0], input[2] ? Order.ATOMIC : Order.NONE) || input[1];
+    }
+  }
+  const code = `mod.${spec[0]}(${args.join(', ')})`;
+  if (spec[1] === 0) return `${code};\n`;
+  return [code, spec[1] === 2 ? Order.ATOMIC : Order.NONE];
+}
+
+/** Registers specGenerator for every table row that has no hand-written generator in `target`. */
+export function installSpecGenerators(target: Record<string, any>) {
+  for (const type of Object.keys(GENERATOR_SPECS)) {
+    if (!(type in target)) target[type] = specGenerator;
+  }
+}
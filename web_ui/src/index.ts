@@ -18,7 +18,7 @@ import {registerMutators, SUBROUTINE_DEF_MUTATOR, SUBROUTINE_CALL_MUTATOR} from
 import {bf6Generators} from './generators/bf6_generators'; // Custom generators
 import {javascriptGenerator} from 'blockly/javascript'; // Use TypeScript generator
 import {save, load, exportForPortal, saveToFile} from './serialization';
-import {toolbox} from './toolbox';
+import {toolbox, lazyCategoryContents} from './toolbox';
 import {bf6Theme} from './bf6_theme';
 import {MenuBar} from './components/MenuBar';
 import { preloadSelectionLists, registerSelectionListExtensions } from './selection_lists';
@@ -766,6 +766,13 @@ const filterToolbox = (searchTerm: string) => {
 
     const categoryNameMatches = category.name.toLowerCase().includes(lowerCaseSearchTerm);
 
+    // Lazy categories are searched like regular ones; unfiltered, they stay lazy.
+    const lazyTypes = category.custom ? lazyCategoryContents[category.custom] : undefined;
+    if (lazyTypes && lowerCaseSearchTerm) {
+        delete category.custom;
+        category.contents = lazyTypes.map((type) => ({ kind: 'block', type }));
+    }
+
     // Handle custom categories (which have no contents array in the JSON)
     if (category.custom) {
         return categoryNameMatches || lowerCaseSearchTerm === '';
@@ -1797,6 +1804,21 @@ try {
     return xmlList;
   });
 
+  // --- Lazily populated categories (rarely used blocks; built on first open) ---
+  for (const [key, types] of Object.entries(lazyCategoryContents)) {
+    let flyout: Element[] | null = null;
+    ws.registerToolboxCategoryCallback(key, () => {
+      if (!flyout) {
+        flyout = types.map((type) => {
+          const blockXml = xmlEl('block');
+          blockXml.setAttribute('type', type);
+          return blockXml;
+        });
+      }
+      return flyout;
+    });
+  }
+
   // --- Custom Toolbox Category for Subroutines ---
   ws.registerToolboxCategoryCallback('SUBROUTINES_CATEGORY', (workspace) => {
     const xmlList: Element[] = [];
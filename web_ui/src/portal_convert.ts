@@ -105,12 +105,12 @@ function deepCloneJson<T>(obj: T): T {
   return JSON.parse(JSON.stringify(obj));
 }
 
-async function loadJsonAsset(url: string): Promise<any> {
+async function loadTextAsset(url: string): Promise<string> {
   // 1) Prefer fetch in normal web contexts.
   try {
     const res = await fetch(url, { cache: 'no-store' });
     if (!res.ok) throw new Error(`HTTP ${res.status}`);
-    return await res.json();
+    return await res.text();
   } catch (e) {
     // 2) Electron/file:// fallback: use Node fs.
     try {
@@ -124,14 +124,26 @@ async function loadJsonAsset(url: string): Promise<any> {
 
       const fileUrl = new URL(url, window.location.href);
       const filePath = fileURLToPath(fileUrl);
-      const raw = fs.readFileSync(filePath, 'utf8');
-      return JSON.parse(raw);
+      return fs.readFileSync(filePath, 'utf8');
     } catch (e2) {
       throw e2;
     }
   }
 }
 
+async function loadJsonAsset(url: string): Promise<any> {
+  return JSON.parse(await loadTextAsset(url));
+}
+
+async function sha256Hex(text: string): Promise<string | null> {
+  // Same digest as CatalogEngine.sha256 for the UTF-8 files the tools write.
+  // Null where WebCrypto is unavailable (non-secure origins).
+  const subtle = (globalThis as any)?.crypto?.subtle;
+  if (!subtle) return null;
+  const digest = new Uint8Array(await subtle.digest('SHA-256', new TextEncoder().encode(text)));
+  return Array.from(digest, (b) => ('0' + b.toString(16)).slice(-2)).join('');
+}
+
 function buildPortalSpecsFromDocsArray(arr: any[]): Map<string, PortalSpec> {
   // Build a compact map: portalType -> { valueInputs: [names], statementInputs: [names] }
   // using bf6portal_blocks.json (args_json).
@@ -180,11 +192,48 @@ function buildPortalSpecsFromDocsArray(arr: any[]): Map<string, PortalSpec> {
   return specs;
 }
 
+function buildPortalSpecsFromCompact(data: any): Map<string, PortalSpec> | null {
+  // bf6portal_blocks.compact.json (tools/update_blocks_db.py) already carries
+  // portal_specs: { portalType: [valueInputs, statementInputs] }.
+  if (!data || data.version !== 1 || !data.portal_specs || typeof data.portal_specs !== 'object') return null;
+
+  const specs = new Map<string, PortalSpec>();
+  for (const [portalType, spec] of Object.entries<any>(data.portal_specs)) {
+    if (!Array.isArray(spec)) continue;
+    const valueInputs = Array.isArray(spec[0]) ? spec[0].map(String) : [];
+    const statementInputs = Array.isArray(spec[1]) ? spec[1].map(String) : [];
+    specs.set(portalType, { valueInputs, statementInputs });
+  }
+  return specs;
+}
+
+async function loadPortalSpecs(): Promise<Map<string, PortalSpec>> {
+  // Prefer the compact catalog, but only if it was built from the bf6portal_blocks.json
+  // shipped next to it (the check CatalogEngine.load_compact_block_db does); a stale
+  // or older compact file falls back to the full docs JSON.
+  let dbText: string | null = null;
+  try {
+    dbText = await loadTextAsset('bf6portal_blocks.json');
+  } catch {
+    // Without the full DB there is nothing to compare against; use the compact file as is.
+  }
+  try {
+    const compact = await loadJsonAsset('bf6portal_blocks.compact.json');
+    if (dbText === null || (compact && compact.source_sha256 && compact.source_sha256 === await sha256Hex(dbText))) {
+      const specs = buildPortalSpecsFromCompact(compact);
+      if (specs && specs.size) return specs;
+    }
+  } catch {
+    // ignore
+  }
+  const arr = dbText !== null ? JSON.parse(dbText) : await loadJsonAsset('bf6portal_blocks.json');
+  return buildPortalSpecsFromDocsArray(Array.isArray(arr) ? arr : []);
+}
+
 async function ensurePortalSpecsLoaded(): Promise<void> {
   if (portalSpecsByType && portalTypeByLower) return;
 
-  const arr = await loadJsonAsset('bf6portal_blocks.json');
-  const specs = buildPortalSpecsFromDocsArray(Array.isArray(arr) ? arr : []);
+  const specs = await loadPortalSpecs();
 
   const byLower = new Map<string, string>();
   for (const portalType of specs.keys()) {
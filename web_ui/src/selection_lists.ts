@@ -5,17 +5,40 @@ import { javascriptGenerator, Order } from 'blockly/javascript';
  * Selection Lists (Portal enums)
  *
  * Source of truth: repo root `selection-lists.md` (generated from `=Resources=/portal-docs-json/index.d.ts`).
- * We ship that markdown into `web_ui/dist/` and parse it at runtime.
+ * At runtime we prefer the pre-indexed `selection-lists/` artifact built from it
+ * (tools/selection_list_artifact.py): a small index plus shards of interned strings.
+ * Shard 0 (the small enums) loads with the index; the large per-map lists load on
+ * first use. If the artifact is missing we fall back to parsing the markdown.
  */
 
 type SelectionListMap = Record<string, string[]>; // EnumName -> values
 
+type SelectionListIndex = {
+  version: number;
+  shards: string[];
+  preload?: number[];
+  enums: Record<string, [number, number, number]>; // EnumName -> [shard, offset, count]
+};
+
+type SelectionListShard = {
+  strings: string[];
+  items: number[]; // indices into strings
+};
+
+const SELECTION_LIST_DIR = 'selection-lists';
+const SELECTION_LIST_INDEX_VERSION = 1;
+
 type Cache = {
   loaded: boolean;
   loading: boolean;
   map: SelectionListMap;
   mapCI: SelectionListMap;
   optionsCache: Record<string, [string, string][]>;
+  index: SelectionListIndex | null;
+  indexCI: Record<string, string>; // lower-case EnumName -> index key
+  shardLoads: Record<number, Promise<void>>;
+  loadedShards: Record<number, boolean>;
+  shardErrors: Record<number, string>; // lazily loaded shards that failed; the other shards stay usable
   lastError?: string;
 };
 
@@ -25,6 +48,11 @@ const cache: Cache = {
   map: {},
   mapCI: {},
   optionsCache: {},
+  index: null,
+  indexCI: {},
+  shardLoads: {},
+  loadedShards: {},
+  shardErrors: {},
 };
 
 function getOptionsCacheKey(enumName: string): string {
@@ -92,9 +120,9 @@ function normalizeEnumKey(name: string): string {
   return s.endsWith('Item') ? s.slice(0, -4) : s;
 }
 
-function getCanonicalEnumNamesFromMap(map: SelectionListMap): string[] {
+function getCanonicalEnumNames(counts: Record<string, number>): string[] {
   const names = new Set<string>();
-  for (const rawKey of Object.keys(map || {})) {
+  for (const rawKey of Object.keys(counts || {})) {
     const norm = normalizeEnumKey(rawKey);
     if (!norm) continue;
     // Ignore alternate index keys.
@@ -102,8 +130,7 @@ function getCanonicalEnumNamesFromMap(map: SelectionListMap): string[] {
     // Prefer the canonical cased version over lower-case duplicates.
     if (norm.toLowerCase() === norm) continue;
     if (!/^[A-Za-z0-9_]+$/.test(norm)) continue;
-    const vals = (map as any)[rawKey];
-    if (!Array.isArray(vals) || vals.length === 0) continue;
+    if (!counts[rawKey]) continue;
     names.add(norm);
   }
   return Array.from(names).sort((a, b) => a.localeCompare(b));
@@ -146,7 +173,11 @@ function registerSelectionListEnumBlocks(): void {
   // Ensure it exists so we can register dynamic enum blocks reliably.
   const blocksRegistry: Record<string, any> = (Blockly as any).Blocks || (((Blockly as any).Blocks = {}) as any);
 
-  const names = getCanonicalEnumNamesFromMap(cache.map);
+  // Lists that are not loaded yet still get a block; their values come from the index on first use.
+  const counts: Record<string, number> = {};
+  for (const [k, v] of Object.entries(cache.map)) counts[k] = Array.isArray(v) ? v.length : 0;
+  for (const [k, entry] of Object.entries(cache.index?.enums || {})) counts[k] = Math.max(counts[k] || 0, entry[2]);
+  const names = getCanonicalEnumNames(counts);
 
   for (const enumName of names) {
     const blockType = `${SELECTION_LIST_BLOCK_PREFIX}${enumName}`;
@@ -339,6 +370,84 @@ async function fetchText(url: string): Promise<string> {
   }
 }
 
+async function loadSelectionListIndex(): Promise<SelectionListIndex | null> {
+  try {
+    const index = JSON.parse(await fetchText(`${SELECTION_LIST_DIR}/index.json`));
+    if (index?.version !== SELECTION_LIST_INDEX_VERSION || !index.enums || !Array.isArray(index.shards)) return null;
+    return index as SelectionListIndex;
+  } catch {
+    return null;
+  }
+}
+
+function rebuildCaseInsensitiveMap(): void {
+  cache.mapCI = {};
+  for (const [k, v] of Object.entries(cache.map)) {
+    const lk = k.toLowerCase();
+    if (!(lk in cache.mapCI)) cache.mapCI[lk] = v;
+  }
+}
+
+function loadShard(shardNo: number): Promise<void> {
+  const index = cache.index;
+  if (!index || !index.shards[shardNo]) return Promise.resolve();
+  let pending = cache.shardLoads[shardNo];
+  if (!pending) {
+    pending = fetchText(`${SELECTION_LIST_DIR}/${index.shards[shardNo]}`).then((text) => {
+      const shard: SelectionListShard = JSON.parse(text);
+      for (const [name, [s, offset, count]] of Object.entries(index.enums)) {
+        if (s !== shardNo) continue;
+        const values: string[] = new Array(count);
+        for (let i = 0; i < count; i++) values[i] = shard.strings[shard.items[offset + i]];
+        cache.map[name] = values;
+      }
+      ensureDerivedSelectionLists(cache.map);
+      rebuildCaseInsensitiveMap();
+      cache.loadedShards[shardNo] = true;
+    });
+    // Allow a retry after a failed fetch.
+    pending.catch(() => { delete cache.shardLoads[shardNo]; });
+    cache.shardLoads[shardNo] = pending;
+  }
+  return pending;
+}
+
+function indexKeyFor(enumName: string): string | undefined {
+  const enums = cache.index?.enums;
+  if (!enums) return undefined;
+  for (const k of [enumName, ENUM_ALIASES[enumName], ...getCandidateEnumKeys(enumName)]) {
+    if (!k) continue;
+    if (enums[k]) return k;
+    const ci = cache.indexCI[k.toLowerCase()];
+    if (ci) return ci;
+  }
+  return undefined;
+}
+
+function shardFor(enumName: string): number | undefined {
+  const key = indexKeyFor(enumName);
+  return key ? cache.index!.enums[key][0] : undefined;
+}
+
+/** Starts loading the shard that holds `enumName`, if any. Returns true while that load is pending. */
+function requestSelectionList(enumName: string): boolean {
+  const shardNo = shardFor(enumName);
+  if (shardNo === undefined || cache.loadedShards[shardNo] || cache.shardErrors[shardNo] || !cache.index!.shards[shardNo]) {
+    return false;
+  }
+  loadShard(shardNo).then(
+    () => {
+      cache.optionsCache = {};
+      refreshSelectionListDropdownFields();
+    },
+    (e: any) => {
+      // Only the lists in this shard are unavailable; the other shards keep working.
+      cache.shardErrors[shardNo] = String(e?.message || e);
+    },
+  );
+  return true;
+}
+
 function refreshSelectionListDropdownFields(): void {
   // If selection lists finished loading after a workspace was created,
   // existing dropdown fields might still be set to the placeholder value.
@@ -412,19 +521,29 @@ export async function preloadSelectionLists(): Promise<void> {
   if (cache.loaded || cache.loading) return;
   cache.loading = true;
   cache.lastError = undefined;
+  cache.shardErrors = {};
   try {
     // Copied into dist by webpack (see `web_ui/webpack.config.js`).
-    // NOTE: Electron packaging excludes *.md by default in this repo, so we ship a
-    // `.txt` copy for runtime and fall back to `.md` for dev.
-    let md: string | null = null;
-    let source: string = 'selection-lists.txt';
-    try {
-      md = await fetchText('selection-lists.txt');
-    } catch {
-      source = 'selection-lists.md';
-      md = await fetchText('selection-lists.md');
+    const index = await loadSelectionListIndex();
+    if (index) {
+      cache.index = index;
+      cache.indexCI = {};
+      for (const k of Object.keys(index.enums)) {
+        const lk = k.toLowerCase();
+        if (!(lk in cache.indexCI)) cache.indexCI[lk] = k;
+      }
+      await Promise.all((index.preload || []).map(loadShard));
+    } else {
+      // NOTE: Electron packaging excludes *.md by default in this repo, so we ship a
+      // `.txt` copy for runtime and fall back to `.md` for dev.
+      let md: string | null = null;
+      try {
+        md = await fetchText('selection-lists.txt');
+      } catch {
+        md = await fetchText('selection-lists.md');
+      }
+      cache.map = parseSelectionListsMarkdown(md);
     }
-    cache.map = parseSelectionListsMarkdown(md);
     // Merge extra lists (only if missing) so callers can rely on a single lookup path.
     for (const [k, v] of Object.entries(EXTRA_SELECTION_LISTS)) {
       if (!cache.map[k] || cache.map[k].length === 0) cache.map[k] = v;
@@ -434,11 +553,7 @@ export async function preloadSelectionLists(): Promise<void> {
     ensureDerivedSelectionLists(cache.map);
 
     // Build a case-insensitive lookup map.
-    cache.mapCI = {};
-    for (const [k, v] of Object.entries(cache.map)) {
-      const lk = k.toLowerCase();
-      if (!(lk in cache.mapCI)) cache.mapCI[lk] = v;
-    }
+    rebuildCaseInsensitiveMap();
 
     // Invalidate any cached dropdown option lists.
     cache.optionsCache = {};
@@ -513,7 +628,7 @@ function getEnumNameFromBlock(block: Blockly.Block): string | null {
     for (const c of list) {
       const s = String(c);
       if (!s) continue;
-      if (lookupSelectionList(s)) return normalizeEnumKey(s);
+      if (lookupSelectionList(s) || indexKeyFor(s)) return normalizeEnumKey(s);
     }
   } catch {
     // ignore
@@ -615,6 +730,11 @@ export function registerSelectionListExtensions(): void {
 
         if (cache.lastError) return [[`(selection lists failed to load: ${cache.lastError})`, '__error__']];
         if (!cache.loaded) return [['(loading selection lists...)', '__loading__']];
+        // Large lists live in their own shard; fetch it on first use.
+        if (requestSelectionList(enumName)) return [['(loading selection list...)', '__loading__']];
+        const shardNo = shardFor(enumName);
+        const shardError = shardNo === undefined ? undefined : cache.shardErrors[shardNo];
+        if (shardError) return [[`(selection list failed to load: ${shardError})`, '__error__']];
         return [[`(no selection list: ${enumName})`, '__missing__']];
       }
 
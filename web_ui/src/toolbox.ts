@@ -1068,4 +1068,8 @@ export const toolbox = {
       ]
     }
   ]
-};
\ No newline at end of file
+};
+
+// Block types of `custom: 'LAZY_*'` categories, filled on first open (see tools/generate_toolbox_v2.py).
+export const lazyCategoryContents: Record<string, string[]> = {
+};
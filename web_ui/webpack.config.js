@@ -68,11 +68,15 @@ const config = {
         { from: 'assets', to: 'assets' },
         { from: 'blockly', to: 'blockly' },
         { from: path.resolve(__dirname, '..', 'bf6portal_blocks.json'), to: 'bf6portal_blocks.json' },
+        // Minified catalog with precomputed portal input specs (tools/update_blocks_db.py).
+        { from: path.resolve(__dirname, '..', 'bf6portal_blocks.compact.json'), to: 'bf6portal_blocks.compact.json', noErrorOnMissing: true },
         // Selection-list enums extracted from Portal docs (repo root file).
         // Used at runtime to populate dropdown options for selection-list blocks.
-        // We ship BOTH:
+        // We ship:
         // - selection-lists.txt: packaged Electron builds (since electron-builder excludes *.md)
         // - selection-lists.md: dev / source inspection
+        // - selection-lists/: pre-indexed, sharded form loaded first (tools/selection_list_artifact.py)
+        { from: path.resolve(__dirname, '..', 'selection-lists'), to: 'selection-lists', noErrorOnMissing: true },
         { from: path.resolve(__dirname, '..', 'selection-lists.md'), to: 'selection-lists.txt' },
         { from: path.resolve(__dirname, '..', 'selection-lists.md'), to: 'selection-lists.md' },
         { from: path.resolve(__dirname, '..', '=Resources=', 'Portal Blocks', 'custom_rush_V1.0.json'), to: 'presets/custom_rush_V1.0.json' },